@@ -47,6 +47,13 @@ import numpy as np
 import pandas as pd
 
 
+def _bar_hash(ts, o, h, l, c) -> str:  # noqa: E741
+    """Bar hash over timestamp + OHLC (rounded to 6 decimals)."""
+    # Normalize values for consistent hashing
+    content = f"{ts}|{o:.6f}|{h:.6f}|{l:.6f}|{c:.6f}"
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
 class HealthState(Enum):
     """System health states."""
 
@@ -122,26 +129,24 @@ class TruthTeller:
         Hash includes: timestamp, OHLC (rounded to 6 decimals)
         Volume excluded (vendor-dependent)
         """
-        # Normalize values for consistent hashing
-        ts = str(row["timestamp"]) if "timestamp" in row.index else str(row.name)
-        o = f"{row['open']:.6f}"
-        h = f"{row['high']:.6f}"
-        l = f"{row['low']:.6f}"
-        c = f"{row['close']:.6f}"
+        ts = row["timestamp"] if "timestamp" in row.index else row.name
+        return _bar_hash(ts, row["open"], row["high"], row["low"], row["close"])
 
-        content = f"{ts}|{o}|{h}|{l}|{c}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
-
-    def compute_dataset_hash(self, df: pd.DataFrame) -> str:
+    def compute_dataset_hash(self, df: pd.DataFrame, chain_hash: str = "0" * 16) -> str:
         """
         Compute hash for entire dataset.
 
         Uses hash chain: each bar's hash includes previous hash.
+        Same per-bar hash as compute_bar_hash, read column-wise (no iterrows).
+
+        Passing the hash of the preceding bars as `chain_hash` continues the
+        chain, so a dataset can be hashed chunk by chunk.
         """
-        chain_hash = "0" * 16
 
-        for idx, row in df.iterrows():
-            bar_hash = self.compute_bar_hash(row)
+        labels = df["timestamp"] if "timestamp" in df.columns else df.index
+        bars = zip(labels, df["open"], df["high"], df["low"], df["close"], strict=True)
+        for ts, o, h, l, c in bars:  # noqa: E741
+            bar_hash = _bar_hash(ts, o, h, l, c)
             combined = f"{chain_hash}|{bar_hash}"
             chain_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
 
@@ -202,6 +202,9 @@ class CSOObserver(GovernanceInterface):
         """
         Detect notable patterns in bar.
 
+        Reads only enrichment.PATTERN_COLUMNS (enrich with
+        EnrichmentPipeline(columns=PATTERN_COLUMNS)).
+
         Returns dict with type + details if found.
         """
         patterns = []
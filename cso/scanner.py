@@ -149,8 +149,11 @@ class CSOScanner:
         forming: list[SetupResult] = []
         none: list[SetupResult] = []
 
+        # One consistent read for every pair when the reader supports it
+        snapshot = self._get_snapshot()
+
         for pair in self._pairs:
-            result = self.scan_pair(pair)
+            result = self.scan_pair(pair, snapshot)
 
             if result.status == SetupStatus.READY:
                 ready.append(result)
@@ -168,18 +171,19 @@ class CSOScanner:
             none_setups=none,
         )
 
-    def scan_pair(self, pair: str) -> SetupResult:
+    def scan_pair(self, pair: str, snapshot: Any | None = None) -> SetupResult:
         """
         Scan single pair for setup.
 
         Args:
             pair: Currency pair (e.g., "EURUSD")
+            snapshot: RiverSnapshot from scan_all_pairs (queries River if None)
 
         Returns:
             SetupResult
         """
         # Get market data
-        htf_bars, ltf_bars, current_price = self._get_market_data(pair)
+        htf_bars, ltf_bars, current_price = self._get_market_data(pair, snapshot)
 
         if htf_bars is None or ltf_bars is None:
             return SetupResult(
@@ -238,21 +242,41 @@ class CSOScanner:
 
         return [p["symbol"] for p in data.get("pairs", []) if p.get("status") == "ACTIVE"]
 
+    def _market_windows(self, pair: str) -> list[tuple[str, str, datetime, datetime]]:
+        """(pair, timeframe, start, end) windows a scan reads."""
+        end = datetime.now(UTC)
+        start_htf = end - timedelta(days=30)  # 30 days for HTF
+        start_ltf = end - timedelta(days=7)  # 7 days for LTF
+        return [(pair, "4H", start_htf, end), (pair, "1H", start_ltf, end)]
+
+    def _get_snapshot(self) -> Any | None:
+        """Batched read of every pair's windows (None → per-pair queries)."""
+        if self._river is None or not hasattr(self._river, "get_snapshot"):
+            return None
+
+        try:
+            requests = [w for pair in self._pairs for w in self._market_windows(pair)]
+            return self._river.get_snapshot(requests, include_states=False)
+        except Exception:
+            return None
+
     def _get_market_data(
         self,
         pair: str,
+        snapshot: Any | None = None,
     ) -> tuple[Any, Any, float]:
         """Get market data for pair."""
         if self._river is None:
             return None, None, 0.0
 
         try:
-            end = datetime.now(UTC)
-            start_htf = end - timedelta(days=30)  # 30 days for HTF
-            start_ltf = end - timedelta(days=7)  # 7 days for LTF
-
-            htf_bars = self._river.get_bars(pair, "4H", start_htf, end)
-            ltf_bars = self._river.get_bars(pair, "1H", start_ltf, end)
+            if snapshot is not None and (pair, "1H") in snapshot.bars:
+                htf_bars = snapshot.bars[(pair, "4H")]
+                ltf_bars = snapshot.bars[(pair, "1H")]
+            else:
+                htf_window, ltf_window = self._market_windows(pair)
+                htf_bars = self._river.get_bars(*htf_window)
+                ltf_bars = self._river.get_bars(*ltf_window)
 
             # Current price from latest bar
             if not ltf_bars.empty:
@@ -18,6 +18,8 @@ from typing import Any
 
 import pandas as pd
 
+from enrichment.layers.l4_structure_breaks import swing_points
+
 # =============================================================================
 # ENUMS
 # =============================================================================
@@ -556,39 +558,11 @@ class StructureDetector:
         bars: pd.DataFrame,
         lookback: int = 3,
     ) -> tuple[list[float], list[float]]:
-        """Detect swing highs and lows."""
-        swing_highs: list[float] = []
-        swing_lows: list[float] = []
-
-        if len(bars) < lookback * 2 + 1:
-            return swing_highs, swing_lows
-
-        for i in range(lookback, len(bars) - lookback):
-            # Check for swing high
-            is_high = True
-            for j in range(1, lookback + 1):
-                if bars.iloc[i]["high"] <= bars.iloc[i - j]["high"]:
-                    is_high = False
-                    break
-                if bars.iloc[i]["high"] <= bars.iloc[i + j]["high"]:
-                    is_high = False
-                    break
-            if is_high:
-                swing_highs.append(bars.iloc[i]["high"])
-
-            # Check for swing low
-            is_low = True
-            for j in range(1, lookback + 1):
-                if bars.iloc[i]["low"] >= bars.iloc[i - j]["low"]:
-                    is_low = False
-                    break
-                if bars.iloc[i]["low"] >= bars.iloc[i + j]["low"]:
-                    is_low = False
-                    break
-            if is_low:
-                swing_lows.append(bars.iloc[i]["low"])
-
-        return swing_highs, swing_lows
+        """Detect swing highs and lows (strictly above / below `lookback` bars each side)."""
+        highs = bars["high"].to_numpy(dtype=float)
+        lows = bars["low"].to_numpy(dtype=float)
+        high_idx, low_idx = swing_points(highs, lows, lookback, strict=True)
+        return highs[high_idx].tolist(), lows[low_idx].tolist()
 
     def _calculate_fvg_fill(
         self,
@@ -7,6 +7,8 @@ Read-only data access layer.
 INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
 """
 
+from .river_follow import RiverFollower
+from .river_pool import RiverConnectionPool, RiverPoolTimeoutError
 from .river_reader import (
     ALLOWED_CALLERS,
     DENIED_CALLERS,
@@ -14,10 +16,17 @@ from .river_reader import (
     RiverReader,
     RiverReadError,
 )
+from .river_snapshot import RiverSnapshot
+from .river_subscription import RiverSubscription
 
 __all__ = [
+    "RiverFollower",
+    "RiverSubscription",
+    "RiverConnectionPool",
+    "RiverPoolTimeoutError",
     "RiverReader",
     "RiverReadError",
+    "RiverSnapshot",
     "RiverAccessDeniedError",
     "ALLOWED_CALLERS",
     "DENIED_CALLERS",
@@ -0,0 +1,136 @@
+"""
+Bar Arrays — Columnar OHLCV Without DataFrames
+==============================================
+
+Contiguous typed arrays for River bars, filled straight from a cursor:
+
+- timestamp: int64 epoch nanoseconds (UTC); .view("datetime64[ns]") is free
+- open/high/low/close/volume: float64 (NULL → NaN)
+
+Hot consumers that only need the numbers skip DataFrame and per-bar dict
+construction. Buffers can be preallocated once and refilled per query.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+BAR_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# Rows pulled from the cursor per fetchmany() call
+FETCH_CHUNK = 65_536
+
+NANOS_PER_SECOND = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class BarArrays:
+    """One array per OHLCV field, all the same length."""
+
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def allocate(cls, capacity: int) -> BarArrays:
+        """Preallocated buffer for `capacity` bars (for get_bars_arrays(out=...))."""
+        return cls(
+            np.empty(capacity, dtype=np.int64),
+            *(np.empty(capacity, dtype=np.float64) for _ in BAR_FIELDS[1:]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def head(self, n: int) -> BarArrays:
+        """First `n` bars (views, no copy)."""
+        return BarArrays(*(getattr(self, f)[:n] for f in BAR_FIELDS))
+
+    def to_frame(self) -> object:
+        """DataFrame view (timestamp as tz-aware UTC) for code that needs one."""
+        import pandas as pd
+
+        data = {f: getattr(self, f) for f in BAR_FIELDS}
+        data["timestamp"] = pd.to_datetime(self.timestamp, unit="ns", utc=True)
+        return pd.DataFrame(data)
+
+
+def fill_from_rows(rows: Iterable[tuple], out: BarArrays | None = None) -> BarArrays:
+    """
+    Fill arrays from (epoch_seconds, open, high, low, close, volume) rows.
+
+    `rows` may be a cursor; it is consumed in FETCH_CHUNK blocks. With `out`
+    the rows are written into its buffers and views of the filled prefix are
+    returned; ValueError if the rows do not fit.
+    """
+    fetch = getattr(rows, "fetchmany", None)
+    if fetch is None:
+        iterator = iter(rows)
+
+        def fetch(size: int) -> list[tuple]:
+            return [row for _, row in zip(range(size), iterator, strict=False)]
+
+    blocks = []
+    filled = 0
+    while True:
+        chunk = fetch(FETCH_CHUNK)
+        if not chunk:
+            break
+        block = np.array(chunk, dtype=np.float64).reshape(len(chunk), len(BAR_FIELDS))
+        if np.isnan(block[:, 0]).any():
+            raise ValueError("Unparseable bar timestamp")
+        if out is not None:
+            if filled + len(block) > len(out):
+                raise ValueError(f"Buffer too small: capacity {len(out)} bars")
+            _write_block(out, filled, block)
+        else:
+            blocks.append(block)
+        filled += len(block)
+
+    if out is not None:
+        return out.head(filled)
+
+    result = BarArrays.allocate(filled)
+    offset = 0
+    for block in blocks:
+        _write_block(result, offset, block)
+        offset += len(block)
+    return result
+
+
+def read_bar_arrays(
+    conn: sqlite3.Connection,
+    table_name: str,
+    start: datetime,
+    end: datetime,
+    out: BarArrays | None = None,
+) -> BarArrays:
+    """RiverReader.get_bars_arrays query on a checked-out connection (table validated)."""
+    # Table name validated by the caller, SQL injection not possible
+    safe_query = f"""
+        SELECT CAST(strftime('%s', timestamp) AS INTEGER),
+               open, high, low, close, volume
+        FROM "{table_name}"
+        WHERE timestamp >= ? AND timestamp <= ?
+        ORDER BY timestamp ASC
+    """  # noqa: S608
+
+    cursor = conn.cursor()
+    cursor.row_factory = None  # plain tuples convert fastest
+    cursor.execute(safe_query, (start.isoformat(), end.isoformat()))
+    return fill_from_rows(cursor, out=out)
+
+
+def _write_block(out: BarArrays, at: int, block: np.ndarray) -> None:
+    rows = slice(at, at + len(block))
+    out.timestamp[rows] = block[:, 0].astype(np.int64) * NANOS_PER_SECOND
+    for col, field in enumerate(BAR_FIELDS[1:], start=1):
+        getattr(out, field)[rows] = block[:, col]
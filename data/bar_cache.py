@@ -0,0 +1,292 @@
+"""
+Bar Window Cache — Range-Merging Memory Cache in Front of RiverReader
+=====================================================================
+
+Scanners and backtests ask River for overlapping windows over and over
+(CSO: 30 days of 4H + 7 days of 1H per pair per scan; Hunt: the same
+DataWindow for every variant). The cache keeps, per (pair, timeframe),
+sorted non-overlapping covered ranges with the bars inside them:
+
+- a request inside a covered range is served from memory
+- otherwise only the uncovered gaps (usually the new tail) are fetched,
+  then merged with the ranges they touch into one contiguous range
+
+Each request first reads the table's data version (RiverReader.
+get_table_version, O(1): MAX(rowid)). When it grew, only the rows added
+since the cached version are read (RiverReader.get_bars_after) and folded
+into the cached ranges they fall in; live scanning therefore fetches just
+the new tail. If the version shrank or the delta cannot be read (e.g. a
+derived timeframe), that pair/timeframe is dropped and refetched.
+In-place UPDATEs keep the version: call invalidate(). Entries are evicted
+least recently used first until the cache fits in max_bytes.
+
+Ranges use the same ISO-8601 text bounds as RiverReader.get_bars, so a
+cached answer is the rows SQL would return.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+
+from .river_reader import RiverReadError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_MAX_BYTES = 256 * 1024**2  # 256 MiB
+
+CacheKey = tuple[str, str]  # (pair, timeframe)
+
+
+@dataclass
+class _Range:
+    """Bars with lo <= timestamp <= hi (ISO text bounds), sorted by timestamp."""
+
+    lo: str
+    hi: str
+    bars: pd.DataFrame
+
+
+@dataclass
+class _Entry:
+    version: Any
+    ranges: list[_Range] = field(default_factory=list)
+    nbytes: int = 0
+
+
+# =============================================================================
+# BAR WINDOW CACHE
+# =============================================================================
+
+
+class BarWindowCache:
+    """
+    Drop-in get_bars() front for a RiverReader.
+
+    Usage:
+        bars = BarWindowCache(RiverReader(caller="cso"))
+        scanner = CSOScanner(river_reader=bars)
+
+    Other reader methods (get_latest_state, is_available, ...) pass through.
+    Returned frames are copies; callers may modify them.
+    """
+
+    def __init__(self, reader: Any, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._reader = reader
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.refreshes = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the cache itself
+        if name == "_reader":
+            raise AttributeError(name)
+        return getattr(self._reader, name)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(entry.nbytes for entry in self._entries.values())
+
+    def get_bars(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """Same result as RiverReader.get_bars, fetching only uncovered gaps."""
+        key = (pair, timeframe)
+        lo, hi = start.isoformat(), end.isoformat()
+        if lo > hi:
+            return self._reader.get_bars(pair, timeframe, start, end)
+        version = self._version(pair, timeframe)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            seen = None if entry is None else entry.version
+            ranges = [] if entry is None else list(entry.ranges)
+
+        if seen != version:
+            ranges = self._refresh(pair, timeframe, ranges, seen, version)
+        gaps = _gaps(ranges, lo, hi)
+
+        fetched = []
+        for gap_lo, gap_hi in gaps:
+            bars = self._reader.get_bars(
+                pair, timeframe, datetime.fromisoformat(gap_lo), datetime.fromisoformat(gap_hi)
+            )
+            fetched.append(_Range(gap_lo, gap_hi, bars))
+
+        with self._lock:
+            if gaps:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.fetches += len(fetched)
+            current = self._entries.get(key)
+            if current is not None and current.version == version:
+                entry = current  # keep ranges another thread added meanwhile
+            else:
+                entry = _Entry(version, ranges)
+            if fetched or current is not entry:
+                entry.ranges = _merge(entry.ranges, fetched, lo, hi)
+                entry.nbytes = sum(_frame_bytes(r.bars) for r in entry.ranges)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            result = _slice(_covering(entry.ranges, lo, hi), lo, hi)
+            self._evict()
+
+        return result
+
+    def get_snapshot(
+        self,
+        requests: Iterable[tuple[str, str, datetime, datetime]],
+        include_states: bool = True,
+    ) -> Any:
+        """
+        RiverReader.get_snapshot served through the cache.
+
+        Each window is consistent with its own table version; states are
+        read live in one query.
+        """
+        from .river_snapshot import RiverSnapshot
+
+        bars = {
+            (pair, timeframe): self.get_bars(pair, timeframe, start, end)
+            for pair, timeframe, start, end in requests
+        }
+        states = self._reader.get_latest_states() if include_states else {}
+        return RiverSnapshot(bars=bars, states=states)
+
+    def invalidate(self, pair: str | None = None, timeframe: str | None = None) -> None:
+        """Drop cached windows (all, one pair, or one pair/timeframe)."""
+        with self._lock:
+            for key in list(self._entries):
+                if (pair is None or key[0] == pair) and (timeframe is None or key[1] == timeframe):
+                    del self._entries[key]
+
+    def _refresh(
+        self, pair: str, timeframe: str, ranges: list[_Range], seen: Any, version: Any
+    ) -> list[_Range]:
+        """
+        Cached ranges brought from version `seen` up to `version`.
+
+        Only rows added after `seen` are read. Returns [] (refetch) when
+        the version did not grow or the reader cannot list new rows.
+        """
+        if not ranges or not isinstance(seen, int) or not isinstance(version, int):
+            return []
+        get_bars_after = getattr(self._reader, "get_bars_after", None)
+        if version < seen or get_bars_after is None:
+            return []
+        try:
+            new, _ = get_bars_after(pair, timeframe, seen)
+        except RiverReadError:
+            return []
+
+        with self._lock:
+            self.refreshes += 1
+        return [_patch(r, new) for r in ranges]
+
+    def _version(self, pair: str, timeframe: str) -> Any:
+        """Data version of the table (None if the reader cannot tell)."""
+        get_version = getattr(self._reader, "get_table_version", None)
+        return None if get_version is None else get_version(pair, timeframe)
+
+    def _evict(self) -> None:
+        """Drop least recently used pair/timeframes until under max_bytes."""
+        total = sum(entry.nbytes for entry in self._entries.values())
+        while total > self._max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.nbytes
+
+
+# =============================================================================
+# RANGE HELPERS
+# =============================================================================
+
+
+def _gaps(ranges: list[_Range], lo: str, hi: str) -> list[tuple[str, str]]:
+    """
+    Sub-intervals of [lo, hi] not covered by `ranges` (sorted, disjoint).
+
+    Gaps include their end points, so boundary bars are fetched twice and
+    de-duplicated on merge.
+    """
+    gaps = []
+    covered_to = None  # [lo, covered_to] is covered once a range overlaps
+    for r in ranges:
+        if r.hi < lo or r.lo > hi:
+            continue
+        start = lo if covered_to is None else covered_to
+        if r.lo > start:
+            gaps.append((start, r.lo))
+        covered_to = r.hi if covered_to is None else max(covered_to, r.hi)
+    if covered_to is None:
+        return [(lo, hi)]
+    if covered_to < hi:
+        gaps.append((covered_to, hi))
+    return gaps
+
+
+def _merge(ranges: list[_Range], fetched: list[_Range], lo: str, hi: str) -> list[_Range]:
+    """Fold fetched gaps and every range touching [lo, hi] into one range."""
+    touching = [r for r in ranges if r.hi >= lo and r.lo <= hi]
+    others = [r for r in ranges if not (r.hi >= lo and r.lo <= hi)]
+    parts = touching + fetched
+    if not parts:
+        return ranges
+    bars = pd.concat([r.bars for r in parts], ignore_index=True)
+    bars = (
+        bars.drop_duplicates("timestamp", keep="last")
+        .sort_values("timestamp", kind="stable")
+        .reset_index(drop=True)
+    )
+    merged = _Range(min(lo, *(r.lo for r in parts)), max(hi, *(r.hi for r in parts)), bars)
+    return sorted([*others, merged], key=lambda r: r.lo)
+
+
+def _patch(r: _Range, new: pd.DataFrame) -> _Range:
+    """Range with new/replaced rows inside its bounds folded in (new rows win)."""
+    ts = new["timestamp"]
+    inside = new[(ts >= r.lo) & (ts <= r.hi)]
+    if inside.empty:
+        return r
+    bars = pd.concat([r.bars, inside], ignore_index=True)
+    bars = (
+        bars.drop_duplicates("timestamp", keep="last")
+        .sort_values("timestamp", kind="stable")
+        .reset_index(drop=True)
+    )
+    return _Range(r.lo, r.hi, bars)
+
+
+def _covering(ranges: list[_Range], lo: str, hi: str) -> _Range:
+    return next(r for r in ranges if r.lo <= lo and r.hi >= hi)
+
+
+def _slice(r: _Range, lo: str, hi: str) -> pd.DataFrame:
+    """Rows with lo <= timestamp <= hi (text comparison, as in SQL)."""
+    ts = r.bars["timestamp"]
+    first = ts.searchsorted(lo, side="left")
+    last = ts.searchsorted(hi, side="right")
+    return r.bars.iloc[first:last].reset_index(drop=True).copy()
+
+
+def _frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
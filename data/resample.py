@@ -0,0 +1,176 @@
+"""
+HTF Resampling — Higher Timeframes Derived on Read
+==================================================
+
+River stores bar tables per (pair, timeframe), but not every pair has
+every timeframe (CSO needs 4H; many pairs only have 1H). When a table is
+missing, RiverReader derives the bars from the finest stored timeframe
+that divides it:
+
+- buckets are aligned to the NY trading day (17:00 NY roll): 4H bars
+  open at 17:00, 21:00, 01:00, 05:00, 09:00, 13:00 NY; 1D bars span one
+  trading day. Timestamps are bucket open times (UTC, ISO text as stored)
+- open/close: first/last base bar; high/low: max/min; volume: sum
+- the last bucket may still be forming, as in a stored HTF table
+
+The per-pair cache of derived bars (HTFResampler) is in river_derived.py.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+NY_TZ = ZoneInfo("America/New_York")
+
+NS_PER_MINUTE = 60 * 10**9
+NS_PER_DAY = 24 * 60 * NS_PER_MINUTE
+
+# Trading day rolls at 17:00 NY (as l1_ny_calendar)
+TRADING_DAY_ROLL_NS = 17 * 60 * NS_PER_MINUTE
+
+# Timeframes RiverReader lists as derivable (when a finer table exists)
+DERIVED_TIMEFRAMES = ("5m", "15m", "30m", "1H", "4H", "1D")
+
+BAR_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+_TIMEFRAME = re.compile(r"^(\d+)(m|H|D)$")
+_UTC_OFFSET = re.compile(r"[+-]\d{2}:?\d{2}$")
+_UNIT_MINUTES = {"m": 1, "H": 60, "D": 24 * 60}
+
+# =============================================================================
+# AGGREGATION
+# =============================================================================
+
+
+def timeframe_nanos(timeframe: str) -> int | None:
+    """
+    Bucket length of a timeframe, None if it cannot be trading-day aligned.
+
+    Intraday lengths must divide 24 hours; "1D" is one trading day.
+    """
+    match = _TIMEFRAME.match(timeframe)
+    if match is None:
+        return None
+    nanos = int(match.group(1)) * _UNIT_MINUTES[match.group(2)] * NS_PER_MINUTE
+    if nanos == 0 or NS_PER_DAY % nanos:
+        return None
+    return nanos
+
+
+def bucket_starts(nanos: np.ndarray, timeframe: str) -> np.ndarray:
+    """
+    UTC epoch nanoseconds of the bucket each bar falls in.
+
+    Buckets follow the NY wall clock from the 17:00 roll, so a 4H bucket
+    holds five hours on the night clocks go back and three on the night
+    they go forward; 1D is always one trading day.
+    """
+    period = timeframe_nanos(timeframe)
+    if period is None:
+        raise ValueError(f"Cannot resample to timeframe: {timeframe}")
+
+    local = pd.DatetimeIndex(nanos, tz="UTC").tz_convert(NY_TZ).tz_localize(None).asi8
+    since_roll = local - TRADING_DAY_ROLL_NS
+    day_start = since_roll // NS_PER_DAY * NS_PER_DAY
+    local_start = day_start + (since_roll - day_start) // period * period + TRADING_DAY_ROLL_NS
+
+    # Back to UTC once per bucket; a bucket opening in the repeated hour
+    # opens at its first occurrence (DST side)
+    unique, inverse = np.unique(local_start, return_inverse=True)
+    utc = (
+        pd.DatetimeIndex(unique)
+        .tz_localize(NY_TZ, ambiguous=np.ones(len(unique), dtype=bool), nonexistent="shift_forward")
+        .asi8
+    )
+    return utc[inverse]
+
+
+def resample_bars(bars: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Aggregate timestamp-sorted OHLCV bars into trading-day aligned buckets."""
+    if bars.empty:
+        return pd.DataFrame({c: bars[c] for c in BAR_COLUMNS}).reset_index(drop=True)
+    return _aggregate(bars, bucket_starts(utc_nanos(bars["timestamp"]), timeframe))
+
+
+def _aggregate(bars: pd.DataFrame, starts: np.ndarray) -> pd.DataFrame:
+    """One row per run of equal bucket starts (vectorized reduceat)."""
+    first = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    last = np.r_[first[1:] - 1, len(starts) - 1]
+
+    return pd.DataFrame(
+        {
+            "timestamp": format_like(starts[first], str(bars["timestamp"].iloc[0])),
+            "open": bars["open"].to_numpy()[first],
+            "high": np.maximum.reduceat(bars["high"].to_numpy(), first),
+            "low": np.minimum.reduceat(bars["low"].to_numpy(), first),
+            "close": bars["close"].to_numpy()[last],
+            "volume": np.add.reduceat(bars["volume"].to_numpy(), first),
+        }
+    )
+
+
+def resample_chunks(chunks: Iterable[pd.DataFrame], timeframe: str) -> pd.DataFrame:
+    """
+    resample_bars over a stream of consecutive chunks (bounded memory).
+
+    Rows of the last bucket of each chunk are carried into the next, so a
+    bucket split across chunks is aggregated once.
+    """
+    parts = []
+    carry: pd.DataFrame | None = None
+    for chunk in chunks:
+        rows = chunk if carry is None else pd.concat([carry, chunk], ignore_index=True)
+        if rows.empty:
+            continue
+        starts = bucket_starts(utc_nanos(rows["timestamp"]), timeframe)
+        cut = int(np.searchsorted(starts, starts[-1], side="left"))
+        if cut:
+            parts.append(_aggregate(rows.iloc[:cut], starts[:cut]))
+        carry = rows.iloc[cut:].reset_index(drop=True)
+    if carry is not None and len(carry):
+        parts.append(resample_bars(carry, timeframe))
+    if not parts:
+        return pd.DataFrame({c: pd.Series(dtype=object) for c in BAR_COLUMNS})
+    return pd.concat(parts, ignore_index=True)
+
+
+def derivation_base(timeframe: str, stored: Iterable[str]) -> str | None:
+    """Finest of the `stored` timeframes whose bars tile `timeframe` buckets."""
+    target = timeframe_nanos(timeframe)
+    if target is None:
+        return None
+    candidates = [
+        (nanos, tf)
+        for tf in stored
+        if (nanos := timeframe_nanos(tf)) is not None and nanos < target and target % nanos == 0
+    ]
+    return min(candidates)[1] if candidates else None
+
+
+def utc_nanos(timestamps: pd.Series) -> np.ndarray:
+    """Epoch nanoseconds of River ISO timestamps."""
+    return pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True, format="ISO8601")).asi8
+
+
+def format_like(nanos: np.ndarray, sample: str) -> np.ndarray:
+    """
+    UTC epoch nanoseconds as text in the layout of River timestamp `sample`.
+
+    Keeps the date/time separator and UTC suffix ("+00:00", "Z" or none),
+    so derived timestamps compare with the base table's as text.
+    """
+    sep = " " if sample[10:11] == " " else "T"
+    suffix = "Z" if sample.endswith("Z") else "+00:00" if _UTC_OFFSET.search(sample) else ""
+    text = pd.DatetimeIndex(nanos, tz="UTC").strftime(f"%Y-%m-%d{sep}%H:%M:%S")
+    return np.asarray(text + suffix, dtype=object)
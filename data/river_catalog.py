@@ -0,0 +1,104 @@
+"""
+River Catalog — Tables, Layers and Latest Pair States
+=====================================================
+
+Metadata queries behind RiverReader's list_* / get_table_columns and
+latest-state methods, on a connection checked out by the reader (and
+shared by river_snapshot.py inside its read transaction):
+
+- bar tables are named pair_timeframe (EURUSD_1H), enrichment tables
+  pair_enrichment_layer (EURUSD_enrichment_L3)
+- pair_state holds timestamped bid/ask ticks per pair
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+
+def stored_timeframes(conn: sqlite3.Connection, pair: str) -> list[str]:
+    """Timeframes with a bar table for `pair`."""
+    # Query sqlite_master for tables matching pair pattern
+    rows = conn.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name LIKE ?
+        ORDER BY name
+        """,
+        (f"{pair}_%",),
+    ).fetchall()
+
+    timeframes = []
+    for (name,) in rows:
+        # Extract timeframe from table name (e.g., EURUSD_1H -> 1H)
+        if "_enrichment_" not in name:
+            parts = name.split("_")
+            if len(parts) >= 2:
+                timeframes.append(parts[-1])
+    return timeframes
+
+
+def stored_layers(conn: sqlite3.Connection, pair: str) -> list[str]:
+    """Enrichment layers with a table for `pair` (e.g., ["L1", "L2"])."""
+    rows = conn.execute(
+        """
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name LIKE ?
+        ORDER BY name
+        """,
+        (f"{pair}_enrichment_%",),
+    ).fetchall()
+
+    prefix = f"{pair}_enrichment_"
+    return [name[len(prefix) :] for (name,) in rows if name.startswith(prefix)]
+
+
+def table_columns(conn: sqlite3.Connection, table_name: str) -> list[tuple[str, str]]:
+    """(column name, declared type) of a validated table, [] if it does not exist."""
+    rows = conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+    return [(row[1], row[2]) for row in rows]
+
+
+# =============================================================================
+# LATEST STATES
+# =============================================================================
+
+
+def latest_states(conn: sqlite3.Connection, caller: str) -> dict[str, dict]:
+    """Latest state of every pair in one query (pair → pair_state dict)."""
+    # SQLite takes bare columns from the row holding MAX(timestamp)
+    rows = conn.execute(
+        """
+        SELECT pair, MAX(timestamp), bid, ask
+        FROM pair_state
+        GROUP BY pair
+        ORDER BY pair
+        """
+    ).fetchall()
+    return {
+        pair: pair_state(pair, timestamp, bid, ask, caller) for pair, timestamp, bid, ask in rows
+    }
+
+
+def pair_state(pair: str, timestamp: str, bid: float, ask: float, caller: str) -> dict:
+    """State dict of one pair_state tick, as RiverReader.get_latest_state returns."""
+    spread = ask - bid
+    mid = (bid + ask) / 2
+
+    return {
+        "pair": pair,
+        "timestamp": timestamp,
+        "bid": bid,
+        "ask": ask,
+        "spread": spread,
+        "mid": mid,
+        "queried_at": datetime.now(UTC).isoformat(),
+        "queried_by": caller,
+    }
@@ -0,0 +1,277 @@
+"""
+River Columnar Reader — RiverReader Interface over a Columnar Snapshot
+=====================================================================
+
+Opens a snapshot written by river_export.export_river() and serves the
+RiverReader read interface from it. Column files are opened with
+np.memmap (read-only); numeric columns are handed out as zero-copy
+views, so any number of processes share one page-cached copy of
+history and pay no load cost.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .bar_arrays import BAR_FIELDS, BarArrays
+from .river_reader import DENIED_CALLERS, RiverAccessDeniedError, RiverReadError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+FORMAT_NAME = "phoenix-river-columnar"
+FORMAT_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+
+
+# =============================================================================
+# COLUMNAR READER
+# =============================================================================
+
+
+@dataclass
+class _Table:
+    """Open column files of one table (numeric data as read-only memmaps)."""
+
+    meta: dict
+    data: dict[str, np.ndarray]
+    nulls: dict[str, np.ndarray]
+    categories: dict[str, np.ndarray]
+
+
+class ColumnarRiverReader:
+    """
+    RiverReader read interface over an export_river() snapshot.
+
+    Usage:
+        reader = ColumnarRiverReader(caller="hunt", snapshot_dir=path)
+        df = reader.get_bars("EURUSD", "1H", start, end)
+
+    Differences from RiverReader:
+    - timestamp columns are datetime64[ns, UTC], not ISO text
+    - numeric columns are read-only views of the mapped files
+      (copy before modifying); integer columns with NULLs and text
+      columns are decoded per call
+    - no live state: get_latest_state() raises RiverReadError
+
+    Column files are mapped lazily on first use and shared by threads.
+    """
+
+    def __init__(self, caller: str, snapshot_dir: Path) -> None:
+        """
+        Open a snapshot.
+
+        Raises:
+            RiverAccessDeniedError: If caller is in DENIED_CALLERS
+            RiverReadError: If the manifest is missing or of another format
+        """
+        if caller.lower() in DENIED_CALLERS:
+            raise RiverAccessDeniedError(
+                f"Caller '{caller}' denied access to River snapshots. "
+                f"Execution must use separate T2-gated path."
+            )
+
+        self._caller = caller.lower()
+        self._dir = Path(snapshot_dir)
+        try:
+            with open(self._dir / MANIFEST_NAME) as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise RiverReadError(f"Failed to open snapshot {self._dir}: {e}") from e
+        if (self._manifest.get("format"), self._manifest.get("version")) != (
+            FORMAT_NAME,
+            FORMAT_VERSION,
+        ):
+            raise RiverReadError(f"Unsupported snapshot format in {self._dir}")
+
+        self._tables: dict[str, _Table] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def manifest(self) -> dict:
+        return self._manifest
+
+    @property
+    def dataset_hash(self) -> str:
+        return self._manifest["dataset_hash"]
+
+    def close(self) -> None:
+        """Drop the mappings (they are reopened on next use)."""
+        with self._lock:
+            self._tables = {}
+
+    def __enter__(self) -> ColumnarRiverReader:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    # =========================================================================
+    # READ INTERFACE
+    # =========================================================================
+
+    def get_bars(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """Bars with start <= timestamp <= end (columns as RiverReader.get_bars)."""
+        table = self._table(f"{pair}_{timeframe}")
+        return self._frame(table, *self._bounds(table, start, end))
+
+    def get_bars_arrays(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        out: BarArrays | None = None,
+    ) -> BarArrays:
+        """
+        Bars as BarArrays (zero-copy views unless `out` is given).
+
+        Raises:
+            RiverReadError: If the table is missing or `out` is too small
+        """
+        table = self._table(f"{pair}_{timeframe}")
+        lo, hi = self._bounds(table, start, end)
+        arrays = [self._column(table, BAR_FIELDS[0], lo, hi)]
+        for field in BAR_FIELDS[1:]:
+            arrays.append(np.asarray(self._column(table, field, lo, hi), dtype=np.float64))
+        if out is None:
+            return BarArrays(*arrays)
+
+        if hi - lo > len(out):
+            raise RiverReadError(
+                f"Failed to get bar arrays: Buffer too small: capacity {len(out)} bars"
+            )
+        for field, array in zip(BAR_FIELDS, arrays, strict=True):
+            getattr(out, field)[: hi - lo] = array
+        return out.head(hi - lo)
+
+    def get_enrichment(
+        self,
+        pair: str,
+        layer: str,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """Enrichment rows with start <= timestamp <= end."""
+        table = self._table(f"{pair}_enrichment_{layer}")
+        return self._frame(table, *self._bounds(table, start, end))
+
+    def get_table_version(self, pair: str, timeframe: str) -> str:
+        """Dataset hash of the exported bar table (a snapshot never changes)."""
+        return self._table_meta(f"{pair}_{timeframe}")["dataset_hash"]
+
+    def get_latest_state(self, pair: str) -> dict:
+        raise RiverReadError(f"Snapshot {self._dir} has no live state for {pair}")
+
+    def list_available_pairs(self) -> list[str]:
+        return sorted({t["pair"] for t in self._manifest["tables"].values()})
+
+    def list_available_timeframes(self, pair: str) -> list[str]:
+        return self._list(pair, "bars", "timeframe")
+
+    def list_available_layers(self, pair: str) -> list[str]:
+        return self._list(pair, "enrichment", "layer")
+
+    def is_available(self) -> bool:
+        return (self._dir / MANIFEST_NAME).exists()
+
+    def has_data_for_pair(self, pair: str, timeframe: str = "1H") -> bool:
+        return f"{pair}_{timeframe}" in self._manifest["tables"]
+
+    # =========================================================================
+    # COLUMN ACCESS
+    # =========================================================================
+
+    def _list(self, pair: str, kind: str, key: str) -> list[str]:
+        tables = self._manifest["tables"].values()
+        return sorted(t[key] for t in tables if t["pair"] == pair and t["kind"] == kind)
+
+    def _table_meta(self, table_name: str) -> dict:
+        meta = self._manifest["tables"].get(table_name)
+        if meta is None:
+            raise RiverReadError(f"No such table in snapshot: {table_name}")
+        return meta
+
+    def _table(self, table_name: str) -> _Table:
+        meta = self._table_meta(table_name)
+        with self._lock:
+            table = self._tables.get(table_name)
+            if table is None:
+                table = self._open(meta)
+                self._tables[table_name] = table
+            return table
+
+    def _open(self, meta: dict) -> _Table:
+        rows = meta["rows"]
+        table = _Table(meta, {}, {}, {})
+        try:
+            for col in meta["columns"]:
+                name = col["name"]
+                table.data[name] = self._map(col["file"], col["dtype"], rows)
+                if "null_file" in col:
+                    table.nulls[name] = self._map(col["null_file"], np.bool_, rows)
+                if "categories_file" in col:
+                    with open(self._dir / col["categories_file"]) as f:
+                        # Trailing None so code -1 (NULL) decodes to None
+                        table.categories[name] = np.array([*json.load(f), None], dtype=object)
+        except (OSError, ValueError) as e:
+            raise RiverReadError(f"Failed to open snapshot columns: {e}") from e
+        return table
+
+    def _map(self, file: str, dtype: Any, rows: int) -> np.ndarray:
+        if rows == 0:  # empty files cannot be mapped
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._dir / file, dtype=dtype, mode="r", shape=(rows,))
+
+    @staticmethod
+    def _bounds(table: _Table, start: datetime, end: datetime) -> tuple[int, int]:
+        """Row slice with start <= timestamp <= end (timestamps are sorted)."""
+        timestamps = table.data["timestamp"]
+        lo = int(timestamps.searchsorted(_to_nanos(start), side="left"))
+        hi = int(timestamps.searchsorted(_to_nanos(end), side="right"))
+        return lo, max(lo, hi)
+
+    @staticmethod
+    def _column(table: _Table, name: str, lo: int, hi: int) -> np.ndarray:
+        """Decoded column slice (a view for numeric columns without NULLs)."""
+        values = np.asarray(table.data[name][lo:hi])
+        if name in table.categories:
+            return table.categories[name][values]
+        nulls = table.nulls.get(name)
+        if nulls is not None and nulls[lo:hi].any():
+            return np.where(nulls[lo:hi], np.nan, values)
+        return values
+
+    def _frame(self, table: _Table, lo: int, hi: int) -> pd.DataFrame:
+        data = {}
+        for col in table.meta["columns"]:
+            values = self._column(table, col["name"], lo, hi)
+            if col["kind"] == "timestamp":
+                values = pd.to_datetime(values, unit="ns", utc=True)
+            data[col["name"]] = values
+        return pd.DataFrame(data, copy=False)
+
+
+def _to_nanos(dt: datetime) -> int:
+    """Epoch nanoseconds (naive datetimes are taken as UTC, as River stores)."""
+    ts = pd.Timestamp(dt)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return int(ts.value)
@@ -0,0 +1,165 @@
+"""
+River Columnar Encoding — Column Files of a River Snapshot
+==========================================================
+
+ColumnWriter appends one River column, chunk by chunk, to the raw
+little-endian files that ColumnarRiverReader maps:
+
+- timestamp: int64 epoch nanoseconds (UTC)
+- float:     float64 (NULL → NaN)
+- int:       int64, plus a c###.null byte mask if any value is NULL
+- text:      int32 codes into c###.json categories (-1 = NULL)
+
+The data and null files are hashed separately and combined at close,
+so a column's sha256 does not depend on how its rows were chunked.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+import pandas as pd
+
+from .river_reader import RiverReadError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# On-disk dtype per column kind (explicitly little-endian)
+KIND_DTYPES = {
+    "timestamp": "<i8",
+    "int": "<i8",
+    "float": "<f8",
+    "text": "<i4",
+}
+
+
+# =============================================================================
+# COLUMN ENCODING
+# =============================================================================
+
+
+def column_kind(name: str, declared: str, values: pd.Series | None = None) -> str:
+    """
+    Encoding for a column: from the values read, else the declared type.
+
+    SQLite columns are dynamically typed, so the first non-NULL values
+    decide; the declared type (SQLite affinity rules) only settles
+    columns with nothing to go on.
+    """
+    if name == "timestamp":
+        return "timestamp"
+    declared = (declared or "").upper()
+    if values is not None and values.notna().any():
+        if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+            return "int"
+        if pd.api.types.is_float_dtype(values):
+            return "int" if "INT" in declared else "float"
+        return "text"
+    if "INT" in declared:
+        return "int"
+    if any(t in declared for t in ("CHAR", "CLOB", "TEXT", "BLOB")) or not declared:
+        return "text"
+    return "float"
+
+
+class ColumnWriter:
+    """Appends encoded chunks of one column to its files."""
+
+    def __init__(self, table_dir: Path, index: int, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self._dir = table_dir
+        self._stem = f"c{index:03d}"
+        self._data = self._open("bin")
+        self._nulls = self._open("null") if kind == "int" else None
+        self._has_null = False
+        self._categories: dict[str, int] = {}
+        self._sha = hashlib.sha256()
+        self._null_sha = hashlib.sha256()
+        self._entry: dict | None = None
+
+    def _open(self, suffix: str) -> IO[bytes]:
+        return open(self._dir / f"{self._stem}.{suffix}", "wb")  # noqa: SIM115
+
+    def append(self, values: pd.Series) -> None:
+        if self.kind == "timestamp":
+            array = _encode_timestamps(self.name, values)
+        elif self.kind == "int":
+            array, nulls = _encode_ints(self.name, values)
+            self._has_null = self._has_null or bool(nulls.any())
+            self._null_sha.update(_write(self._nulls, nulls.view(np.uint8)))
+        elif self.kind == "float":
+            array = pd.to_numeric(values).to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            array = _encode_text(self.name, values, self._categories)
+        self._sha.update(_write(self._data, array.astype(KIND_DTYPES[self.kind], copy=False)))
+
+    def close(self) -> dict:
+        """Close the files (idempotent); returns the column's manifest entry."""
+        if self._entry is not None:
+            return self._entry
+        self._data.close()
+        entry = {
+            "name": self.name,
+            "kind": self.kind,
+            "dtype": KIND_DTYPES[self.kind],
+            "file": f"{self._dir.name}/{self._stem}.bin",
+        }
+        if self._nulls is not None:
+            self._nulls.close()
+            if self._has_null:
+                entry["null_file"] = f"{self._dir.name}/{self._stem}.null"
+                self._sha.update(self._null_sha.digest())
+            else:
+                (self._dir / f"{self._stem}.null").unlink()
+        if self.kind == "text":
+            categories = sorted(self._categories, key=self._categories.__getitem__)
+            with open(self._dir / f"{self._stem}.json", "w") as f:
+                json.dump(categories, f)
+            self._sha.update(json.dumps(categories).encode())
+            entry["categories_file"] = f"{self._dir.name}/{self._stem}.json"
+        entry["sha256"] = self._sha.hexdigest()
+        self._entry = entry
+        return entry
+
+
+def _write(f: IO[bytes], array: np.ndarray) -> bytes:
+    """Write the array's raw bytes; returns them for hashing."""
+    buffer = np.ascontiguousarray(array).tobytes()
+    f.write(buffer)
+    return buffer
+
+
+def _encode_timestamps(name: str, values: pd.Series) -> np.ndarray:
+    parsed = pd.to_datetime(values, utc=True, format="ISO8601")
+    if parsed.isna().any():
+        raise RiverReadError(f"Column {name}: NULL or unparseable timestamp")
+    return pd.DatetimeIndex(parsed).asi8
+
+
+def _encode_ints(name: str, values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    numbers = pd.to_numeric(values).to_numpy(dtype=np.float64, na_value=np.nan)
+    nulls = np.isnan(numbers)
+    numbers[nulls] = 0
+    if not np.array_equal(numbers, np.round(numbers)):
+        raise RiverReadError(f"Column {name}: non-integer value in integer column")
+    return numbers.astype(np.int64), nulls
+
+
+def _encode_text(name: str, values: pd.Series, categories: dict[str, int]) -> np.ndarray:
+    """Codes into the column's growing category table (-1 = NULL)."""
+    local, uniques = pd.factorize(values)
+    ids = []
+    for value in uniques:
+        if not isinstance(value, str):
+            raise RiverReadError(f"Column {name}: unsupported {type(value).__name__} value")
+        ids.append(categories.setdefault(value, len(categories)))
+    # Trailing -1 so local code -1 (NULL) maps to -1
+    lookup = np.array([*ids, -1], dtype=np.int32)
+    return lookup[local]
@@ -0,0 +1,213 @@
+"""
+River Derived Timeframes — Cached HTF Bars for Missing Tables
+=============================================================
+
+When a (pair, timeframe) table does not exist, RiverReader.get_bars
+derives the bars from the finest stored timeframe that divides it
+(aggregation in resample.py).
+
+Derived bars are cached per (pair, timeframe) together with the base
+table version they cover (RiverReader.get_table_version). When the base
+table moves, only the bars from the earliest bucket touched by new base
+rows (RiverReader.get_bars_after) onwards are re-aggregated. Buckets are
+selected on parsed timestamps, so any ISO layout River stores (naive,
+"+00:00", "Z", space-separated) extends exactly as a rebuild would.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from .resample import (
+    DERIVED_TIMEFRAMES,
+    bucket_starts,
+    derivation_base,
+    resample_bars,
+    resample_chunks,
+    timeframe_nanos,
+    utc_nanos,
+)
+from .river_reader import RiverReadError
+
+if TYPE_CHECKING:
+    from .river_reader import RiverReader
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bounds covering all River history (ISO text comparison, any layout)
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_END = datetime(9999, 12, 31, tzinfo=UTC)
+
+
+# =============================================================================
+# CACHED RESAMPLER
+# =============================================================================
+
+
+@dataclass
+class _Derived:
+    base: str  # base timeframe
+    version: int  # base table version covered (0: empty)
+    bars: pd.DataFrame
+    starts: np.ndarray  # UTC epoch nanoseconds of bars["timestamp"]
+
+
+class HTFResampler:
+    """
+    Derived-timeframe bars for a RiverReader, cached and extended in place.
+
+    Used by RiverReader for timeframes without a stored table; reads go
+    through the reader's public methods.
+    """
+
+    def __init__(self, reader: RiverReader) -> None:
+        self._reader = reader
+        self._entries: dict[tuple[str, str], _Derived] = {}
+        self._lock = threading.Lock()
+
+    def base_timeframe(self, pair: str, timeframe: str) -> str | None:
+        """Finest stored timeframe that `timeframe` can be built from (None if none)."""
+        return derivation_base(timeframe, self._reader.list_available_timeframes(pair))
+
+    def get_bars(self, pair: str, timeframe: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """Derived bars with start <= timestamp <= end (as RiverReader.get_bars)."""
+        bars, starts = self._refresh(pair, timeframe)
+        lo = starts.searchsorted(_utc_ns(start), side="left")
+        hi = starts.searchsorted(_utc_ns(end), side="right")
+        return bars.iloc[lo:hi].reset_index(drop=True)
+
+    def get_table_version(self, pair: str, timeframe: str) -> int | None:
+        """Version of the base table the derived bars come from."""
+        base = self._base(pair, timeframe)
+        return self._reader.get_table_version(pair, base)
+
+    def derive_bars(
+        self, pair: str, timeframe: str, start: datetime, end: datetime, missing: Exception
+    ) -> pd.DataFrame:
+        """
+        RiverReader.get_bars fallback after its table read failed with `missing`.
+
+        Raises:
+            RiverReadError: If no stored timeframe derives `timeframe`, or
+                resampling fails
+        """
+        try:
+            if self.base_timeframe(pair, timeframe) is None:
+                raise RiverReadError(f"Failed to get bars: {missing}") from missing
+            return self.get_bars(pair, timeframe, start, end)
+
+        except RiverReadError:
+            raise
+        except Exception as e:
+            raise RiverReadError(f"Failed to derive {timeframe} bars: {e}") from e
+
+    def derive_table_version(self, pair: str, timeframe: str, missing: Exception) -> int | None:
+        """RiverReader.get_table_version fallback: a derived table changes with its base."""
+        if self.base_timeframe(pair, timeframe) is None:
+            raise RiverReadError(f"Failed to get table version: {missing}") from missing
+        return self.get_table_version(pair, timeframe)
+
+    def invalidate(self, pair: str | None = None) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                if pair is None or key[0] == pair:
+                    del self._entries[key]
+
+    def _base(self, pair: str, timeframe: str) -> str:
+        base = self.base_timeframe(pair, timeframe)
+        if base is None:
+            raise ValueError(f"No stored timeframe to derive {pair} {timeframe} from")
+        return base
+
+    def _refresh(self, pair: str, timeframe: str) -> tuple[pd.DataFrame, np.ndarray]:
+        """Bars (and their starts) brought up to the current base table version."""
+        key = (pair, timeframe)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._build(pair, timeframe)
+            else:
+                version = self._reader.get_table_version(pair, entry.base) or 0
+                if version < entry.version:  # rows deleted: start over
+                    entry = self._build(pair, timeframe)
+                elif version > entry.version:
+                    self._extend(pair, timeframe, entry)
+            self._entries[key] = entry
+            return entry.bars, entry.starts
+
+    def _build(self, pair: str, timeframe: str) -> _Derived:
+        base = self._base(pair, timeframe)
+        version = self._reader.get_table_version(pair, base) or 0
+        chunks = (c.new for c in self._reader.iter_bars(pair, base, _EPOCH, _END))
+        bars = resample_chunks(chunks, timeframe)
+        return _Derived(base, version, bars, utc_nanos(bars["timestamp"]))
+
+    def _extend(self, pair: str, timeframe: str, entry: _Derived) -> None:
+        """Re-aggregate from the earliest bucket touched by new base rows."""
+        new, version = self._reader.get_bars_after(pair, entry.base, entry.version)
+        if new.empty:
+            entry.version = version
+            return
+
+        earliest = bucket_starts(utc_nanos(new["timestamp"]), timeframe).min()
+        # get_bars bounds are text: start a day early (every ISO layout sorts
+        # by its date prefix), then cut exactly on parsed timestamps
+        since = pd.Timestamp(earliest, tz="UTC").to_pydatetime() - timedelta(days=1)
+        base = self._reader.get_bars(pair, entry.base, since, _END)
+        tail = resample_bars(base[utc_nanos(base["timestamp"]) >= earliest], timeframe)
+
+        cut = int(entry.starts.searchsorted(earliest, side="left"))
+        entry.starts = np.r_[entry.starts[:cut], utc_nanos(tail["timestamp"])]
+        if cut and len(tail):
+            entry.bars = pd.concat([entry.bars.iloc[:cut], tail], ignore_index=True)
+        elif cut:
+            entry.bars = entry.bars.iloc[:cut]
+        else:
+            entry.bars = tail
+        entry.version = version
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def derivable_timeframes(stored: list[str]) -> list[str]:
+    """Timeframes without a table in `stored` that one of them derives."""
+    return [
+        tf
+        for tf in DERIVED_TIMEFRAMES
+        if tf not in stored and derivation_base(tf, stored) is not None
+    ]
+
+
+def base_window(timeframe: str, start: datetime, end: datetime) -> tuple[datetime, datetime]:
+    """get_bars bounds of the base rows of every bucket opening in [start, end]."""
+    period = timedelta(microseconds=timeframe_nanos(timeframe) // 1000)
+    return start - timedelta(days=1), end + period + timedelta(days=1)
+
+
+def resample_window(
+    base: pd.DataFrame, timeframe: str, start: datetime, end: datetime
+) -> pd.DataFrame:
+    """Buckets opening in [start, end] from base rows read with base_window."""
+    bars = resample_bars(base, timeframe)
+    starts = utc_nanos(bars["timestamp"])
+    keep = (starts >= _utc_ns(start)) & (starts <= _utc_ns(end))
+    return bars[keep].reset_index(drop=True)
+
+
+def _utc_ns(moment: datetime) -> int:
+    """Epoch nanoseconds of a datetime (naive: UTC, as River timestamps)."""
+    ts = pd.Timestamp(moment)
+    return (ts if ts.tzinfo else ts.tz_localize(UTC)).value
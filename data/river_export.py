@@ -0,0 +1,216 @@
+"""
+River Columnar Export — Memory-Mapped Snapshots for Research Workloads
+======================================================================
+
+Hunt and CFP research scan the same history over and over; through
+SQLite every scan pays for row decoding again. export_river() streams
+each `{pair}_{timeframe}` table and its `{pair}_enrichment_{layer}`
+tables once into a snapshot directory:
+
+    snapshot/
+        manifest.json               tables, columns, row counts, hashes
+        EURUSD_1H/c000.bin          one raw little-endian file per column
+        EURUSD_enrichment_L3/...
+
+Column encodings:
+- timestamp: int64 epoch nanoseconds (UTC)
+- float:     float64 (NULL → NaN)
+- int:       int64, plus a c###.null byte mask if any value is NULL
+- text:      int32 codes into c###.json categories (-1 = NULL)
+
+ColumnarRiverReader (river_columnar.py) serves the RiverReader read
+interface from a snapshot.
+
+The manifest records the TruthTeller dataset hash of every bar table, a
+sha256 of every table's column data and one dataset_hash over all of
+them. Column hashes do not depend on chunk_rows. A snapshot is written
+to a temporary directory and renamed into place when complete.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from contracts.truth_teller import TruthTeller
+
+from .bar_arrays import BAR_FIELDS
+from .river_columnar import FORMAT_NAME, FORMAT_VERSION, MANIFEST_NAME
+from .river_columnar_writer import ColumnWriter, column_kind
+from .river_paging import RiverChunk
+from .river_reader import DEFAULT_CHUNK_ROWS, RiverReader, RiverReadError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Lower bound covering all River history
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+
+def export_river(
+    reader: RiverReader,
+    out_dir: Path,
+    pairs: list[str] | None = None,
+    timeframes: list[str] | None = None,
+    layers: list[str] | None = None,
+    as_of: datetime | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> dict:
+    """
+    Export River tables to a memory-mapped columnar snapshot.
+
+    Args:
+        reader: Source RiverReader (all reads go through it)
+        out_dir: Snapshot directory to create (must not exist)
+        pairs: Pairs to export (default: all pairs in River)
+        timeframes: Bar timeframes to export (default: all per pair)
+        layers: Enrichment layers to export (default: all per pair; [] for none)
+        as_of: Last bar timestamp included (default: now); rows appended
+            while the export runs are not included
+        chunk_rows: Rows read per chunk (bounds memory)
+
+    Returns:
+        The manifest (also written to out_dir/manifest.json)
+
+    Raises:
+        FileExistsError: If out_dir exists
+        RiverReadError: If a table cannot be read or encoded
+    """
+    out_dir = Path(out_dir)
+    if out_dir.exists():
+        raise FileExistsError(f"Snapshot directory exists: {out_dir}")
+    as_of = as_of or datetime.now(UTC)
+
+    partial = out_dir.with_name(f".{out_dir.name}.partial")
+    if partial.exists():
+        shutil.rmtree(partial)
+    partial.mkdir(parents=True)
+
+    try:
+        tables = {}
+        for pair in pairs if pairs is not None else reader.list_available_pairs():
+            available = reader.list_available_timeframes(pair)
+            for timeframe in timeframes if timeframes is not None else available:
+                if timeframe not in available:
+                    continue
+                table_name = f"{pair}_{timeframe}"
+                tables[table_name] = _export_table(
+                    reader,
+                    partial,
+                    table_name,
+                    reader.iter_bars(pair, timeframe, _EPOCH, as_of, chunk_rows),
+                    BAR_FIELDS,
+                    {"kind": "bars", "pair": pair, "timeframe": timeframe},
+                )
+
+            available = reader.list_available_layers(pair)
+            for layer in layers if layers is not None else available:
+                if layer not in available:
+                    continue
+                table_name = f"{pair}_enrichment_{layer}"
+                tables[table_name] = _export_table(
+                    reader,
+                    partial,
+                    table_name,
+                    reader.iter_enrichment(pair, layer, _EPOCH, as_of, chunk_rows),
+                    None,
+                    {"kind": "enrichment", "pair": pair, "layer": layer},
+                )
+
+        manifest = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "as_of": as_of.isoformat(),
+            "dataset_hash": _combined_hash(tables),
+            "tables": tables,
+        }
+        with open(partial / MANIFEST_NAME, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        os.rename(partial, out_dir)
+    except BaseException:
+        shutil.rmtree(partial, ignore_errors=True)
+        raise
+
+    return manifest
+
+
+def _export_table(
+    reader: RiverReader,
+    snapshot_dir: Path,
+    table_name: str,
+    chunks: Iterator[RiverChunk],
+    only_columns: tuple[str, ...] | None,
+    meta: dict,
+) -> dict:
+    """Stream one table into column files; returns its manifest entry."""
+    declared = dict(reader.get_table_columns(table_name))
+    table_dir = snapshot_dir / table_name
+    table_dir.mkdir()
+
+    teller = TruthTeller() if meta["kind"] == "bars" else None
+    chain_hash = "0" * 16
+    writers: list[ColumnWriter] | None = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            data = chunk.new
+            if writers is None:
+                writers = [
+                    ColumnWriter(table_dir, i, name, column_kind(name, declared[name], values))
+                    for i, (name, values) in enumerate(data.items())
+                ]
+            for writer in writers:
+                writer.append(data[writer.name])
+            if teller is not None:
+                chain_hash = teller.compute_dataset_hash(data, chain_hash)
+            rows += len(data)
+
+        if writers is None:  # empty table: kinds from declared types only
+            names = only_columns or tuple(declared)
+            writers = [
+                ColumnWriter(table_dir, i, name, column_kind(name, declared.get(name, "")))
+                for i, name in enumerate(names)
+            ]
+        columns = [writer.close() for writer in writers]
+    except RiverReadError:
+        raise
+    except Exception as e:
+        raise RiverReadError(f"Failed to export {table_name}: {e}") from e
+    finally:
+        for writer in writers or ():
+            writer.close()
+
+    entry = {**meta, "rows": rows, "columns": columns}
+    entry["sha256"] = hashlib.sha256(
+        "|".join(col["sha256"] for col in columns).encode()
+    ).hexdigest()
+    if teller is not None:
+        entry["dataset_hash"] = chain_hash
+    return entry
+
+
+def _combined_hash(tables: dict[str, dict]) -> str:
+    """One hash over every table (dataset hash for bars, data sha256 otherwise)."""
+    digest = hashlib.sha256()
+    for name in sorted(tables):
+        table = tables[name]
+        digest.update(f"{name}|{table.get('dataset_hash', table['sha256'])}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+# =============================================================================
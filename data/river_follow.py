@@ -0,0 +1,222 @@
+"""
+River Follow — Tail-Follow Subscriptions for New Bars
+=====================================================
+
+Consumers found new bars by re-querying a time window on a timer. A
+subscription instead keeps a high-water mark per (pair, timeframe) — the
+table version (RiverReader.get_table_version, MAX(rowid)) it has already
+delivered — and poll() returns only rows added after it.
+
+Change detection is two-level, shared by every subscription of one
+RiverFollower (subscriptions live in river_subscription.py):
+- PRAGMA data_version on one dedicated connection: unchanged means no
+  commit anywhere in River since the last check, so an idle poll costs
+  one PRAGMA and no table reads
+- on change, get_table_version per followed table; only tables that
+  moved are read
+
+Create one follower per process. With start(), a single background
+thread polls and delivers new bars to subscription callbacks (the hook
+for driving CSO / Shadow from new bars instead of fixed timers).
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from .river_pool import RiverConnectionPool
+from .river_reader import RiverReader, RiverReadError
+from .river_subscription import FollowKey, NewBars, RiverSubscription
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Seconds between data_version checks of a started follower
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+# =============================================================================
+# FOLLOWER (one poller per process)
+# =============================================================================
+
+
+class RiverFollower:
+    """
+    Shared change detection for tail-follow subscriptions.
+
+    Usage:
+        follower = RiverFollower(RiverReader(caller="cso"))
+        sub = follower.subscribe([("EURUSD", "1H"), ("GBPUSD", "1H")])
+        new_bars = sub.poll()          # {} while River is idle
+
+        follower.subscribe([("EURUSD", "4H")], callback=on_new_bars)
+        follower.start()               # one thread for every subscription
+    """
+
+    def __init__(
+        self,
+        reader: RiverReader,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self._reader = reader
+        self._poll_interval = poll_interval
+        # data_version is per connection: always check on the same one
+        self._version_pool = RiverConnectionPool(reader.river_path, max_connections=1)
+
+        self._lock = threading.Lock()
+        self._data_version: int | None = None
+        self._versions: dict[FollowKey, int | None] = {}
+        self._subscriptions: list[RiverSubscription] = []
+
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        self.checks = 0
+        self.refreshes = 0
+
+    @property
+    def reader(self) -> RiverReader:
+        return self._reader
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def subscribe(
+        self,
+        keys: Iterable[FollowKey],
+        since: datetime | None = None,
+        callback: Callable[[NewBars], None] | None = None,
+    ) -> RiverSubscription:
+        """
+        Follow (pair, timeframe) tables.
+
+        Args:
+            keys: (pair, timeframe) tables to follow
+            since: Also deliver existing bars with timestamp >= since
+                (default: only bars added from now on)
+            callback: Called with new bars by the started follower's thread
+
+        Raises:
+            RiverReadError: If a table cannot be read
+        """
+        keys = list(dict.fromkeys(keys))
+        versions = {key: self._reader.get_table_version(*key) for key in keys}
+        marks = {key: 0 if since is not None else (versions[key] or 0) for key in keys}
+
+        subscription = RiverSubscription(self, marks, since, callback)
+        with self._lock:
+            for key, version in versions.items():
+                self._versions.setdefault(key, version)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def version(self, key: FollowKey) -> int | None:
+        """Last seen table version of a followed table."""
+        with self._lock:
+            return self._versions.get(key)
+
+    def check(self) -> bool:
+        """
+        Refresh followed table versions if River changed since the last check.
+
+        Returns:
+            True if any followed table moved (waiting subscriptions are woken)
+
+        Raises:
+            RiverReadError: If a query fails
+        """
+        with self._lock:
+            self.checks += 1
+            try:
+                with self._version_pool.connection() as conn:
+                    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            except Exception as e:
+                raise RiverReadError(f"Failed to check River data version: {e}") from e
+            if data_version == self._data_version:
+                return False
+
+            # Read after data_version: a commit in between is seen next check
+            self._data_version = data_version
+            self.refreshes += 1
+            moved = set()
+            for key, old in self._versions.items():
+                new = self._reader.get_table_version(*key)
+                if new != old:
+                    self._versions[key] = new
+                    moved.add(key)
+            woken = [s for s in self._subscriptions if moved.intersection(s.keys)]
+
+        for subscription in woken:
+            subscription._wakeup.set()
+        return bool(moved)
+
+    def _unsubscribe(self, subscription: RiverSubscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            followed = {key for s in self._subscriptions for key in s.keys}
+            for key in list(self._versions):
+                if key not in followed:
+                    del self._versions[key]
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> None:
+        """Poll in a background thread and deliver new bars to callbacks."""
+        if self._thread is not None:
+            logger.warning("River follower already running")
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop and close the version connection (the reader is left open)."""
+        self.stop()
+        self._version_pool.close()
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self.check():
+                    self._dispatch()
+            except Exception as e:
+                logger.error(f"River follow poll error: {e}")
+
+            self._stop_event.wait(self._poll_interval)
+
+    def _dispatch(self) -> None:
+        """Deliver new bars to subscriptions with a callback."""
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s._callback is not None]
+
+        for subscription in subscriptions:
+            try:
+                new = subscription._collect()
+                if new:
+                    subscription._callback(new)
+            except Exception as e:
+                logger.error(f"River follow callback error: {e}")
@@ -0,0 +1,179 @@
+"""
+River Paging — Chunked Streaming of River Tables
+================================================
+
+RiverReader.iter_bars / iter_enrichment stream a time range in chunks
+instead of loading it whole:
+
+- by rows: keyset pagination on (timestamp, rowid), so each page is one
+  index seek however deep into the table it starts
+- by span: consecutive [lo, lo + span) time windows
+
+Each chunk may repeat the trailing rows of the previous one as warmup
+for windowed consumers (swing lookback, ATR).
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from .river_reader import RiverReadError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Smallest rowid: keyset start that includes every row at `start`
+_MIN_ROWID = -(2**63)
+
+Connect = Callable[[], AbstractContextManager[sqlite3.Connection]]
+
+
+# =============================================================================
+# CHUNK
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RiverChunk:
+    """
+    One chunk of a streamed River range (RiverReader.iter_bars).
+
+    The first `warmup` rows repeat the end of the previous chunk so that
+    windowed consumers (swing lookback, ATR) have context; `new` is the
+    part not seen before.
+    """
+
+    data: pd.DataFrame
+    warmup: int = 0
+
+    @property
+    def new(self) -> pd.DataFrame:
+        return self.data.iloc[self.warmup :]
+
+
+# =============================================================================
+# PAGINATION
+# =============================================================================
+
+
+def iter_chunks(
+    connect: Connect,
+    table_name: str,
+    columns: str,
+    start: datetime,
+    end: datetime,
+    chunk_rows: int,
+    chunk_span: timedelta | None,
+    overlap: int,
+) -> Iterator[RiverChunk]:
+    """
+    Chunks of `table_name` rows with start <= timestamp <= end.
+
+    `connect` checks out a read-only connection (RiverReader._connection);
+    the table name must already be validated.
+    """
+    if chunk_span is None and chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+    if chunk_span is not None and chunk_span <= timedelta(0):
+        raise ValueError(f"chunk_span must be positive, got {chunk_span}")
+    if overlap < 0:
+        raise ValueError(f"overlap must be >= 0, got {overlap}")
+
+    if chunk_span is None:
+        pages = _pages_by_rows(connect, table_name, columns, start, end, chunk_rows)
+    else:
+        pages = _pages_by_span(connect, table_name, columns, start, end, chunk_span)
+
+    tail = None
+    for page in pages:
+        if page.empty:
+            continue
+        if tail is not None and len(tail):
+            data = pd.concat([tail, page], ignore_index=True)
+            chunk = RiverChunk(data, warmup=len(tail))
+        else:
+            chunk = RiverChunk(page.reset_index(drop=True))
+        # Copy so the previous chunk's block can be freed
+        tail = chunk.data.iloc[max(0, len(chunk.data) - overlap) :].copy() if overlap else None
+        yield chunk
+
+
+def _pages_by_rows(
+    connect: Connect,
+    table_name: str,
+    columns: str,
+    start: datetime,
+    end: datetime,
+    chunk_rows: int,
+) -> Iterator[pd.DataFrame]:
+    """Keyset pagination: each page starts after the last (timestamp, rowid)."""
+    # Table name validated by caller, SQL injection not possible
+    safe_query = f"""
+        SELECT rowid AS _river_rowid, {columns}
+        FROM "{table_name}"
+        WHERE (timestamp, rowid) > (?, ?) AND timestamp <= ?
+        ORDER BY timestamp ASC, rowid ASC
+        LIMIT ?
+    """  # noqa: S608
+
+    key = (start.isoformat(), _MIN_ROWID)
+    while True:
+        try:
+            with connect() as conn:
+                page = pd.read_sql_query(
+                    safe_query, conn, params=(*key, end.isoformat(), chunk_rows)
+                )
+        except Exception as e:
+            raise RiverReadError(f"Failed to stream {table_name}: {e}") from e
+
+        if page.empty:
+            return
+        key = (page["timestamp"].iloc[-1], int(page["_river_rowid"].iloc[-1]))
+        yield page.drop(columns="_river_rowid")
+        if len(page) < chunk_rows:
+            return
+
+
+def _pages_by_span(
+    connect: Connect,
+    table_name: str,
+    columns: str,
+    start: datetime,
+    end: datetime,
+    span: timedelta,
+) -> Iterator[pd.DataFrame]:
+    """Consecutive [lo, lo + span) windows; the last one includes `end`."""
+    # Table name validated by caller, SQL injection not possible
+    safe_query = f"""
+        SELECT {columns}
+        FROM "{table_name}"
+        WHERE timestamp >= ? AND (timestamp < ? OR (? AND timestamp = ?))
+        ORDER BY timestamp ASC, rowid ASC
+    """  # noqa: S608
+
+    lo = start
+    while lo <= end:
+        hi = min(lo + span, end)
+        last = hi == end
+        try:
+            with connect() as conn:
+                page = pd.read_sql_query(
+                    safe_query,
+                    conn,
+                    params=(lo.isoformat(), hi.isoformat(), last, hi.isoformat()),
+                )
+        except Exception as e:
+            raise RiverReadError(f"Failed to stream {table_name}: {e}") from e
+        yield page
+        if last:
+            return
+        lo = hi
@@ -0,0 +1,224 @@
+"""
+River Connection Pool — Read-Only SQLite Connections for Concurrent Readers
+============================================================================
+
+A sqlite3.Connection must not be used by two threads at once, so a single
+RiverReader handle serializes every consumer. The pool hands each thread
+its own read-only connection for the duration of a query (checkout /
+return) and reuses idle connections afterwards.
+
+Every connection is:
+- opened with `uri=True` and `?mode=ro` (physical read-only)
+- set to `PRAGMA query_only` (second line of defence)
+- tuned for read-heavy use: memory-mapped I/O and a large page cache
+
+Connections are created lazily up to max_connections; further checkouts
+wait for one to be returned. ReaderPool is a RiverReader's handle on its
+pool: shared with other readers, or owned and created on first use.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Memory-mapped I/O window per connection (bytes)
+DEFAULT_MMAP_SIZE = 256 * 1024**2
+
+# Page cache per connection (KiB; passed to PRAGMA cache_size as negative)
+DEFAULT_CACHE_KIB = 64 * 1024
+
+DEFAULT_MAX_CONNECTIONS = min(8, os.cpu_count() or 1)
+
+# Seconds a checkout waits for a free connection
+DEFAULT_CHECKOUT_TIMEOUT = 30.0
+
+
+class RiverPoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes free in time."""
+
+    pass
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+
+class RiverConnectionPool:
+    """
+    Bounded pool of read-only River connections.
+
+    Usage:
+        pool = RiverConnectionPool(river_path, max_connections=8)
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+
+    A connection is used by one thread at a time (the one that checked it
+    out), so it is opened with check_same_thread=False to allow reuse by
+    whichever thread checks it out next.
+    """
+
+    def __init__(
+        self,
+        river_path: Path,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        cache_kib: int = DEFAULT_CACHE_KIB,
+        checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {max_connections}")
+
+        self._river_path = Path(river_path)
+        self._max_connections = max_connections
+        self._mmap_size = mmap_size
+        self._cache_kib = cache_kib
+        self._checkout_timeout = checkout_timeout
+
+        self._cond = threading.Condition()
+        self._idle: list[sqlite3.Connection] = []
+        self._open = 0
+        self._closed = False
+
+    @property
+    def river_path(self) -> Path:
+        return self._river_path
+
+    @property
+    def max_connections(self) -> int:
+        return self._max_connections
+
+    @property
+    def open_connections(self) -> int:
+        """Connections currently open (idle + checked out)."""
+        with self._cond:
+            return self._open
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open one tuned read-only connection."""
+        # READ-ONLY connection via URI
+        # https://www.sqlite.org/uri.html
+        uri = f"file:{self._river_path}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+            conn.execute(f"PRAGMA cache_size = {-int(self._cache_kib)}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("River connection pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self._max_connections:
+                    self._open += 1
+                    break
+                if not self._cond.wait(self._checkout_timeout):
+                    raise RiverPoolTimeoutError(
+                        f"No River connection free after {self._checkout_timeout}s "
+                        f"({self._max_connections} in use)"
+                    )
+
+        # Open outside the lock so slow opens do not block returns
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def _return(self, conn: sqlite3.Connection) -> None:
+        with self._cond:
+            if self._closed:
+                self._open -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the calling thread."""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._return(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+
+# =============================================================================
+# READER POOL
+# =============================================================================
+
+
+class ReaderPool:
+    """
+    The connection pool behind one RiverReader.
+
+    Either shared (passed in; close() leaves it open for its other
+    readers) or owned (created on first use, closed by close() and
+    reopened by the next query).
+    """
+
+    def __init__(
+        self,
+        river_path: Path,
+        pool: RiverConnectionPool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        self._river_path = pool.river_path if pool is not None else Path(river_path)
+        self._shared = pool
+        self._pool = pool
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+
+    @property
+    def river_path(self) -> Path:
+        return self._river_path
+
+    def get(self) -> RiverConnectionPool:
+        with self._lock:
+            if self._pool is None:
+                self._pool = RiverConnectionPool(self._river_path, self._max_connections)
+            return self._pool
+
+    def connection(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Check out a read-only connection for the calling thread."""
+        return self.get().connection()
+
+    def close(self) -> None:
+        """Close an owned pool (a shared pool is left open)."""
+        with self._lock:
+            pool, self._pool = self._pool, self._shared
+        if pool is not None and pool is not self._shared:
+            pool.close()
@@ -23,19 +23,43 @@ ALLOWED CALLERS:
 DENIED CALLERS:
 - Execution (uses separate path with T2 gates)
 
+CONCURRENCY:
+- Queries check out a connection from a RiverConnectionPool, so threads
+  sharing one reader (or readers sharing one pool) run in parallel
+
+RiverReader is a facade; the work behind its newer methods lives in
+sibling modules:
+- river_pool.py: pooled read-only connections
+- bar_arrays.py: get_bars_arrays (typed arrays, no DataFrame)
+- river_versions.py: get_table_version / get_bars_after (bar_cache.py,
+  river_follow.py)
+- river_paging.py: iter_bars / iter_enrichment (chunked streaming)
+- river_snapshot.py: get_snapshot (one read transaction)
+- river_derived.py: timeframes derived from a finer stored table
+
 INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
 """
 
 from __future__ import annotations
 
 import sqlite3
-from datetime import UTC, datetime
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .river_pool import DEFAULT_MAX_CONNECTIONS, ReaderPool, RiverConnectionPool
+
 if TYPE_CHECKING:
     import pandas as pd
 
+    from .bar_arrays import BarArrays
+    from .river_derived import HTFResampler
+    from .river_paging import RiverChunk
+    from .river_snapshot import RiverSnapshot
+
 
 # =============================================================================
 # CONSTANTS
@@ -50,6 +74,11 @@ ALLOWED_CALLERS = frozenset({"hunt", "cso", "briefing", "shadow", "athena"})
 # Denied callers (enforcement is documentation + code review)
 DENIED_CALLERS = frozenset({"execution"})
 
+# Rows per chunk for iter_bars / iter_enrichment
+DEFAULT_CHUNK_ROWS = 100_000
+
+BAR_COLUMNS = "timestamp, open, high, low, close, volume"
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -78,10 +107,16 @@ class RiverReader:
     Read-only access to River data.
 
     PHYSICAL READ-ONLY ENFORCEMENT:
-    - Connection opened with `uri=True` and `?mode=ro`
+    - Connections opened with `uri=True` and `?mode=ro`
     - No write methods exist in this class
     - Any attempt to execute write SQL will fail at database level
 
+    THREAD SAFETY:
+    - Each query checks out its own pooled connection; a reader may be
+      shared by many threads
+    - Pass `pool=` to share one pool across readers (the reader then does
+      not close it)
+
     Usage:
         reader = RiverReader(caller="hunt")
         df = reader.get_bars("EURUSD", "1H", start, end)
@@ -91,6 +126,8 @@ class RiverReader:
         self,
         caller: str,
         river_path: Path | None = None,
+        pool: RiverConnectionPool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ) -> None:
         """
         Initialize River reader.
@@ -98,6 +135,8 @@ class RiverReader:
         Args:
             caller: Identifier of calling module (for access control)
             river_path: Path to River database (default: ~/nex/river.db)
+            pool: Shared connection pool (default: one owned by this reader)
+            max_connections: Size of the owned pool
 
         Raises:
             RiverAccessDeniedError: If caller is in DENIED_CALLERS
@@ -111,30 +150,27 @@ class RiverReader:
             )
 
         self._caller = caller_lower
-        self._river_path = river_path or DEFAULT_RIVER_PATH
-        self._conn: sqlite3.Connection | None = None
+        self._pool = ReaderPool(river_path or DEFAULT_RIVER_PATH, pool, max_connections)
+        self._river_path = self._pool.river_path
+        self._resampler_lock = threading.Lock()
+        self._resampler: HTFResampler | None = None
+
+    @property
+    def river_path(self) -> Path:
+        return self._river_path
 
-    def _get_connection(self) -> sqlite3.Connection:
+    def _connection(self) -> AbstractContextManager[sqlite3.Connection]:
         """
-        Get read-only database connection.
+        Check out a read-only database connection for this thread.
 
-        Returns connection opened in READ-ONLY mode.
+        Connections are opened in READ-ONLY mode.
         This is physical enforcement — writes will fail at DB level.
         """
-        if self._conn is None:
-            # READ-ONLY connection via URI
-            # https://www.sqlite.org/uri.html
-            uri = f"file:{self._river_path}?mode=ro"
-            self._conn = sqlite3.connect(uri, uri=True)
-            self._conn.row_factory = sqlite3.Row
-
-        return self._conn
+        return self._pool.connection()
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        """Close database connections (a shared pool is left open)."""
+        self._pool.close()
 
     def __enter__(self) -> RiverReader:
         """Context manager entry."""
@@ -170,36 +206,209 @@ class RiverReader:
         Raises:
             RiverReadError: If query fails
         """
-        import pandas as pd
+        try:
+            with self._connection() as conn:
+                return self._read_bars(conn, pair, timeframe, start, end)
 
-        conn = self._get_connection()
+        except Exception as e:
+            if not _is_missing_table(e):
+                raise RiverReadError(f"Failed to get bars: {e}") from e
+            missing = e
+
+        # No stored table: derive from a finer one (HTF resampling)
+        return self._get_resampler().derive_bars(pair, timeframe, start, end, missing)
+
+    def _get_resampler(self) -> HTFResampler:
+        """Derived-timeframe cache (created on first use; numpy/pandas loaded then)."""
+        from .river_derived import HTFResampler
+
+        with self._resampler_lock:
+            if self._resampler is None:
+                self._resampler = HTFResampler(self)
+            return self._resampler
+
+    def _read_bars(
+        self,
+        conn: sqlite3.Connection,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame:
+        """get_bars query on a checked-out connection."""
+        import pandas as pd
 
         # Table name convention: pair_timeframe (e.g., EURUSD_1H)
         table_name = f"{pair}_{timeframe}"
 
+        # SQLite doesn't support parameterized table names
+        # We validate table_name format to prevent injection
+        if not self._validate_table_name(table_name):
+            raise RiverReadError(f"Invalid table name format: {table_name}")
+
+        # Table name validated above, SQL injection not possible
+        safe_query = f"""
+            SELECT timestamp, open, high, low, close, volume
+            FROM "{table_name}"
+            WHERE timestamp >= ? AND timestamp <= ?
+            ORDER BY timestamp ASC
+        """  # noqa: S608
+
+        return pd.read_sql_query(
+            safe_query,
+            conn,
+            params=(start.isoformat(), end.isoformat()),
+        )
+
+    # =========================================================================
+    # STREAMING (bounded memory)
+    # =========================================================================
+
+    def iter_bars(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        chunk_span: timedelta | None = None,
+        overlap: int = 0,
+    ) -> Iterator[RiverChunk]:
+        """
+        Stream get_bars() rows in chunks instead of loading the whole range.
+
+        Args:
+            pair: Trading pair (e.g., "EURUSD")
+            timeframe: Timeframe (e.g., "1m", "1H")
+            start: Start datetime (UTC)
+            end: End datetime (UTC)
+            chunk_rows: Rows per chunk (keyset pagination on timestamp, rowid)
+            chunk_span: Time span per chunk instead of a row count
+            overlap: Trailing rows of each chunk repeated as warmup of the next
+
+        Yields:
+            RiverChunk (no empty chunks)
+
+        Raises:
+            RiverReadError: If a query fails
+        """
+        from .river_paging import iter_chunks
+
+        table_name = self._checked_table(f"{pair}_{timeframe}")
+        return iter_chunks(
+            self._connection, table_name, BAR_COLUMNS, start, end, chunk_rows, chunk_span, overlap
+        )
+
+    def iter_enrichment(
+        self,
+        pair: str,
+        layer: str,
+        start: datetime,
+        end: datetime,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        chunk_span: timedelta | None = None,
+        overlap: int = 0,
+    ) -> Iterator[RiverChunk]:
+        """Stream get_enrichment() rows in chunks (arguments as iter_bars)."""
+        from .river_paging import iter_chunks
+
+        table_name = self._checked_table(f"{pair}_enrichment_{layer}")
+        return iter_chunks(
+            self._connection, table_name, "*", start, end, chunk_rows, chunk_span, overlap
+        )
+
+    def get_snapshot(
+        self,
+        requests: Iterable[tuple[str, str, datetime, datetime]],
+        include_states: bool = True,
+    ) -> RiverSnapshot:
+        """
+        Bars for many (pair, timeframe, start, end) windows, and the latest
+        state of every pair, from one consistent read transaction.
+
+        Raises:
+            RiverReadError: If any query fails or a (pair, timeframe) repeats
+        """
+        from .river_snapshot import read_snapshot
+
+        return read_snapshot(self, requests, include_states)
+
+    def get_bars_arrays(
+        self,
+        pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        out: BarArrays | None = None,
+    ) -> BarArrays:
+        """
+        get_bars() rows as contiguous typed arrays (no DataFrame).
+
+        Timestamps are int64 epoch nanoseconds (UTC, whole seconds); prices
+        and volume are float64. With `out` its buffers are filled and views
+        of the filled prefix are returned.
+
+        Raises:
+            RiverReadError: If query fails or `out` is too small
+        """
+        from .bar_arrays import read_bar_arrays
+
         try:
-            # SQLite doesn't support parameterized table names
-            # We validate table_name format to prevent injection
-            if not self._validate_table_name(table_name):
-                raise RiverReadError(f"Invalid table name format: {table_name}")
+            table_name = self._checked_table(f"{pair}_{timeframe}")
+            with self._connection() as conn:
+                return read_bar_arrays(conn, table_name, start, end, out)
 
-            # Table name validated above, SQL injection not possible
-            safe_query = f"""
-                SELECT timestamp, open, high, low, close, volume
-                FROM "{table_name}"
-                WHERE timestamp >= ? AND timestamp <= ?
-                ORDER BY timestamp ASC
-            """  # noqa: S608
+        except Exception as e:
+            raise RiverReadError(f"Failed to get bar arrays: {e}") from e
 
-            df = pd.read_sql_query(
-                safe_query,
-                conn,
-                params=(start.isoformat(), end.isoformat()),
-            )
-            return df
+    def get_table_version(self, pair: str, timeframe: str) -> int | None:
+        """
+        Cheap change token for a bar table (O(1): MAX(rowid); None if empty).
+
+        Raises:
+            RiverReadError: If query fails
+        """
+        from .river_versions import read_table_version
+
+        try:
+            table_name = self._checked_table(f"{pair}_{timeframe}")
+            with self._connection() as conn:
+                return read_table_version(conn, table_name)
 
         except Exception as e:
-            raise RiverReadError(f"Failed to get bars: {e}") from e
+            if not _is_missing_table(e):
+                raise RiverReadError(f"Failed to get table version: {e}") from e
+            missing = e
+
+        # Derived timeframe: changes exactly when its base table does
+        return self._get_resampler().derive_table_version(pair, timeframe, missing)
+
+    def get_bars_after(
+        self,
+        pair: str,
+        timeframe: str,
+        version: int,
+        since: datetime | None = None,
+    ) -> tuple[pd.DataFrame, int]:
+        """
+        Bars appended or re-written after a get_table_version() value (0:
+        every row), optionally with timestamp >= since.
+
+        Returns:
+            (bars ordered by timestamp, version covering the returned rows)
+
+        Raises:
+            RiverReadError: If query fails
+        """
+        from .river_versions import read_bars_after
+
+        try:
+            table_name = self._checked_table(f"{pair}_{timeframe}")
+            with self._connection() as conn:
+                return read_bars_after(conn, table_name, version, since)
+
+        except Exception as e:
+            raise RiverReadError(f"Failed to get new bars: {e}") from e
 
     def get_enrichment(
         self,
@@ -225,8 +434,6 @@ class RiverReader:
         """
         import pandas as pd
 
-        conn = self._get_connection()
-
         # Table name convention: pair_enrichment_layer (e.g., EURUSD_enrichment_L3)
         table_name = f"{pair}_enrichment_{layer}"
 
@@ -242,11 +449,12 @@ class RiverReader:
                 ORDER BY timestamp ASC
             """  # noqa: S608
 
-            df = pd.read_sql_query(
-                safe_query,
-                conn,
-                params=(start.isoformat(), end.isoformat()),
-            )
+            with self._connection() as conn:
+                df = pd.read_sql_query(
+                    safe_query,
+                    conn,
+                    params=(start.isoformat(), end.isoformat()),
+                )
             return df
 
         except Exception as e:
@@ -270,46 +478,50 @@ class RiverReader:
         Raises:
             RiverReadError: If query fails
         """
-        conn = self._get_connection()
+        from .river_catalog import pair_state
 
         try:
-            cursor = conn.cursor()
-
-            # Get latest tick from state table
-            cursor.execute(
-                """
-                SELECT timestamp, bid, ask
-                FROM pair_state
-                WHERE pair = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-                """,
-                (pair,),
-            )
-
-            row = cursor.fetchone()
+            with self._connection() as conn:
+                # Get latest tick from state table
+                row = conn.execute(
+                    """
+                    SELECT timestamp, bid, ask
+                    FROM pair_state
+                    WHERE pair = ?
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                    """,
+                    (pair,),
+                ).fetchone()
 
             if row is None:
                 raise RiverReadError(f"No state found for pair: {pair}")
 
             timestamp, bid, ask = row
-            spread = ask - bid
-            mid = (bid + ask) / 2
-
-            return {
-                "pair": pair,
-                "timestamp": timestamp,
-                "bid": bid,
-                "ask": ask,
-                "spread": spread,
-                "mid": mid,
-                "queried_at": datetime.now(UTC).isoformat(),
-                "queried_by": self._caller,
-            }
+            return pair_state(pair, timestamp, bid, ask, self._caller)
 
         except Exception as e:
             raise RiverReadError(f"Failed to get latest state: {e}") from e
 
+    def get_latest_states(self) -> dict[str, dict]:
+        """
+        Get current state for every pair in one query.
+
+        Returns:
+            Dict of pair → state dict (same fields as get_latest_state)
+
+        Raises:
+            RiverReadError: If query fails
+        """
+        from .river_catalog import latest_states
+
+        try:
+            with self._connection() as conn:
+                return latest_states(conn, self._caller)
+
+        except Exception as e:
+            raise RiverReadError(f"Failed to get latest states: {e}") from e
+
     def list_available_pairs(self) -> list[str]:
         """
         List pairs available in River.
@@ -317,57 +529,79 @@ class RiverReader:
         Returns:
             List of pair symbols
         """
-        conn = self._get_connection()
-
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT DISTINCT pair FROM pair_state ORDER BY pair
-                """
-            )
-            return [row[0] for row in cursor.fetchall()]
+            with self._connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT DISTINCT pair FROM pair_state ORDER BY pair
+                    """
+                ).fetchall()
+            return [row[0] for row in rows]
 
         except Exception as e:
             raise RiverReadError(f"Failed to list pairs: {e}") from e
 
-    def list_available_timeframes(self, pair: str) -> list[str]:
+    def list_available_timeframes(self, pair: str, include_derived: bool = False) -> list[str]:
         """
         List timeframes available for a pair.
 
         Args:
             pair: Trading pair
+            include_derived: Also list timeframes get_bars() derives from a
+                finer stored table (see data/resample.py)
 
         Returns:
-            List of timeframe strings
+            List of timeframe strings (stored tables first)
         """
-        conn = self._get_connection()
+        from .river_catalog import stored_timeframes
 
         try:
-            cursor = conn.cursor()
-
-            # Query sqlite_master for tables matching pair pattern
-            cursor.execute(
-                """
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name LIKE ?
-                ORDER BY name
-                """,
-                (f"{pair}_%",),
-            )
+            with self._connection() as conn:
+                timeframes = stored_timeframes(conn, pair)
 
-            timeframes = []
-            for (name,) in cursor.fetchall():
-                # Extract timeframe from table name (e.g., EURUSD_1H -> 1H)
-                if "_enrichment_" not in name:
-                    parts = name.split("_")
-                    if len(parts) >= 2:
-                        timeframes.append(parts[-1])
+        except Exception as e:
+            raise RiverReadError(f"Failed to list timeframes: {e}") from e
+
+        if include_derived:
+            from .river_derived import derivable_timeframes
 
-            return timeframes
+            timeframes += derivable_timeframes(timeframes)
+        return timeframes
+
+    def list_available_layers(self, pair: str) -> list[str]:
+        """List enrichment layers stored for a pair (e.g., ["L1", "L2"])."""
+        from .river_catalog import stored_layers
+
+        try:
+            with self._connection() as conn:
+                return stored_layers(conn, pair)
 
         except Exception as e:
-            raise RiverReadError(f"Failed to list timeframes: {e}") from e
+            raise RiverReadError(f"Failed to list layers: {e}") from e
+
+    def get_table_columns(self, table_name: str) -> list[tuple[str, str]]:
+        """
+        Column names and declared SQLite types of a River table.
+
+        Args:
+            table_name: Table (e.g., "EURUSD_1H", "EURUSD_enrichment_L3")
+
+        Returns:
+            List of (column name, declared type) in table order
+        """
+        from .river_catalog import table_columns
+
+        try:
+            self._checked_table(table_name)
+            with self._connection() as conn:
+                columns = table_columns(conn, table_name)
+
+            if not columns:
+                raise RiverReadError(f"No such table: {table_name}")
+            return columns
+
+        except Exception as e:
+            raise RiverReadError(f"Failed to describe {table_name}: {e}") from e
 
     def is_available(self) -> bool:
         """
@@ -380,10 +614,9 @@ class RiverReader:
             return False
 
         try:
-            conn = self._get_connection()
-            # Try a simple query
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
+            with self._connection() as conn:
+                # Try a simple query
+                conn.execute("SELECT 1")
             return True
         except Exception:
             return False
@@ -397,23 +630,15 @@ class RiverReader:
             timeframe: Timeframe to check
 
         Returns:
-            True if table exists and has data.
+            True if the table exists, or the timeframe can be derived
+            from a finer stored table.
         """
         table_name = f"{pair}_{timeframe}"
         if not self._validate_table_name(table_name):
             return False
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name=?
-                """,
-                (table_name,),
-            )
-            return cursor.fetchone() is not None
+            return timeframe in self.list_available_timeframes(pair, include_derived=True)
         except Exception:
             return False
 
@@ -432,6 +657,26 @@ class RiverReader:
 
         return bool(re.match(r"^[A-Za-z0-9_]+$", name))
 
+    def _checked_table(self, name: str) -> str:
+        """`name` if it is a valid table name, else RiverReadError."""
+        if not self._validate_table_name(name):
+            raise RiverReadError(f"Invalid table name format: {name}")
+        return name
+
+
+def _is_missing_table(error: BaseException | None) -> bool:
+    """
+    Whether a read failed because its table does not exist.
+
+    pd.read_sql_query re-raises sqlite3 errors as pandas DatabaseError
+    (with the sqlite3 error as __cause__), so the cause chain is checked.
+    """
+    while error is not None:
+        if isinstance(error, sqlite3.OperationalError) and "no such table" in str(error):
+            return True
+        error = error.__cause__
+    return False
+
 
 # =============================================================================
 # MODULE-LEVEL VERIFICATION
@@ -0,0 +1,88 @@
+"""
+River Snapshot — Consistent Multi-Query Reads
+=============================================
+
+RiverReader.get_snapshot reads bars for many (pair, timeframe) windows
+and the latest pair states on one connection inside BEGIN ... ROLLBACK,
+so every result comes from the same consistent snapshot of River (a
+scan of all pairs never mixes bars from before and after a River write).
+Derived timeframes (river_derived.py) read their base rows inside the
+same transaction and are resampled after it.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .resample import derivation_base
+from .river_catalog import latest_states, stored_timeframes
+from .river_derived import base_window, resample_window
+from .river_reader import RiverReadError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .river_reader import RiverReader
+
+
+@dataclass(frozen=True)
+class RiverSnapshot:
+    """Results of one consistent multi-query read (RiverReader.get_snapshot)."""
+
+    bars: dict[tuple[str, str], pd.DataFrame]
+    states: dict[str, dict] = field(default_factory=dict)
+
+
+def read_snapshot(
+    reader: RiverReader,
+    requests: Iterable[tuple[str, str, datetime, datetime]],
+    include_states: bool,
+) -> RiverSnapshot:
+    """RiverReader.get_snapshot (arguments as there)."""
+    requests = list(requests)
+    keys = [(pair, timeframe) for pair, timeframe, _, _ in requests]
+    if len(set(keys)) != len(keys):
+        raise RiverReadError("Duplicate (pair, timeframe) in snapshot requests")
+
+    derived = {}  # (pair, timeframe) -> base rows read in the snapshot
+    try:
+        with reader._connection() as conn:
+            conn.execute("BEGIN")  # read snapshot starts at the first SELECT
+            try:
+                bars = {}
+                stored = {}  # pair -> stored timeframes, read in the snapshot
+                for pair, timeframe, start, end in requests:
+                    if pair not in stored:
+                        stored[pair] = stored_timeframes(conn, pair)
+                    base = None
+                    if timeframe not in stored[pair]:
+                        base = derivation_base(timeframe, stored[pair])
+                    if base is None:  # stored (or underivable: fails as a stored read)
+                        bars[(pair, timeframe)] = reader._read_bars(
+                            conn, pair, timeframe, start, end
+                        )
+                    else:
+                        since, until = base_window(timeframe, start, end)
+                        derived[(pair, timeframe)] = reader._read_bars(
+                            conn, pair, base, since, until
+                        )
+                states = latest_states(conn, reader._caller) if include_states else {}
+            finally:
+                conn.rollback()  # nothing to keep; ends the read transaction
+
+    except Exception as e:
+        raise RiverReadError(f"Failed to get snapshot: {e}") from e
+
+    for pair, timeframe, start, end in requests:
+        if (pair, timeframe) in derived:
+            try:
+                base = derived[(pair, timeframe)]
+                bars[(pair, timeframe)] = resample_window(base, timeframe, start, end)
+            except Exception as e:
+                raise RiverReadError(f"Failed to get snapshot: {e}") from e
+    return RiverSnapshot(bars=bars, states=states)
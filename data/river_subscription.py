@@ -0,0 +1,130 @@
+"""
+River Subscription — One Subscriber's High-Water Marks
+======================================================
+
+A RiverSubscription holds the table version (MAX(rowid)) it has already
+delivered per (pair, timeframe); poll() returns only rows added after
+it. Change detection is shared by every subscription of one
+RiverFollower (river_follow.py).
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .river_reader import RiverReadError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .river_follow import RiverFollower
+
+# =============================================================================
+# TYPES
+# =============================================================================
+
+FollowKey = tuple[str, str]  # (pair, timeframe)
+
+NewBars = dict[FollowKey, "pd.DataFrame"]
+
+
+# =============================================================================
+# SUBSCRIPTION
+# =============================================================================
+
+
+class RiverSubscription:
+    """
+    One subscriber's view: high-water marks for its (pair, timeframe) keys.
+
+    Created by RiverFollower.subscribe(). Safe to poll from any thread.
+    """
+
+    def __init__(
+        self,
+        follower: RiverFollower,
+        marks: dict[FollowKey, int],
+        since: datetime | None,
+        callback: Callable[[NewBars], None] | None,
+    ) -> None:
+        self._follower = follower
+        self._marks = marks
+        self._since = since
+        self._callback = callback
+        self._latest: dict[FollowKey, str | None] = dict.fromkeys(marks)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+    @property
+    def keys(self) -> tuple[FollowKey, ...]:
+        return tuple(self._marks)
+
+    def high_water_mark(self, pair: str, timeframe: str) -> int:
+        """Table version delivered so far for (pair, timeframe)."""
+        with self._lock:
+            return self._marks[(pair, timeframe)]
+
+    def last_timestamp(self, pair: str, timeframe: str) -> str | None:
+        """Newest bar timestamp delivered for (pair, timeframe) (None before any)."""
+        with self._lock:
+            return self._latest[(pair, timeframe)]
+
+    def poll(self) -> NewBars:
+        """
+        Bars added since the last poll, per (pair, timeframe) with any.
+
+        Raises:
+            RiverReadError: If a check or read fails, or the subscription is closed
+        """
+        self._follower.check()
+        return self._collect()
+
+    def wait(self, timeout: float | None = None) -> NewBars:
+        """Block until new bars arrive; returns them ({} after `timeout` seconds)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            new = self.poll()
+            if new:
+                return new
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return {}
+            # A started follower wakes us early; otherwise re-check each interval
+            interval = self._follower.poll_interval
+            self._wakeup.wait(interval if remaining is None else min(interval, remaining))
+
+    def close(self) -> None:
+        """Stop following (further polls raise)."""
+        with self._lock:
+            self._closed = True
+        self._follower._unsubscribe(self)
+        self._wakeup.set()
+
+    def _collect(self) -> NewBars:
+        """Read rows past the marks of keys whose table version moved."""
+        with self._lock:
+            if self._closed:
+                raise RiverReadError("Subscription is closed")
+            self._wakeup.clear()
+
+            new = {}
+            for key, mark in self._marks.items():
+                version = self._follower.version(key)
+                if version is None or version <= mark:
+                    continue
+                bars, self._marks[key] = self._follower.reader.get_bars_after(
+                    *key, mark, self._since
+                )
+                if not bars.empty:
+                    newest = bars["timestamp"].max()
+                    latest = self._latest[key]
+                    self._latest[key] = newest if latest is None else max(latest, newest)
+                    new[key] = bars
+            return new
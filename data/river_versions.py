@@ -0,0 +1,56 @@
+"""
+River Versions — Change Tokens and Deltas of Bar Tables
+=======================================================
+
+BarWindowCache (bar_cache.py) and RiverFollower (river_follow.py) poll
+River for new bars without re-reading whole windows:
+
+- table version: MAX(rowid), O(1); changes when bars are appended or
+  replaced (INSERT OR REPLACE assigns a new rowid)
+- bars after a version: rows with a larger rowid, so appended bars and
+  re-written bars are both returned, whatever their timestamp
+
+Queries run on a connection checked out by RiverReader; table names are
+validated by the reader.
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+from .river_reader import BAR_COLUMNS
+
+
+def read_table_version(conn: sqlite3.Connection, table_name: str) -> int | None:
+    """MAX(rowid) of the table (None if it is empty)."""
+    # Table name validated by the caller, SQL injection not possible
+    safe_query = f'SELECT MAX(rowid) FROM "{table_name}"'  # noqa: S608
+    return conn.execute(safe_query).fetchone()[0]
+
+
+def read_bars_after(
+    conn: sqlite3.Connection,
+    table_name: str,
+    version: int,
+    since: datetime | None = None,
+) -> tuple[pd.DataFrame, int]:
+    """Bars with rowid > version (and timestamp >= since), and their version."""
+    # Table name validated by the caller, SQL injection not possible
+    safe_query = f"""
+        SELECT rowid AS _river_rowid, {BAR_COLUMNS}
+        FROM "{table_name}"
+        WHERE rowid > ? AND timestamp >= ?
+        ORDER BY timestamp ASC, rowid ASC
+    """  # noqa: S608
+
+    floor = since.isoformat() if since is not None else ""
+    df = pd.read_sql_query(safe_query, conn, params=(version, floor))
+
+    if not df.empty:
+        version = max(version, int(df["_river_rowid"].max()))
+    return df.drop(columns="_river_rowid"), version
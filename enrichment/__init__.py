@@ -18,6 +18,7 @@ INVARIANTS:
 - INV-CONTRACT-1: Deterministic (same input → same output)
 """
 
+from .cache import EnrichmentCache
 from .layers import (
     l1_time_sessions,
     l2_reference_levels,
@@ -26,8 +27,15 @@ from .layers import (
     l5_order_blocks,
     l6_fvg_imbalances,
 )
+from .parallel import ParallelEnricher
+from .pipeline import EnrichmentPipeline
+from .steps import PATTERN_COLUMNS
 
 __all__ = [
+    "EnrichmentCache",
+    "EnrichmentPipeline",
+    "PATTERN_COLUMNS",
+    "ParallelEnricher",
     "l1_time_sessions",
     "l2_reference_levels",
     "l3_sweeps",
@@ -0,0 +1,204 @@
+"""
+Enrichment Benchmark — L1-L6 throughput on synthetic OHLCV.
+
+SPRINT: S27.0
+
+Measures, per (timeframe, years) case:
+
+- per-layer time and bars/sec (hand chain L1 → L2 → L3 → L4 → L6 → L5)
+- full chain time and bars/sec (EnrichmentPipeline)
+- peak RSS of the process that ran the case
+
+order_block_scaling times L5 in each OB mode on trending bars, where live
+order blocks pile up: the reference tracker rescans every live OB per bar
+(O(n·k)), the indexed one is about O(n log k).
+
+Bars are deterministic (seeded random walk with displacement jumps, weekdays
+only) and flagged is_synthetic=True; they never leave the benchmark.
+
+This module holds the measurement helpers (synthetic_bars, run_case,
+order_block_scaling, compare). The suite runner and CLI are scripts/enrichment_benchmark.py,
+which runs each case in a fresh process so peak RSS belongs to that case.
+
+INVARIANTS:
+- INV-DATA-2: synthetic bars carry is_synthetic=True
+"""
+
+from __future__ import annotations
+
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .layers import (
+    l1_time_sessions,
+    l2_reference_levels,
+    l3_sweeps,
+    l4_structure_breaks,
+    l5_order_blocks,
+    l6_fvg_imbalances,
+)
+from .pipeline import EnrichmentPipeline
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+TIMEFRAME_MINUTES = {"1m": 1, "15m": 15, "1H": 60}
+DEFAULT_YEARS = (1, 5, 10)
+
+# Bar counts for order_block_scaling (each doubles the previous)
+SCALING_SIZES = (2000, 4000, 8000)
+
+# Allowed bars/sec drop against a baseline before a case counts as regressed
+DEFAULT_TOLERANCE = 0.20
+
+SYMBOL = "EURUSD"
+
+# Hand chain order (L5 reads L6 displacement columns)
+LAYERS = (
+    ("l1_time_sessions", lambda df: l1_time_sessions.enrich(df)),
+    ("l2_reference_levels", lambda df: l2_reference_levels.enrich(df, symbol=SYMBOL)),
+    ("l3_sweeps", lambda df: l3_sweeps.enrich(df, symbol=SYMBOL)),
+    ("l4_structure_breaks", lambda df: l4_structure_breaks.enrich(df)),
+    ("l6_fvg_imbalances", lambda df: l6_fvg_imbalances.enrich(df)),
+    ("l5_order_blocks", lambda df: l5_order_blocks.enrich(df)),
+)
+
+
+# =============================================================================
+# SYNTHETIC BARS
+# =============================================================================
+
+
+def synthetic_bars(timeframe: str, days: int, seed: int = 0) -> pd.DataFrame:
+    """Deterministic weekday OHLCV bars covering `days` calendar days."""
+    minutes = TIMEFRAME_MINUTES[timeframe]
+    timestamps = pd.date_range(
+        "2015-01-05", periods=days * 24 * 60 // minutes, freq=f"{minutes}min", tz="UTC"
+    )
+    timestamps = timestamps[timestamps.dayofweek < 5]
+    n = len(timestamps)
+
+    rng = np.random.default_rng(seed)
+    step = 0.0004 * np.sqrt(minutes / 60)
+    close = 1.1 + np.cumsum(rng.standard_normal(n) * step)
+    jumps = rng.integers(0, max(n, 1), n // 40)
+    close[jumps] += rng.standard_normal(len(jumps)) * step * 8
+    open_ = np.r_[close[:1], close[:-1]]
+    wick = step * rng.random((2, n))
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": open_,
+            "high": np.maximum(open_, close) + wick[0],
+            "low": np.minimum(open_, close) - wick[1],
+            "close": close,
+            "volume": rng.integers(100, 5000, n),
+            "is_synthetic": True,
+        }
+    )
+
+
+def trending_bars(n: int, seed: int = 0) -> pd.DataFrame:
+    """Steady uptrend: bull OBs pile up and are rarely mitigated."""
+    rng = np.random.default_rng(seed)
+    close = 1.0850 + np.cumsum(0.0004 + rng.standard_normal(n) * 0.0003)
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0002,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0002,
+            "close": close,
+            "is_synthetic": True,
+        }
+    )
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _rate(bars: int, seconds: float) -> float:
+    return bars / seconds if seconds > 0 else float("inf")
+
+
+def run_case(timeframe: str, days: int, repeat: int = 1, seed: int = 0) -> dict:
+    """Benchmark one case in this process (best of `repeat` runs)."""
+    bars = synthetic_bars(timeframe, days, seed)
+    n = len(bars)
+
+    layer_seconds = {name: float("inf") for name, _ in LAYERS}
+    chain_seconds = float("inf")
+    for _ in range(repeat):
+        df = bars
+        for name, enrich in LAYERS:
+            start = time.perf_counter()
+            df = enrich(df)
+            layer_seconds[name] = min(layer_seconds[name], time.perf_counter() - start)
+        del df
+
+        start = time.perf_counter()
+        EnrichmentPipeline(symbol=SYMBOL).run(bars)
+        chain_seconds = min(chain_seconds, time.perf_counter() - start)
+
+    return {
+        "timeframe": timeframe,
+        "days": days,
+        "bars": n,
+        "layers": {
+            name: {"seconds": seconds, "bars_per_sec": _rate(n, seconds)}
+            for name, seconds in layer_seconds.items()
+        },
+        "chain": {"seconds": chain_seconds, "bars_per_sec": _rate(n, chain_seconds)},
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def order_block_scaling(sizes: tuple[int, ...] = SCALING_SIZES, seed: int = 0) -> dict:
+    """L5 enrich seconds per OB mode for each trending history size."""
+    seconds = {mode: [] for mode in l5_order_blocks.OB_MODES}
+    for n in sizes:
+        df = trending_bars(n, seed)
+        for mode, timings in seconds.items():
+            start = time.perf_counter()
+            l5_order_blocks.enrich(df, mode=mode)
+            timings.append(time.perf_counter() - start)
+    return {"sizes": list(sizes), "seconds": seconds}
+
+
+# =============================================================================
+# REGRESSIONS
+# =============================================================================
+
+
+def compare(baseline: dict, current: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Cases / layers whose bars/sec fell more than `tolerance` below baseline."""
+    before = {(r["timeframe"], r["days"]): r for r in baseline["results"]}
+    regressions = []
+    for case in current["results"]:
+        old = before.get((case["timeframe"], case["days"]))
+        if old is None:
+            continue
+        stages = {"chain": (old["chain"], case["chain"])}
+        for name, timing in case["layers"].items():
+            if name in old["layers"]:
+                stages[name] = (old["layers"][name], timing)
+        for name, (was, now) in stages.items():
+            if now["bars_per_sec"] < was["bars_per_sec"] * (1 - tolerance):
+                regressions.append(
+                    f"{case['timeframe']} {case['days']}d {name}: "
+                    f"{was['bars_per_sec']:,.0f} → {now['bars_per_sec']:,.0f} bars/s"
+                )
+    return regressions
@@ -0,0 +1,94 @@
+"""
+Columnar Builder — one array per column, one frame at the end.
+
+SPRINT: S27.0
+
+Backs EnrichmentPipeline(mode="columnar"). Instead of every layer copying
+an ever-widening DataFrame, each step sees a narrow frame of just the
+columns it reads (zero-copy views), and only the columns it produces are
+kept. Intermediate columns are released after their last reader, constant
+(stub) columns are materialized only when the output is assembled, and
+the output frame is built once without consolidating blocks.
+
+Peak memory ≈ output columns + the widest single step.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+def _values(series: pd.Series) -> object:
+    """Column storage: ndarray for numpy dtypes, else the extension array."""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.array
+
+
+def _detach(values: object) -> object:
+    """Own the column if it is a view into a wider (multi-column) block."""
+    if not isinstance(values, np.ndarray):
+        return values
+    root = values
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    return values if root.nbytes == values.nbytes else values.copy()
+
+
+class ColumnarBuilder:
+    """Column arrays for one enrichment run."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._index = df.index.copy()
+        self._arrays: dict[str, object] = {col: _values(df[col]).copy() for col in df.columns}
+        self._constants: dict[str, object] = {}
+
+    def __contains__(self, col: str) -> bool:
+        return col in self._arrays or col in self._constants
+
+    def view(self, columns: Iterable[str]) -> pd.DataFrame:
+        """Narrow frame over `columns` (no copy; steps may add columns to it)."""
+        data = {col: self._column(col) for col in columns}
+        return pd.DataFrame(data, index=self._index, copy=False)
+
+    def harvest(self, frame: pd.DataFrame, produces: Iterable[str]) -> None:
+        """Keep the new `produces` columns of a step's frame, in frame order."""
+        wanted = set(produces)
+        for col in frame.columns:
+            if col in wanted and col not in self:
+                self._arrays[col] = _detach(_values(frame[col]))
+
+    def put_constants(self, constants: Mapping[str, object]) -> None:
+        """Record constant columns (materialized by to_frame)."""
+        for col, value in constants.items():
+            if col not in self:
+                self._constants[col] = value
+
+    def release(self, columns: Iterable[str]) -> None:
+        """Drop columns no later step or the output needs."""
+        for col in columns:
+            self._arrays.pop(col, None)
+            self._constants.pop(col, None)
+
+    def to_frame(
+        self, columns: Iterable[str], convert: Callable[[str, object], object] | None = None
+    ) -> pd.DataFrame:
+        """Assemble the output frame once (`convert` maps each column's values)."""
+        data = {}
+        for col in columns:
+            if col not in self:
+                continue
+            values = self._column(col)
+            if convert is not None:
+                values = convert(col, values)
+                self.release([col])  # drop the unconverted array as we go
+            data[col] = values
+        return pd.DataFrame(data, index=self._index, copy=False)
+
+    def _column(self, col: str) -> object:
+        if col in self._constants:
+            return np.full(len(self._index), self._constants[col])
+        return self._arrays[col]
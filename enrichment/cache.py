@@ -0,0 +1,255 @@
+"""
+Enrichment Cache — on-disk enriched frames keyed by data and code.
+
+SPRINT: S27.0
+
+Enriched frames are stored as parquet files (columnar; needs pyarrow, the
+`enrichment-cache` extra) under one directory per layer version:
+
+    <cache_dir>/<layer_version>/<pair>_<timeframe>_<window+params>__<dataset_hash>.parquet
+
+- dataset_hash: full-precision hash of the whole raw frame (every column,
+  dtype and index value), since a hit returns the caller's raw columns too
+- layer_version: hash of every enrichment source that shapes the output
+  (layers, steps, pipeline, builder, compact, ...), so any code change
+  starts a fresh directory
+- window: first/last raw bar timestamp; params: columns + ATR period
+
+Raw data changes give a new dataset_hash: the stale file for the same
+pair/timeframe/window/params is replaced on write. Old layer versions are
+evicted first, then least recently used entries, until the cache fits in
+max_bytes.
+
+INVARIANTS:
+- INV-CONTRACT-1: a hit returns the frame the pipeline would produce
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+import shutil
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from .pipeline import EnrichmentPipeline
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_CACHE_DIR = Path.home() / "phoenix" / "data" / "enrichment_cache"
+DEFAULT_MAX_BYTES = 20 * 1024**3  # 20 GiB
+
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+ENRICHMENT_ROOT = Path(__file__).parent
+VERSIONED_SOURCES = ("*.py", "layers/*.py")
+# Sources that never change enriched values
+UNVERSIONED_SOURCES = frozenset({"cache.py", "benchmark.py"})
+
+
+@lru_cache(maxsize=1)
+def layer_version() -> str:
+    """Hash of the enrichment code that determines enriched values."""
+    digest = hashlib.sha256()
+    for pattern in VERSIONED_SOURCES:
+        for path in sorted(ENRICHMENT_ROOT.glob(pattern)):
+            name = path.relative_to(ENRICHMENT_ROOT).as_posix()
+            if name in UNVERSIONED_SOURCES:
+                continue
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# =============================================================================
+# CACHE KEY
+# =============================================================================
+
+
+def frame_hash(df: pd.DataFrame) -> str:
+    """Hash of every value, column name, dtype and index label of `df`."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """Identity of one enriched frame."""
+
+    pair: str
+    timeframe: str
+    window_start: str
+    window_end: str
+    dataset_hash: str
+    layer_version: str
+    columns: tuple[str, ...] | None = None
+    atr_period: int = 14
+
+    @classmethod
+    def for_bars(
+        cls,
+        pair: str,
+        timeframe: str,
+        bars: pd.DataFrame,
+        columns: Iterable[str] | None = None,
+        atr_period: int = 14,
+    ) -> CacheKey:
+        """Key for enriching raw `bars` with the current layer code."""
+        ts = bars["timestamp"]
+        return cls(
+            pair=pair,
+            timeframe=timeframe,
+            window_start=str(ts.iloc[0]) if len(ts) else "",
+            window_end=str(ts.iloc[-1]) if len(ts) else "",
+            dataset_hash=frame_hash(bars),
+            layer_version=layer_version(),
+            columns=None if columns is None else tuple(columns),
+            atr_period=atr_period,
+        )
+
+    @property
+    def prefix(self) -> str:
+        """File name shared by every dataset version of this slot."""
+        slot = repr((self.window_start, self.window_end, self.columns, self.atr_period))
+        return f"{self.pair}_{self.timeframe}_{hashlib.sha256(slot.encode()).hexdigest()[:16]}"
+
+    @property
+    def filename(self) -> str:
+        return f"{self.prefix}__{self.dataset_hash}.parquet"
+
+
+# =============================================================================
+# ENRICHMENT CACHE
+# =============================================================================
+
+
+class EnrichmentCache:
+    """
+    Persistent cache of enriched frames.
+
+    Usage:
+        cache = EnrichmentCache()
+        enriched = cache.get_or_enrich("EURUSD", "1H", bars)
+
+    Requires pyarrow (pip install 'phoenix[enrichment-cache]').
+    """
+
+    def __init__(
+        self, cache_dir: Path | str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """
+        Initialize cache.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PARQUET_AVAILABLE:
+            raise ImportError(
+                "pyarrow not installed (enrichment cache needs parquet). "
+                "Install with: pip install 'phoenix[enrichment-cache]'"
+            )
+        self._root = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: CacheKey) -> Path:
+        return self._root / key.layer_version / key.filename
+
+    def get(self, key: CacheKey) -> pd.DataFrame | None:
+        """Cached frame for `key`, or None."""
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        os.utime(path)  # LRU recency
+        self.hits += 1
+        return df
+
+    def put(self, key: CacheKey, df: pd.DataFrame) -> None:
+        """Store `df` under `key`, replace stale data versions, then evict."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write-then-rename so readers never see a partial file
+        tmp = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            df.to_parquet(tmp, index=True)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        for stale in path.parent.glob(f"{key.prefix}__*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        self.evict()
+
+    def get_or_enrich(
+        self,
+        pair: str,
+        timeframe: str,
+        bars: pd.DataFrame,
+        columns: Iterable[str] | None = None,
+        atr_period: int = 14,
+    ) -> pd.DataFrame:
+        """Serve from cache, else run EnrichmentPipeline and store the result."""
+        columns = None if columns is None else list(columns)
+        key = CacheKey.for_bars(pair, timeframe, bars, columns, atr_period)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        enriched = EnrichmentPipeline(columns, symbol=pair, atr_period=atr_period).run(bars)
+        self.put(key, enriched)
+        return enriched
+
+    # =========================================================================
+    # EVICTION
+    # =========================================================================
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self._root.glob("*/*.parquet"))
+
+    def evict(self) -> int:
+        """Drop old layer versions, then LRU entries, until under max_bytes."""
+        if not self._root.exists():
+            return 0
+        evicted = 0
+        current = layer_version()
+        for version_dir in self._root.iterdir():
+            if version_dir.is_dir() and version_dir.name != current:
+                evicted += len(list(version_dir.glob("*.parquet")))
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+        entries = [(path.stat(), path) for path in self._root.glob("*/*.parquet")]
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda e: e[0].st_mtime_ns):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        shutil.rmtree(self._root, ignore_errors=True)
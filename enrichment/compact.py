@@ -0,0 +1,132 @@
+"""
+Compact Enrichment Schema — categorical enums, small ints, day dates.
+
+SPRINT: S27.0
+
+Enriched frames hold enum columns as object arrays of Python strings /
+None, small counters as int64 and trading_day as datetime.date objects.
+The compact schema stores:
+
+- enums:        pandas categoricals with FIXED categories (int8 codes;
+                None → NaN), so codes agree across pairs and frames
+- small ints:   int8 / int32
+- trading_day:  datetime64 (no per-row date objects)
+
+Flags are already numpy bool (1 byte) and stay that way: pandas filters
+and groupbys use them directly, which bit-packing would prevent.
+
+A full L1-L6 frame shrinks about 1.7x (1 year of 1H bars: 9.4 MB →
+5.5 MB). Price-valued columns stay float64. They are ~90 of ~180
+columns and over 80% of the compact frame. float32 would break
+decode(compact(df)) == df, and level comparisons such as high > pdh
+could flip. The schema columns themselves shrink more than 4x.
+
+decode() is the view consumers that expect the original dtypes use (e.g.
+bar dicts where a missing enum must be None, not NaN).
+
+INVARIANTS:
+- INV-CONTRACT-1: decode(compact(df)) == df
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# SCHEMA
+# =============================================================================
+
+ENUM_CATEGORIES: dict[str, tuple[str, ...]] = {
+    # L1
+    "session_name": ("off_session", "asia", "london", "new_york"),
+    "kz_name": ("asia_kz", "lokz", "nykz"),
+    "dow_context": ("consolidation", "how_low_forming", "distribution"),
+    # L3
+    "sweep_direction": ("bullish", "bearish"),
+    "sweep_target_type": ("pdh", "pwh", "asia_high", "pdl", "pwl", "asia_low"),
+    "sweep_extension_class": ("tap", "sweep", "displacement"),
+    "sweep_timing_quality": ("kz", "session", "off_session"),
+    # L4
+    "order_flow": ("neutral", "bullish", "bearish", "mixed"),
+    "structure_trend": ("neutral", "bullish", "bearish", "mixed"),
+}
+
+# column: (compact dtype, enrichment dtype)
+SMALL_INT_COLUMNS: dict[str, tuple[type, type]] = {
+    "hour_ny": (np.int8, np.int32),
+    "minute_ny": (np.int8, np.int32),
+    "day_of_week": (np.int8, np.int32),
+    "sweep_timing_score": (np.int8, np.int64),
+    "sweep_reversal_bars": (np.int32, np.int64),
+    "liq_pool_count_above": (np.int8, np.int64),
+    "liq_pool_count_below": (np.int8, np.int64),
+    "pd_fvg_count_bull": (np.int32, np.int64),
+    "pd_fvg_count_bear": (np.int32, np.int64),
+    "ob_bull_age": (np.int32, np.int64),
+    "ob_bull_touches": (np.int32, np.int64),
+    "ob_bear_age": (np.int32, np.int64),
+    "ob_bear_touches": (np.int32, np.int64),
+    "bars_since_displacement_up": (np.int32, np.int64),
+    "bars_since_displacement_down": (np.int32, np.int64),
+    "bars_since_any_displacement": (np.int32, np.int64),
+}
+
+DATE_COLUMNS = ("trading_day",)
+
+
+# =============================================================================
+# COMPACT / DECODE
+# =============================================================================
+
+
+def compact_column(name: str, values: object) -> object:
+    """Compact representation of one enriched column (others unchanged)."""
+    if name in ENUM_CATEGORIES:
+        return _to_categorical(name, values)
+    if name in SMALL_INT_COLUMNS:
+        compact_dtype = SMALL_INT_COLUMNS[name][0]
+        values = np.asarray(values)
+        if len(values) and (
+            values.min() < np.iinfo(compact_dtype).min
+            or values.max() > np.iinfo(compact_dtype).max
+        ):
+            raise ValueError(f"{name} out of range for {np.dtype(compact_dtype)}")
+        return values.astype(compact_dtype)
+    if name in DATE_COLUMNS:
+        return pd.to_datetime(pd.Series(values, copy=False)).to_numpy()
+    return values
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Frame with schema columns in compact dtypes."""
+    data = {col: compact_column(col, df[col]) for col in df.columns}
+    return pd.DataFrame(data, index=df.index)
+
+
+def decode(df: pd.DataFrame) -> pd.DataFrame:
+    """Frame with compact columns restored to the enrichment dtypes."""
+    data = {}
+    for col in df.columns:
+        series = df[col]
+        if col in ENUM_CATEGORIES and isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.to_numpy(dtype=object)
+            values[series.isna().to_numpy()] = None
+            data[col] = values
+        elif col in SMALL_INT_COLUMNS:
+            data[col] = series.to_numpy().astype(SMALL_INT_COLUMNS[col][1])
+        elif col in DATE_COLUMNS and pd.api.types.is_datetime64_dtype(series.dtype):
+            data[col] = series.dt.date.to_numpy(dtype=object)
+        else:
+            data[col] = series
+    return pd.DataFrame(data, index=df.index)
+
+
+def _to_categorical(name: str, values: object) -> pd.Categorical:
+    """Fixed-category codes; unknown values are an error, not NaN."""
+    categorical = pd.Categorical(values, categories=list(ENUM_CATEGORIES[name]))
+    unknown = categorical.isna() & ~pd.isna(np.asarray(values, dtype=object))
+    if unknown.any():
+        found = sorted(set(np.asarray(values, dtype=object)[unknown].tolist()))
+        raise ValueError(f"Unknown {name} values: {found}")
+    return categorical
@@ -0,0 +1,17 @@
+"""
+Phoenix Incremental Enrichment — tail-only L1-L6.
+
+SPRINT: S27.0
+
+Appending a bar enriches only that bar (plus any earlier bars whose group
+levels it moves) using carried per-layer state. Output is identical to a
+full recompute (INV-CONTRACT-1).
+"""
+
+from .engine import MIN_HISTORY_BARS, EnrichmentDelta, IncrementalEnricher
+
+__all__ = [
+    "IncrementalEnricher",
+    "EnrichmentDelta",
+    "MIN_HISTORY_BARS",
+]
@@ -0,0 +1,161 @@
+"""
+Incremental Carry State — per-group aggregates that survive between appends.
+
+SPRINT: S27.0
+
+Mirrors the groupby-broadcast semantics of L1/L2 so appended bars can be
+enriched without regrouping history:
+
+- GroupFirst:     first non-null value per key (weekly / midnight opens)
+- GroupExtrema:   max(high) / min(low) per key (Asia, London, NY ranges)
+- ShiftedExtrema: extrema of the PREVIOUS key in sort order (PDH/PDL, PWH/PWL)
+
+Every update() returns the keys whose broadcast value changed, so history
+rows carrying those keys can be patched (group values are not causal: a
+later bar can change the level seen by earlier bars of the same group).
+
+INVARIANTS:
+- INV-CONTRACT-1: values identical to a full groupby recompute
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Equality that treats NaN == NaN (tuples compared element-wise)."""
+    if isinstance(a, tuple):
+        return all(_same(x, y) for x, y in zip(a, b, strict=True))
+    if a is None or b is None:
+        return a is b
+    return bool(a == b) or (a != a and b != b)
+
+
+class GroupFirst:
+    """
+    First non-null value per key, with optional preferred rows.
+
+    value(key) = first preferred value if any, else first value of the group
+    (the L1 "Sunday 17:00 open, else first bar of the week" rule).
+    """
+
+    def __init__(self) -> None:
+        self._preferred: dict[Any, float] = {}
+        self._fallback: dict[Any, float] = {}
+
+    def value(self, key: Any) -> float:
+        """Broadcast value for a key (NaN if unknown)."""
+        preferred = self._preferred.get(key, np.nan)
+        if preferred == preferred:
+            return preferred
+        return self._fallback.get(key, np.nan)
+
+    def update(self, keys: pd.Series, values: pd.Series, preferred: pd.Series) -> set:
+        """Absorb rows in time order; return keys whose value changed."""
+        before = {k: self.value(k) for k in pd.unique(keys)}
+
+        rows = zip(keys.tolist(), values.tolist(), preferred.tolist(), strict=True)
+        for key, value, is_preferred in rows:
+            if value != value:
+                continue
+            self._fallback.setdefault(key, value)
+            if is_preferred:
+                self._preferred.setdefault(key, value)
+
+        return {k for k, v in before.items() if not _same(v, self.value(k))}
+
+    def lookup(self, keys: pd.Series) -> np.ndarray:
+        """Vectorized value() for a key column."""
+        table = {k: self.value(k) for k in pd.unique(keys)}
+        return keys.map(table).to_numpy(dtype=float)
+
+
+class GroupExtrema:
+    """Running max(high) / min(low) per key (NaN-skipping, like groupby max/min)."""
+
+    def __init__(self) -> None:
+        self.high: dict[Any, float] = {}
+        self.low: dict[Any, float] = {}
+
+    def value(self, key: Any) -> tuple[float, float]:
+        """(high, low) for a key (NaN if unknown)."""
+        return self.high.get(key, np.nan), self.low.get(key, np.nan)
+
+    def update(self, keys: pd.Series, highs: pd.Series, lows: pd.Series) -> set:
+        """Absorb rows; return keys whose (high, low) changed."""
+        before = {k: self.value(k) for k in pd.unique(keys)}
+
+        high, low = self.high, self.low
+        for key, hi, lo in zip(keys.tolist(), highs.tolist(), lows.tolist(), strict=True):
+            if key not in high:
+                high[key], low[key] = np.nan, np.nan
+            # NaN-skipping max/min (NaN only if every value is NaN)
+            if hi == hi and not hi <= high[key]:
+                high[key] = hi
+            if lo == lo and not lo >= low[key]:
+                low[key] = lo
+
+        return {k for k, v in before.items() if k in high and not _same(v, self.value(k))}
+
+    def lookup(self, keys: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized value() for a key column."""
+        return (
+            keys.map(self.high).to_numpy(dtype=float),
+            keys.map(self.low).to_numpy(dtype=float),
+        )
+
+
+class ShiftedExtrema:
+    """
+    Extrema of the previous key in sort order (groupby + shift(1)).
+
+    Keys sort the way pandas groupby sorts them (dates chronologically,
+    strings lexicographically), so a new key can land anywhere and change
+    the predecessor of an existing key.
+    """
+
+    def __init__(self) -> None:
+        self._stats = GroupExtrema()
+        self._keys: list = []
+
+    def value(self, key: Any) -> tuple[float, float]:
+        """(prev_high, prev_low) for a key."""
+        pos = bisect_left(self._keys, key)
+        if pos == 0:
+            return np.nan, np.nan
+        return self._stats.value(self._keys[pos - 1])
+
+    def update(self, keys: pd.Series, highs: pd.Series, lows: pd.Series) -> set:
+        """Absorb rows; return EXISTING keys whose shifted value changed."""
+        tail_keys = list(pd.unique(keys))
+        new_keys = [k for k in tail_keys if k not in self._stats.high]
+
+        after = list(self._keys)
+        for key in new_keys:
+            insort(after, key)
+
+        # Only successors (in the new order) of touched keys can change
+        affected = set()
+        for key in tail_keys:
+            pos = bisect_right(after, key)
+            if pos < len(after):
+                affected.add(after[pos])
+        affected.difference_update(new_keys)
+        before = {k: self.value(k) for k in affected}
+
+        self._stats.update(keys, highs, lows)
+        self._keys = after
+
+        return {k for k, v in before.items() if not _same(v, self.value(k))}
+
+    def lookup(self, keys: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized value() for a key column."""
+        table = {k: self.value(k) for k in pd.unique(keys)}
+        highs = keys.map({k: v[0] for k, v in table.items()})
+        lows = keys.map({k: v[1] for k, v in table.items()})
+        return highs.to_numpy(dtype=float), lows.to_numpy(dtype=float)
@@ -0,0 +1,217 @@
+"""
+Incremental Enricher — tail-only L1-L6 enrichment.
+
+SPRINT: S27.0
+
+Seeds once with a full L1→L2→L3→L4→L6→L5 run, then enriches appended bars
+using carried per-layer state instead of recomputing history:
+
+- L1: weekly / midnight opens per group (groups.py)
+- L2: Asia + session ranges, PDH/PDL, PWH/PWL per group (groups.py)
+- L3: row-local, recomputed for new rows and rows whose L2 levels moved
+- L4: swing state at the last confirmed bar; only the final
+      SWING_LOOKBACK bars are revisited (swings confirm late)
+- L6: last ATR value (EWM recursion resumes from it), last displacement
+- L5: active bull/bear OB lists
+
+The per-layer tail steps live in steps.py.
+
+Group levels are broadcast to every bar of the group, so a new bar can move
+a level already reported for earlier bars of the same group. Those rows are
+rewritten in place and reported via EnrichmentDelta.patched.
+
+INVARIANTS:
+- INV-CONTRACT-1: frame after any sequence of appends is identical
+  (bit-for-bit) to a full recompute over the same bars
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..layers import l1_time_sessions as l1
+from ..layers import l2_reference_levels as l2
+from ..layers import l3_sweeps as l3
+from ..layers import l4_structure_breaks as l4
+from ..layers import l5_order_blocks as l5
+from ..layers import l6_fvg_imbalances as l6
+from . import steps
+from .groups import GroupLevels
+from .store import ColumnStore
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Below this many bars an append re-seeds (windowed layers lack context)
+MIN_HISTORY_BARS = 2 * l4.SWING_LOOKBACK + l5.OB_LOOKBACK
+
+L3_INPUT_COLUMNS = ["hour_ny", "high", "low", "close"]
+
+
+@dataclass
+class EnrichmentDelta:
+    """Result of one append."""
+
+    tail: pd.DataFrame  # enriched new bars (index = global bar position)
+    patched: np.ndarray  # positions of earlier bars rewritten by this append
+
+
+# =============================================================================
+# INCREMENTAL ENRICHER
+# =============================================================================
+
+
+class IncrementalEnricher:
+    """
+    Tail-only enrichment with per-layer carry state.
+
+    Usage:
+        enricher = IncrementalEnricher(symbol="EURUSD")
+        enricher.seed(history_df)
+        delta = enricher.append(new_bars_df)
+    """
+
+    def __init__(self, symbol: str = "EURUSD", atr_period: int = 14) -> None:
+        self._symbol = symbol
+        self._pip_mult = l2.pip_multiplier(symbol)
+        self._atr_period = atr_period
+        self._store: ColumnStore | None = None
+        self._raw_columns: list[str] = []
+
+    def __len__(self) -> int:
+        return 0 if self._store is None else len(self._store)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Full enriched history (materialized copy)."""
+        if self._store is None:
+            raise ValueError("IncrementalEnricher not seeded")
+        return self._store.to_frame()
+
+    # =========================================================================
+    # SEED (full recompute)
+    # =========================================================================
+
+    def seed(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Run the full chain over `df` and capture carry state."""
+        raw = df.reset_index(drop=True)
+        _validate_raw(raw)
+        self._raw_columns = list(raw.columns)
+
+        frame = l1.enrich(raw)
+        frame = l2.enrich(frame, symbol=self._symbol)
+        frame = l3.enrich(frame, symbol=self._symbol)
+        cols4, self._l4_state = l4.compute_structure(frame["high"].values, frame["low"].values)
+        for col in l4.LAYER_4_COLUMNS:
+            frame[col] = cols4[col]
+        frame = l6.enrich(frame, atr_period=self._atr_period)
+        obs = l5.detect_order_blocks(frame)
+        cols5, self._l5_active = l5.track_order_blocks(
+            frame["close"].values, frame["high"].values, frame["low"].values, obs
+        )
+        for col in l5.LAYER_5_COLUMNS:
+            frame[col] = cols5[col]
+
+        self._last_disp = {}
+        for event in ("displacement_up", "displacement_down"):
+            hits = np.flatnonzero(frame[event].to_numpy(dtype=bool))
+            self._last_disp[event] = int(hits[-1]) if len(hits) else None
+
+        self._store = ColumnStore(frame)
+        self._groups = GroupLevels(self._pip_mult)
+        self._groups.seed(frame)
+        return frame
+
+    # =========================================================================
+    # APPEND (tail only)
+    # =========================================================================
+
+    def append(self, bars: pd.DataFrame) -> EnrichmentDelta:
+        """Enrich appended bars; patch earlier bars whose group levels moved."""
+        if self._store is None:
+            raise ValueError("IncrementalEnricher not seeded")
+        n0 = len(self._store)
+        bars = self._validate_append(bars)
+        if len(bars) == 0:
+            empty = np.array([], dtype=np.int64)
+            return EnrichmentDelta(tail=self._store.take(self._store.columns, empty), patched=empty)
+
+        if n0 < MIN_HISTORY_BARS:
+            history = self._store.to_frame(self._raw_columns)
+            frame = self.seed(pd.concat([history, bars], ignore_index=True))
+            return EnrichmentDelta(tail=frame.iloc[n0:], patched=np.arange(n0))
+
+        tail = l1.enrich(bars.set_axis(pd.RangeIndex(n0, n0 + len(bars))))
+        changed: dict[str, set] = {}
+        keys = self._groups.absorb(tail, changed)
+        self._groups.fill(tail, keys)
+        stubs = l2.add_stubbed_columns(pd.DataFrame(index=tail.index))
+
+        patched = self._patch_groups(changed, n0)
+        patched.update(range(n0 - l4.SWING_LOOKBACK, n0))
+        cols = steps.sweeps(tail, self._symbol)
+        structure, self._l4_state = steps.structure(self._store, tail, n0, self._l4_state)
+        cols.update(structure)
+        cols.update(
+            steps.displacement(self._store, tail, n0, self._atr_period, self._last_disp)
+        )
+        order_blocks, self._l5_active = steps.order_blocks(
+            self._store, tail.assign(**cols), n0, self._l5_active
+        )
+        cols.update(order_blocks)
+
+        tail = pd.concat([tail, stubs, pd.DataFrame(cols, index=tail.index)], axis=1)
+        tail = tail[self._store.columns]
+        self._store.append(tail)
+        self._groups.commit(keys)
+        return EnrichmentDelta(tail=tail, patched=np.array(sorted(patched), dtype=np.int64))
+
+    def _validate_append(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """Check columns and strictly increasing timestamps after history."""
+        missing = set(self._raw_columns) - set(bars.columns)
+        if missing:
+            raise ValueError(f"Missing required columns: {sorted(missing)}")
+        bars = bars[self._raw_columns].reset_index(drop=True)
+        if len(bars) == 0:
+            return bars
+
+        last = self._store.take(["timestamp"], np.array([len(self._store) - 1]))
+        ts = bars["timestamp"]
+        if not (ts.iloc[0] > last["timestamp"].iloc[0] and ts.is_monotonic_increasing):
+            raise ValueError("Appended bars must be strictly after existing history")
+        if not ts.is_unique:
+            raise ValueError("Appended bars contain duplicate timestamps")
+        return bars
+
+    # =========================================================================
+    # GROUP PATCHES
+    # =========================================================================
+
+    def _patch_groups(self, changed: dict[str, set], n0: int) -> set[int]:
+        """Rewrite L1/L2/L3 values of history bars whose group level moved."""
+        positions = self._groups.positions(changed, n0)
+        if len(positions) == 0:
+            return set()
+
+        sub = self._store.take(L3_INPUT_COLUMNS, positions)
+        self._groups.fill(sub, self._groups.keys_at(positions))
+        self._store.put(positions, sub.drop(columns=L3_INPUT_COLUMNS))
+        self._store.put(positions, pd.DataFrame(steps.sweeps(sub, self._symbol)))
+        return set(positions.tolist())
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _validate_raw(df: pd.DataFrame) -> None:
+    """Validate raw OHLC input."""
+    required = ["timestamp", *steps.OHLC]
+    missing = [c for c in required if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
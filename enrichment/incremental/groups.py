@@ -0,0 +1,143 @@
+"""
+Group Levels — L1/L2 group carry for the incremental enricher.
+
+SPRINT: S27.0
+
+Folds bars into per-group carry (carry.py) and keeps one integer code per
+bar for each group key, so history bars whose group level moved can be
+found and rewritten:
+
+- week:        L1 weekly open
+- day:         L1 NY-midnight open
+- trading_day: L2 Asia / London / NY ranges, PDH/PDL
+- pw_week:     L2 PWH/PWL
+
+INVARIANTS:
+- INV-CONTRACT-1: values identical to a full groupby recompute
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from ..layers import l1_time_sessions as l1
+from ..layers import l2_reference_levels as l2
+from .carry import GroupExtrema, GroupFirst, ShiftedExtrema
+from .store import ColumnStore
+
+KEY_NAMES = ("week", "day", "trading_day", "pw_week")
+
+
+class GroupLevels:
+    """
+    L1 opens and L2 levels carried per group, plus per-bar group codes.
+
+    Usage:
+        groups = GroupLevels(pip_mult)
+        groups.seed(frame)
+        changed = {}
+        keys = groups.absorb(tail, changed)
+        groups.fill(tail, keys)
+        groups.commit(keys)
+    """
+
+    def __init__(self, pip_mult: float) -> None:
+        self._pip_mult = pip_mult
+        self._codes: dict[str, dict] = {name: {} for name in KEY_NAMES}
+        self._key_values: dict[str, list] = {name: [] for name in KEY_NAMES}
+        self._weekly_open = GroupFirst()
+        self._midnight_open = GroupFirst()
+        self._sessions = {s: GroupExtrema() for s in ("asia", "london", "ny")}
+        self._daily = ShiftedExtrema()
+        self._weekly = ShiftedExtrema()
+        self._keys: ColumnStore | None = None
+
+    def seed(self, frame: pd.DataFrame) -> None:
+        """Fold a fully enriched history into the carry."""
+        self._keys = ColumnStore(self._encode(self.absorb(frame, {})))
+
+    def commit(self, keys: dict[str, pd.Series]) -> None:
+        """Record group codes of appended bars (after absorb)."""
+        self._keys.append(self._encode(keys))
+
+    def absorb(self, df: pd.DataFrame, changed: dict[str, set]) -> dict[str, pd.Series]:
+        """Fold bars into group carry; record changed keys; return group keys."""
+        cal = l1.ny_calendar(df)
+        keys = {
+            "week": pd.Series(l1.week_ids(cal), index=df.index),
+            "day": pd.Series(l1.day_ids(cal), index=df.index),
+            "trading_day": df["trading_day"],
+            "pw_week": l2.week_ids(df["trading_day"]),
+        }
+        changed["week"] = self._weekly_open.update(
+            keys["week"], df["close"], l1.weekly_open_mask(cal)
+        )
+        changed["day"] = self._midnight_open.update(
+            keys["day"], df["close"], l1.midnight_mask(cal)
+        )
+        changed["trading_day"] = self._daily.update(keys["trading_day"], df["high"], df["low"])
+        for session, mask in _session_masks(df).items():
+            changed["trading_day"] |= self._sessions[session].update(
+                keys["trading_day"][mask], df["high"][mask], df["low"][mask]
+            )
+        changed["pw_week"] = self._weekly.update(keys["pw_week"], df["high"], df["low"])
+        return keys
+
+    def fill(self, df: pd.DataFrame, keys: dict[str, pd.Series]) -> None:
+        """Write L1 opens + L2 levels (and derived columns) from carry."""
+        df["weekly_open_price"] = self._weekly_open.lookup(keys["week"])
+        df["ny_midnight_open"] = self._midnight_open.lookup(keys["day"])
+        l1.add_reference_derived(df)
+
+        td = keys["trading_day"]
+        df["asia_high"], df["asia_low"] = self._sessions["asia"].lookup(td)
+        l2.derive_asia(df, self._pip_mult)
+        df["pdh"], df["pdl"] = self._daily.lookup(td)
+        l2.derive_pd(df, self._pip_mult)
+        df["pwh"], df["pwl"] = self._weekly.lookup(keys["pw_week"])
+        l2.derive_pw(df)
+        for session in ("london", "ny"):
+            prefix = session[:3]
+            high, low = self._sessions[session].lookup(td)
+            df[f"{prefix}_session_high"], df[f"{prefix}_session_low"] = high, low
+            l2.derive_session(df, session, self._pip_mult)
+
+    def positions(self, changed: dict[str, set], n0: int) -> np.ndarray:
+        """Positions among the first n0 bars whose group key changed."""
+        mask = np.zeros(n0, dtype=bool)
+        for name, keys in changed.items():
+            codes = [self._codes[name][k] for k in keys if k in self._codes[name]]
+            if codes:
+                mask |= np.isin(self._keys.column(name, 0, n0), codes)
+        return np.flatnonzero(mask)
+
+    def keys_at(self, positions: np.ndarray) -> dict[str, pd.Series]:
+        """Group keys of stored bars (for fill on patched rows)."""
+        return {name: self._decode(name, positions) for name in KEY_NAMES}
+
+    def _encode(self, keys: dict[str, pd.Series]) -> pd.DataFrame:
+        """Integer code per bar for each group key (for patch lookups)."""
+        encoded = {}
+        for name in KEY_NAMES:
+            codes, values = self._codes[name], self._key_values[name]
+            for key in pd.unique(keys[name]):
+                if key not in codes:
+                    codes[key] = len(values)
+                    values.append(key)
+            encoded[name] = keys[name].map(codes).to_numpy(dtype=np.int64)
+        return pd.DataFrame(encoded)
+
+    def _decode(self, name: str, positions: np.ndarray) -> pd.Series:
+        codes = self._keys.column(name)[positions]
+        values = np.empty(len(self._key_values[name]), dtype=object)
+        values[:] = self._key_values[name]
+        return pd.Series(values[codes])
+
+
+def _session_masks(df: pd.DataFrame) -> dict[str, pd.Series]:
+    return {
+        "asia": df["is_asia_session"] == True,  # noqa: E712
+        "london": df["is_london_session"] == True,  # noqa: E712
+        "ny": df["is_ny_session"] == True,  # noqa: E712
+    }
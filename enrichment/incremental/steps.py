@@ -0,0 +1,122 @@
+"""
+Layer Steps — L3/L4/L6/L5 over appended bars, resumed from carry state.
+
+SPRINT: S27.0
+
+Each step enriches only the appended tail, reading the few history bars
+its window needs from the ColumnStore:
+
+- L3: row-local (one bar of context, since bar 0 is never scanned)
+- L4: resumes from the last confirmed swing state; rewrites the final
+      SWING_LOOKBACK history bars (swings confirm late)
+- L6: ATR resumes from the last value; FVGs need two bars of context
+- L5: OBs formed in the tail join the carried active-OB lists
+
+INVARIANTS:
+- INV-CONTRACT-1: tail values identical to a full recompute
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..layers import l3_sweeps as l3
+from ..layers import l4_structure_breaks as l4
+from ..layers import l5_order_blocks as l5
+from ..layers import l6_fvg_imbalances as l6
+from .store import ColumnStore
+
+OHLC = ["open", "high", "low", "close"]
+DISPLACEMENT_COLUMNS = ["is_displacement", "displacement_up", "displacement_down"]
+
+
+def sweeps(df: pd.DataFrame, symbol: str) -> dict[str, np.ndarray]:
+    """L3 is row-local except that bar 0 is never scanned."""
+    frame = df.reset_index(drop=True)
+    if df.index[0] != 0:
+        frame = pd.concat([frame.iloc[:1], frame], ignore_index=True)
+    result = l3.enrich(frame, symbol=symbol).iloc[len(frame) - len(df) :]
+    return {col: result[col].to_numpy() for col in l3.LAYER_3_COLUMNS}
+
+
+def structure(
+    store: ColumnStore, tail: pd.DataFrame, n0: int, state: Any
+) -> tuple[dict[str, np.ndarray], Any]:
+    """Resume L4 from the last confirmed swing state; revisit unconfirmed bars."""
+    lookback = l4.SWING_LOOKBACK
+    r0 = n0 - lookback
+    w0 = r0 - lookback
+    highs = np.concatenate([store.column("high", w0, n0), tail["high"].values])
+    lows = np.concatenate([store.column("low", w0, n0), tail["low"].values])
+    cols, state = l4.compute_structure(highs, lows, lookback, offset=w0, state=state)
+
+    revisit = pd.DataFrame({c: cols[c][r0 - w0 : n0 - w0] for c in l4.LAYER_4_COLUMNS})
+    store.put(np.arange(r0, n0), revisit)
+    return {col: cols[col][n0 - w0 :] for col in l4.LAYER_4_COLUMNS}, state
+
+
+def displacement(
+    store: ColumnStore,
+    tail: pd.DataFrame,
+    n0: int,
+    atr_period: int,
+    last_disp: dict[str, int | None],
+) -> dict[str, np.ndarray]:
+    """Resume ATR from the last value; advances `last_disp` in place."""
+    atr_col = f"atr_{atr_period}"
+    ctx = store.take(OHLC + [atr_col], np.arange(n0 - 2, n0))
+    true_range = l6.compute_true_range(
+        tail["high"].values,
+        tail["low"].values,
+        tail["close"].values,
+        prev_close=ctx["close"].iloc[-1],
+    )
+    atr = l6.compute_atr(true_range, atr_period, prev_atr=ctx[atr_col].iloc[-1])
+
+    frame = pd.concat([ctx, tail[OHLC].assign(**{atr_col: atr})], ignore_index=True)
+    result = l6.enrich(frame, atr_period=atr_period).iloc[2:]
+    cols = {atr_col: atr}
+    cols.update({col: result[col].to_numpy() for col in l6.LAYER_6_COLUMNS})
+
+    for event in last_disp:
+        cols[f"bars_since_{event}"] = l6.compute_bars_since(
+            cols[event], start=n0, last=last_disp[event]
+        )
+        hits = np.flatnonzero(cols[event])
+        if len(hits):
+            last_disp[event] = n0 + int(hits[-1])
+    cols["bars_since_any_displacement"] = np.minimum(
+        cols["bars_since_displacement_up"], cols["bars_since_displacement_down"]
+    )
+    return cols
+
+
+def order_blocks(
+    store: ColumnStore, tail: pd.DataFrame, n0: int, active: Any
+) -> tuple[dict[str, np.ndarray], Any]:
+    """Detect OBs formed in the tail, then resume active-OB tracking."""
+    lookback = l5.OB_LOOKBACK
+    cols = OHLC + DISPLACEMENT_COLUMNS
+    ctx = store.take(cols, np.arange(n0 - lookback, n0))
+    found = l5.detect_order_blocks(pd.concat([ctx, tail[cols]], ignore_index=True))
+
+    shift = n0 - lookback
+    obs = {
+        side: [
+            dict(ob, idx=ob["idx"] + shift, ob_idx=ob["ob_idx"] + shift)
+            for ob in found[side]
+            if ob["idx"] >= lookback
+        ]
+        for side in ("bull", "bear")
+    }
+    return l5.track_order_blocks(
+        tail["close"].values,
+        tail["high"].values,
+        tail["low"].values,
+        obs,
+        offset=n0,
+        active=active,
+    )
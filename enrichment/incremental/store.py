@@ -0,0 +1,100 @@
+"""
+Column Store — growable typed arrays backing the incremental enricher.
+
+SPRINT: S27.0
+
+Holds the enriched history as one numpy array per column with spare
+capacity, so appending a bar is amortized O(columns) instead of a full
+DataFrame concat, and patching earlier rows is a positional write.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+MIN_CAPACITY = 256
+
+
+def _to_numpy(series: pd.Series, dtype: object) -> np.ndarray:
+    """Convert a column to the storage representation for `dtype`."""
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+    if isinstance(dtype, np.dtype):
+        return series.to_numpy(dtype=dtype)
+    return series.to_numpy(dtype=object)
+
+
+def _from_numpy(values: np.ndarray, dtype: object) -> object:
+    """Rebuild a column of `dtype` from its storage representation."""
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(dtype.tz)
+    if isinstance(dtype, np.dtype):
+        return values
+    return pd.array(values, dtype=dtype)
+
+
+class ColumnStore:
+    """Positional, append-only column arrays with in-place row patching."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._columns = list(frame.columns)
+        self._dtypes = {c: frame[c].dtype for c in self._columns}
+        self._size = 0
+        self._arrays: dict[str, np.ndarray] = {}
+
+        capacity = max(MIN_CAPACITY, 2 * len(frame))
+        for col in self._columns:
+            sample = _to_numpy(frame[col].iloc[:0], self._dtypes[col])
+            self._arrays[col] = np.empty(capacity, dtype=sample.dtype)
+        self.append(frame)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in frame order."""
+        return list(self._columns)
+
+    def append(self, frame: pd.DataFrame) -> None:
+        """Append rows (columns must match the store)."""
+        m = len(frame)
+        self._reserve(self._size + m)
+        for col in self._columns:
+            self._arrays[col][self._size : self._size + m] = _to_numpy(
+                frame[col], self._dtypes[col]
+            )
+        self._size += m
+
+    def put(self, positions: np.ndarray, frame: pd.DataFrame) -> None:
+        """Overwrite rows at `positions` with `frame` (rows aligned by order)."""
+        for col in frame.columns:
+            self._arrays[col][positions] = _to_numpy(frame[col], self._dtypes[col])
+
+    def column(self, col: str, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Raw storage view of one column slice (do not mutate)."""
+        stop = self._size if stop is None else stop
+        return self._arrays[col][start:stop]
+
+    def take(self, columns: list[str], positions: np.ndarray) -> pd.DataFrame:
+        """Rows at `positions` as a DataFrame indexed by position."""
+        data = {c: _from_numpy(self._arrays[c][positions], self._dtypes[c]) for c in columns}
+        return pd.DataFrame(data, index=pd.Index(positions))
+
+    def to_frame(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Materialize the stored history (copy, RangeIndex)."""
+        columns = self._columns if columns is None else columns
+        return self.take(columns, np.arange(self._size)).reset_index(drop=True)
+
+    def _reserve(self, size: int) -> None:
+        """Grow every array (doubling) until it holds `size` rows."""
+        capacity = len(next(iter(self._arrays.values())))
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for col, arr in self._arrays.items():
+            grown = np.empty(capacity, dtype=arr.dtype)
+            grown[: self._size] = arr[: self._size]
+            self._arrays[col] = grown
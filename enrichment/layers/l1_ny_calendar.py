@@ -0,0 +1,110 @@
+"""
+L1 NY Calendar — cached UTC→New York calendar table.
+
+SPRINT: S27.0
+
+One table per UTC year with a row per UTC hour (8784 max), holding every
+calendar field L1 needs for bars in that hour:
+
+- hour_ny, day_of_week, is_dst_us
+- day:          NY calendar day (days since epoch)
+- trading_day:  NY day, rolling at 17:00 NY
+- week:         ISO week + calendar year key (year * 100 + isoweek)
+
+The UTC offset comes from zoneinfo once per year, so DST transitions are
+exact to the hour (NY offsets are whole hours; minutes are taken from UTC).
+Bars are joined by integer position: row = utc_hour - first hour of year.
+
+INVARIANTS:
+- INV-CONTRACT-1: same fields as per-row tz_convert / .dst() / .date()
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+NS_PER_MINUTE = 60 * 10**9
+NS_PER_HOUR = 60 * NS_PER_MINUTE
+HOURS_PER_DAY = 24
+
+# Trading day rolls at 17:00 NY
+TRADING_DAY_ROLL_HOUR = 17
+
+CALENDAR_FIELDS = ("hour_ny", "day_of_week", "is_dst_us", "day", "trading_day", "week")
+
+
+@lru_cache(maxsize=64)
+def ny_calendar_year(year: int, tz: str = "America/New_York") -> dict[str, np.ndarray]:
+    """Hourly calendar table for UTC year `year` (cached, read-only arrays)."""
+    # One extra day before the year: the trading day looks back 24h
+    hours = pd.date_range(
+        f"{year - 1}-12-31", f"{year + 1}-01-01", freq="h", tz="UTC", inclusive="left"
+    )
+    utc_hour = hours.asi8 // NS_PER_HOUR
+    offset = hours.tz_convert(tz).tz_localize(None).asi8 // NS_PER_HOUR - utc_hour
+    local_day = (utc_hour + offset) // HOURS_PER_DAY
+
+    utc_hour, offset = utc_hour[HOURS_PER_DAY:], offset[HOURS_PER_DAY:]
+    local_hour = utc_hour + offset
+    hour_ny = local_hour % HOURS_PER_DAY
+    day = local_hour // HOURS_PER_DAY
+
+    # Before 17:00 the trading day is the NY date 24 elapsed hours earlier
+    # (not the previous calendar date: the two differ on the day after the
+    # spring DST jump, between 00:00 and 01:00 NY)
+    trading_day = np.where(hour_ny >= TRADING_DAY_ROLL_HOUR, day, local_day[:-HOURS_PER_DAY])
+    weekday = (day + 3) % 7  # 1970-01-01 was a Thursday (Monday=0)
+
+    # ISO week: the week's Thursday decides the ISO year
+    thursday = day - weekday + 3
+    iso_year_start = (
+        thursday.astype("datetime64[D]").astype("datetime64[Y]").astype("datetime64[D]")
+    ).astype(np.int64)
+    iso_week = (thursday - iso_year_start) // 7 + 1
+    calendar_year = day.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+    table = {
+        "hour_ny": hour_ny.astype(np.int32),
+        "day_of_week": weekday.astype(np.int32),
+        # DST adds an hour to the zone's standard offset
+        "is_dst_us": offset > offset.min(),
+        "day": day,
+        "trading_day": trading_day,
+        "week": calendar_year * 100 + iso_week,
+    }
+    for values in table.values():
+        values.flags.writeable = False
+    return table
+
+
+def utc_nanos(timestamps: pd.Series) -> np.ndarray:
+    """UTC epoch nanoseconds (naive timestamps are taken as UTC)."""
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+    return timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def join_ny_calendar(nanos: np.ndarray) -> dict[str, np.ndarray]:
+    """Look up every calendar field for UTC epoch nanoseconds."""
+    utc_hour = nanos // NS_PER_HOUR
+    years = utc_hour.astype("datetime64[h]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+    template = ny_calendar_year(1970)
+    fields = {name: np.empty(len(nanos), dtype=template[name].dtype) for name in CALENDAR_FIELDS}
+    for year in np.unique(years):
+        table = ny_calendar_year(int(year))
+        in_year = years == year
+        rows = utc_hour[in_year] - np.datetime64(f"{year}-01-01", "h").astype(np.int64)
+        for name in CALENDAR_FIELDS:
+            fields[name][in_year] = table[name][rows]
+
+    fields["minute_ny"] = ((nanos // NS_PER_MINUTE) % 60).astype(np.int32)
+    return fields
+
+
+def days_to_dates(days: np.ndarray) -> np.ndarray:
+    """Days since epoch → object array of datetime.date."""
+    return days.astype("datetime64[D]").astype(object)
@@ -32,8 +32,11 @@ INVARIANTS:
 
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
+from .l1_ny_calendar import days_to_dates, join_ny_calendar, utc_nanos
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -69,54 +72,70 @@ def enrich(df: pd.DataFrame) -> pd.DataFrame:
     # Validate dependencies
     _validate_input(df)
 
-    # Convert timestamps
-    timestamp_ny = _get_ny_timestamps(df)
+    # Join the cached NY calendar (no per-row tz conversion)
+    cal = ny_calendar(df)
+
+    add_time_columns(df, cal)
+    add_reference_columns(df, cal)
+    add_dow_columns(df, cal)
+
+    return df
+
+
+def add_time_columns(df: pd.DataFrame, cal: dict[str, np.ndarray]) -> None:
+    """Time, DST, session and kill zone columns (in place)."""
+    hour = cal["hour_ny"]
 
     # Time columns (4)
-    df["hour_ny"] = timestamp_ny.dt.hour
-    df["minute_ny"] = timestamp_ny.dt.minute
-    df["day_of_week"] = timestamp_ny.dt.weekday  # Monday=0
-    df["trading_day"] = _calculate_trading_day(timestamp_ny)
+    df["hour_ny"] = hour
+    df["minute_ny"] = cal["minute_ny"]
+    df["day_of_week"] = cal["day_of_week"]
+    df["trading_day"] = days_to_dates(cal["trading_day"])
 
     # DST (1)
-    df["is_dst_us"] = timestamp_ny.apply(lambda x: bool(x.dst()) if x.dst() is not None else False)
+    df["is_dst_us"] = cal["is_dst_us"]
 
     # Session columns (5)
-    df["is_asia_session"] = df["hour_ny"] >= 19
-    df["is_london_session"] = (df["hour_ny"] >= 2) & (df["hour_ny"] <= 4)
-    df["is_ny_session"] = (df["hour_ny"] >= 7) & (df["hour_ny"] <= 9)
-    df["session_name"] = _get_session_name(df)
+    is_asia = hour >= 19
+    is_london = (hour >= 2) & (hour <= 4)
+    is_ny = (hour >= 7) & (hour <= 9)
+    df["is_asia_session"] = is_asia
+    df["is_london_session"] = is_london
+    df["is_ny_session"] = is_ny
+    df["session_name"] = _get_session_name(is_asia, is_london, is_ny)
     df["is_session_overlap"] = (
-        df["is_asia_session"].astype(int)
-        + df["is_london_session"].astype(int)
-        + df["is_ny_session"].astype(int)
+        is_asia.astype(int) + is_london.astype(int) + is_ny.astype(int)
     ) > 1
 
     # Kill zone columns (6)
-    df["is_kz_asia"] = df["hour_ny"] == 20
-    df["is_kz_lokz"] = df["hour_ny"] == 3
-    df["is_kz_nykz"] = df["hour_ny"] == 8
-    df["kz_active"] = df["is_kz_asia"] | df["is_kz_lokz"] | df["is_kz_nykz"]
-    df["kz_name"] = _get_kz_name(df)
-    df["is_manipulation_hour"] = (df["hour_ny"] == 19) | (df["hour_ny"] == 2) | (df["hour_ny"] == 7)
-
-    # Reference levels (6) — NO FORWARD_FILL
-    df["weekly_open_price"] = _calculate_weekly_open(df, timestamp_ny)
-    df["ny_midnight_open"] = _calculate_midnight_open(df, timestamp_ny)
-    df["price_vs_weekly_open"] = df["close"] - df["weekly_open_price"]
-    df["price_vs_midnight_open"] = df["close"] - df["ny_midnight_open"]
-    df["above_weekly_open"] = df["close"] > df["weekly_open_price"]
-    df["above_midnight_open"] = df["close"] > df["ny_midnight_open"]
-
+    is_kz_asia = hour == 20
+    is_kz_lokz = hour == 3
+    is_kz_nykz = hour == 8
+    df["is_kz_asia"] = is_kz_asia
+    df["is_kz_lokz"] = is_kz_lokz
+    df["is_kz_nykz"] = is_kz_nykz
+    df["kz_active"] = is_kz_asia | is_kz_lokz | is_kz_nykz
+    df["kz_name"] = _get_kz_name(is_kz_asia, is_kz_lokz, is_kz_nykz)
+    df["is_manipulation_hour"] = (hour == 19) | (hour == 2) | (hour == 7)
+
+
+def add_reference_columns(df: pd.DataFrame, cal: dict[str, np.ndarray]) -> None:
+    """Reference levels (6) — NO FORWARD_FILL (in place)."""
+    df["weekly_open_price"] = _calculate_weekly_open(df, cal)
+    df["ny_midnight_open"] = _calculate_midnight_open(df, cal)
+    add_reference_derived(df)
+
+
+def add_dow_columns(df: pd.DataFrame, cal: dict[str, np.ndarray]) -> None:
+    """Day-of-week context and trading hours columns (after time columns)."""
     # DOW context (2)
-    df["dow_context"] = _get_dow_context(df)
-    df["is_how_low_day"] = df["day_of_week"].isin([1, 2])
+    day_of_week = cal["day_of_week"]
+    df["dow_context"] = _get_dow_context(day_of_week)
+    df["is_how_low_day"] = (day_of_week == 1) | (day_of_week == 2)
 
     # Trading hours (1)
     df["is_trading_hours"] = df["is_asia_session"] | df["is_london_session"] | df["is_ny_session"]
 
-    return df
-
 
 # =============================================================================
 # HELPERS
@@ -131,117 +150,112 @@ def _validate_input(df: pd.DataFrame) -> None:
         raise ValueError(f"Missing required columns: {missing}")
 
 
-def _get_ny_timestamps(df: pd.DataFrame) -> pd.Series:
-    """Convert timestamps to NY timezone."""
-    if df["timestamp"].dt.tz is None:
-        timestamp_utc = df["timestamp"].dt.tz_localize("UTC")
-    else:
-        timestamp_utc = df["timestamp"]
-    return timestamp_utc.dt.tz_convert(NY_TZ)
-
-
-def _calculate_trading_day(timestamp_ny: pd.Series) -> pd.Series:
-    """
-    Calculate trading day (starts 17:00 NY prior day).
+def ny_calendar(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """NY calendar fields per bar (see l1_ny_calendar.CALENDAR_FIELDS)."""
+    return join_ny_calendar(utc_nanos(df["timestamp"]))
 
-    NO FORWARD_FILL — uses vectorized operation.
-    """
-    return timestamp_ny.apply(
-        lambda x: x.date() if x.hour >= 17 else (x - pd.Timedelta(days=1)).date()
-    )
 
-
-def _get_session_name(df: pd.DataFrame) -> pd.Series:
+def _get_session_name(
+    is_asia: np.ndarray, is_london: np.ndarray, is_ny: np.ndarray
+) -> np.ndarray:
     """Get session name (priority: NY > London > Asia > off)."""
-    session = pd.Series("off_session", index=df.index)
-    session.loc[df["is_asia_session"]] = "asia"
-    session.loc[df["is_london_session"]] = "london"
-    session.loc[df["is_ny_session"]] = "new_york"
-    return session
+    return np.select(
+        [is_ny, is_london, is_asia], ["new_york", "london", "asia"], "off_session"
+    ).astype(object)
 
 
-def _get_kz_name(df: pd.DataFrame) -> pd.Series:
+def _get_kz_name(
+    is_kz_asia: np.ndarray, is_kz_lokz: np.ndarray, is_kz_nykz: np.ndarray
+) -> np.ndarray:
     """Get kill zone name."""
-    kz = pd.Series(None, index=df.index, dtype=object)
-    kz.loc[df["is_kz_asia"]] = "asia_kz"
-    kz.loc[df["is_kz_lokz"]] = "lokz"
-    kz.loc[df["is_kz_nykz"]] = "nykz"
+    kz = np.full(len(is_kz_asia), None, dtype=object)
+    kz[is_kz_asia] = "asia_kz"
+    kz[is_kz_lokz] = "lokz"
+    kz[is_kz_nykz] = "nykz"
     return kz
 
 
-def _get_dow_context(df: pd.DataFrame) -> pd.Series:
+def _get_dow_context(day_of_week: np.ndarray) -> np.ndarray:
     """Get day-of-week context."""
-    ctx = pd.Series("distribution", index=df.index)
-    ctx.loc[df["day_of_week"] == 0] = "consolidation"  # Monday
-    ctx.loc[df["day_of_week"].isin([1, 2])] = "how_low_forming"  # Tue/Wed
+    ctx = np.full(len(day_of_week), "distribution", dtype=object)
+    ctx[day_of_week == 0] = "consolidation"  # Monday
+    ctx[(day_of_week == 1) | (day_of_week == 2)] = "how_low_forming"  # Tue/Wed
     return ctx
 
 
-def _calculate_weekly_open(df: pd.DataFrame, timestamp_ny: pd.Series) -> pd.Series:
+def _calculate_weekly_open(df: pd.DataFrame, cal: dict[str, np.ndarray]) -> pd.Series:
     """
     Calculate weekly open price (Sunday 17:00 NY).
 
     CRITICAL: NO forward_fill — uses groupby broadcast.
     Missing values use FIRST price as sentinel, not ffill.
     """
-    # Create week identifier
-    week_id = (
-        timestamp_ny.dt.isocalendar().week.astype(str) + "_" + timestamp_ny.dt.year.astype(str)
-    )
-
-    # Find Sunday 17:00 bars
-    is_sunday = timestamp_ny.dt.weekday == 6
-    is_17h = timestamp_ny.dt.hour == 17
-    is_first_minute = timestamp_ny.dt.minute == 0
-    is_weekly_open = is_sunday & is_17h & is_first_minute
-
-    # Get weekly open for each week
-    weekly_opens = df.loc[is_weekly_open, ["close"]].copy()
-    weekly_opens["week_id"] = week_id[is_weekly_open]
-    weekly_open_map = weekly_opens.groupby("week_id")["close"].first()
-
-    # Map back to full dataframe
-    result = week_id.map(weekly_open_map)
-
-    # For weeks without Sunday 17:00 bar, use first bar of that week
-    # NOT forward_fill — explicit first-bar fallback
-    if result.isna().any():
-        week_first = df.groupby(week_id)["close"].first()
-        result = result.fillna(week_id.map(week_first))
-
-    return result
+    return _group_open(df["close"], week_ids(cal), weekly_open_mask(cal))
 
 
-def _calculate_midnight_open(df: pd.DataFrame, timestamp_ny: pd.Series) -> pd.Series:
+def _calculate_midnight_open(df: pd.DataFrame, cal: dict[str, np.ndarray]) -> pd.Series:
     """
     Calculate NY midnight open (00:00 NY each day).
 
     CRITICAL: NO forward_fill — uses groupby broadcast.
     Missing values use FIRST price of day, not ffill.
     """
-    # Create day identifier
-    day_id = timestamp_ny.dt.date.astype(str)
+    return _group_open(df["close"], day_ids(cal), midnight_mask(cal))
 
-    # Find midnight bars
-    is_midnight = (timestamp_ny.dt.hour == 0) & (timestamp_ny.dt.minute == 0)
 
-    # Get midnight open for each day
-    midnight_opens = df.loc[is_midnight, ["close"]].copy()
-    midnight_opens["day_id"] = day_id[is_midnight]
-    midnight_map = midnight_opens.groupby("day_id")["close"].first()
+def _group_open(close: pd.Series, keys: np.ndarray, is_open: np.ndarray) -> pd.Series:
+    """First close at an open bar per group, else the group's first close."""
+    group = pd.Series(keys, index=close.index)
 
-    # Map back to full dataframe
-    result = day_id.map(midnight_map)
+    # Get open for each group, mapped back to every bar
+    open_map = close[is_open].groupby(group[is_open]).first()
+    result = group.map(open_map)
 
-    # For days without midnight bar, use first bar of that day
+    # For groups without an open bar, use first bar of that group
     # NOT forward_fill — explicit first-bar fallback
     if result.isna().any():
-        day_first = df.groupby(day_id)["close"].first()
-        result = result.fillna(day_id.map(day_first))
+        group_first = close.groupby(group).first()
+        result = result.fillna(group.map(group_first))
 
     return result
 
 
+def add_reference_derived(df: pd.DataFrame) -> None:
+    """Derive price-vs-open columns from weekly/midnight opens (in place)."""
+    df["price_vs_weekly_open"] = df["close"] - df["weekly_open_price"]
+    df["price_vs_midnight_open"] = df["close"] - df["ny_midnight_open"]
+    df["above_weekly_open"] = df["close"] > df["weekly_open_price"]
+    df["above_midnight_open"] = df["close"] > df["ny_midnight_open"]
+
+
+# =============================================================================
+# GROUP KEYS (shared with incremental enrichment)
+# =============================================================================
+
+
+def week_ids(cal: dict[str, np.ndarray]) -> np.ndarray:
+    """Week key used to group weekly opens (ISO week + calendar year)."""
+    return cal["week"]
+
+
+def day_ids(cal: dict[str, np.ndarray]) -> np.ndarray:
+    """NY calendar-day key used to group midnight opens."""
+    return cal["day"]
+
+
+def weekly_open_mask(cal: dict[str, np.ndarray]) -> np.ndarray:
+    """Bars that open the trading week (Sunday 17:00 NY)."""
+    is_sunday = cal["day_of_week"] == 6
+    is_17h = cal["hour_ny"] == 17
+    is_first_minute = cal["minute_ny"] == 0
+    return is_sunday & is_17h & is_first_minute
+
+
+def midnight_mask(cal: dict[str, np.ndarray]) -> np.ndarray:
+    """Bars at NY midnight (00:00)."""
+    return (cal["hour_ny"] == 0) & (cal["minute_ny"] == 0)
+
+
 # =============================================================================
 # COLUMN MANIFEST
 # =============================================================================
@@ -67,39 +67,42 @@ def enrich(df: pd.DataFrame, symbol: str = None) -> pd.DataFrame:
     # Validate L1 dependencies
     _validate_input(df)
 
-    pip_mult = (
-        PIP_MULTIPLIERS.get(symbol.upper(), DEFAULT_PIP_MULTIPLIER)
-        if symbol
-        else DEFAULT_PIP_MULTIPLIER
-    )
+    pip_mult = pip_multiplier(symbol)
 
     # Asia range (9)
-    df = _calculate_asia_range(df, pip_mult)
+    df = calculate_asia_range(df, pip_mult)
 
     # PDH/PDL (9)
-    df = _calculate_pdh_pdl(df, pip_mult)
+    df = calculate_pdh_pdl(df, pip_mult)
 
     # Weekly levels (11)
-    df = _calculate_weekly_levels(df)
+    df = calculate_weekly_levels(df)
 
     # London session (7)
-    df = _calculate_session_levels(df, "london", pip_mult)
+    df = calculate_session_levels(df, "london", pip_mult)
 
     # NY session (7)
-    df = _calculate_session_levels(df, "ny", pip_mult)
+    df = calculate_session_levels(df, "ny", pip_mult)
 
     # Stubbed columns for Phase 3 (28)
-    df = _add_stubbed_columns(df)
+    df = add_stubbed_columns(df)
 
     return df
 
 
+def pip_multiplier(symbol: str | None) -> int:
+    """Pip multiplier for a symbol (JPY pairs use 100)."""
+    if not symbol:
+        return DEFAULT_PIP_MULTIPLIER
+    return PIP_MULTIPLIERS.get(symbol.upper(), DEFAULT_PIP_MULTIPLIER)
+
+
 # =============================================================================
 # ASIA RANGE
 # =============================================================================
 
 
-def _calculate_asia_range(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
+def calculate_asia_range(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     """
     Calculate Asia range (19:00-23:59 NY).
 
@@ -122,7 +125,13 @@ def _calculate_asia_range(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     df["asia_high"] = df["trading_day"].map(asia_stats["_asia_high"])
     df["asia_low"] = df["trading_day"].map(asia_stats["_asia_low"])
 
-    # Derived columns
+    derive_asia(df, pip_mult)
+
+    return df
+
+
+def derive_asia(df: pd.DataFrame, pip_mult: int) -> None:
+    """Derive Asia range columns from asia_high/asia_low (in place)."""
     df["asia_range"] = df["asia_high"] - df["asia_low"]
     df["asia_range_pips"] = df["asia_range"] * pip_mult
     df["asia_range_ce"] = (df["asia_high"] + df["asia_low"]) / 2
@@ -133,15 +142,13 @@ def _calculate_asia_range(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     df["inside_asia_range"] = ~(df["above_asia_range"] | df["below_asia_range"])
     df["price_vs_asia_ce"] = df["close"] - df["asia_range_ce"]
 
-    return df
-
 
 # =============================================================================
 # PDH/PDL
 # =============================================================================
 
 
-def _calculate_pdh_pdl(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
+def calculate_pdh_pdl(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     """
     Calculate Previous Day High/Low.
 
@@ -162,7 +169,13 @@ def _calculate_pdh_pdl(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     df["pdh"] = df["trading_day"].map(daily_stats["_pdh"])
     df["pdl"] = df["trading_day"].map(daily_stats["_pdl"])
 
-    # Derived
+    derive_pd(df, pip_mult)
+
+    return df
+
+
+def derive_pd(df: pd.DataFrame, pip_mult: int) -> None:
+    """Derive previous-day columns from pdh/pdl (in place)."""
     df["pd_range"] = df["pdh"] - df["pdl"]
     df["pd_range_pips"] = df["pd_range"] * pip_mult
     df["pd_ce"] = (df["pdh"] + df["pdl"]) / 2
@@ -173,24 +186,20 @@ def _calculate_pdh_pdl(df: pd.DataFrame, pip_mult: int) -> pd.DataFrame:
     df["between_pd_levels"] = ~(df["above_pdh"] | df["below_pdl"])
     df["price_vs_pd_ce"] = df["close"] - df["pd_ce"]
 
-    return df
-
 
 # =============================================================================
 # WEEKLY LEVELS
 # =============================================================================
 
 
-def _calculate_weekly_levels(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_weekly_levels(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate PWH/PWL (Previous Week High/Low).
 
     NO forward_fill — uses shift on weekly aggregation.
     """
     # Create week identifier from trading_day
-    df["_week"] = pd.to_datetime(df["trading_day"]).dt.isocalendar().week
-    df["_year"] = pd.to_datetime(df["trading_day"]).dt.year
-    df["_week_id"] = df["_year"].astype(str) + "_" + df["_week"].astype(str)
+    df["_week_id"] = week_ids(df["trading_day"])
 
     # Weekly stats
     weekly_stats = (
@@ -210,7 +219,20 @@ def _calculate_weekly_levels(df: pd.DataFrame) -> pd.DataFrame:
     df["pwh"] = df["_week_id"].map(weekly_stats["_pwh"])
     df["pwl"] = df["_week_id"].map(weekly_stats["_pwl"])
 
-    # Derived
+    derive_pw(df)
+
+    # is_weekly_open (from L1, verify exists)
+    if "weekly_open_price" not in df.columns:
+        df["weekly_open_price"] = MISSING_LEVEL
+
+    # Cleanup temp columns
+    df = df.drop(columns=["_week_id"], errors="ignore")
+
+    return df
+
+
+def derive_pw(df: pd.DataFrame) -> None:
+    """Derive previous-week columns from pwh/pwl (in place)."""
     df["pw_range"] = df["pwh"] - df["pwl"]
     df["pw_ce"] = (df["pwh"] + df["pwl"]) / 2
 
@@ -220,14 +242,11 @@ def _calculate_weekly_levels(df: pd.DataFrame) -> pd.DataFrame:
     df["between_pw_levels"] = ~(df["above_pwh"] | df["below_pwl"])
     df["price_vs_pw_ce"] = df["close"] - df["pw_ce"]
 
-    # is_weekly_open (from L1, verify exists)
-    if "weekly_open_price" not in df.columns:
-        df["weekly_open_price"] = MISSING_LEVEL
-
-    # Cleanup temp columns
-    df = df.drop(columns=["_week", "_year", "_week_id"], errors="ignore")
 
-    return df
+def week_ids(trading_day: pd.Series) -> pd.Series:
+    """Week identifier (year_isoweek of trading_day) used for PWH/PWL grouping."""
+    as_dt = pd.to_datetime(trading_day)
+    return as_dt.dt.year.astype(str) + "_" + as_dt.dt.isocalendar().week.astype(str)
 
 
 # =============================================================================
@@ -235,7 +254,7 @@ def _calculate_weekly_levels(df: pd.DataFrame) -> pd.DataFrame:
 # =============================================================================
 
 
-def _calculate_session_levels(df: pd.DataFrame, session: str, pip_mult: int) -> pd.DataFrame:
+def calculate_session_levels(df: pd.DataFrame, session: str, pip_mult: int) -> pd.DataFrame:
     """
     Calculate session high/low (London or NY).
 
@@ -246,7 +265,7 @@ def _calculate_session_levels(df: pd.DataFrame, session: str, pip_mult: int) ->
         raise ValueError(f"Missing {session_col} from L1")
 
     session_mask = df[session_col] == True
-    prefix = session[:3]  # 'lon' or 'ny_'
+    prefix = session[:3]  # 'lon' or 'ny'
 
     # Groupby
     session_stats = df[session_mask].groupby("trading_day").agg({"high": "max", "low": "min"})
@@ -255,7 +274,15 @@ def _calculate_session_levels(df: pd.DataFrame, session: str, pip_mult: int) ->
     df[f"{prefix}_session_high"] = df["trading_day"].map(session_stats["high"])
     df[f"{prefix}_session_low"] = df["trading_day"].map(session_stats["low"])
 
-    # Derived
+    derive_session(df, session, pip_mult)
+
+    return df
+
+
+def derive_session(df: pd.DataFrame, session: str, pip_mult: int) -> None:
+    """Derive session range columns from session high/low (in place)."""
+    prefix = session[:3]
+
     df[f"{prefix}_session_range"] = df[f"{prefix}_session_high"] - df[f"{prefix}_session_low"]
     df[f"{prefix}_session_range_pips"] = df[f"{prefix}_session_range"] * pip_mult
 
@@ -264,52 +291,51 @@ def _calculate_session_levels(df: pd.DataFrame, session: str, pip_mult: int) ->
     df[f"below_{session}_low"] = df["close"] < df[f"{prefix}_session_low"]
     df[f"inside_{session}_range"] = ~(df[f"above_{session}_high"] | df[f"below_{session}_low"])
 
-    return df
-
 
 # =============================================================================
 # STUBBED COLUMNS (Phase 3)
 # =============================================================================
 
-
-def _add_stubbed_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Add stubbed columns for Phase 3 (FVG, OB, IFVG, BPR)."""
+STUB_COLUMNS = {
     # PD FVGs (10)
-    df["pd_fvg_bull_high"] = MISSING_LEVEL
-    df["pd_fvg_bull_low"] = MISSING_LEVEL
-    df["pd_fvg_bull_ce"] = MISSING_LEVEL
-    df["in_pd_fvg_bull"] = False
-    df["pd_fvg_bear_high"] = MISSING_LEVEL
-    df["pd_fvg_bear_low"] = MISSING_LEVEL
-    df["pd_fvg_bear_ce"] = MISSING_LEVEL
-    df["in_pd_fvg_bear"] = False
-    df["pd_fvg_count_bull"] = 0
-    df["pd_fvg_count_bear"] = 0
-
+    "pd_fvg_bull_high": MISSING_LEVEL,
+    "pd_fvg_bull_low": MISSING_LEVEL,
+    "pd_fvg_bull_ce": MISSING_LEVEL,
+    "in_pd_fvg_bull": False,
+    "pd_fvg_bear_high": MISSING_LEVEL,
+    "pd_fvg_bear_low": MISSING_LEVEL,
+    "pd_fvg_bear_ce": MISSING_LEVEL,
+    "in_pd_fvg_bear": False,
+    "pd_fvg_count_bull": 0,
+    "pd_fvg_count_bear": 0,
     # PD Order Blocks (6)
-    df["pd_ob_bull_high"] = MISSING_LEVEL
-    df["pd_ob_bull_low"] = MISSING_LEVEL
-    df["in_pd_ob_bull"] = False
-    df["pd_ob_bear_high"] = MISSING_LEVEL
-    df["pd_ob_bear_low"] = MISSING_LEVEL
-    df["in_pd_ob_bear"] = False
-
+    "pd_ob_bull_high": MISSING_LEVEL,
+    "pd_ob_bull_low": MISSING_LEVEL,
+    "in_pd_ob_bull": False,
+    "pd_ob_bear_high": MISSING_LEVEL,
+    "pd_ob_bear_low": MISSING_LEVEL,
+    "in_pd_ob_bear": False,
     # IFVG (6)
-    df["ifvg_bull_high"] = MISSING_LEVEL
-    df["ifvg_bull_low"] = MISSING_LEVEL
-    df["in_ifvg_bull"] = False
-    df["ifvg_bear_high"] = MISSING_LEVEL
-    df["ifvg_bear_low"] = MISSING_LEVEL
-    df["in_ifvg_bear"] = False
-
+    "ifvg_bull_high": MISSING_LEVEL,
+    "ifvg_bull_low": MISSING_LEVEL,
+    "in_ifvg_bull": False,
+    "ifvg_bear_high": MISSING_LEVEL,
+    "ifvg_bear_low": MISSING_LEVEL,
+    "in_ifvg_bear": False,
     # BPR (6)
-    df["bpr_high"] = MISSING_LEVEL
-    df["bpr_low"] = MISSING_LEVEL
-    df["bpr_mid"] = MISSING_LEVEL
-    df["in_bpr"] = False
-    df["bpr_type"] = None
-    df["bpr_strength"] = MISSING_LEVEL
+    "bpr_high": MISSING_LEVEL,
+    "bpr_low": MISSING_LEVEL,
+    "bpr_mid": MISSING_LEVEL,
+    "in_bpr": False,
+    "bpr_type": None,
+    "bpr_strength": MISSING_LEVEL,
+}
 
+
+def add_stubbed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add stubbed columns for Phase 3 (FVG, OB, IFVG, BPR)."""
+    for col, value in STUB_COLUMNS.items():
+        df[col] = value
     return df
 
 
@@ -377,10 +403,10 @@ LAYER_2_COLUMNS = [
     "below_london_low",
     "inside_london_range",
     # NY (7)
-    "ny__session_high",
-    "ny__session_low",
-    "ny__session_range",
-    "ny__session_range_pips",
+    "ny_session_high",
+    "ny_session_low",
+    "ny_session_range",
+    "ny_session_range_pips",
     "above_ny_high",
     "below_ny_low",
     "inside_ny_range",
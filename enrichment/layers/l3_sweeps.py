@@ -32,6 +32,34 @@ import pandas as pd
 # CONSTANTS
 # =============================================================================
 
+# "vectorized": array scan; "reference": original per-bar loop
+# (layers/reference/l3_sweeps.py)
+SWEEP_MODES = ("vectorized", "reference")
+
+# L2 levels a bar can sweep (missing columns scan as NaN)
+SWEEP_LEVEL_COLUMNS = ("pdh", "pdl", "pwh", "pwl", "asia_high", "asia_low")
+
+# Scan priority: first matching target wins; highs are checked before lows
+SWEEP_TARGETS = [
+    # (target_type, level, direction)
+    ("pdh", "pdh", "bearish"),
+    ("pwh", "pwh", "bearish"),
+    ("asia_high", "asia_high", "bearish"),
+    ("pdl", "pdl", "bullish"),
+    ("pwl", "pwl", "bullish"),
+    ("asia_low", "asia_low", "bullish"),
+]
+
+# Kill Zones by NY hour (score 3): Asia KZ, LOKZ, NYKZ
+KILL_ZONE_HOURS = (20, 3, 8)
+
+# Main Sessions as [start, end) NY hours (score 2): Asia (wraps midnight), London, NY
+SESSION_HOURS = ((19, 1), (2, 5), (7, 10))
+
+# Extension classes: tap < SWEEP_MIN_PIPS <= sweep <= SWEEP_MAX_PIPS < displacement
+SWEEP_MIN_PIPS = 5
+SWEEP_MAX_PIPS = 20
+
 
 def _pip_size(symbol: str) -> float:
     """Get pip size for symbol."""
@@ -43,47 +71,45 @@ def _pip_size(symbol: str) -> float:
 # =============================================================================
 
 
-def _get_timing_quality(hour_ny: int) -> tuple[bool, bool, str, int]:
+def _timing_flags(hour_ny: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    Determine sweep timing priority.
+    Kill Zone / Main Session flags per bar.
 
-    Returns: (during_kz, during_session, timing_quality, timing_score)
+    Returns: (during_kz, during_session); every Kill Zone lies in a session
     """
-    # Kill Zones (score 3)
-    if hour_ny == 20:  # Asia KZ
-        return True, True, "kz", 3
-    elif hour_ny == 3:  # LOKZ
-        return True, True, "kz", 3
-    elif hour_ny == 8:  # NYKZ
-        return True, True, "kz", 3
-
-    # Main Sessions (score 2)
-    elif hour_ny >= 19 or hour_ny < 1:  # Asia
-        return False, True, "session", 2
-    elif 2 <= hour_ny < 5:  # London
-        return False, True, "session", 2
-    elif 7 <= hour_ny < 10:  # NY
-        return False, True, "session", 2
-
-    # Off-session (score 1)
-    return False, False, "off_session", 1
-
-
-def _classify_extension(extension_pips: float) -> tuple[str, bool]:
+    during_kz = np.isin(hour_ny, KILL_ZONE_HOURS)
+    during_session = during_kz.copy()
+    for start, end in SESSION_HOURS:
+        if start < end:
+            during_session |= (hour_ny >= start) & (hour_ny < end)
+        else:
+            during_session |= (hour_ny >= start) | (hour_ny < end)
+    return during_kz, during_session
+
+
+def _timing_quality(
+    during_kz: np.ndarray, during_session: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Timing quality and score per bar: kz (3), session (2), off_session (1)."""
+    quality = np.where(during_kz, "kz", np.where(during_session, "session", "off_session"))
+    score = np.where(during_kz, 3, np.where(during_session, 2, 1))
+    return quality, score
+
+
+def _classify_extensions(extension_pips: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    Classify sweep extension.
+    Classify sweep extensions.
 
     Returns: (classification, is_valid)
     - tap: < 5 pips (not valid)
     - sweep: 5-20 pips (VALID)
     - displacement: > 20 pips (not valid)
     """
-    if extension_pips < 5:
-        return "tap", False
-    elif extension_pips <= 20:
-        return "sweep", True
-    else:
-        return "displacement", False
+    is_valid = (extension_pips >= SWEEP_MIN_PIPS) & (extension_pips <= SWEEP_MAX_PIPS)
+    ext_class = np.where(
+        extension_pips < SWEEP_MIN_PIPS, "tap", np.where(is_valid, "sweep", "displacement")
+    )
+    return ext_class, is_valid
 
 
 # =============================================================================
@@ -91,7 +117,7 @@ def _classify_extension(extension_pips: float) -> tuple[str, bool]:
 # =============================================================================
 
 
-def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
+def enrich(df: pd.DataFrame, symbol: str = "EURUSD", mode: str = "vectorized") -> pd.DataFrame:
     """
     Add sweep detection columns.
 
@@ -101,148 +127,133 @@ def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
     Args:
         df: DataFrame with L1/L2 columns
         symbol: Trading pair
+        mode: "vectorized" (default) or "reference" (per-bar loop, for parity checks)
 
     Returns:
         DataFrame with 37 new columns
     """
+    if mode not in SWEEP_MODES:
+        raise ValueError(f"Unknown sweep mode: {mode!r} (expected one of {SWEEP_MODES})")
+
     df = df.copy()
 
     _validate_input(df)
 
+    # Core sweep columns (17)
+    add_sweeps(df, symbol, mode)
+
+    # Add liquidity pool tracking columns (20)
+    df = add_liquidity_pools(df)
+
+    return df
+
+
+def add_sweeps(df: pd.DataFrame, symbol: str = "EURUSD", mode: str = "vectorized") -> None:
+    """Scan sweeps against the L2 reference levels (in place)."""
     pip = _pip_size(symbol)
     n = len(df)
 
-    hour_ny = df["hour_ny"].values
-    high = df["high"].values
-    low = df["low"].values
-    close = df["close"].values
-
     # Get reference levels from L2
-    pdh = df["pdh"].values if "pdh" in df.columns else np.full(n, np.nan)
-    pdl = df["pdl"].values if "pdl" in df.columns else np.full(n, np.nan)
-    pwh = df["pwh"].values if "pwh" in df.columns else np.full(n, np.nan)
-    pwl = df["pwl"].values if "pwl" in df.columns else np.full(n, np.nan)
-    asia_high = df["asia_high"].values if "asia_high" in df.columns else np.full(n, np.nan)
-    asia_low = df["asia_low"].values if "asia_low" in df.columns else np.full(n, np.nan)
-
-    # Initialize columns
-    sweep_detected = np.zeros(n, dtype=bool)
-    sweep_direction = np.full(n, None, dtype=object)
-    sweep_target_type = np.full(n, None, dtype=object)
-    sweep_target_level = np.full(n, np.nan)
-    sweep_extension_pips = np.full(n, np.nan)
-    sweep_extension_class = np.full(n, None, dtype=object)
-    sweep_is_valid = np.zeros(n, dtype=bool)
-    sweep_during_kz = np.zeros(n, dtype=bool)
-    sweep_during_session = np.zeros(n, dtype=bool)
-    sweep_timing_quality = np.full(n, None, dtype=object)
-    sweep_timing_score = np.zeros(n, dtype=int)
-    sweep_reversal_bars = np.zeros(n, dtype=int)
-    sweep_into_pda = np.zeros(n, dtype=bool)
-    sweep_mss_confirmed = np.zeros(n, dtype=bool)
-    sweep_displacement_confirmed = np.zeros(n, dtype=bool)
-    sweep_fvg_created = np.zeros(n, dtype=bool)
-    sweep_is_setup = np.zeros(n, dtype=bool)
-
-    # Scan for sweeps
-    for i in range(1, n):
-        # Check if high swept any level
-        swept_high = False
-        target_type = None
-        target_level = np.nan
-        direction = None
-
-        # PDH sweep (bearish setup)
-        if not np.isnan(pdh[i]) and high[i] > pdh[i]:
-            swept_high = True
-            target_type = "pdh"
-            target_level = pdh[i]
-            direction = "bearish"
-        # PWH sweep
-        elif not np.isnan(pwh[i]) and high[i] > pwh[i]:
-            swept_high = True
-            target_type = "pwh"
-            target_level = pwh[i]
-            direction = "bearish"
-        # Asia high sweep
-        elif not np.isnan(asia_high[i]) and high[i] > asia_high[i]:
-            swept_high = True
-            target_type = "asia_high"
-            target_level = asia_high[i]
-            direction = "bearish"
-
-        # Check if low swept any level
-        swept_low = False
-        if not swept_high:
-            # PDL sweep (bullish setup)
-            if not np.isnan(pdl[i]) and low[i] < pdl[i]:
-                swept_low = True
-                target_type = "pdl"
-                target_level = pdl[i]
-                direction = "bullish"
-            # PWL sweep
-            elif not np.isnan(pwl[i]) and low[i] < pwl[i]:
-                swept_low = True
-                target_type = "pwl"
-                target_level = pwl[i]
-                direction = "bullish"
-            # Asia low sweep
-            elif not np.isnan(asia_low[i]) and low[i] < asia_low[i]:
-                swept_low = True
-                target_type = "asia_low"
-                target_level = asia_low[i]
-                direction = "bullish"
-
-        if swept_high or swept_low:
-            sweep_detected[i] = True
-            sweep_direction[i] = direction
-            sweep_target_type[i] = target_type
-            sweep_target_level[i] = target_level
-
-            # Calculate extension
-            if swept_high:
-                ext = (high[i] - target_level) / pip
-            else:
-                ext = (target_level - low[i]) / pip
-
-            sweep_extension_pips[i] = ext
-            ext_class, is_valid = _classify_extension(ext)
-            sweep_extension_class[i] = ext_class
-            sweep_is_valid[i] = is_valid
-
-            # Timing quality
-            during_kz, during_session, timing_q, timing_s = _get_timing_quality(hour_ny[i])
-            sweep_during_kz[i] = during_kz
-            sweep_during_session[i] = during_session
-            sweep_timing_quality[i] = timing_q
-            sweep_timing_score[i] = timing_s
-
-            # Setup check (sweep + valid + good timing)
-            sweep_is_setup[i] = is_valid and during_session
+    levels = {
+        col: df[col].values if col in df.columns else np.full(n, np.nan)
+        for col in SWEEP_LEVEL_COLUMNS
+    }
+
+    if mode == "vectorized":
+        scan = _scan_sweeps_vectorized
+    else:
+        from .reference import l3_sweeps as reference
+
+        scan = reference.scan_sweeps
+    columns = scan(df["hour_ny"].values, df["high"].values, df["low"].values, levels, pip)
 
     # Assign to dataframe
-    df["sweep_detected"] = sweep_detected
-    df["sweep_direction"] = sweep_direction
-    df["sweep_target_type"] = sweep_target_type
-    df["sweep_target_level"] = sweep_target_level
-    df["sweep_extension_pips"] = sweep_extension_pips
-    df["sweep_extension_class"] = sweep_extension_class
-    df["sweep_is_valid"] = sweep_is_valid
-    df["sweep_during_kz"] = sweep_during_kz
-    df["sweep_during_session"] = sweep_during_session
-    df["sweep_timing_quality"] = sweep_timing_quality
-    df["sweep_timing_score"] = sweep_timing_score
-    df["sweep_reversal_bars"] = sweep_reversal_bars
-    df["sweep_into_pda"] = sweep_into_pda
-    df["sweep_mss_confirmed"] = sweep_mss_confirmed
-    df["sweep_displacement_confirmed"] = sweep_displacement_confirmed
-    df["sweep_fvg_created"] = sweep_fvg_created
-    df["sweep_is_setup"] = sweep_is_setup
+    for col, values in columns.items():
+        df[col] = values
 
-    # Add liquidity pool tracking columns (20)
-    df = _add_liquidity_pools(df)
 
-    return df
+# =============================================================================
+# SWEEP SCAN
+# =============================================================================
+
+
+def empty_sweep_columns(n: int) -> dict[str, np.ndarray]:
+    """Core sweep columns (17) with their no-sweep defaults."""
+    return {
+        "sweep_detected": np.zeros(n, dtype=bool),
+        "sweep_direction": np.full(n, None, dtype=object),
+        "sweep_target_type": np.full(n, None, dtype=object),
+        "sweep_target_level": np.full(n, np.nan),
+        "sweep_extension_pips": np.full(n, np.nan),
+        "sweep_extension_class": np.full(n, None, dtype=object),
+        "sweep_is_valid": np.zeros(n, dtype=bool),
+        "sweep_during_kz": np.zeros(n, dtype=bool),
+        "sweep_during_session": np.zeros(n, dtype=bool),
+        "sweep_timing_quality": np.full(n, None, dtype=object),
+        "sweep_timing_score": np.zeros(n, dtype=int),
+        "sweep_reversal_bars": np.zeros(n, dtype=int),
+        "sweep_into_pda": np.zeros(n, dtype=bool),
+        "sweep_mss_confirmed": np.zeros(n, dtype=bool),
+        "sweep_displacement_confirmed": np.zeros(n, dtype=bool),
+        "sweep_fvg_created": np.zeros(n, dtype=bool),
+        "sweep_is_setup": np.zeros(n, dtype=bool),
+    }
+
+
+def _scan_sweeps_vectorized(
+    hour_ny: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    levels: dict[str, np.ndarray],
+    pip: float,
+) -> dict[str, np.ndarray]:
+    """Detect sweeps for all bars at once (same result as the reference loop)."""
+    n = len(high)
+    out = empty_sweep_columns(n)
+    if n < 2:
+        return out
+
+    # Comparisons against NaN are False, matching the loop's isnan guards
+    hits = np.stack(
+        [
+            high > levels[level] if direction == "bearish" else low < levels[level]
+            for _, level, direction in SWEEP_TARGETS
+        ]
+    )
+    hits[:, 0] = False  # bar 0 is never scanned
+
+    detected = hits.any(axis=0)
+    rows = np.flatnonzero(detected)
+    target = hits[:, rows].argmax(axis=0)
+    swept_high = target < 3
+
+    target_types = np.array([t for t, _, _ in SWEEP_TARGETS], dtype=object)
+    directions = np.array([d for _, _, d in SWEEP_TARGETS], dtype=object)
+    level_matrix = np.stack([levels[level] for _, level, _ in SWEEP_TARGETS])
+    target_level = level_matrix[target, rows]
+
+    ext = np.where(
+        swept_high,
+        (high[rows] - target_level) / pip,
+        (target_level - low[rows]) / pip,
+    )
+    ext_class, is_valid = _classify_extensions(ext)
+    during_kz, during_session = _timing_flags(hour_ny[rows])
+    timing_quality, timing_score = _timing_quality(during_kz, during_session)
+
+    out["sweep_detected"] = detected
+    out["sweep_direction"][rows] = directions[target]
+    out["sweep_target_type"][rows] = target_types[target]
+    out["sweep_target_level"][rows] = target_level
+    out["sweep_extension_pips"][rows] = ext
+    out["sweep_extension_class"][rows] = ext_class.astype(object)
+    out["sweep_is_valid"][rows] = is_valid
+    out["sweep_during_kz"][rows] = during_kz
+    out["sweep_during_session"][rows] = during_session
+    out["sweep_timing_quality"][rows] = timing_quality.astype(object)
+    out["sweep_timing_score"][rows] = timing_score
+    out["sweep_is_setup"][rows] = is_valid & during_session
+    return out
 
 
 # =============================================================================
@@ -250,7 +261,7 @@ def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
 # =============================================================================
 
 
-def _add_liquidity_pools(df: pd.DataFrame) -> pd.DataFrame:
+def add_liquidity_pools(df: pd.DataFrame) -> pd.DataFrame:
     """Add liquidity pool tracking columns."""
     n = len(df)
 
@@ -27,38 +27,64 @@ INVARIANTS:
 import numpy as np
 import pandas as pd
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bars either side of a swing point (swing confirmed SWING_LOOKBACK bars later)
+SWING_LOOKBACK = 3
+
+# "vectorized": window extrema + array state pass; "reference": original loops
+# (layers/reference/l4_structure_breaks.py)
+STRUCTURE_MODES = ("vectorized", "reference")
+
+
 # =============================================================================
 # SWING DETECTION
 # =============================================================================
 
 
-def _detect_swings(
-    highs: np.ndarray, lows: np.ndarray, lookback: int = 3
-) -> tuple[list[tuple[int, float]], list[tuple[int, float]]]:
+def swing_points(
+    highs: np.ndarray, lows: np.ndarray, lookback: int = SWING_LOOKBACK, strict: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Detect swing highs and lows using local extrema.
+    Indices of swing highs and lows (sliding-window extrema).
 
     INV-CONTRACT-1: Deterministic.
 
-    Swing High: high[i] is highest in window [i-lookback, i+lookback]
-    Swing Low: low[i] is lowest in window [i-lookback, i+lookback]
+    Swing High: high[i] >= every high in [i-lookback, i+lookback]
+    Swing Low: low[i] <= every low in [i-lookback, i+lookback]
+    strict=True requires > / < (no ties), as cso.StructureDetector uses, and
+    keeps its per-bar loop's NaN handling: NaN neighbours are skipped and a
+    NaN bar is a swing (no comparison with it can fail).
+
+    Only bars with `lookback` bars on both sides qualify.
     """
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
     n = len(highs)
-    swing_highs = []
-    swing_lows = []
-
-    for i in range(lookback, n - lookback):
-        # Swing high if highest in window
-        window_high = highs[i - lookback : i + lookback + 1]
-        if highs[i] == max(window_high):
-            swing_highs.append((i, highs[i]))
-
-        # Swing low if lowest in window
-        window_low = lows[i - lookback : i + lookback + 1]
-        if lows[i] == min(window_low):
-            swing_lows.append((i, lows[i]))
-
-    return swing_highs, swing_lows
+    if n < 2 * lookback + 1:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty.copy()
+    if lookback == 0:
+        every = np.arange(n, dtype=np.int64)
+        return every, every.copy()
+
+    # strict: fmax skips NaN neighbours, and "not <=" lets a NaN bar through
+    side_max = np.fmax if strict else np.maximum
+
+    def peaks(values: np.ndarray) -> np.ndarray:
+        windows = np.lib.stride_tricks.sliding_window_view(values, lookback)
+        side = side_max.reduce(windows, axis=1)
+        center = values[lookback : n - lookback]
+        left = side[: n - 2 * lookback]  # max of values[i-lookback : i]
+        right = side[lookback + 1 :]  # max of values[i+1 : i+lookback+1]
+        if strict:
+            return np.flatnonzero(~(center <= left) & ~(center <= right)) + lookback
+        return np.flatnonzero((center >= left) & (center >= right)) + lookback
+
+    # Swing lows are the peaks of the negated lows
+    return peaks(highs), peaks(-lows)
 
 
 # =============================================================================
@@ -66,7 +92,7 @@ def _detect_swings(
 # =============================================================================
 
 
-def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
+def enrich(df: pd.DataFrame, symbol: str = "EURUSD", mode: str = "vectorized") -> pd.DataFrame:
     """
     Add structure columns.
 
@@ -77,127 +103,183 @@ def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
     Args:
         df: DataFrame with OHLC
         symbol: Trading symbol
+        mode: "vectorized" (default) or "reference" (per-bar loop, for parity checks)
 
     Returns:
         DataFrame with 13 new columns
     """
+    if mode not in STRUCTURE_MODES:
+        raise ValueError(f"Unknown structure mode: {mode!r} (expected one of {STRUCTURE_MODES})")
+
     df = df.copy()
 
     _validate_input(df)
 
-    highs = df["high"].values
-    lows = df["low"].values
-    n = len(df)
-
-    # Initialize arrays
-    swing_high_arr = np.full(n, np.nan)
-    swing_low_arr = np.full(n, np.nan)
-    swing_high_idx_arr = np.full(n, np.nan)
-    swing_low_idx_arr = np.full(n, np.nan)
-
-    is_higher_high = np.zeros(n, dtype=bool)
-    is_lower_high = np.zeros(n, dtype=bool)
-    is_higher_low = np.zeros(n, dtype=bool)
-    is_lower_low = np.zeros(n, dtype=bool)
-
-    order_flow_arr = np.array(["neutral"] * n, dtype=object)
-
-    structure_break_up = np.zeros(n, dtype=bool)
-    structure_break_down = np.zeros(n, dtype=bool)
-    structure_trend_arr = np.array(["neutral"] * n, dtype=object)
-
-    # Detect swings
-    swing_highs, swing_lows = _detect_swings(highs, lows, lookback=3)
-
-    # Track state (NO ffill — explicit state machine)
-    prev_swing_high = None
-    prev_swing_low = None
-    current_swing_high = np.nan
-    current_swing_low = np.nan
-    current_swing_high_idx = np.nan
-    current_swing_low_idx = np.nan
-    last_high_comparison = None  # 'HH' or 'LH'
-    last_low_comparison = None  # 'HL' or 'LL'
-
-    sh_ptr = 0
-    sl_ptr = 0
-
-    # Process each bar
-    for i in range(n):
-        # Check if new swing high at this bar
-        while sh_ptr < len(swing_highs) and swing_highs[sh_ptr][0] <= i:
-            swing_idx, swing_price = swing_highs[sh_ptr]
-
-            if prev_swing_high is not None:
-                if swing_price > prev_swing_high:
-                    is_higher_high[swing_idx] = True
-                    last_high_comparison = "HH"
-                    # Structure break up when HH confirmed
-                    structure_break_up[swing_idx] = True
-                else:
-                    is_lower_high[swing_idx] = True
-                    last_high_comparison = "LH"
-
-            prev_swing_high = swing_price
-            current_swing_high = swing_price
-            current_swing_high_idx = float(swing_idx)
-            sh_ptr += 1
-
-        # Check if new swing low at this bar
-        while sl_ptr < len(swing_lows) and swing_lows[sl_ptr][0] <= i:
-            swing_idx, swing_price = swing_lows[sl_ptr]
-
-            if prev_swing_low is not None:
-                if swing_price > prev_swing_low:
-                    is_higher_low[swing_idx] = True
-                    last_low_comparison = "HL"
-                else:
-                    is_lower_low[swing_idx] = True
-                    last_low_comparison = "LL"
-                    # Structure break down when LL confirmed
-                    structure_break_down[swing_idx] = True
-
-            prev_swing_low = swing_price
-            current_swing_low = swing_price
-            current_swing_low_idx = float(swing_idx)
-            sl_ptr += 1
-
-        # Store current swing values
-        swing_high_arr[i] = current_swing_high
-        swing_low_arr[i] = current_swing_low
-        swing_high_idx_arr[i] = current_swing_high_idx
-        swing_low_idx_arr[i] = current_swing_low_idx
-
-        # Determine order flow
-        if last_high_comparison and last_low_comparison:
-            if last_high_comparison == "HH" and last_low_comparison == "HL":
-                order_flow_arr[i] = "bullish"
-                structure_trend_arr[i] = "bullish"
-            elif last_high_comparison == "LH" and last_low_comparison == "LL":
-                order_flow_arr[i] = "bearish"
-                structure_trend_arr[i] = "bearish"
-            else:
-                order_flow_arr[i] = "mixed"
-                structure_trend_arr[i] = "mixed"
+    columns, _ = compute_structure(
+        df["high"].values, df["low"].values, lookback=SWING_LOOKBACK, mode=mode
+    )
 
     # Assign columns
-    df["swing_high"] = swing_high_arr
-    df["swing_low"] = swing_low_arr
-    df["swing_high_idx"] = swing_high_idx_arr
-    df["swing_low_idx"] = swing_low_idx_arr
-    df["is_higher_high"] = is_higher_high
-    df["is_lower_high"] = is_lower_high
-    df["is_higher_low"] = is_higher_low
-    df["is_lower_low"] = is_lower_low
-    df["order_flow"] = order_flow_arr
-    df["structure_break_up"] = structure_break_up
-    df["structure_break_down"] = structure_break_down
-    df["structure_trend"] = structure_trend_arr
-    df["structure_confirmed"] = structure_break_up | structure_break_down
+    for col in LAYER_4_COLUMNS:
+        df[col] = columns[col]
 
     return df
 
 
+def compute_structure(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    lookback: int = SWING_LOOKBACK,
+    offset: int = 0,
+    state: dict | None = None,
+    mode: str = "vectorized",
+) -> tuple[dict[str, np.ndarray], dict]:
+    """
+    Run swing detection and the HH/HL/LH/LL state machine over arrays.
+
+    A swing at bar i is only confirmed once bars up to i+lookback exist, so
+    the state after bar `len - lookback - 1` is final. That state is returned
+    so incremental enrichment can resume from it (offset = global index of
+    highs[0]; resumed windows must start `lookback` bars before the first
+    unconfirmed bar).
+
+    Both modes give identical results for finite prices.
+
+    Returns:
+        (columns keyed by LAYER_4_COLUMNS, carry state)
+    """
+    if mode == "reference":
+        from .reference import l4_structure_breaks as reference
+
+        return reference.compute_structure(highs, lows, lookback, offset, state)
+
+    n = len(highs)
+    st = dict(state) if state else initial_state()
+    high_idx, low_idx = swing_points(highs, lows, lookback)
+    high_prices = np.asarray(highs)[high_idx]
+    low_prices = np.asarray(lows)[low_idx]
+
+    swing_high_arr, swing_high_idx_arr, is_higher_high, is_lower_high, high_codes = (
+        _structure_side(n, high_idx, high_prices, st, "high", ("HH", "LH"), offset)
+    )
+    swing_low_arr, swing_low_idx_arr, is_higher_low, is_lower_low, low_codes = (
+        _structure_side(n, low_idx, low_prices, st, "low", ("HL", "LL"), offset)
+    )
+
+    # Order flow from the latest comparison on each side
+    flow = _ORDER_FLOW[high_codes, low_codes]
+    structure_break_up = is_higher_high.copy()  # HH confirmed
+    structure_break_down = is_lower_low.copy()  # LL confirmed
+
+    # Every swing sits at or before bar `n - lookback - 1`, so the carry
+    # state is the state after the last swing on each side
+    final_at = n - lookback - 1
+    if final_at >= 0:
+        for side, idx, prices, codes, labels in (
+            ("high", high_idx, high_prices, high_codes, ("HH", "LH")),
+            ("low", low_idx, low_prices, low_codes, ("HL", "LL")),
+        ):
+            if len(idx):
+                st[f"prev_swing_{side}"] = prices[-1]
+                st[f"current_swing_{side}"] = prices[-1]
+                st[f"current_swing_{side}_idx"] = float(idx[-1] + offset)
+            code = codes[final_at]
+            st[f"last_{side}_comparison"] = labels[code - 1] if code else None
+
+    columns = {
+        "swing_high": swing_high_arr,
+        "swing_low": swing_low_arr,
+        "swing_high_idx": swing_high_idx_arr,
+        "swing_low_idx": swing_low_idx_arr,
+        "is_higher_high": is_higher_high,
+        "is_lower_high": is_lower_high,
+        "is_higher_low": is_higher_low,
+        "is_lower_low": is_lower_low,
+        "order_flow": flow,
+        "structure_break_up": structure_break_up,
+        "structure_break_down": structure_break_down,
+        "structure_trend": flow.copy(),
+        "structure_confirmed": structure_break_up | structure_break_down,
+    }
+    return columns, st
+
+
+# Comparison codes: 0 = none yet, 1 = HH / HL, 2 = LH / LL
+_ORDER_FLOW = np.array(
+    [
+        ["neutral", "neutral", "neutral"],
+        ["neutral", "bullish", "mixed"],
+        ["neutral", "mixed", "bearish"],
+    ],
+    dtype=object,
+)
+
+
+def _structure_side(
+    n: int,
+    idx: np.ndarray,
+    prices: np.ndarray,
+    st: dict,
+    side: str,
+    labels: tuple[str, str],
+    offset: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Array form of one side (highs or lows) of the state machine.
+
+    Each swing is compared with the swing before it (the first one with the
+    carried prev_swing_*), and every bar takes the values of the latest
+    swing at or before it.
+
+    Returns:
+        (swing value, swing idx, higher flags, lower flags, comparison codes)
+    """
+    prev = st[f"prev_swing_{side}"]
+    higher = np.zeros(n, dtype=bool)
+    lower = np.zeros(n, dtype=bool)
+    values = np.full(n, st[f"current_swing_{side}"], dtype=np.float64)
+    indices = np.full(n, st[f"current_swing_{side}_idx"], dtype=np.float64)
+    last = st[f"last_{side}_comparison"]
+    codes = np.full(n, 0 if last is None else labels.index(last) + 1, dtype=np.int8)
+    if not len(idx):
+        return values, indices, higher, lower, codes
+
+    before = np.empty(len(idx), dtype=np.float64)
+    before[1:] = prices[:-1]
+    before[0] = np.nan if prev is None else prev
+    compared = np.ones(len(idx), dtype=bool)
+    compared[0] = prev is not None
+    is_higher = compared & (prices > before)
+    is_lower = compared & ~(prices > before)
+    higher[idx] = is_higher
+    lower[idx] = is_lower
+    swing_codes = np.where(is_higher, 1, np.where(is_lower, 2, codes[0])).astype(np.int8)
+
+    # Latest swing at or before each bar (-1 = none yet)
+    latest = np.full(n, -1, dtype=np.int64)
+    latest[idx] = np.arange(len(idx))
+    latest = np.maximum.accumulate(latest)
+    seen = latest >= 0
+    values[seen] = prices[latest[seen]]
+    indices[seen] = (idx + offset)[latest[seen]]
+    codes[seen] = swing_codes[latest[seen]]
+    return values, indices, higher, lower, codes
+
+
+def initial_state() -> dict:
+    """Structure state before any swing has been seen."""
+    return {
+        "prev_swing_high": None,
+        "prev_swing_low": None,
+        "current_swing_high": np.nan,
+        "current_swing_low": np.nan,
+        "current_swing_high_idx": np.nan,
+        "current_swing_low_idx": np.nan,
+        "last_high_comparison": None,
+        "last_low_comparison": None,
+    }
+
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
@@ -0,0 +1,112 @@
+"""
+L5 Active Order-Block Index — indexed mitigation for OB tracking.
+
+SPRINT: S27.0
+
+Replaces the per-bar rescan of every live OB with:
+
+- a heap ordered by mitigation level (bull: low, bear: high), so a bar
+  pops exactly the OBs its close mitigates: O(log k + hits)
+- an insertion-ordered stack with lazy removal for the most recent
+  active OB (amortized O(1))
+- lazy touch counting: only the reported OB is kept current bar by bar;
+  an OB resurfacing after being buried counts its missed bars in one
+  array operation
+
+Touch semantics match the reference loop: a bar touches an active OB when
+low <= ob.high and high >= ob.low (counted on the formation bar too).
+
+INVARIANTS:
+- INV-CONTRACT-1: identical columns/state to the reference loop
+"""
+
+from __future__ import annotations
+
+import heapq
+
+import numpy as np
+
+
+class ActiveOrderBlocks:
+    """Active OBs of one side over one block of bars."""
+
+    def __init__(
+        self,
+        side: str,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        active: list[dict] | None = None,
+    ) -> None:
+        self._bull = side == "bull"
+        self._highs = highs
+        self._lows = lows
+
+        self._obs: list[dict] = []
+        self._alive: list[bool] = []
+        self._counted: list[int] = []  # last local bar included in touches
+        self._heap: list[tuple[float, int]] = []
+        self._stack: list[int] = []
+
+        # Carried OBs have touches counted through the previous block
+        for ob in active or []:
+            self.add(dict(ob), counted=-1)
+
+    def add(self, ob: dict, counted: int) -> None:
+        """Activate an OB (touches already counted through local bar `counted`)."""
+        slot = len(self._obs)
+        self._obs.append(ob)
+        self._alive.append(True)
+        self._counted.append(counted)
+        self._stack.append(slot)
+
+        # NaN levels are never mitigated (comparison is False), keep them off the heap
+        level = ob["low"] if self._bull else ob["high"]
+        if level == level:
+            heapq.heappush(self._heap, (-level if self._bull else level, slot))
+
+    def mitigate(self, close: float) -> bool:
+        """Remove every OB the close mitigates; True if any was removed."""
+        heap = self._heap
+        hit = False
+        if self._bull:
+            # close below OB low
+            while heap and close < -heap[0][0]:
+                self._alive[heapq.heappop(heap)[1]] = False
+                hit = True
+        else:
+            # close above OB high
+            while heap and close > heap[0][0]:
+                self._alive[heapq.heappop(heap)[1]] = False
+                hit = True
+        return hit
+
+    def latest(self, k: int) -> dict | None:
+        """Most recent active OB with touches counted through local bar k."""
+        stack = self._stack
+        while stack and not self._alive[stack[-1]]:
+            stack.pop()
+        if not stack:
+            return None
+        slot = stack[-1]
+        self._count_touches(slot, k)
+        return self._obs[slot]
+
+    def state(self, k: int) -> list[dict]:
+        """Active OBs (insertion order) with touches through local bar k."""
+        slots = [s for s in self._stack if self._alive[s]]
+        for slot in slots:
+            self._count_touches(slot, k)
+        return [self._obs[s] for s in slots]
+
+    def _count_touches(self, slot: int, k: int) -> None:
+        start = self._counted[slot] + 1
+        if start > k:
+            return
+        ob = self._obs[slot]
+        if start == k:
+            touched = self._lows[k] <= ob["high"] and self._highs[k] >= ob["low"]
+        else:
+            lows, highs = self._lows[start : k + 1], self._highs[start : k + 1]
+            touched = np.count_nonzero((lows <= ob["high"]) & (highs >= ob["low"]))
+        ob["touches"] += int(touched)
+        self._counted[slot] = k
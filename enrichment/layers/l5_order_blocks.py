@@ -36,12 +36,28 @@ INVARIANTS:
 import numpy as np
 import pandas as pd
 
+from .l5_active_index import ActiveOrderBlocks
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Bars searched back from a displacement for the opposing OB candle
+OB_LOOKBACK = 10
+
+# "indexed": vectorized formation scan + ActiveOrderBlocks; "reference": original loops
+# (layers/reference/l5_order_blocks.py)
+OB_MODES = ("indexed", "reference")
+
+
 # =============================================================================
 # OB DETECTION
 # =============================================================================
 
 
-def _detect_order_blocks(df: pd.DataFrame, lookback: int = 10) -> dict[str, list[dict]]:
+def detect_order_blocks(
+    df: pd.DataFrame, lookback: int = OB_LOOKBACK, mode: str = "indexed"
+) -> dict[str, list[dict]]:
     """
     Detect Order Blocks.
 
@@ -51,17 +67,38 @@ def _detect_order_blocks(df: pd.DataFrame, lookback: int = 10) -> dict[str, list
 
     NO forward_fill — returns discrete OB events.
     """
-    obs_bull = []
-    obs_bear = []
-
     if len(df) < 5:
-        return {"bull": obs_bull, "bear": obs_bear}
+        return {"bull": [], "bear": []}
 
     opens = df["open"].values
     highs = df["high"].values
     lows = df["low"].values
     closes = df["close"].values
+    disp_up, disp_down = _displacement_flags(df, opens, highs, lows, closes)
+
+    if mode == "reference":
+        from .reference import l5_order_blocks as reference
 
+        return reference.scan_order_blocks(opens, highs, lows, closes, disp_up, disp_down, lookback)
+
+    n = len(df)
+    idx = np.arange(n)
+    return {
+        # BULLISH OB: Last bearish candle before bullish displacement
+        "bull": _scan_formations(disp_up, closes < opens, highs, lows, idx, lookback),
+        # BEARISH OB: Last bullish candle before bearish displacement
+        "bear": _scan_formations(disp_down, closes > opens, highs, lows, idx, lookback),
+    }
+
+
+def _displacement_flags(
+    df: pd.DataFrame,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Displacement up/down per bar (L6 columns, else inline fallback)."""
     # Check for displacement column (from L6)
     if "is_displacement" in df.columns:
         is_disp = df["is_displacement"].values
@@ -86,38 +123,35 @@ def _detect_order_blocks(df: pd.DataFrame, lookback: int = 10) -> dict[str, list
         disp_up = is_disp & (closes > opens)
         disp_down = is_disp & (closes < opens)
 
-    for i in range(2, len(df)):
-        # BULLISH OB: Last bearish candle before bullish displacement
-        if disp_up[i]:
-            for j in range(i - 1, max(i - lookback, 0), -1):
-                if closes[j] < opens[j]:  # Bearish candle
-                    obs_bull.append(
-                        {
-                            "idx": i,
-                            "ob_idx": j,
-                            "high": highs[j],
-                            "low": lows[j],
-                            "ce": (highs[j] + lows[j]) / 2,
-                        }
-                    )
-                    break
+    return disp_up, disp_down
 
-        # BEARISH OB: Last bullish candle before bearish displacement
-        if disp_down[i]:
-            for j in range(i - 1, max(i - lookback, 0), -1):
-                if closes[j] > opens[j]:  # Bullish candle
-                    obs_bear.append(
-                        {
-                            "idx": i,
-                            "ob_idx": j,
-                            "high": highs[j],
-                            "low": lows[j],
-                            "ce": (highs[j] + lows[j]) / 2,
-                        }
-                    )
-                    break
-
-    return {"bull": obs_bull, "bear": obs_bear}
+
+def _scan_formations(
+    disp: np.ndarray,
+    opposing: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    idx: np.ndarray,
+    lookback: int,
+) -> list[dict]:
+    """
+    Vectorized formation scan for one side.
+
+    For displacement bar i the OB is the most recent opposing candle j with
+    max(i - lookback, 0) < j < i (same window as the reference loop).
+    """
+    # Most recent opposing candle at or before each bar (-1 if none)
+    last_opposing = np.maximum.accumulate(np.where(opposing, idx, -1))
+
+    bars = np.flatnonzero(np.asarray(disp, dtype=bool)[2:]) + 2
+    ob_idx = last_opposing[bars - 1]
+    keep = ob_idx > np.maximum(bars - lookback, 0)
+    bars, ob_idx = bars[keep], ob_idx[keep]
+
+    return [
+        {"idx": int(i), "ob_idx": int(j), "high": highs[j], "low": lows[j], "ce": ce}
+        for i, j, ce in zip(bars, ob_idx, (highs[ob_idx] + lows[ob_idx]) / 2, strict=True)
+    ]
 
 
 # =============================================================================
@@ -125,7 +159,7 @@ def _detect_order_blocks(df: pd.DataFrame, lookback: int = 10) -> dict[str, list
 # =============================================================================
 
 
-def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
+def enrich(df: pd.DataFrame, symbol: str = "EURUSD", mode: str = "indexed") -> pd.DataFrame:
     """
     Add order block columns.
 
@@ -139,134 +173,110 @@ def enrich(df: pd.DataFrame, symbol: str = "EURUSD") -> pd.DataFrame:
     Args:
         df: DataFrame with OHLC and L6 columns
         symbol: Trading symbol
+        mode: "indexed" (default) or "reference" (original loops, for parity checks)
 
     Returns:
         DataFrame with 14 new columns
     """
+    if mode not in OB_MODES:
+        raise ValueError(f"Unknown order block mode: {mode!r} (expected one of {OB_MODES})")
+
     df = df.copy()
 
     _validate_input(df)
 
-    n = len(df)
-    closes = df["close"].values
-    highs = df["high"].values
-    lows = df["low"].values
-
     # Detect OBs
-    obs = _detect_order_blocks(df)
-
-    # Initialize arrays
-    ob_bull_high = np.full(n, np.nan)
-    ob_bull_low = np.full(n, np.nan)
-    ob_bull_ce = np.full(n, np.nan)
-    ob_bull_active = np.zeros(n, dtype=bool)
-    ob_bull_mitigated = np.zeros(n, dtype=bool)
-    ob_bull_age = np.zeros(n, dtype=int)
-    ob_bull_touches = np.zeros(n, dtype=int)
-
-    ob_bear_high = np.full(n, np.nan)
-    ob_bear_low = np.full(n, np.nan)
-    ob_bear_ce = np.full(n, np.nan)
-    ob_bear_active = np.zeros(n, dtype=bool)
-    ob_bear_mitigated = np.zeros(n, dtype=bool)
-    ob_bear_age = np.zeros(n, dtype=int)
-    ob_bear_touches = np.zeros(n, dtype=int)
-
-    # Track active OBs (NO ffill — explicit state)
-    active_bull_obs = []  # List of {'high', 'low', 'ce', 'start_idx', 'touches'}
-    active_bear_obs = []
-
-    # Create lookup for OB formation bars
-    bull_ob_map = {ob["idx"]: ob for ob in obs["bull"]}
-    bear_ob_map = {ob["idx"]: ob for ob in obs["bear"]}
-
-    # Process each bar
-    for i in range(n):
-        # Add new OBs formed at this bar
-        if i in bull_ob_map:
-            ob = bull_ob_map[i]
-            active_bull_obs.append(
-                {"high": ob["high"], "low": ob["low"], "ce": ob["ce"], "start_idx": i, "touches": 0}
-            )
-
-        if i in bear_ob_map:
-            ob = bear_ob_map[i]
-            active_bear_obs.append(
-                {"high": ob["high"], "low": ob["low"], "ce": ob["ce"], "start_idx": i, "touches": 0}
-            )
-
-        # Check BULLISH OBs
-        mitigated_bull = []
-        for j, ob in enumerate(active_bull_obs):
-            # Check if price in OB zone
-            if lows[i] <= ob["high"] and highs[i] >= ob["low"]:
-                ob["touches"] += 1
-
-            # Check mitigation (price closes below OB low)
-            if closes[i] < ob["low"]:
-                mitigated_bull.append(j)
-                ob_bull_mitigated[i] = True
-
-        # Remove mitigated OBs
-        for j in reversed(mitigated_bull):
-            active_bull_obs.pop(j)
-
-        # Store most recent active bull OB (if any)
-        if active_bull_obs:
-            latest = active_bull_obs[-1]
-            ob_bull_high[i] = latest["high"]
-            ob_bull_low[i] = latest["low"]
-            ob_bull_ce[i] = latest["ce"]
-            ob_bull_active[i] = True
-            ob_bull_age[i] = i - latest["start_idx"]
-            ob_bull_touches[i] = latest["touches"]
-
-        # Check BEARISH OBs
-        mitigated_bear = []
-        for j, ob in enumerate(active_bear_obs):
-            # Check if price in OB zone
-            if lows[i] <= ob["high"] and highs[i] >= ob["low"]:
-                ob["touches"] += 1
-
-            # Check mitigation (price closes above OB high)
-            if closes[i] > ob["high"]:
-                mitigated_bear.append(j)
-                ob_bear_mitigated[i] = True
-
-        # Remove mitigated OBs
-        for j in reversed(mitigated_bear):
-            active_bear_obs.pop(j)
-
-        # Store most recent active bear OB (if any)
-        if active_bear_obs:
-            latest = active_bear_obs[-1]
-            ob_bear_high[i] = latest["high"]
-            ob_bear_low[i] = latest["low"]
-            ob_bear_ce[i] = latest["ce"]
-            ob_bear_active[i] = True
-            ob_bear_age[i] = i - latest["start_idx"]
-            ob_bear_touches[i] = latest["touches"]
+    obs = detect_order_blocks(df, mode=mode)
+
+    if mode == "indexed":
+        track = track_order_blocks
+    else:
+        from .reference import l5_order_blocks as reference
+
+        track = reference.track_order_blocks
+    columns, _ = track(df["close"].values, df["high"].values, df["low"].values, obs)
 
     # Assign columns
-    df["ob_bull_high"] = ob_bull_high
-    df["ob_bull_low"] = ob_bull_low
-    df["ob_bull_ce"] = ob_bull_ce
-    df["ob_bull_active"] = ob_bull_active
-    df["ob_bull_mitigated"] = ob_bull_mitigated
-    df["ob_bull_age"] = ob_bull_age
-    df["ob_bull_touches"] = ob_bull_touches
-
-    df["ob_bear_high"] = ob_bear_high
-    df["ob_bear_low"] = ob_bear_low
-    df["ob_bear_ce"] = ob_bear_ce
-    df["ob_bear_active"] = ob_bear_active
-    df["ob_bear_mitigated"] = ob_bear_mitigated
-    df["ob_bear_age"] = ob_bear_age
-    df["ob_bear_touches"] = ob_bear_touches
+    for col in LAYER_5_COLUMNS:
+        df[col] = columns[col]
 
     return df
 
 
+def track_order_blocks(
+    closes: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    obs: dict[str, list[dict]],
+    offset: int = 0,
+    active: tuple[list[dict], list[dict]] | None = None,
+) -> tuple[dict[str, np.ndarray], tuple[list[dict], list[dict]]]:
+    """
+    Track active OBs with ActiveOrderBlocks (O(log k + hits) per bar).
+
+    Same contract as the per-bar reference loop: `obs` idx values are
+    global bar indices, `offset` is the global index of closes[0], and the
+    returned active lists resume tracking in a later call.
+    """
+    n = len(closes)
+    columns = {}
+    state = []
+
+    for side, book in (("bull", 0), ("bear", 1)):
+        index = ActiveOrderBlocks(side, highs, lows, active[book] if active else None)
+        formed = {ob["idx"] - offset: ob for ob in obs[side]}
+
+        latest = np.full(n, -1)
+        touches = np.zeros(n, dtype=int)
+        mitigated = np.zeros(n, dtype=bool)
+        reported: list[dict] = []
+
+        for k in range(n):
+            if k in formed:
+                ob = formed[k]
+                index.add(
+                    {
+                        "high": ob["high"],
+                        "low": ob["low"],
+                        "ce": ob["ce"],
+                        "start_idx": k + offset,
+                        "touches": 0,
+                    },
+                    counted=k - 1,
+                )
+            mitigated[k] = index.mitigate(closes[k])
+
+            current = index.latest(k)
+            if current is not None:
+                if not reported or reported[-1] is not current:
+                    reported.append(current)
+                latest[k] = len(reported) - 1
+                touches[k] = current["touches"]
+
+        active_rows = latest >= 0
+        rows = latest[active_rows]
+        zone = {
+            key: np.array([ob[key] for ob in reported], dtype=float)
+            for key in ("high", "low", "ce")
+        }
+        starts = np.array([ob["start_idx"] for ob in reported], dtype=int)
+
+        for key in ("high", "low", "ce"):
+            values = np.full(n, np.nan)
+            values[active_rows] = zone[key][rows]
+            columns[f"ob_{side}_{key}"] = values
+        columns[f"ob_{side}_active"] = active_rows
+        columns[f"ob_{side}_mitigated"] = mitigated
+        age = np.zeros(n, dtype=int)
+        age[active_rows] = np.flatnonzero(active_rows) + offset - starts[rows]
+        columns[f"ob_{side}_age"] = age
+        columns[f"ob_{side}_touches"] = touches
+        state.append(index.state(n - 1))
+
+    columns = {col: columns[col] for col in LAYER_5_COLUMNS}
+    return columns, (state[0], state[1])
+
+
 # =============================================================================
 # VALIDATION
 # =============================================================================
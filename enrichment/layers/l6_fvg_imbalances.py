@@ -38,37 +38,56 @@ import pandas as pd
 
 def _calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Calculate Average True Range."""
-    high = df["high"]
-    low = df["low"]
-    close = df["close"].shift(1)
+    true_range = compute_true_range(df["high"].values, df["low"].values, df["close"].values)
+    return pd.Series(compute_atr(true_range, period), index=df.index)
 
-    tr1 = high - low
-    tr2 = abs(high - close)
-    tr3 = abs(low - close)
 
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.ewm(span=period, adjust=False).mean()
+def compute_true_range(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, prev_close: float = np.nan
+) -> np.ndarray:
+    """
+    True range per bar (NaN terms skipped, so bar 0 falls back to high - low).
 
-    return atr
+    `prev_close` is the close before high[0] (resuming from earlier bars).
+    """
+    prev = np.concatenate([[prev_close], close[:-1]])
 
+    tr1 = high - low
+    tr2 = np.abs(high - prev)
+    tr3 = np.abs(low - prev)
 
-def _bars_since_event(event_series: pd.Series) -> pd.Series:
+    return np.fmax(np.fmax(tr1, tr2), tr3)
+
+
+def compute_atr(
+    true_range: np.ndarray, period: int = 14, prev_atr: float | None = None
+) -> np.ndarray:
     """
-    Calculate bars since last True event.
+    ATR as EWM(span=period, adjust=False) of true range.
 
-    NO forward_fill — explicit iteration.
+    The recursion runs in pandas' compiled EWM (linear, one pass). Passing
+    the ATR of the previous bar as `prev_atr` continues the recursion
+    exactly where an earlier call stopped.
     """
-    n = len(event_series)
-    bars_since = np.full(n, 9999, dtype=int)
+    if prev_atr is None:
+        return pd.Series(true_range).ewm(span=period, adjust=False).mean().to_numpy()
+    seeded = np.concatenate([[prev_atr], true_range])
+    return pd.Series(seeded).ewm(span=period, adjust=False).mean().to_numpy()[1:]
 
-    last_event_idx = None
-    for i in range(n):
-        if event_series.iloc[i]:
-            last_event_idx = i
-        if last_event_idx is not None:
-            bars_since[i] = i - last_event_idx
 
-    return pd.Series(bars_since, index=event_series.index)
+def compute_bars_since(events: np.ndarray, start: int = 0, last: int | None = None) -> np.ndarray:
+    """
+    Bars since the last True event (9999 before any event).
+
+    Bar k has index start + k; `last` is the index of an earlier event
+    (resuming from earlier bars).
+    """
+    idx = np.arange(start, start + len(events))
+    hit = np.where(events, idx, -1)
+    if last is not None:
+        hit = np.maximum(hit, last)
+    hit = np.maximum.accumulate(hit)
+    return np.where(hit >= 0, idx - hit, 9999)
 
 
 # =============================================================================
@@ -76,16 +95,17 @@ def _bars_since_event(event_series: pd.Series) -> pd.Series:
 # =============================================================================
 
 
-def _detect_fvg(df: pd.DataFrame) -> dict:
+def _fvg_arrays(highs: np.ndarray, lows: np.ndarray) -> dict:
     """
     Detect FVGs using ICT definition.
 
     Bullish FVG: Candle[i-2].high < Candle[i].low
     Bearish FVG: Candle[i-2].low > Candle[i].high
 
-    Returns discrete FVG events (NO forward_fill).
+    Returns discrete FVG events (NO forward_fill); the first two bars never
+    form a gap.
     """
-    n = len(df)
+    n = len(highs)
 
     fvg_bull = np.zeros(n, dtype=bool)
     fvg_bear = np.zeros(n, dtype=bool)
@@ -94,26 +114,23 @@ def _detect_fvg(df: pd.DataFrame) -> dict:
     fvg_bear_high = np.full(n, np.nan)
     fvg_bear_low = np.full(n, np.nan)
 
-    highs = df["high"].values
-    lows = df["low"].values
-
-    for i in range(2, n):
-        candle_a_high = highs[i - 2]
-        candle_a_low = lows[i - 2]
-        candle_c_high = highs[i]
-        candle_c_low = lows[i]
+    if n >= 3:
+        candle_a_high = highs[:-2]
+        candle_a_low = lows[:-2]
+        candle_c_high = highs[2:]
+        candle_c_low = lows[2:]
 
         # Bullish FVG
-        if candle_a_high < candle_c_low:
-            fvg_bull[i] = True
-            fvg_bull_high[i] = candle_c_low  # Top of gap
-            fvg_bull_low[i] = candle_a_high  # Bottom of gap
+        bull = candle_a_high < candle_c_low
+        fvg_bull[2:] = bull
+        fvg_bull_high[2:][bull] = candle_c_low[bull]  # Top of gap
+        fvg_bull_low[2:][bull] = candle_a_high[bull]  # Bottom of gap
 
         # Bearish FVG
-        if candle_a_low > candle_c_high:
-            fvg_bear[i] = True
-            fvg_bear_high[i] = candle_a_low  # Top of gap
-            fvg_bear_low[i] = candle_c_high  # Bottom of gap
+        bear = candle_a_low > candle_c_high
+        fvg_bear[2:] = bear
+        fvg_bear_high[2:][bear] = candle_a_low[bear]  # Top of gap
+        fvg_bear_low[2:][bear] = candle_c_high[bear]  # Bottom of gap
 
     return {
         "fvg_bull": fvg_bull,
@@ -148,6 +165,14 @@ def enrich(df: pd.DataFrame, atr_period: int = 14) -> pd.DataFrame:
 
     _validate_input(df)
 
+    add_displacement(df, atr_period)
+    add_fvg(df)
+
+    return df
+
+
+def add_displacement(df: pd.DataFrame, atr_period: int = 14) -> None:
+    """ATR, body/range metrics and displacement columns (in place)."""
     # =========================================================================
     # ATR CALCULATION
     # =========================================================================
@@ -160,58 +185,61 @@ def enrich(df: pd.DataFrame, atr_period: int = 14) -> pd.DataFrame:
     # BODY & RANGE METRICS (4 columns)
     # =========================================================================
 
-    df["candle_body"] = abs(df["close"] - df["open"])
-    df["candle_range"] = df["high"] - df["low"]
+    opens = df["open"].values
+    highs = df["high"].values
+    lows = df["low"].values
+    closes = df["close"].values
+    atr = df[atr_col].values
+
+    candle_body = np.abs(closes - opens)
+    candle_range = highs - lows
 
-    df["body_ratio"] = np.where(df["candle_range"] > 0, df["candle_body"] / df["candle_range"], 0)
+    df["candle_body"] = candle_body
+    df["candle_range"] = candle_range
 
-    df["atr_body_multiple"] = np.where(df[atr_col] > 0, df["candle_body"] / df[atr_col], 0)
+    body_ratio = np.where(candle_range > 0, candle_body / candle_range, 0)
+    df["body_ratio"] = body_ratio
+
+    atr_body_multiple = np.where(atr > 0, candle_body / atr, 0)
+    df["atr_body_multiple"] = atr_body_multiple
 
     # =========================================================================
     # DISPLACEMENT DETECTION (3 columns)
     # =========================================================================
 
     # Displacement = body > 1.5x ATR AND body_ratio > 0.6
-    is_displacement = (df["atr_body_multiple"] > 1.5) & (df["body_ratio"] > 0.6)
-    is_bullish = df["close"] > df["open"]
-    is_bearish = df["close"] < df["open"]
+    is_displacement = (atr_body_multiple > 1.5) & (body_ratio > 0.6)
+    displacement_up = is_displacement & (closes > opens)
+    displacement_down = is_displacement & (closes < opens)
 
-    df["displacement_up"] = is_displacement & is_bullish
-    df["displacement_down"] = is_displacement & is_bearish
+    df["displacement_up"] = displacement_up
+    df["displacement_down"] = displacement_down
     df["is_displacement"] = is_displacement
 
     # =========================================================================
     # DISPLACEMENT METRICS (5 columns)
     # =========================================================================
 
-    df["displacement_pips"] = np.where(is_displacement, df["candle_body"] * 10000, 0)
-
-    df["displacement_atr_multiple"] = np.where(is_displacement, df["atr_body_multiple"], 0)
+    df["displacement_pips"] = np.where(is_displacement, candle_body * 10000, 0)
 
-    df["bars_since_displacement_up"] = _bars_since_event(df["displacement_up"])
-    df["bars_since_displacement_down"] = _bars_since_event(df["displacement_down"])
-    df["bars_since_any_displacement"] = np.minimum(
-        df["bars_since_displacement_up"], df["bars_since_displacement_down"]
-    )
+    df["displacement_atr_multiple"] = np.where(is_displacement, atr_body_multiple, 0)
 
-    # =========================================================================
-    # FVG DETECTION (8 columns)
-    # =========================================================================
+    bars_since_up = compute_bars_since(displacement_up)
+    bars_since_down = compute_bars_since(displacement_down)
+    df["bars_since_displacement_up"] = bars_since_up
+    df["bars_since_displacement_down"] = bars_since_down
+    df["bars_since_any_displacement"] = np.minimum(bars_since_up, bars_since_down)
 
-    fvg = _detect_fvg(df)
 
-    df["fvg_bull"] = fvg["fvg_bull"]
-    df["fvg_bear"] = fvg["fvg_bear"]
-    df["fvg_bull_high"] = fvg["fvg_bull_high"]
-    df["fvg_bull_low"] = fvg["fvg_bull_low"]
-    df["fvg_bear_high"] = fvg["fvg_bear_high"]
-    df["fvg_bear_low"] = fvg["fvg_bear_low"]
+def add_fvg(df: pd.DataFrame) -> None:
+    """FVG columns (8) from highs/lows (in place)."""
+    fvg = _fvg_arrays(df["high"].values, df["low"].values)
+    for col, values in fvg.items():
+        df[col] = values
 
     # FVG midpoint (CE - Consequent Encroachment)
-    df["fvg_bull_ce"] = (df["fvg_bull_high"] + df["fvg_bull_low"]) / 2
-    df["fvg_bear_ce"] = (df["fvg_bear_high"] + df["fvg_bear_low"]) / 2
-
-    return df
+    df["fvg_bull_ce"] = (fvg["fvg_bull_high"] + fvg["fvg_bull_low"]) / 2
+    df["fvg_bear_ce"] = (fvg["fvg_bear_high"] + fvg["fvg_bear_low"]) / 2
 
 
 # =============================================================================
@@ -0,0 +1,12 @@
+"""
+Phoenix Enrichment Layers — Reference Loops.
+
+SPRINT: S27.0
+
+Original per-bar loops of L3-L6, kept as the parity reference for the
+array kernels. Each layer's mode="reference" runs these, and the parity
+tests import them directly. Never on the production path.
+
+INVARIANTS:
+- INV-CONTRACT-1: array kernels match these loops exactly
+"""
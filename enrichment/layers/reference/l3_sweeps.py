@@ -0,0 +1,165 @@
+"""
+Layer 3 Reference: Sweeps — Per-Bar Loop.
+
+SPRINT: S27.0
+
+Original sweep scan, one bar at a time, with scalar timing and extension
+rules. l3_sweeps.add_sweeps runs it with mode="reference"; the vectorized
+scan must match it column for column. Both read the Kill Zone, session
+and extension thresholds from l3_sweeps.
+
+INVARIANTS:
+- INV-CONTRACT-1: deterministic
+"""
+
+import numpy as np
+
+from ..l3_sweeps import (
+    KILL_ZONE_HOURS,
+    SESSION_HOURS,
+    SWEEP_MAX_PIPS,
+    SWEEP_MIN_PIPS,
+    empty_sweep_columns,
+)
+
+# =============================================================================
+# TIMING HELPERS
+# =============================================================================
+
+
+def timing_quality(hour_ny: int) -> tuple[bool, bool, str, int]:
+    """
+    Determine sweep timing priority.
+
+    Returns: (during_kz, during_session, timing_quality, timing_score)
+    """
+    # Kill Zones (score 3)
+    if hour_ny in KILL_ZONE_HOURS:
+        return True, True, "kz", 3
+
+    # Main Sessions (score 2)
+    for start, end in SESSION_HOURS:
+        if start < end:
+            inside = start <= hour_ny < end
+        else:
+            inside = hour_ny >= start or hour_ny < end
+        if inside:
+            return False, True, "session", 2
+
+    # Off-session (score 1)
+    return False, False, "off_session", 1
+
+
+def classify_extension(extension_pips: float) -> tuple[str, bool]:
+    """
+    Classify sweep extension.
+
+    Returns: (classification, is_valid)
+    - tap: < 5 pips (not valid)
+    - sweep: 5-20 pips (VALID)
+    - displacement: > 20 pips (not valid)
+    """
+    if extension_pips < SWEEP_MIN_PIPS:
+        return "tap", False
+    elif extension_pips <= SWEEP_MAX_PIPS:
+        return "sweep", True
+    else:
+        return "displacement", False
+
+
+# =============================================================================
+# SWEEP SCAN
+# =============================================================================
+
+
+def scan_sweeps(
+    hour_ny: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    levels: dict[str, np.ndarray],
+    pip: float,
+) -> dict[str, np.ndarray]:
+    """Per-bar scan (same result as the vectorized l3_sweeps scan)."""
+    n = len(high)
+    out = empty_sweep_columns(n)
+    pdh, pdl = levels["pdh"], levels["pdl"]
+    pwh, pwl = levels["pwh"], levels["pwl"]
+    asia_high, asia_low = levels["asia_high"], levels["asia_low"]
+
+    # Scan for sweeps
+    for i in range(1, n):
+        # Check if high swept any level
+        swept_high = False
+        target_type = None
+        target_level = np.nan
+        direction = None
+
+        # PDH sweep (bearish setup)
+        if not np.isnan(pdh[i]) and high[i] > pdh[i]:
+            swept_high = True
+            target_type = "pdh"
+            target_level = pdh[i]
+            direction = "bearish"
+        # PWH sweep
+        elif not np.isnan(pwh[i]) and high[i] > pwh[i]:
+            swept_high = True
+            target_type = "pwh"
+            target_level = pwh[i]
+            direction = "bearish"
+        # Asia high sweep
+        elif not np.isnan(asia_high[i]) and high[i] > asia_high[i]:
+            swept_high = True
+            target_type = "asia_high"
+            target_level = asia_high[i]
+            direction = "bearish"
+
+        # Check if low swept any level
+        swept_low = False
+        if not swept_high:
+            # PDL sweep (bullish setup)
+            if not np.isnan(pdl[i]) and low[i] < pdl[i]:
+                swept_low = True
+                target_type = "pdl"
+                target_level = pdl[i]
+                direction = "bullish"
+            # PWL sweep
+            elif not np.isnan(pwl[i]) and low[i] < pwl[i]:
+                swept_low = True
+                target_type = "pwl"
+                target_level = pwl[i]
+                direction = "bullish"
+            # Asia low sweep
+            elif not np.isnan(asia_low[i]) and low[i] < asia_low[i]:
+                swept_low = True
+                target_type = "asia_low"
+                target_level = asia_low[i]
+                direction = "bullish"
+
+        if swept_high or swept_low:
+            out["sweep_detected"][i] = True
+            out["sweep_direction"][i] = direction
+            out["sweep_target_type"][i] = target_type
+            out["sweep_target_level"][i] = target_level
+
+            # Calculate extension
+            if swept_high:
+                ext = (high[i] - target_level) / pip
+            else:
+                ext = (target_level - low[i]) / pip
+
+            out["sweep_extension_pips"][i] = ext
+            ext_class, is_valid = classify_extension(ext)
+            out["sweep_extension_class"][i] = ext_class
+            out["sweep_is_valid"][i] = is_valid
+
+            # Timing quality
+            during_kz, during_session, timing_q, timing_s = timing_quality(hour_ny[i])
+            out["sweep_during_kz"][i] = during_kz
+            out["sweep_during_session"][i] = during_session
+            out["sweep_timing_quality"][i] = timing_q
+            out["sweep_timing_score"][i] = timing_s
+
+            # Setup check (sweep + valid + good timing)
+            out["sweep_is_setup"][i] = is_valid and during_session
+
+    return out
@@ -0,0 +1,185 @@
+"""
+Layer 4 Reference: Structure Breaks — Per-Bar Loops.
+
+SPRINT: S27.0
+
+Original swing detection and HH/HL/LH/LL state machine, one bar at a
+time. l4_structure_breaks.compute_structure(mode="reference") runs it;
+the vectorized path must match it column for column.
+
+INVARIANTS:
+- INV-CONTRACT-1: deterministic
+"""
+
+import numpy as np
+
+from ..l4_structure_breaks import SWING_LOOKBACK, initial_state
+
+# =============================================================================
+# SWING DETECTION
+# =============================================================================
+
+
+def detect_swings(
+    highs: np.ndarray, lows: np.ndarray, lookback: int = SWING_LOOKBACK
+) -> tuple[list[tuple[int, float]], list[tuple[int, float]]]:
+    """
+    Detect swing highs and lows using local extrema.
+
+    Swing High: high[i] is highest in window [i-lookback, i+lookback]
+    Swing Low: low[i] is lowest in window [i-lookback, i+lookback]
+    """
+    n = len(highs)
+    swing_highs = []
+    swing_lows = []
+
+    for i in range(lookback, n - lookback):
+        # Swing high if highest in window
+        window_high = highs[i - lookback : i + lookback + 1]
+        if highs[i] == max(window_high):
+            swing_highs.append((i, highs[i]))
+
+        # Swing low if lowest in window
+        window_low = lows[i - lookback : i + lookback + 1]
+        if lows[i] == min(window_low):
+            swing_lows.append((i, lows[i]))
+
+    return swing_highs, swing_lows
+
+
+# =============================================================================
+# STATE MACHINE
+# =============================================================================
+
+
+def compute_structure(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    lookback: int = SWING_LOOKBACK,
+    offset: int = 0,
+    state: dict | None = None,
+) -> tuple[dict[str, np.ndarray], dict]:
+    """Per-bar state machine (same contract as l4_structure_breaks.compute_structure)."""
+    n = len(highs)
+
+    # Initialize arrays
+    swing_high_arr = np.full(n, np.nan)
+    swing_low_arr = np.full(n, np.nan)
+    swing_high_idx_arr = np.full(n, np.nan)
+    swing_low_idx_arr = np.full(n, np.nan)
+
+    is_higher_high = np.zeros(n, dtype=bool)
+    is_lower_high = np.zeros(n, dtype=bool)
+    is_higher_low = np.zeros(n, dtype=bool)
+    is_lower_low = np.zeros(n, dtype=bool)
+
+    order_flow_arr = np.array(["neutral"] * n, dtype=object)
+
+    structure_break_up = np.zeros(n, dtype=bool)
+    structure_break_down = np.zeros(n, dtype=bool)
+    structure_trend_arr = np.array(["neutral"] * n, dtype=object)
+
+    # Detect swings
+    swing_highs, swing_lows = detect_swings(highs, lows, lookback=lookback)
+
+    # Track state (NO ffill — explicit state machine)
+    st = dict(state) if state else initial_state()
+    prev_swing_high = st["prev_swing_high"]
+    prev_swing_low = st["prev_swing_low"]
+    current_swing_high = st["current_swing_high"]
+    current_swing_low = st["current_swing_low"]
+    current_swing_high_idx = st["current_swing_high_idx"]
+    current_swing_low_idx = st["current_swing_low_idx"]
+    last_high_comparison = st["last_high_comparison"]  # 'HH' or 'LH'
+    last_low_comparison = st["last_low_comparison"]  # 'HL' or 'LL'
+    final_at = n - lookback - 1
+
+    sh_ptr = 0
+    sl_ptr = 0
+
+    # Process each bar
+    for i in range(n):
+        # Check if new swing high at this bar
+        while sh_ptr < len(swing_highs) and swing_highs[sh_ptr][0] <= i:
+            swing_idx, swing_price = swing_highs[sh_ptr]
+
+            if prev_swing_high is not None:
+                if swing_price > prev_swing_high:
+                    is_higher_high[swing_idx] = True
+                    last_high_comparison = "HH"
+                    # Structure break up when HH confirmed
+                    structure_break_up[swing_idx] = True
+                else:
+                    is_lower_high[swing_idx] = True
+                    last_high_comparison = "LH"
+
+            prev_swing_high = swing_price
+            current_swing_high = swing_price
+            current_swing_high_idx = float(swing_idx + offset)
+            sh_ptr += 1
+
+        # Check if new swing low at this bar
+        while sl_ptr < len(swing_lows) and swing_lows[sl_ptr][0] <= i:
+            swing_idx, swing_price = swing_lows[sl_ptr]
+
+            if prev_swing_low is not None:
+                if swing_price > prev_swing_low:
+                    is_higher_low[swing_idx] = True
+                    last_low_comparison = "HL"
+                else:
+                    is_lower_low[swing_idx] = True
+                    last_low_comparison = "LL"
+                    # Structure break down when LL confirmed
+                    structure_break_down[swing_idx] = True
+
+            prev_swing_low = swing_price
+            current_swing_low = swing_price
+            current_swing_low_idx = float(swing_idx + offset)
+            sl_ptr += 1
+
+        # Store current swing values
+        swing_high_arr[i] = current_swing_high
+        swing_low_arr[i] = current_swing_low
+        swing_high_idx_arr[i] = current_swing_high_idx
+        swing_low_idx_arr[i] = current_swing_low_idx
+
+        # Determine order flow
+        if last_high_comparison and last_low_comparison:
+            if last_high_comparison == "HH" and last_low_comparison == "HL":
+                order_flow_arr[i] = "bullish"
+                structure_trend_arr[i] = "bullish"
+            elif last_high_comparison == "LH" and last_low_comparison == "LL":
+                order_flow_arr[i] = "bearish"
+                structure_trend_arr[i] = "bearish"
+            else:
+                order_flow_arr[i] = "mixed"
+                structure_trend_arr[i] = "mixed"
+
+        if i == final_at:
+            st = {
+                "prev_swing_high": prev_swing_high,
+                "prev_swing_low": prev_swing_low,
+                "current_swing_high": current_swing_high,
+                "current_swing_low": current_swing_low,
+                "current_swing_high_idx": current_swing_high_idx,
+                "current_swing_low_idx": current_swing_low_idx,
+                "last_high_comparison": last_high_comparison,
+                "last_low_comparison": last_low_comparison,
+            }
+
+    columns = {
+        "swing_high": swing_high_arr,
+        "swing_low": swing_low_arr,
+        "swing_high_idx": swing_high_idx_arr,
+        "swing_low_idx": swing_low_idx_arr,
+        "is_higher_high": is_higher_high,
+        "is_lower_high": is_lower_high,
+        "is_higher_low": is_higher_low,
+        "is_lower_low": is_lower_low,
+        "order_flow": order_flow_arr,
+        "structure_break_up": structure_break_up,
+        "structure_break_down": structure_break_down,
+        "structure_trend": structure_trend_arr,
+        "structure_confirmed": structure_break_up | structure_break_down,
+    }
+    return columns, st
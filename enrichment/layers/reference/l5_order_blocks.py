@@ -0,0 +1,204 @@
+"""
+Layer 5 Reference: Order Blocks — Per-Bar Loops.
+
+SPRINT: S27.0
+
+Original OB formation scan (nested lookback loop) and active-OB tracking
+(every live OB rescanned per bar). l5_order_blocks runs them with
+mode="reference"; the indexed path must match them column for column.
+
+INVARIANTS:
+- INV-CONTRACT-1: deterministic
+"""
+
+import numpy as np
+
+# =============================================================================
+# OB DETECTION
+# =============================================================================
+
+
+def scan_order_blocks(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    disp_up: np.ndarray,
+    disp_down: np.ndarray,
+    lookback: int,
+) -> dict[str, list[dict]]:
+    """Nested lookback loop (same result as l5_order_blocks.detect_order_blocks)."""
+    obs_bull = []
+    obs_bear = []
+
+    for i in range(2, len(closes)):
+        # BULLISH OB: Last bearish candle before bullish displacement
+        if disp_up[i]:
+            for j in range(i - 1, max(i - lookback, 0), -1):
+                if closes[j] < opens[j]:  # Bearish candle
+                    obs_bull.append(
+                        {
+                            "idx": i,
+                            "ob_idx": j,
+                            "high": highs[j],
+                            "low": lows[j],
+                            "ce": (highs[j] + lows[j]) / 2,
+                        }
+                    )
+                    break
+
+        # BEARISH OB: Last bullish candle before bearish displacement
+        if disp_down[i]:
+            for j in range(i - 1, max(i - lookback, 0), -1):
+                if closes[j] > opens[j]:  # Bullish candle
+                    obs_bear.append(
+                        {
+                            "idx": i,
+                            "ob_idx": j,
+                            "high": highs[j],
+                            "low": lows[j],
+                            "ce": (highs[j] + lows[j]) / 2,
+                        }
+                    )
+                    break
+
+    return {"bull": obs_bull, "bear": obs_bear}
+
+
+# =============================================================================
+# OB TRACKING
+# =============================================================================
+
+
+def track_order_blocks(
+    closes: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    obs: dict[str, list[dict]],
+    offset: int = 0,
+    active: tuple[list[dict], list[dict]] | None = None,
+) -> tuple[dict[str, np.ndarray], tuple[list[dict], list[dict]]]:
+    """
+    Track active OBs bar by bar, rescanning every live OB.
+
+    `obs` idx values and `start_idx` are global bar indices; `offset` is the
+    global index of closes[0]. Passing the returned active lists back in
+    resumes tracking exactly where the previous call stopped.
+
+    Returns:
+        (columns keyed by LAYER_5_COLUMNS, (active_bull_obs, active_bear_obs))
+    """
+    n = len(closes)
+
+    # Initialize arrays
+    ob_bull_high = np.full(n, np.nan)
+    ob_bull_low = np.full(n, np.nan)
+    ob_bull_ce = np.full(n, np.nan)
+    ob_bull_active = np.zeros(n, dtype=bool)
+    ob_bull_mitigated = np.zeros(n, dtype=bool)
+    ob_bull_age = np.zeros(n, dtype=int)
+    ob_bull_touches = np.zeros(n, dtype=int)
+
+    ob_bear_high = np.full(n, np.nan)
+    ob_bear_low = np.full(n, np.nan)
+    ob_bear_ce = np.full(n, np.nan)
+    ob_bear_active = np.zeros(n, dtype=bool)
+    ob_bear_mitigated = np.zeros(n, dtype=bool)
+    ob_bear_age = np.zeros(n, dtype=int)
+    ob_bear_touches = np.zeros(n, dtype=int)
+
+    # Track active OBs (NO ffill — explicit state)
+    # List of {'high', 'low', 'ce', 'start_idx', 'touches'}
+    active_bull_obs = [dict(ob) for ob in active[0]] if active else []
+    active_bear_obs = [dict(ob) for ob in active[1]] if active else []
+
+    # Create lookup for OB formation bars
+    bull_ob_map = {ob["idx"]: ob for ob in obs["bull"]}
+    bear_ob_map = {ob["idx"]: ob for ob in obs["bear"]}
+
+    # Process each bar
+    for k in range(n):
+        i = k + offset
+
+        # Add new OBs formed at this bar
+        if i in bull_ob_map:
+            ob = bull_ob_map[i]
+            active_bull_obs.append(
+                {"high": ob["high"], "low": ob["low"], "ce": ob["ce"], "start_idx": i, "touches": 0}
+            )
+
+        if i in bear_ob_map:
+            ob = bear_ob_map[i]
+            active_bear_obs.append(
+                {"high": ob["high"], "low": ob["low"], "ce": ob["ce"], "start_idx": i, "touches": 0}
+            )
+
+        # Check BULLISH OBs
+        mitigated_bull = []
+        for j, ob in enumerate(active_bull_obs):
+            # Check if price in OB zone
+            if lows[k] <= ob["high"] and highs[k] >= ob["low"]:
+                ob["touches"] += 1
+
+            # Check mitigation (price closes below OB low)
+            if closes[k] < ob["low"]:
+                mitigated_bull.append(j)
+                ob_bull_mitigated[k] = True
+
+        # Remove mitigated OBs
+        for j in reversed(mitigated_bull):
+            active_bull_obs.pop(j)
+
+        # Store most recent active bull OB (if any)
+        if active_bull_obs:
+            latest = active_bull_obs[-1]
+            ob_bull_high[k] = latest["high"]
+            ob_bull_low[k] = latest["low"]
+            ob_bull_ce[k] = latest["ce"]
+            ob_bull_active[k] = True
+            ob_bull_age[k] = i - latest["start_idx"]
+            ob_bull_touches[k] = latest["touches"]
+
+        # Check BEARISH OBs
+        mitigated_bear = []
+        for j, ob in enumerate(active_bear_obs):
+            # Check if price in OB zone
+            if lows[k] <= ob["high"] and highs[k] >= ob["low"]:
+                ob["touches"] += 1
+
+            # Check mitigation (price closes above OB high)
+            if closes[k] > ob["high"]:
+                mitigated_bear.append(j)
+                ob_bear_mitigated[k] = True
+
+        # Remove mitigated OBs
+        for j in reversed(mitigated_bear):
+            active_bear_obs.pop(j)
+
+        # Store most recent active bear OB (if any)
+        if active_bear_obs:
+            latest = active_bear_obs[-1]
+            ob_bear_high[k] = latest["high"]
+            ob_bear_low[k] = latest["low"]
+            ob_bear_ce[k] = latest["ce"]
+            ob_bear_active[k] = True
+            ob_bear_age[k] = i - latest["start_idx"]
+            ob_bear_touches[k] = latest["touches"]
+
+    columns = {
+        "ob_bull_high": ob_bull_high,
+        "ob_bull_low": ob_bull_low,
+        "ob_bull_ce": ob_bull_ce,
+        "ob_bull_active": ob_bull_active,
+        "ob_bull_mitigated": ob_bull_mitigated,
+        "ob_bull_age": ob_bull_age,
+        "ob_bull_touches": ob_bull_touches,
+        "ob_bear_high": ob_bear_high,
+        "ob_bear_low": ob_bear_low,
+        "ob_bear_ce": ob_bear_ce,
+        "ob_bear_active": ob_bear_active,
+        "ob_bear_mitigated": ob_bear_mitigated,
+        "ob_bear_age": ob_bear_age,
+        "ob_bear_touches": ob_bear_touches,
+    }
+    return columns, (active_bull_obs, active_bear_obs)
@@ -0,0 +1,108 @@
+"""
+Layer 6 Reference: FVG & Imbalances — Per-Bar Loops.
+
+SPRINT: S27.0
+
+Original pandas ATR, bars-since loop and candle-by-candle FVG scan. L6
+computes these with array kernels (compute_true_range / compute_atr,
+compute_bars_since, _fvg_arrays) that must match them exactly.
+
+INVARIANTS:
+- INV-CONTRACT-1: deterministic
+"""
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# DISPLACEMENT DETECTION
+# =============================================================================
+
+
+def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """Calculate Average True Range."""
+    high = df["high"]
+    low = df["low"]
+    close = df["close"].shift(1)
+
+    tr1 = high - low
+    tr2 = abs(high - close)
+    tr3 = abs(low - close)
+
+    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    atr = true_range.ewm(span=period, adjust=False).mean()
+
+    return atr
+
+
+def bars_since_event(event_series: pd.Series) -> pd.Series:
+    """
+    Calculate bars since last True event.
+
+    NO forward_fill — explicit iteration.
+    """
+    n = len(event_series)
+    bars_since = np.full(n, 9999, dtype=int)
+
+    last_event_idx = None
+    for i in range(n):
+        if event_series.iloc[i]:
+            last_event_idx = i
+        if last_event_idx is not None:
+            bars_since[i] = i - last_event_idx
+
+    return pd.Series(bars_since, index=event_series.index)
+
+
+# =============================================================================
+# FVG DETECTION
+# =============================================================================
+
+
+def detect_fvg(df: pd.DataFrame) -> dict:
+    """
+    Detect FVGs using ICT definition.
+
+    Bullish FVG: Candle[i-2].high < Candle[i].low
+    Bearish FVG: Candle[i-2].low > Candle[i].high
+
+    Returns discrete FVG events (NO forward_fill).
+    """
+    n = len(df)
+
+    fvg_bull = np.zeros(n, dtype=bool)
+    fvg_bear = np.zeros(n, dtype=bool)
+    fvg_bull_high = np.full(n, np.nan)
+    fvg_bull_low = np.full(n, np.nan)
+    fvg_bear_high = np.full(n, np.nan)
+    fvg_bear_low = np.full(n, np.nan)
+
+    highs = df["high"].values
+    lows = df["low"].values
+
+    for i in range(2, n):
+        candle_a_high = highs[i - 2]
+        candle_a_low = lows[i - 2]
+        candle_c_high = highs[i]
+        candle_c_low = lows[i]
+
+        # Bullish FVG
+        if candle_a_high < candle_c_low:
+            fvg_bull[i] = True
+            fvg_bull_high[i] = candle_c_low  # Top of gap
+            fvg_bull_low[i] = candle_a_high  # Bottom of gap
+
+        # Bearish FVG
+        if candle_a_low > candle_c_high:
+            fvg_bear[i] = True
+            fvg_bear_high[i] = candle_a_low  # Top of gap
+            fvg_bear_low[i] = candle_c_high  # Bottom of gap
+
+    return {
+        "fvg_bull": fvg_bull,
+        "fvg_bear": fvg_bear,
+        "fvg_bull_high": fvg_bull_high,
+        "fvg_bull_low": fvg_bull_low,
+        "fvg_bear_high": fvg_bear_high,
+        "fvg_bear_low": fvg_bear_low,
+    }
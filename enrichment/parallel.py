@@ -0,0 +1,252 @@
+"""
+Parallel Enricher — multi-pair enrichment on a process pool.
+
+SPRINT: S27.0
+
+Shards are keyed by (pair, timeframe) and enriched independently by
+EnrichmentPipeline in worker processes. Frames cross the process boundary
+through shared memory, not pickled DataFrames:
+
+- numeric / bool columns: raw column bytes
+- datetime columns: int64 ticks (+ tz)
+- object / categorical columns: int32 codes (+ small category list)
+
+Only the layout (column names, dtypes, offsets, categories) is pickled.
+A shard is never split further: L1/L2 group levels, ATR and L4/L5 state
+depend on the whole series, so splitting by year would change results.
+
+INVARIANTS:
+- INV-CONTRACT-1: results are identical to the serial path and
+  independent of worker count or completion order
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from .pipeline import EnrichmentPipeline
+
+PAIRS_PATH = Path(__file__).parent.parent / "config" / "pairs.yaml"
+
+# Column blocks start on 8-byte boundaries
+ALIGNMENT = 8
+
+ShardKey = tuple[str, str]  # (pair, timeframe)
+
+
+def active_pairs(path: Path = PAIRS_PATH) -> list[str]:
+    """ACTIVE pair symbols from pairs.yaml."""
+    with open(path) as f:
+        data = yaml.safe_load(f)
+    return [p["symbol"] for p in data.get("pairs", []) if p.get("status") == "ACTIVE"]
+
+
+# =============================================================================
+# SHARED MEMORY FRAMES
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Column:
+    """Placement of one column inside a shared memory block."""
+
+    name: Any
+    kind: str  # "array" | "datetime" | "codes"
+    dtype: str
+    offset: int
+    extra: Any = None  # tz for "datetime"; categories for "codes"
+
+
+@dataclass(frozen=True)
+class _FrameLayout:
+    """Everything needed to rebuild a frame from its shared memory block."""
+
+    shm_name: str
+    n_rows: int
+    columns: tuple[_Column, ...]
+
+
+def _encode(series: pd.Series) -> tuple[np.ndarray, str, Any]:
+    """Column → (contiguous array, kind, extra)."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        naive = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        return naive, "datetime", str(dtype.tz)
+    if isinstance(dtype, pd.CategoricalDtype):
+        cat = series.cat
+        extra = ("category", cat.categories, cat.ordered)
+        return cat.codes.to_numpy(dtype=np.int32), "codes", extra
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        return series.to_numpy(), "array", None
+    # object columns: factorize (None / NaN → -1)
+    codes, uniques = pd.factorize(series.to_numpy(dtype=object), use_na_sentinel=True)
+    return codes.astype(np.int32), "codes", ("object", list(uniques), False)
+
+
+def _decode(values: np.ndarray, column: _Column) -> pd.Series:
+    """Inverse of _encode (values are copied out of shared memory)."""
+    if column.kind == "datetime":
+        return pd.Series(values.copy()).dt.tz_localize("UTC").dt.tz_convert(column.extra)
+    if column.kind == "codes":
+        kind, categories, ordered = column.extra
+        if kind == "category":
+            return pd.Series(
+                pd.Categorical.from_codes(values.copy(), categories=categories, ordered=ordered)
+            )
+        lookup = np.empty(len(categories) + 1, dtype=object)
+        lookup[:-1] = categories
+        lookup[-1] = None  # code -1
+        return pd.Series(lookup[values])
+    return pd.Series(values.copy())
+
+
+def _write_frame(df: pd.DataFrame) -> tuple[SharedMemory, _FrameLayout]:
+    """Copy `df` into a new shared memory block (caller owns the block)."""
+    encoded = []
+    offset = 0
+    for name in df.columns:
+        values, kind, extra = _encode(df[name])
+        encoded.append((values, _Column(name, kind, values.dtype.str, offset, extra)))
+        offset += -(-values.nbytes // ALIGNMENT) * ALIGNMENT
+
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for values, column in encoded:
+            target = np.ndarray(
+                len(values), dtype=values.dtype, buffer=shm.buf, offset=column.offset
+            )
+            target[:] = values
+            del target  # release the buffer export before close()
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    layout = _FrameLayout(shm.name, len(df), tuple(column for _, column in encoded))
+    return shm, layout
+
+
+def _read_frame(shm: SharedMemory, layout: _FrameLayout) -> pd.DataFrame:
+    """Rebuild a frame (RangeIndex) from a shared memory block."""
+    data = {}
+    for column in layout.columns:
+        view = np.ndarray(
+            layout.n_rows, dtype=np.dtype(column.dtype), buffer=shm.buf, offset=column.offset
+        )
+        data[column.name] = _decode(view, column)
+        del view  # release the buffer export before close()
+    return pd.DataFrame(data, index=pd.RangeIndex(layout.n_rows))
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+
+def _enrich_shard(
+    layout: _FrameLayout, pair: str, columns: list[str] | None, atr_period: int
+) -> _FrameLayout:
+    """Worker: enrich one shard from shared memory into a new block."""
+    shm = SharedMemory(name=layout.shm_name)
+    try:
+        raw = _read_frame(shm, layout)
+    finally:
+        shm.close()
+
+    enriched = EnrichmentPipeline(columns, symbol=pair, atr_period=atr_period).run(raw)
+    out, out_layout = _write_frame(enriched)
+    out.close()  # parent reads and unlinks
+    return out_layout
+
+
+# =============================================================================
+# PARALLEL ENRICHER
+# =============================================================================
+
+
+class ParallelEnricher:
+    """
+    Enrich many (pair, timeframe) shards across a process pool.
+
+    Usage:
+        enricher = ParallelEnricher(max_workers=6)
+        results = enricher.enrich({("EURUSD", "1H"): bars, ("GBPUSD", "1H"): bars2})
+
+    max_workers=1 runs the serial path in-process. Results come back in
+    input order with a RangeIndex.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str] | None = None,
+        atr_period: int = 14,
+        max_workers: int | None = None,
+    ) -> None:
+        self._columns = None if columns is None else list(columns)
+        self._atr_period = atr_period
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    def enrich(self, shards: Mapping[ShardKey, pd.DataFrame]) -> dict[ShardKey, pd.DataFrame]:
+        """Enrich every shard; same output as enrich_serial()."""
+        if self._max_workers <= 1 or len(shards) <= 1:
+            return self.enrich_serial(shards)
+
+        inputs: dict[ShardKey, SharedMemory] = {}
+        futures: dict[ShardKey, Future] = {}
+        results: dict[ShardKey, pd.DataFrame] = {}
+        try:
+            workers = min(self._max_workers, len(shards))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Largest shards first so the tail of the run stays balanced
+                for key in sorted(shards, key=lambda k: -len(shards[k])):
+                    shm, layout = _write_frame(shards[key].reset_index(drop=True))
+                    inputs[key] = shm
+                    futures[key] = pool.submit(
+                        _enrich_shard, layout, key[0], self._columns, self._atr_period
+                    )
+                for key, future in futures.items():
+                    results[key] = _collect(future.result())
+                    _release(inputs.pop(key))
+        finally:
+            for shm in inputs.values():
+                _release(shm)
+            # A failed shard aborts the run; free blocks of shards that finished
+            for key, future in futures.items():
+                if key not in results and not future.cancelled() and future.exception() is None:
+                    _collect(future.result())
+
+        return {key: results[key] for key in shards}
+
+    def enrich_serial(
+        self, shards: Mapping[ShardKey, pd.DataFrame]
+    ) -> dict[ShardKey, pd.DataFrame]:
+        """Reference path: one shard after another in this process."""
+        return {
+            (pair, timeframe): EnrichmentPipeline(
+                self._columns, symbol=pair, atr_period=self._atr_period
+            ).run(df.reset_index(drop=True))
+            for (pair, timeframe), df in shards.items()
+        }
+
+
+def _collect(layout: _FrameLayout) -> pd.DataFrame:
+    """Read a worker's output block, then free it."""
+    shm = SharedMemory(name=layout.shm_name)
+    try:
+        return _read_frame(shm, layout)
+    finally:
+        _release(shm)
+
+
+def _release(shm: SharedMemory) -> None:
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,172 @@
+"""
+Enrichment Pipeline — dependency-aware L1-L6 with column pruning.
+
+SPRINT: S27.0
+
+Each layer is split into steps (steps.py) that declare the columns they
+produce and the columns they read. Given a requested column set, the
+pipeline runs only the steps those columns (transitively) depend on, in
+chain order L1→L2→L3→L4→L6→L5, on a single working frame:
+
+    L1: time ──┬─ dow
+               └─ reference (weekly / midnight opens)
+    L2: asia, pd, pw, london, ny (each from L1 sessions), stubs
+    L3: sweeps (L1 hour + L2 levels), liquidity (L2 levels)
+    L4: structure (raw OHLC)
+    L6: displacement (raw OHLC + ATR), fvg (raw highs/lows)
+    L5: order blocks (L6 displacement)
+
+Output keeps every input column plus the requested columns; intermediate
+columns are dropped.
+
+Modes:
+- "columnar" (default): steps read narrow views and write column arrays
+  (builder.py); the output frame is assembled once
+- "frame": steps mutate one working DataFrame (reference, for parity checks)
+
+compact=True returns the compact schema (compact.py: categorical enums,
+small ints); compact.decode() restores the default dtypes.
+
+INVARIANTS:
+- INV-CONTRACT-1: requested columns are identical to the full hand chain
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import pandas as pd
+
+from .builder import ColumnarBuilder
+from .compact import compact, compact_column
+from .steps import EnrichmentStep, RunContext, build_steps
+
+PIPELINE_MODES = ("columnar", "frame")
+
+
+# =============================================================================
+# ENRICHMENT PIPELINE
+# =============================================================================
+
+
+class EnrichmentPipeline:
+    """
+    Compute only the enrichment columns a consumer needs.
+
+    Usage:
+        pipeline = EnrichmentPipeline(columns=["sweep_detected", "fvg_bull"])
+        pipeline.steps        # ['l1_time', 'l2_asia', ..., 'l6_fvg']
+        enriched = pipeline.run(bars_df)
+
+    columns=None runs every step (same frame as the full hand chain).
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str] | None = None,
+        symbol: str = "EURUSD",
+        atr_period: int = 14,
+        mode: str = "columnar",
+        compact: bool = False,
+    ) -> None:
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"Unknown pipeline mode: {mode!r} (expected one of {PIPELINE_MODES})")
+        self._mode = mode
+        self._compact = compact
+        self._symbol = symbol
+        self._atr_period = atr_period
+        self._registry = build_steps(atr_period)
+        self._columns = None if columns is None else list(dict.fromkeys(columns))
+        self._plan = _resolve(self._registry, self._columns)
+
+    @property
+    def steps(self) -> list[str]:
+        """Names of the steps this pipeline runs, in execution order."""
+        return [step.name for step in self._plan]
+
+    @property
+    def columns(self) -> list[str]:
+        """Enrichment columns in the output (requested, or all)."""
+        if self._columns is not None:
+            return list(self._columns)
+        return [col for step in self._registry for col in step.produces]
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Enrich `df` with the requested columns."""
+        produced = {col for step in self._registry for col in step.produces}
+        needed_raw = {col for step in self._plan for col in step.requires} - produced
+        if self._columns is not None:
+            needed_raw |= set(self._columns) - produced
+        missing = sorted(needed_raw - set(df.columns))
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        ctx = RunContext(symbol=self._symbol, atr_period=self._atr_period)
+        if self._mode == "columnar":
+            return self._run_columnar(df, ctx)
+        return self._run_frame(df, ctx)
+
+    def _run_frame(self, df: pd.DataFrame, ctx: RunContext) -> pd.DataFrame:
+        """Every step mutates one working copy of `df`."""
+        frame = df.copy()
+        for step in self._plan:
+            if step.constants is not None:
+                for col, value in step.constants.items():
+                    frame[col] = value
+                continue
+            result = step.run(frame, ctx)
+            if result is not None:
+                frame = result
+
+        if self._columns is not None:
+            keep = set(df.columns) | set(self._columns)
+            frame = frame[[col for col in frame.columns if col in keep]]
+        return compact(frame) if self._compact else frame
+
+    def _run_columnar(self, df: pd.DataFrame, ctx: RunContext) -> pd.DataFrame:
+        """Steps read narrow views; columns are kept as arrays until the end."""
+        builder = ColumnarBuilder(df)
+        output = set(df.columns) | set(self.columns)
+        order = list(df.columns)
+        last_read = {col: i for i, step in enumerate(self._plan) for col in step.requires}
+
+        for i, step in enumerate(self._plan):
+            if step.constants is not None:
+                builder.put_constants(step.constants)
+                order.extend(col for col in step.constants if col not in order)
+                continue
+            frame = builder.view(step.requires)
+            result = step.run(frame, ctx)
+            frame = frame if result is None else result
+            builder.harvest(frame, step.produces)
+            order.extend(col for col in frame.columns if col in builder and col not in order)
+            builder.release(
+                col for col, last in last_read.items() if last == i and col not in output
+            )
+
+        convert = compact_column if self._compact else None
+        return builder.to_frame((col for col in order if col in output), convert)
+
+
+# =============================================================================
+# PLANNING
+# =============================================================================
+
+
+def _resolve(
+    registry: list[EnrichmentStep], columns: list[str] | None
+) -> list[EnrichmentStep]:
+    """Steps needed for `columns` (all if None), in chain order."""
+    if columns is None:
+        return list(registry)
+
+    producer = {col: step for step in registry for col in step.produces}
+    needed: set[str] = set()
+    pending = [col for col in columns if col in producer]
+    while pending:
+        step = producer[pending.pop()]
+        if step.name in needed:
+            continue
+        needed.add(step.name)
+        pending.extend(col for col in step.requires if col in producer)
+    return [step for step in registry if step.name in needed]
@@ -0,0 +1,245 @@
+"""
+Enrichment Steps — the L1-L6 step registry behind EnrichmentPipeline.
+
+SPRINT: S27.0
+
+Each layer is split into steps that declare the columns they produce and
+the columns they read; EnrichmentPipeline resolves a requested column set
+against this registry. Steps are listed in chain order L1→L2→L3→L4→L6→L5.
+
+Consumer column sets (e.g. PATTERN_COLUMNS for CSO) live here so
+consumers can request them without importing each other.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from .layers import l1_time_sessions as l1
+from .layers import l2_reference_levels as l2
+from .layers import l3_sweeps as l3
+from .layers import l4_structure_breaks as l4
+from .layers import l5_order_blocks as l5
+from .layers import l6_fvg_imbalances as l6
+
+OHLC = ("open", "high", "low", "close")
+SESSION_COLUMNS = ("is_asia_session", "is_london_session", "is_ny_session")
+L3_LEVEL_COLUMNS = (
+    "asia_high",
+    "asia_low",
+    "lon_session_high",
+    "lon_session_low",
+    "ny_session_high",
+    "ny_session_low",
+    "pdh",
+    "pdl",
+    "pwh",
+    "pwl",
+)
+DISPLACEMENT_COLUMNS = ("is_displacement", "displacement_up", "displacement_down")
+
+
+# =============================================================================
+# CONSUMER COLUMN SETS
+# =============================================================================
+
+# Enriched columns read by CSOObserver._detect_pattern
+PATTERN_COLUMNS = (
+    "structure_break_up",
+    "structure_break_down",
+    "fvg_bull",
+    "fvg_bull_high",
+    "fvg_bull_low",
+    "fvg_bear",
+    "fvg_bear_high",
+    "fvg_bear_low",
+    "is_displacement",
+    "displacement_up",
+    "displacement_pips",
+    "displacement_atr_multiple",
+    "sweep_detected",
+    "sweep_target_type",
+    "sweep_direction",
+    "sweep_is_valid",
+)
+
+
+# =============================================================================
+# STEP TYPES
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class EnrichmentStep:
+    """One sub-computation of a layer."""
+
+    name: str
+    produces: tuple[str, ...]
+    requires: tuple[str, ...]
+    run: Callable[[pd.DataFrame, RunContext], pd.DataFrame | None] | None = None
+    constants: Mapping[str, object] | None = None  # constant columns (no run)
+
+
+@dataclass
+class RunContext:
+    """Per-run parameters and values shared between steps."""
+
+    symbol: str
+    atr_period: int
+    _calendar: dict[str, np.ndarray] | None = field(default=None, repr=False)
+
+    def calendar(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """NY calendar fields, joined once per run."""
+        if self._calendar is None:
+            self._calendar = l1.ny_calendar(df)
+        return self._calendar
+
+
+def _span(manifest: list[str], first: str, last: str) -> tuple[str, ...]:
+    """Manifest columns from `first` to `last` inclusive."""
+    return tuple(manifest[manifest.index(first) : manifest.index(last) + 1])
+
+
+def _join(df: pd.DataFrame, columns: Mapping[str, np.ndarray], names: list[str]) -> pd.DataFrame:
+    """`df` plus the `names` arrays, joined in one concat (no per-column inserts)."""
+    new = pd.DataFrame({col: columns[col] for col in names}, index=df.index)
+    return pd.concat([df.drop(columns=names, errors="ignore"), new], axis=1)
+
+
+# =============================================================================
+# STEPS (chain order)
+# =============================================================================
+
+
+def _l1_time(df: pd.DataFrame, ctx: RunContext) -> None:
+    l1.add_time_columns(df, ctx.calendar(df))
+
+
+def _l1_reference(df: pd.DataFrame, ctx: RunContext) -> None:
+    l1.add_reference_columns(df, ctx.calendar(df))
+
+
+def _l1_dow(df: pd.DataFrame, ctx: RunContext) -> None:
+    l1.add_dow_columns(df, ctx.calendar(df))
+
+
+def _l2_session(session: str) -> Callable[[pd.DataFrame, RunContext], pd.DataFrame]:
+    def run(df: pd.DataFrame, ctx: RunContext) -> pd.DataFrame:
+        return l2.calculate_session_levels(df, session, l2.pip_multiplier(ctx.symbol))
+
+    return run
+
+
+def _l4_structure(df: pd.DataFrame, ctx: RunContext) -> pd.DataFrame:
+    columns, _ = l4.compute_structure(
+        df["high"].values, df["low"].values, lookback=l4.SWING_LOOKBACK
+    )
+    return _join(df, columns, l4.LAYER_4_COLUMNS)
+
+
+def _l5_order_blocks(df: pd.DataFrame, ctx: RunContext) -> pd.DataFrame:
+    obs = l5.detect_order_blocks(df)
+    columns, _ = l5.track_order_blocks(
+        df["close"].values, df["high"].values, df["low"].values, obs
+    )
+    return _join(df, columns, l5.LAYER_5_COLUMNS)
+
+
+def build_steps(atr_period: int) -> list[EnrichmentStep]:
+    """Step registry for one ATR period (the ATR column name depends on it)."""
+    m1, m2, m3 = l1.LAYER_1_COLUMNS, l2.LAYER_2_COLUMNS, l3.LAYER_3_COLUMNS
+    m6 = l6.LAYER_6_COLUMNS
+    hlc = ("high", "low", "close")
+
+    return [
+        # L1
+        EnrichmentStep(
+            "l1_time",
+            _span(m1, "hour_ny", "is_manipulation_hour"),
+            ("timestamp",),
+            _l1_time,
+        ),
+        EnrichmentStep(
+            "l1_reference",
+            _span(m1, "weekly_open_price", "above_midnight_open"),
+            ("timestamp", "close"),
+            _l1_reference,
+        ),
+        EnrichmentStep(
+            "l1_dow",
+            _span(m1, "dow_context", "is_trading_hours"),
+            ("timestamp", *SESSION_COLUMNS),
+            _l1_dow,
+        ),
+        # L2
+        EnrichmentStep(
+            "l2_asia",
+            _span(m2, "asia_high", "price_vs_asia_ce"),
+            ("trading_day", "is_asia_session", *hlc),
+            lambda df, ctx: l2.calculate_asia_range(df, l2.pip_multiplier(ctx.symbol)),
+        ),
+        EnrichmentStep(
+            "l2_pd",
+            _span(m2, "pdh", "price_vs_pd_ce"),
+            ("trading_day", *hlc),
+            lambda df, ctx: l2.calculate_pdh_pdl(df, l2.pip_multiplier(ctx.symbol)),
+        ),
+        EnrichmentStep(
+            "l2_pw",
+            _span(m2, "pwh", "price_vs_pw_ce"),
+            ("trading_day", *hlc),
+            lambda df, ctx: l2.calculate_weekly_levels(df),
+        ),
+        EnrichmentStep(
+            "l2_london",
+            _span(m2, "lon_session_high", "inside_london_range"),
+            ("trading_day", "is_london_session", *hlc),
+            _l2_session("london"),
+        ),
+        EnrichmentStep(
+            "l2_ny",
+            _span(m2, "ny_session_high", "inside_ny_range"),
+            ("trading_day", "is_ny_session", *hlc),
+            _l2_session("ny"),
+        ),
+        EnrichmentStep("l2_stubs", tuple(l2.STUB_COLUMNS), (), constants=l2.STUB_COLUMNS),
+        # L3
+        EnrichmentStep(
+            "l3_sweeps",
+            _span(m3, "sweep_detected", "sweep_is_setup"),
+            ("hour_ny", *hlc, *l3.SWEEP_LEVEL_COLUMNS),
+            lambda df, ctx: l3.add_sweeps(df, ctx.symbol),
+        ),
+        EnrichmentStep(
+            "l3_liquidity",
+            _span(m3, "liq_asia_high", "dist_to_nearest_below"),
+            ("close", *L3_LEVEL_COLUMNS),
+            lambda df, ctx: l3.add_liquidity_pools(df),
+        ),
+        # L4
+        EnrichmentStep("l4_structure", tuple(l4.LAYER_4_COLUMNS), ("high", "low"), _l4_structure),
+        # L6
+        EnrichmentStep(
+            "l6_displacement",
+            (f"atr_{atr_period}", *_span(m6, "candle_body", "bars_since_any_displacement")),
+            OHLC,
+            lambda df, ctx: l6.add_displacement(df, ctx.atr_period),
+        ),
+        EnrichmentStep(
+            "l6_fvg",
+            _span(m6, "fvg_bull", "fvg_bear_ce"),
+            ("high", "low"),
+            lambda df, ctx: l6.add_fvg(df),
+        ),
+        # L5
+        EnrichmentStep(
+            "l5_order_blocks",
+            tuple(l5.LAYER_5_COLUMNS),
+            (*OHLC, *DISPLACEMENT_COLUMNS),
+            _l5_order_blocks,
+        ),
+    ]
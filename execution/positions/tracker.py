@@ -14,11 +14,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .lifecycle import Position, PositionLifecycle
 from .states import PositionState
 
+if TYPE_CHECKING:
+    from memory.bead_queue import BeadWriteQueue
+
 
 class PositionTracker:
     """
@@ -35,6 +38,7 @@ class PositionTracker:
         lifecycle: PositionLifecycle | None = None,
         emit_bead: Callable[[dict[str, Any]], None] | None = None,
         emit_alert: Callable[[str, str], None] | None = None,
+        bead_queue: BeadWriteQueue | None = None,
     ) -> None:
         """
         Initialize tracker.
@@ -43,19 +47,37 @@ class PositionTracker:
             lifecycle: Lifecycle manager (created if not provided)
             emit_bead: Callback for bead emission
             emit_alert: Callback for alerts
+            bead_queue: Write-behind queue for beads, in place of emit_bead
+                (memory/bead_queue.py); close() flushes and closes it
         """
+        if bead_queue is not None:
+            if emit_bead is not None:
+                raise ValueError("Pass emit_bead to the bead queue, not the tracker")
+            emit_bead = bead_queue.emit
         self._positions: dict[str, Position] = {}
         self._lifecycle = lifecycle or PositionLifecycle(
             emit_bead=emit_bead,
             emit_alert=emit_alert,
         )
         self._emit_alert = emit_alert
+        self._bead_queue = bead_queue
 
     @property
     def lifecycle(self) -> PositionLifecycle:
         """Get lifecycle manager."""
         return self._lifecycle
 
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Shutdown: flush and close the bead queue (if any).
+
+        Returns:
+            True if every queued bead was written before `timeout`
+        """
+        if self._bead_queue is None:
+            return True
+        return self._bead_queue.close(timeout)
+
     # =========================================================================
     # POSITION MANAGEMENT
     # =========================================================================
@@ -6,6 +6,8 @@ Queryable memory palace — BeadStore + Athena.
 
 Components:
 - BeadStore: Bead persistence (SQLite + read-only query path)
+- BeadWriteQueue: Write-behind bead emission (batched, halt-safe flush)
+- ChainVerifier: Incremental hash-chain audit with signed checkpoints
 - Athena: NL query → Query IR → SQL → capped results
 - QueryParser: Natural language → Query IR
 
@@ -16,12 +18,16 @@ INVARIANTS:
 """
 
 from .athena import Athena, QueryResult
+from .bead_queue import BeadWriteQueue
 from .bead_store import BeadStore, BeadStoreError
+from .chain_verifier import ChainVerifier
 from .query_parser import QueryIR, QueryParser
 
 __all__ = [
     "BeadStore",
     "BeadStoreError",
+    "BeadWriteQueue",
+    "ChainVerifier",
     "QueryIR",
     "QueryParser",
     "Athena",
@@ -23,6 +23,8 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
+from .bead_attrs import attribute_filter
+from .bead_fts import full_text_filter
 from .bead_store import BeadStore
 from .query_parser import QueryIR, QueryParser, Requester, ValidationResult
 
@@ -205,20 +207,24 @@ class Athena:
             conditions.append(f"bead_type IN ({placeholders})")
             params.extend(bt.value for bt in ir.bead_types)
 
-        # Pair filter (search in content JSON)
+        # Pair filter (indexed: top-level pair and the nested pair paths
+        # producers use, see ATTRIBUTE_PATHS)
         if ir.pair_filter:
-            pair_conditions = []
-            for pair in ir.pair_filter:
-                pair_conditions.append("content LIKE ?")
-                params.append(f'%"{pair}"%')
-            conditions.append(f"({' OR '.join(pair_conditions)})")
+            pair_condition, pair_params = attribute_filter("pair", ir.pair_filter)
+            conditions.append(pair_condition)
+            params.extend(pair_params)
 
-        # Keyword filter (search in content JSON)
+        # Keyword filter (substring of content JSON; full-text index if present)
         if ir.keywords:
-            for keyword in ir.keywords:
-                # Sanitized via validation (no SQL operators)
-                conditions.append("content LIKE ?")
-                params.append(f"%{keyword}%")
+            # Sanitized via validation (no SQL operators)
+            if self._store.has_full_text_index:
+                keyword_condition, keyword_params = full_text_filter(ir.keywords)
+                conditions.append(keyword_condition)
+                params.extend(keyword_params)
+            else:
+                for keyword in ir.keywords:
+                    conditions.append("content LIKE ?")
+                    params.append(f"%{keyword}%")
 
         # Date range filter
         if ir.date_range:
@@ -238,7 +244,7 @@ class Athena:
             SELECT bead_id, bead_type, timestamp_utc, content
             FROM beads
             WHERE {where_clause}
-            ORDER BY timestamp_utc DESC
+            ORDER BY timestamp_utc DESC, bead_id DESC
             LIMIT ?
         """  # noqa: S608
         params.append(limit + 1)  # +1 to detect if capped
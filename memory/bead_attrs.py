@@ -0,0 +1,215 @@
+"""
+Bead Attributes — Side Index of Hot Content Keys
+================================================
+
+Athena, Signalman and the kill manager filter beads by a few content
+keys (strategy_id, pair, signal_id, position_id, status). BeadStore
+copies them at write time into bead_attrs, one row per (key, value):
+
+- ATTRIBUTE_PATHS lists the content paths per key: the top-level key,
+  then the nested paths where producers put it (HUNT: hpg_json.pair;
+  PERFORMANCE: position.pair)
+- only string and integer values are indexed, as text
+- the primary key (key, value, bead_type, timestamp_utc, bead_id) serves
+  newest-first lookups without touching beads
+
+attribute_query() / attribute_filter() build indexed SQL for query_sql
+instead of LIKE / json_extract scans over content. Databases from before
+bead_attrs (or before a path was added) are backfilled once on open
+(PRAGMA user_version).
+
+INVARIANTS:
+- INV-BEAD-IMMUTABLE-1: Rows are only inserted, with the bead they index
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bead_store import Bead
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Content paths indexed in bead_attrs per key (scalar values, as text)
+ATTRIBUTE_PATHS = {
+    "strategy_id": ("strategy_id",),
+    "pair": ("pair", "hpg_json.pair", "position.pair"),
+    "signal_id": ("signal_id",),
+    "position_id": ("position_id",),
+    "status": ("status",),
+}
+INDEXED_ATTRIBUTES = tuple(ATTRIBUTE_PATHS)
+
+# PRAGMA user_version once bead_attrs covers every ATTRIBUTE_PATHS path
+ATTRIBUTE_INDEX_VERSION = 2
+
+
+# =============================================================================
+# SCHEMA + WRITE PATH
+# =============================================================================
+
+
+def create_attribute_index(cursor: sqlite3.Cursor) -> None:
+    """Create bead_attrs, indexing existing beads if it is new or lacks a path."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'bead_attrs'")
+    existed = cursor.fetchone() is not None
+
+    # (key, value, type) lookups come out newest first from the primary key alone
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bead_attrs (
+            attr_key TEXT NOT NULL,
+            attr_value TEXT NOT NULL,
+            bead_type TEXT NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            bead_id TEXT NOT NULL REFERENCES beads(bead_id),
+            PRIMARY KEY (attr_key, attr_value, bead_type, timestamp_utc, bead_id)
+        ) WITHOUT ROWID
+        """
+    )
+    user_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    if not existed or user_version < ATTRIBUTE_INDEX_VERSION:
+        _backfill_attributes(cursor)
+        cursor.execute(f"PRAGMA user_version = {ATTRIBUTE_INDEX_VERSION}")
+
+
+def _backfill_attributes(cursor: sqlite3.Cursor) -> None:
+    """Index beads written before bead_attrs (or a path) existed, as writes do."""
+    for key, paths in ATTRIBUTE_PATHS.items():
+        for path in (f"$.{p}" for p in paths):
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO bead_attrs
+                    (attr_key, attr_value, bead_type, timestamp_utc, bead_id)
+                SELECT ?, CAST(json_extract(content, ?) AS TEXT),
+                       bead_type, timestamp_utc, bead_id
+                FROM beads
+                WHERE json_type(content, ?) IN ('text', 'integer')
+                """,
+                (key, path, path),
+            )
+
+
+def insert_attributes(conn: sqlite3.Connection, beads: Iterable[Bead]) -> None:
+    """Index beads being written (inside the caller's transaction)."""
+    conn.executemany(
+        """
+        INSERT INTO bead_attrs (
+            attr_key, attr_value, bead_type, timestamp_utc, bead_id
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        [
+            (key, value, bead.bead_type.value, bead.timestamp_utc.isoformat(), bead.bead_id)
+            for bead in beads
+            for key, value in bead_attributes(bead.content)
+        ],
+    )
+
+
+def bead_attributes(content: dict[str, Any]) -> list[tuple[str, str]]:
+    """(key, value) rows of a bead for bead_attrs (one per distinct value)."""
+    rows = []
+    for key, paths in ATTRIBUTE_PATHS.items():
+        for path in paths:
+            value = _attr_value(_content_at(content, path))
+            if value is not None and (key, value) not in rows:
+                rows.append((key, value))
+    return rows
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+def attribute_query(
+    key: str,
+    value: Any,
+    bead_type: str | None = None,
+    since: datetime | None = None,
+    limit: int | None = None,
+) -> tuple[str, tuple]:
+    """
+    SELECT for beads with `value` at a content path of `key`, newest first
+    (for query_sql).
+
+    With bead_type the rows come from the bead_attrs primary key in
+    order, so a LIMIT 1 lookup is one index seek at any table size.
+
+    Raises:
+        BeadStoreError: If key is not in INDEXED_ATTRIBUTES
+    """
+    _check_attribute(key)
+    conditions = ["a.attr_key = ?", "a.attr_value = ?"]
+    params: list[Any] = [key, _attr_value(value)]
+    if bead_type is not None:
+        conditions.append("a.bead_type = ?")
+        params.append(bead_type)
+    if since is not None:
+        conditions.append("a.timestamp_utc >= ?")
+        params.append(since.isoformat())
+
+    sql = (
+        "SELECT b.* FROM bead_attrs a JOIN beads b ON b.bead_id = a.bead_id "  # noqa: S608
+        f"WHERE {' AND '.join(conditions)} ORDER BY a.timestamp_utc DESC"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, tuple(params)
+
+
+def attribute_filter(key: str, values: Iterable[Any]) -> tuple[str, tuple]:
+    """
+    WHERE condition on beads: a content path of `key` holds one of `values`
+    (indexed).
+
+    Raises:
+        BeadStoreError: If key is not in INDEXED_ATTRIBUTES
+    """
+    _check_attribute(key)
+    values = [_attr_value(v) for v in values]
+    placeholders = ",".join("?" * len(values))
+    # Only "?" placeholders are interpolated; key and values are bound parameters
+    condition = (
+        "bead_id IN (SELECT bead_id FROM bead_attrs "  # noqa: S608
+        f"WHERE attr_key = ? AND attr_value IN ({placeholders}))"
+    )
+    return condition, (key, *values)
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _content_at(content: dict[str, Any], path: str) -> Any:
+    """Value at a dotted content path (None if any level is missing)."""
+    value: Any = content
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _attr_value(value: Any) -> str | None:
+    """Indexed text form of a content value (strings and integers only)."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return None
+
+
+def _check_attribute(key: str) -> None:
+    from .bead_store import BeadStoreError  # bead_store imports this module
+
+    if key not in INDEXED_ATTRIBUTES:
+        raise BeadStoreError(f"Attribute not indexed: {key}")
@@ -0,0 +1,98 @@
+"""
+Bead Full-Text — Trigram Keyword Index Over Bead Content
+========================================================
+
+Athena keyword search used to scan every bead with content LIKE
+'%keyword%'. BeadStore indexes content in bead_fts (FTS5, trigram
+tokenizer) at write time:
+
+- external content: the index keys on beads.rowid and reads text from
+  beads, so content is not stored twice
+- full_text_filter() matches keywords as substrings, exactly like
+  content LIKE '%keyword%', without scanning every bead
+- keywords shorter than a trigram fall back to LIKE on beads
+
+Needs SQLite with FTS5 trigram (3.34+); without it no index is created
+and keyword search stays on LIKE. Beads are never updated or deleted;
+after a VACUUM (may renumber rowids) run
+INSERT INTO bead_fts (bead_fts) VALUES ('rebuild').
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Trigram index: shorter keywords cannot use it (matched with LIKE on beads)
+FULL_TEXT_MIN_CHARS = 3
+
+
+# =============================================================================
+# SCHEMA + WRITE PATH
+# =============================================================================
+
+
+def create_full_text_index(cursor: sqlite3.Cursor) -> bool:
+    """Create and fill bead_fts if missing; whether it exists afterwards."""
+    if _table_exists(cursor, "bead_fts_content"):
+        cursor.execute("DROP TABLE bead_fts")  # older index holding a copy of content
+    if not _table_exists(cursor, "bead_fts"):
+        try:
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE bead_fts USING fts5(
+                    content, content = 'beads', content_rowid = 'rowid',
+                    tokenize = 'trigram'
+                )
+                """
+            )
+        except sqlite3.OperationalError:
+            return False  # No FTS5: keyword search falls back to LIKE
+        cursor.execute("INSERT INTO bead_fts (bead_fts) VALUES ('rebuild')")
+    return True
+
+
+def insert_full_text(conn: sqlite3.Connection, bead_ids: Iterable[str]) -> None:
+    """Index beads just inserted (inside the caller's transaction)."""
+    conn.executemany(
+        "INSERT INTO bead_fts (rowid, content) SELECT rowid, content FROM beads WHERE bead_id = ?",
+        [(bead_id,) for bead_id in bead_ids],
+    )
+
+
+def has_full_text(cursor: sqlite3.Cursor) -> bool:
+    """Whether bead_fts exists (keyword filters can use full_text_filter)."""
+    return _table_exists(cursor, "bead_fts")
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+
+def full_text_filter(keywords: Iterable[str]) -> tuple[str, tuple]:
+    """
+    WHERE condition on beads: content contains every keyword (bead_fts index).
+
+    Same matches as one content LIKE '%keyword%' per keyword. Keywords
+    shorter than FULL_TEXT_MIN_CHARS are matched with LIKE on beads.
+    """
+    indexed, short = [], []
+    for keyword in keywords:
+        (indexed if len(keyword) >= FULL_TEXT_MIN_CHARS else short).append(f"%{keyword}%")
+
+    conditions = ["content LIKE ?"] * len(short)
+    if indexed:
+        likes = " AND ".join(["content LIKE ?"] * len(indexed))
+        # Only fixed "content LIKE ?" terms are interpolated; keywords are bound
+        conditions.insert(0, f"rowid IN (SELECT rowid FROM bead_fts WHERE {likes})")  # noqa: S608
+    return " AND ".join(conditions), (*indexed, *short)
+
+
+def _table_exists(cursor: sqlite3.Cursor, name: str) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,))
+    return cursor.fetchone() is not None
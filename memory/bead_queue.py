@@ -0,0 +1,300 @@
+"""
+Bead Queue — Write-Behind Bead Emission
+=======================================
+
+Bead emission callbacks (PositionLifecycle, Reconciler, AlertManager,
+HeartbeatBeadEmitter) run inside trading logic, so a slow disk stalls
+the caller. BeadWriteQueue.emit only enqueues:
+
+- a bounded queue; when full, emit() blocks (backpressure) instead of
+  growing without limit or dropping beads
+- one writer thread drains the queue in batches (BeadStore.write_many:
+  one transaction, one commit per batch)
+- flush(timeout) waits until every bead emitted before the call is
+  written; halt propagation (on_halt) and shutdown (close) call it
+- beads that cannot be written are kept as dead letters (retry_failed)
+
+for_store() writes complete beads. Producers emit payload dicts (no
+bead_id, bead_hash or signer); for_callback() queues in front of them:
+
+    queue = BeadWriteQueue.for_callback(emit_bead, name="position_beads")
+    queue.start()
+    queue.register_halt(halt_manager)
+    tracker = PositionTracker(bead_queue=queue)  # Heartbeat: starts/closes it
+    ...
+    tracker.close(timeout=5.0)  # shutdown: flush, refuse new beads
+
+INVARIANTS:
+- INV-BEAD-QUEUE-1: Beads are written in emit order
+- INV-BEAD-QUEUE-2: flush() returns True only when all prior beads are written
+  (False while any bead is a dead letter)
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .bead_store import BeadStore, BeadStoreError
+from .bead_writer import BatchWriter, as_bead, take_batch
+
+if TYPE_CHECKING:
+    from governance.halt import HaltManager
+    from governance.types import AckReceipt
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_MAX_SIZE = 10_000  # queued beads before emit() blocks
+DEFAULT_MAX_BATCH = 500  # beads per write
+DEFAULT_HALT_FLUSH_TIMEOUT = 0.4  # seconds (within INV-HALT-2 cascade SLO)
+
+_IDLE_WAIT = 0.1  # writer wakes this often to notice stop() while idle
+
+
+# =============================================================================
+# EXCEPTIONS
+# =============================================================================
+
+
+class BeadQueueFullError(BeadStoreError):
+    """Queue stayed full for the whole emit() timeout."""
+
+    pass
+
+
+class BeadQueueClosedError(BeadStoreError):
+    """Bead emitted after close()."""
+
+    pass
+
+
+# =============================================================================
+# WRITE-BEHIND QUEUE
+# =============================================================================
+
+
+class BeadWriteQueue:
+    """
+    Bounded write-behind queue in front of a batch writer.
+
+    `write_batch` receives beads in emit order and must be all or nothing
+    (as BeadStore.write_many); BatchWriter (bead_writer.py) retries a
+    failed batch bead by bead and keeps beads that still fail as dead
+    letters until retry_failed().
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[Any]], Any],
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        put_timeout: float | None = None,
+        name: str = "bead_queue",
+    ) -> None:
+        """
+        Initialize queue.
+
+        Args:
+            write_batch: Writes a list of beads (one transaction)
+            max_size: Queued beads before emit() blocks
+            max_batch: Most beads per write_batch call
+            put_timeout: Longest emit() blocks on a full queue (None: no limit)
+            name: Module id in halt acknowledgments
+        """
+        self.writer = BatchWriter(write_batch)
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_size)
+        self._max_batch = max_batch
+        self._put_timeout = put_timeout
+        self._name = name
+
+        # Beads accepted / finished (written or failed); flush waits on these
+        self._cond = threading.Condition()
+        self._accepted = 0
+        self._finished = 0
+        self._closed = False
+
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._drain_lock = threading.Lock()
+
+    @classmethod
+    def for_store(cls, store: BeadStore, **kwargs: Any) -> BeadWriteQueue:
+        """Queue writing to a BeadStore (accepts Bead, bead dicts or .to_dict() objects)."""
+        return cls(lambda beads: store.write_many(as_bead(b) for b in beads), **kwargs)
+
+    @classmethod
+    def for_callback(cls, emit: Callable[[Any], Any], **kwargs: Any) -> BeadWriteQueue:
+        """Queue in front of an existing per-bead emit callback (one bead per call)."""
+        kwargs.setdefault("max_batch", 1)
+        return cls(lambda beads: [emit(b) for b in beads], **kwargs)
+
+    @property
+    def pending(self) -> int:
+        """Beads accepted but not yet written."""
+        with self._cond:
+            return self._accepted - self._finished
+
+    @property
+    def dead_letters(self) -> list[Any]:
+        """Beads whose write failed, in emit order (not retried yet)."""
+        return self.writer.dead_letters
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    # =========================================================================
+    # PRODUCER SIDE
+    # =========================================================================
+
+    def emit(self, bead: Any) -> None:
+        """
+        Enqueue a bead for writing (the producer-side cost of emission).
+
+        Blocks while the queue is full (backpressure).
+
+        Raises:
+            BeadQueueClosedError: If the queue is closed
+            BeadQueueFullError: If still full after put_timeout
+        """
+        with self._cond:
+            if self._closed:
+                raise BeadQueueClosedError(f"Bead queue {self._name} is closed")
+            self._accepted += 1
+
+        try:
+            self._queue.put(bead, timeout=self._put_timeout)
+        except queue.Full:
+            with self._cond:
+                self._accepted -= 1
+                self._cond.notify_all()
+            raise BeadQueueFullError(
+                f"Bead queue {self._name} full for {self._put_timeout}s"
+            ) from None
+
+    # =========================================================================
+    # FLUSH / HALT
+    # =========================================================================
+
+    def retry_failed(self) -> int:
+        """Re-enqueue dead letters (behind beads already queued); returns how many."""
+        beads = self.writer.take_dead_letters()
+        for bead in beads:
+            self.emit(bead)
+        return len(beads)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every bead emitted before this call is written.
+
+        Without a running writer thread the queue is drained in the
+        calling thread.
+
+        Returns:
+            True if flushed, False if `timeout` seconds passed first or
+            any bead is a dead letter
+        """
+        with self._cond:
+            target = self._accepted
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if self._thread is None:
+                self._drain()
+            with self._cond:
+                if self._finished >= min(target, self._accepted):
+                    return not self.writer.dead_letters
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(_IDLE_WAIT if remaining is None else min(remaining, _IDLE_WAIT))
+
+    def on_halt(self, halt_id: str) -> AckReceipt:
+        """
+        Halt dependent callback (HaltManager.register_dependent).
+
+        Flushes queued beads; ack is False if the flush timed out or a
+        bead failed. The queue keeps accepting beads (halt and violation
+        beads follow).
+        """
+        from governance.types import AckReceipt, LifecycleState
+
+        flushed = self.flush(DEFAULT_HALT_FLUSH_TIMEOUT)
+        if not flushed:
+            logger.warning(f"Bead queue {self._name}: {self._lost()} at halt")
+        return AckReceipt(module_id=self._name, ack=flushed, module_state=LifecycleState.RUNNING)
+
+    def register_halt(self, halt_manager: HaltManager) -> None:
+        """Flush this queue when `halt_manager` propagates a halt."""
+        halt_manager.register_dependent(self._name, self.on_halt)
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            logger.warning(f"Bead queue {self._name} already running")
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer thread (queued beads stay queued)."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def close(self, timeout: float | None = None) -> bool:
+        """
+        Shutdown: refuse new beads, flush, stop the writer.
+
+        Returns:
+            True if every bead was written before `timeout`
+        """
+        with self._cond:
+            self._closed = True
+        flushed = self.flush(timeout)
+        self.stop()
+        if not flushed:
+            logger.error(f"Bead queue {self._name}: {self._lost()} at close")
+        return flushed
+
+    def _lost(self) -> str:
+        return f"{self.pending} beads unflushed, {len(self.writer.dead_letters)} failed"
+
+    # =========================================================================
+    # WRITER
+    # =========================================================================
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                first = self._queue.get(timeout=_IDLE_WAIT)
+            except queue.Empty:
+                continue
+            self._write([first, *take_batch(self._queue, self._max_batch - 1)])
+
+    def _drain(self) -> None:
+        """Write everything queued, in the calling thread."""
+        with self._drain_lock:
+            while batch := take_batch(self._queue, self._max_batch):
+                self._write(batch)
+
+    def _write(self, batch: list[Any]) -> None:
+        self.writer.write(batch)
+        with self._cond:
+            self._finished += len(batch)
+            self._cond.notify_all()
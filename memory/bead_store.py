@@ -6,7 +6,13 @@ SQLite-backed storage for all bead types.
 
 DESIGN:
 - Write path: BeadStore.write() — full access
+- Batch write path: write_many() / batch() — one transaction, one commit
 - Read path: BeadStore.read(), query_sql() — READ-ONLY
+- WAL journal: readers (Athena) do not block the writer
+- Attribute index (bead_attrs.py): hot content keys are copied to
+  bead_attrs at write time, for indexed lookups by key
+- Full-text index (bead_fts.py): content is indexed in bead_fts (FTS5
+  trigram) at write time, for keyword search without scanning every bead
 
 INVARIANTS:
 - INV-BEAD-IMMUTABLE-1: Beads cannot be modified after creation
@@ -25,19 +31,24 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .bead_attrs import attribute_query, create_attribute_index, insert_attributes
+from .bead_fts import create_full_text_index, has_full_text, insert_full_text
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
 DEFAULT_BEAD_DB_PATH = Path.home() / "phoenix" / "data" / "beads.db"
 
-
 # =============================================================================
 # ENUMS
 # =============================================================================
@@ -160,6 +171,20 @@ class Bead:
         return hashlib.sha256(data.encode()).hexdigest()
 
 
+@dataclass
+class BeadBatch:
+    """Beads collected by BeadStore.batch(), written together on exit."""
+
+    beads: list[Bead] = field(default_factory=list)
+
+    def write(self, bead: Bead) -> str:
+        self.beads.append(bead)
+        return bead.bead_id
+
+    def write_dict(self, bead_dict: dict[str, Any]) -> str:
+        return self.write(Bead.from_dict(bead_dict))
+
+
 # =============================================================================
 # BEAD STORE
 # =============================================================================
@@ -190,6 +215,10 @@ class BeadStore:
         self._db_path = db_path or DEFAULT_BEAD_DB_PATH
         self._read_only = read_only
         self._conn: sqlite3.Connection | None = None
+        self._full_text: bool | None = None
+        # Serializes write transactions (the connection is shared across
+        # threads, e.g. with a BeadWriteQueue writer thread)
+        self._write_lock = threading.RLock()
 
         # Ensure parent directory exists
         if not read_only:
@@ -204,9 +233,9 @@ class BeadStore:
             if self._read_only:
                 # Read-only mode for Athena
                 uri = f"file:{self._db_path}?mode=ro"
-                self._conn = sqlite3.connect(uri, uri=True)
+                self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
             else:
-                self._conn = sqlite3.connect(str(self._db_path))
+                self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
 
             self._conn.row_factory = sqlite3.Row
 
@@ -220,6 +249,9 @@ class BeadStore:
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        # WAL: one fsync per commit, readers never block the writer
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # Beads table
         cursor.execute(
             """
@@ -246,6 +278,10 @@ class BeadStore:
             "CREATE INDEX IF NOT EXISTS idx_beads_timestamp ON beads(timestamp_utc)"
         )
 
+        # Side indexes filled at write time (bead_attrs.py, bead_fts.py)
+        create_attribute_index(cursor)
+        self._full_text = create_full_text_index(cursor)
+
         conn.commit()
 
     def close(self) -> None:
@@ -282,49 +318,121 @@ class BeadStore:
             BeadImmutabilityError: If bead already exists
             BeadValidationError: If bead validation fails
         """
+        return self.write_many([bead])[0]
+
+    def write_many(self, beads: Iterable[Bead]) -> list[str]:
+        """
+        Write beads in one transaction (all or none, one commit).
+
+        Immutability and chain references are checked for the whole batch
+        with one query. A bead may chain to an earlier bead of the batch.
+
+        INVARIANT: INV-BEAD-IMMUTABLE-1 — Cannot overwrite existing beads
+        INVARIANT: INV-BEAD-CHAIN-1 — prev_bead_id must exist (or come earlier)
+
+        Args:
+            beads: Beads to write, in chain order
+
+        Returns:
+            bead_ids of written beads
+
+        Raises:
+            BeadImmutabilityError: If a bead exists or repeats in the batch
+            BeadValidationError: If bead validation fails
+        """
         if self._read_only:
             raise BeadStoreError("Cannot write in read-only mode")
 
-        # Validate bead
-        self._validate_bead(bead)
+        beads = list(beads)
+        if not beads:
+            return []
 
-        # Check immutability
-        if self._bead_exists(bead.bead_id):
-            raise BeadImmutabilityError(
-                f"Bead {bead.bead_id} already exists (INV-BEAD-IMMUTABLE-1)"
-            )
+        # Validate beads
+        for bead in beads:
+            self._validate_bead(bead)
 
-        # Validate chain
-        if bead.prev_bead_id and not self._bead_exists(bead.prev_bead_id):
-            raise BeadValidationError(
-                f"prev_bead_id {bead.prev_bead_id} does not exist (INV-BEAD-CHAIN-1)"
-            )
+        with self._write_lock:
+            return self._write_transaction(beads)
 
-        # Write
+    def _write_transaction(self, beads: list[Bead]) -> list[str]:
+        """Check and insert beads in one transaction (caller holds _write_lock)."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        # Take the write lock before checking, so no other writer can
+        # insert a checked id before we commit
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._check_batch(beads)
+            contents = [json.dumps(bead.content) for bead in beads]
+            conn.executemany(
+                """
+                INSERT INTO beads (
+                    bead_id, bead_type, prev_bead_id, bead_hash,
+                    timestamp_utc, signer, version, content
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        bead.bead_id,
+                        bead.bead_type.value,
+                        bead.prev_bead_id,
+                        bead.bead_hash,
+                        bead.timestamp_utc.isoformat(),
+                        bead.signer.value,
+                        bead.version,
+                        content,
+                    )
+                    for bead, content in zip(beads, contents, strict=True)
+                ],
+            )
+            insert_attributes(conn, beads)
+            if self._full_text:
+                insert_full_text(conn, [bead.bead_id for bead in beads])
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        return [bead.bead_id for bead in beads]
+
+    @contextmanager
+    def batch(self) -> Iterator[BeadBatch]:
+        """
+        Collect beads and write them with write_many() on exit.
 
-        cursor.execute(
-            """
-            INSERT INTO beads (
-                bead_id, bead_type, prev_bead_id, bead_hash,
-                timestamp_utc, signer, version, content
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                bead.bead_id,
-                bead.bead_type.value,
-                bead.prev_bead_id,
-                bead.bead_hash,
-                bead.timestamp_utc.isoformat(),
-                bead.signer.value,
-                bead.version,
-                json.dumps(bead.content),
-            ),
-        )
+        Usage:
+            with store.batch() as batch:
+                for bead in beads:
+                    batch.write(bead)
 
-        conn.commit()
-        return bead.bead_id
+        Nothing is written if the block raises.
+        """
+        batch = BeadBatch()
+        yield batch
+        self.write_many(batch.beads)
+
+    def _check_batch(self, beads: list[Bead]) -> None:
+        """Set-based INV-BEAD-IMMUTABLE-1 / INV-BEAD-CHAIN-1 checks."""
+        referenced = {bead.prev_bead_id for bead in beads if bead.prev_bead_id}
+        existing = self._existing_ids({bead.bead_id for bead in beads} | referenced)
+
+        # Check immutability
+        seen: set[str] = set()
+        for bead in beads:
+            if bead.bead_id in existing or bead.bead_id in seen:
+                raise BeadImmutabilityError(
+                    f"Bead {bead.bead_id} already exists (INV-BEAD-IMMUTABLE-1)"
+                )
+            seen.add(bead.bead_id)
+
+        # Validate chain
+        written: set[str] = set()
+        for bead in beads:
+            prev = bead.prev_bead_id
+            if prev and prev not in existing and prev not in written:
+                raise BeadValidationError(
+                    f"prev_bead_id {prev} does not exist (INV-BEAD-CHAIN-1)"
+                )
+            written.add(bead.bead_id)
 
     def write_dict(self, bead_dict: dict[str, Any]) -> str:
         """
@@ -342,17 +450,30 @@ class BeadStore:
         # TODO: Standardize hash computation across all producers
         pass
 
-    def _bead_exists(self, bead_id: str) -> bool:
-        """Check if bead exists."""
+    def _existing_ids(self, bead_ids: set[str]) -> set[str]:
+        """Which of `bead_ids` are stored (one query, any number of ids)."""
         conn = self._get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM beads WHERE bead_id = ?", (bead_id,))
-        return cursor.fetchone() is not None
+        cursor.execute(
+            """
+            SELECT bead_id FROM beads
+            WHERE bead_id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(sorted(bead_ids)),),
+        )
+        return {row[0] for row in cursor.fetchall()}
 
     # =========================================================================
     # READ PATH (Used by Athena)
     # =========================================================================
 
+    @property
+    def has_full_text_index(self) -> bool:
+        """Whether bead_fts exists (keyword filters can use full_text_filter)."""
+        if self._full_text is None:
+            self._full_text = has_full_text(self._get_connection().cursor())
+        return self._full_text
+
     def read(self, bead_id: str) -> Bead:
         """
         Read a bead by ID.
@@ -468,3 +589,28 @@ class BeadStore:
             cursor.execute("SELECT COUNT(*) FROM beads")
 
         return cursor.fetchone()[0]
+
+    def find_by_attribute(
+        self,
+        key: str,
+        value: Any,
+        bead_type: BeadType | str | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Beads with `value` at a content path of `key`, newest first (bead_attrs index).
+
+        Args:
+            key: One of INDEXED_ATTRIBUTES
+            value: Attribute value
+            bead_type: Only beads of this type
+            since: Only beads with timestamp_utc >= since
+            limit: Most rows returned
+
+        Returns:
+            Row dictionaries (as query_sql)
+        """
+        if isinstance(bead_type, BeadType):
+            bead_type = bead_type.value
+        return self.query_sql(*attribute_query(key, value, bead_type, since, limit))
@@ -0,0 +1,107 @@
+"""
+Bead Writer — Batch Bead Writes with Dead Letters
+=================================================
+
+The write side of BeadWriteQueue (bead_queue.py). A batch is written all
+or nothing (BeadStore.write_many: one transaction); a failed batch is
+retried bead by bead so one bad bead does not cost the rest. Beads that
+still fail are kept as dead letters for retry, never dropped.
+
+INVARIANTS:
+- INV-BEAD-QUEUE-2: failed beads are kept as dead letters, never dropped
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .bead_store import Bead
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """
+    All-or-nothing batch writes, retried singly on failure.
+
+    Usage:
+        writer = BatchWriter(store.write_many)
+        failed = writer.write(beads)
+        beads = writer.take_dead_letters()
+    """
+
+    def __init__(self, write_batch: Callable[[list[Any]], Any]) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            write_batch: Writes a list of beads (one transaction)
+        """
+        self._write_batch = write_batch
+        self._lock = threading.Lock()
+        self._dead: list[Any] = []
+
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def dead_letters(self) -> list[Any]:
+        """Beads whose write failed, in emit order (not retried yet)."""
+        with self._lock:
+            return list(self._dead)
+
+    def take_dead_letters(self) -> list[Any]:
+        """Remove and return the dead letters (for retry)."""
+        with self._lock:
+            beads, self._dead = self._dead, []
+            return beads
+
+    def write(self, batch: list[Any]) -> list[Any]:
+        """Write one batch; on failure retry bead by bead. Returns the beads that failed."""
+        failed = []
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                failed = batch
+                logger.error(f"Bead write failed: {e}")
+            else:
+                logger.warning(f"Bead batch write failed, retrying singly: {e}")
+                for bead in batch:
+                    try:
+                        self._write_batch([bead])
+                    except Exception as bead_error:
+                        failed.append(bead)
+                        logger.error(f"Bead write failed: {bead_error}")
+
+        with self._lock:
+            self.written += len(batch) - len(failed)
+            self.failed += len(failed)
+            self.batches += 1
+            self._dead.extend(failed)
+        return failed
+
+
+def take_batch(source: queue.Queue[Any], limit: int) -> list[Any]:
+    """Up to `limit` queued beads, without blocking."""
+    batch: list[Any] = []
+    while len(batch) < limit:
+        try:
+            batch.append(source.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def as_bead(bead: Any) -> Bead:
+    """Bead from a Bead, a bead dict or an object with .to_dict()."""
+    if isinstance(bead, Bead):
+        return bead
+    if isinstance(bead, dict):
+        return Bead.from_dict(bead)
+    return Bead.from_dict(bead.to_dict())
@@ -0,0 +1,203 @@
+"""
+Chain Checkpoint — Signed Bead Hash-Chain Verification State
+============================================================
+
+ChainVerifier records each run as a signed checkpoint (HMAC-SHA256),
+appended to a JSONL file next to the database:
+- last verified bead (rowid + bead_id + bead_hash); beads after it are
+  verified by the next run
+- cumulative digest: sha256 fold of (bead_id, bead_hash) in rowid order
+  since genesis, up to and including the last verified bead
+- known failures (bead_id, reason, rowid) up to that bead, carried
+  forward and reported again by incremental runs without re-hashing
+- counts of beads folded and known failures
+
+Earlier lines are kept as history; only the last one is read back.
+
+A checkpoint is resumable while its anchor (last trusted bead) keeps its
+rowid and bead_hash. fold_chain extends the digest over later beads and
+can recompute it at an old anchor, to re-check a checkpoint after a full
+verification.
+
+INVARIANTS:
+- INV-CHAIN-VERIFY-1: A checkpoint is trusted only if its signature verifies
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import sqlite3
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .bead_store import BeadStoreError
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+GENESIS_DIGEST = "0" * 64
+
+
+# =============================================================================
+# EXCEPTIONS
+# =============================================================================
+
+
+class ChainVerificationError(BeadStoreError):
+    """Checkpoint cannot be trusted (bad signature or unreadable)."""
+
+    pass
+
+
+# =============================================================================
+# CHECKPOINT
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ChainFailure:
+    """One bead that fails verification."""
+
+    bead_id: str
+    reason: str  # HASH_MISMATCH | MISSING_PREV | DIGEST_MISMATCH
+    rowid: int
+
+
+@dataclass
+class ChainCheckpoint:
+    """Signed verification state after a run."""
+
+    last_rowid: int
+    last_bead_id: str | None
+    last_bead_hash: str | None
+    bead_count: int
+    digest: str
+    failure_count: int
+    verified_at: str
+    known_failures: list[ChainFailure] = field(default_factory=list)
+    signature: str = ""
+
+    def payload(self) -> bytes:
+        """Canonical signed bytes (every field except the signature)."""
+        data = asdict(self)
+        del data["signature"]
+        return json.dumps(data, sort_keys=True).encode()
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChainCheckpoint:
+        known = [ChainFailure(**f) for f in data.get("known_failures", [])]
+        return cls(**{**data, "known_failures": known})
+
+
+def sign_checkpoint(key: bytes, checkpoint: ChainCheckpoint) -> str:
+    """HMAC-SHA256 of the checkpoint payload."""
+    return hmac.new(key, checkpoint.payload(), hashlib.sha256).hexdigest()
+
+
+def read_checkpoint(path: Path, key: bytes) -> ChainCheckpoint | None:
+    """
+    Last checkpoint in the JSONL file (None if there is none).
+
+    Raises:
+        ChainVerificationError: If it is unreadable or its signature fails
+    """
+    if not path.exists():
+        return None
+    lines = path.read_text().splitlines()
+    last = next((line for line in reversed(lines) if line.strip()), None)
+    if last is None:
+        return None
+
+    try:
+        checkpoint = ChainCheckpoint.from_dict(json.loads(last))
+    except (TypeError, ValueError) as e:
+        raise ChainVerificationError(f"Unreadable chain checkpoint: {e}") from e
+    if not hmac.compare_digest(checkpoint.signature, sign_checkpoint(key, checkpoint)):
+        raise ChainVerificationError("Chain checkpoint signature mismatch (INV-CHAIN-VERIFY-1)")
+    return checkpoint
+
+
+def append_checkpoint(path: Path, checkpoint: ChainCheckpoint) -> None:
+    """Append a signed checkpoint to the JSONL history."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(checkpoint.to_dict(), sort_keys=True) + "\n")
+
+
+def fold_digest(digest: str, bead_id: str, bead_hash: str) -> str:
+    """Extend the cumulative digest by one bead."""
+    return hashlib.sha256(f"{digest}|{bead_id}|{bead_hash}".encode()).hexdigest()
+
+
+# =============================================================================
+# ANCHOR + DIGEST
+# =============================================================================
+
+
+def read_anchor(conn: sqlite3.Connection, checkpoint: ChainCheckpoint) -> tuple[int, str] | None:
+    """Current (rowid, bead_hash) of the checkpoint's last bead (None if gone)."""
+    if checkpoint.last_bead_id is None:
+        return None
+    return conn.execute(
+        "SELECT rowid, bead_hash FROM beads WHERE bead_id = ?", (checkpoint.last_bead_id,)
+    ).fetchone()
+
+
+def anchor_holds(checkpoint: ChainCheckpoint, anchor: tuple[int, str] | None) -> bool:
+    """Whether the last bead still sits at its recorded rowid with its recorded hash."""
+    if checkpoint.last_bead_id is None:
+        return checkpoint.last_rowid == 0
+    return anchor == (checkpoint.last_rowid, checkpoint.last_bead_hash)
+
+
+def fold_chain(
+    conn: sqlite3.Connection,
+    base: ChainCheckpoint | None,
+    start: int,
+    end: int,
+    audit: int | None,
+) -> tuple[dict, int, str | None]:
+    """
+    Fold the digest over beads with start < rowid <= end.
+
+    Returns the checkpoint fields at the last bead, the number of beads
+    folded, and the digest through rowid `audit` (None if not requested,
+    or if the chain no longer reaches it).
+    """
+    head = {
+        "last_rowid": start,
+        "last_bead_id": base.last_bead_id if base else None,
+        "last_bead_hash": base.last_bead_hash if base else None,
+        "bead_count": base.bead_count if base else 0,
+        "digest": base.digest if base else GENESIS_DIGEST,
+    }
+    digest = head["digest"]
+    folded = 0
+    audited = None
+    rows = conn.execute(
+        "SELECT rowid, bead_id, bead_hash FROM beads WHERE rowid > ? AND rowid <= ? ORDER BY rowid",
+        (start, end),
+    )
+    for rowid, bead_id, bead_hash in rows:
+        if audit is not None and audited is None and rowid > audit:
+            audited = digest
+        digest = fold_digest(digest, bead_id, bead_hash)
+        folded += 1
+    if folded:
+        head.update(
+            last_rowid=rowid,
+            last_bead_id=bead_id,
+            last_bead_hash=bead_hash,
+            bead_count=head["bead_count"] + folded,
+            digest=digest,
+        )
+    if audit is not None and audited is None and end >= audit:
+        audited = digest
+    return head, folded, audited
@@ -0,0 +1,273 @@
+"""
+Chain Verifier — Incremental, Checkpointed Bead Hash-Chain Audit
+================================================================
+
+Bead.compute_hash chains every bead to its predecessor:
+
+    bead_hash == compute_hash(content, prev.bead_hash, timestamp_utc, signer)
+
+Each bead is checked against its own row and the stored hash of its
+prev_bead_id, so beads can be verified in any order. Disjoint rowid
+segments are verified in parallel worker processes.
+
+A run ends with a signed checkpoint (chain_checkpoint.py) at the last
+bead. Failing beads are recorded in it as known failures: incremental
+runs report them again from the checkpoint without re-hashing them, so
+a bad bead (BeadStore accepts non-standard hashes, e.g. Hunt's) does not
+pull every later run back to it. Only a full run re-hashes them, and
+drops those that were repaired.
+
+The next run resumes after the checkpoint's anchor bead if that bead
+still has its recorded rowid and bead_hash. A nightly audit therefore
+costs time proportional to new beads. verify(full=True) re-checks all
+history and compares the recomputed digest at the anchor with the
+checkpoint's, catching history rewritten with recomputed hashes or
+pruned before the anchor (DIGEST_MISMATCH). A diverged history is not
+checkpointed; the last trusted checkpoint stays in force.
+
+The bead database is opened read-only. CLI: scripts/chain_verify.py.
+
+INVARIANTS:
+- INV-BEAD-CHAIN-1: prev_bead_id must reference an existing bead
+- INV-CHAIN-VERIFY-1: A checkpoint is trusted only if its signature verifies
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from .bead_store import DEFAULT_BEAD_DB_PATH, Bead, BeadStoreError
+from .chain_checkpoint import (
+    ChainCheckpoint,
+    ChainFailure,
+    anchor_holds,
+    append_checkpoint,
+    fold_chain,
+    read_anchor,
+    read_checkpoint,
+    sign_checkpoint,
+)
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+DEFAULT_SEGMENT_SIZE = 50_000  # rowids per worker task
+
+# Environment variable holding the checkpoint signing key (CLI)
+KEY_ENV = "PHOENIX_CHAIN_KEY"
+
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+@dataclass
+class VerificationReport:
+    """Outcome of ChainVerifier.verify()."""
+
+    checkpoint: ChainCheckpoint
+    verified: int  # beads checked in this run
+    failures: list[ChainFailure] = field(default_factory=list)  # known + new
+    resumed_from: str | None = None  # checkpoint bead_id (None: from genesis)
+    segments: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+# =============================================================================
+# CHAIN VERIFIER
+# =============================================================================
+
+
+class ChainVerifier:
+    """
+    Verifies a bead store's hash chain from its last signed checkpoint.
+
+    Usage:
+        verifier = ChainVerifier(key=secret, db_path=path)
+        report = verifier.verify()          # new beads only
+        report = verifier.verify(full=True) # all history
+    """
+
+    def __init__(
+        self,
+        key: bytes,
+        db_path: Path | None = None,
+        checkpoint_path: Path | None = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Initialize verifier.
+
+        Args:
+            key: HMAC key signing checkpoints
+            db_path: Bead database (opened read-only)
+            checkpoint_path: Checkpoint JSONL (default: <db>.chain.jsonl)
+            segment_size: Rowids per parallel segment
+            max_workers: Worker processes (1: verify in this process)
+        """
+        if not key:
+            raise ValueError("Checkpoint signing key must not be empty")
+        self._key = key
+        self._db_path = db_path or DEFAULT_BEAD_DB_PATH
+        self._checkpoint_path = checkpoint_path or self._db_path.with_suffix(".chain.jsonl")
+        self._segment_size = segment_size
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self._checkpoint_path
+
+    def latest_checkpoint(self) -> ChainCheckpoint | None:
+        """
+        Last recorded checkpoint (None before the first run).
+
+        Raises:
+            ChainVerificationError: If it is unreadable or its signature fails
+        """
+        return read_checkpoint(self._checkpoint_path, self._key)
+
+    def verify(self, full: bool = False) -> VerificationReport:
+        """
+        Verify beads after the last checkpoint (or all) and record a new one.
+
+        Without a resumable checkpoint (full=True, or its anchor bead was
+        moved or rewritten) history is verified from genesis and the
+        digest at the old anchor is compared with the checkpoint's.
+
+        Raises:
+            ChainVerificationError: If the latest checkpoint is not trusted
+        """
+        latest = self.latest_checkpoint()
+
+        conn = _connect(self._db_path)
+        try:
+            anchor = read_anchor(conn, latest) if latest else None
+            resume = latest if latest and not full and anchor_holds(latest, anchor) else None
+            start = resume.last_rowid if resume else 0
+            end = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM beads").fetchone()[0]
+            end = max(end, start)
+
+            segments = [
+                (lo, min(lo + self._segment_size, end))
+                for lo in range(start, end, self._segment_size)
+            ]
+            failures = self._verify_segments(segments)
+
+            # Re-check the old checkpoint at its anchor's current rowid
+            # (rowids can be renumbered by VACUUM; bead order is kept)
+            audit = None
+            if resume is None and latest is not None and latest.last_bead_id is not None:
+                audit = anchor[0] if anchor else latest.last_rowid
+            head, verified, audited = fold_chain(conn, resume, start, end, audit)
+        finally:
+            conn.close()
+
+        if resume is not None:  # reported from the checkpoint, not re-hashed
+            failures = resume.known_failures + failures
+
+        if audit is not None and audited != latest.digest:
+            failures.append(ChainFailure(latest.last_bead_id, "DIGEST_MISMATCH", audit))
+            failures.sort(key=lambda failure: failure.rowid)
+            checkpoint = latest  # do not checkpoint the diverged history
+        else:
+            checkpoint = ChainCheckpoint(
+                **head,
+                failure_count=len(failures),
+                verified_at=datetime.now(UTC).isoformat(),
+                known_failures=list(failures),
+            )
+            checkpoint.signature = self._sign(checkpoint)
+            self._append(checkpoint)
+
+        return VerificationReport(
+            checkpoint=checkpoint,
+            verified=verified,
+            failures=failures,
+            resumed_from=resume.last_bead_id if resume else None,
+            segments=len(segments),
+        )
+
+    def _verify_segments(self, segments: list[tuple[int, int]]) -> list[ChainFailure]:
+        """Failures of every segment, in rowid order."""
+        if self._max_workers <= 1 or len(segments) <= 1:
+            results = [verify_segment(self._db_path, lo, hi) for lo, hi in segments]
+        else:
+            workers = min(self._max_workers, len(segments))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        verify_segment,
+                        [self._db_path] * len(segments),
+                        *zip(*segments, strict=True),
+                    )
+                )
+        return [failure for result in results for failure in result]
+
+    def _sign(self, checkpoint: ChainCheckpoint) -> str:
+        return sign_checkpoint(self._key, checkpoint)
+
+    def _append(self, checkpoint: ChainCheckpoint) -> None:
+        append_checkpoint(self._checkpoint_path, checkpoint)
+
+
+# =============================================================================
+# SEGMENT VERIFICATION (worker processes)
+# =============================================================================
+
+
+def verify_segment(db_path: Path, lo: int, hi: int) -> list[ChainFailure]:
+    """
+    Verify beads with lo < rowid <= hi against their predecessors.
+
+    Module-level so worker processes can run it; opens its own read-only
+    connection.
+    """
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            """
+            SELECT b.rowid, b.bead_id, b.prev_bead_id, b.bead_hash, b.timestamp_utc,
+                   b.signer, b.content, p.bead_hash
+            FROM beads b LEFT JOIN beads p ON p.bead_id = b.prev_bead_id
+            WHERE b.rowid > ? AND b.rowid <= ?
+            ORDER BY b.rowid
+            """,
+            (lo, hi),
+        )
+        failures = []
+        for rowid, bead_id, prev_id, bead_hash, timestamp, signer, content, prev_hash in rows:
+            if prev_id and prev_hash is None:
+                failures.append(ChainFailure(bead_id, "MISSING_PREV", rowid))
+                continue
+            expected = Bead.compute_hash(
+                json.loads(content), prev_hash, datetime.fromisoformat(timestamp), signer
+            )
+            if not hmac.compare_digest(expected, bead_hash):
+                failures.append(ChainFailure(bead_id, "HASH_MISMATCH", rowid))
+        return failures
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    if not Path(db_path).exists():
+        raise BeadStoreError(f"Bead database not found: {db_path}")
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
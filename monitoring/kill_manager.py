@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
+from memory.bead_attrs import attribute_query
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -228,9 +230,7 @@ class KillManager:
 
         try:
             beads = self._bead_store.query_sql(
-                "SELECT * FROM beads WHERE bead_type = 'KILL_FLAG' "  # noqa: S608
-                f"AND json_extract(content, '$.strategy_id') = '{strategy_id}' "
-                "ORDER BY timestamp_utc DESC LIMIT 1",
+                *attribute_query("strategy_id", strategy_id, "KILL_FLAG", limit=1)
             )
 
             if beads:
@@ -34,7 +34,7 @@ from .semantic_health import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from memory.bead_queue import BeadWriteQueue
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +101,7 @@ class Heartbeat:
         ibkr_health_provider: Any = None,
         recon_health_provider: Any = None,
         position_health_provider: Any = None,
+        bead_queue: BeadWriteQueue | None = None,
     ) -> None:
         """
         Initialize heartbeat daemon.
@@ -112,11 +113,18 @@ class Heartbeat:
             ibkr_health_provider: IBKR state provider for semantic checks
             recon_health_provider: Reconciliation state provider
             position_health_provider: Position state provider
+            bead_queue: Write-behind queue for beads, in place of bead_emitter
+                (memory/bead_queue.py); started by start(), closed by stop()
         """
         self._config = config or HeartbeatConfig()
         self._state = HeartbeatState()
 
-        # Bead emitter
+        # Bead emitter (through the write-behind queue if given)
+        if bead_queue is not None:
+            if bead_emitter is not None:
+                raise ValueError("Pass bead_emitter to the bead queue, not the heartbeat")
+            bead_emitter = bead_queue.emit
+        self._bead_queue = bead_queue
         self._bead_emitter = HeartbeatBeadEmitter(bead_emitter)
 
         # Alert callback
@@ -164,6 +172,9 @@ class Heartbeat:
         self._stop_event.clear()
         self._state.running = True
 
+        if self._bead_queue is not None and not self._bead_queue.running:
+            self._bead_queue.start()
+
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
@@ -184,6 +195,10 @@ class Heartbeat:
             self._thread.join(timeout=5.0)
             self._thread = None
 
+        # Shutdown: write queued beads, refuse new ones
+        if self._bead_queue is not None:
+            self._bead_queue.close(timeout=5.0)
+
         logger.info("Heartbeat stopped")
 
     def is_running(self) -> bool:
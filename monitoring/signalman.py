@@ -22,6 +22,8 @@ from typing import Any
 
 import numpy as np
 
+from memory.bead_attrs import attribute_query
+
 # =============================================================================
 # ENUMS
 # =============================================================================
@@ -244,14 +246,10 @@ class Signalman:
 
         try:
             cutoff = datetime.now(UTC) - timedelta(days=self._lookback_days)
-            cutoff_str = cutoff.isoformat()
 
-            # Query beads
+            # Query beads (indexed strategy_id, newest first)
             beads = self._bead_store.query_sql(
-                f"SELECT * FROM beads WHERE bead_type = 'PERFORMANCE' "  # noqa: S608
-                f"AND content LIKE '%{strategy_id}%' "
-                f"AND timestamp_utc >= '{cutoff_str}' "
-                f"ORDER BY timestamp_utc DESC",
+                *attribute_query("strategy_id", strategy_id, "PERFORMANCE", since=cutoff)
             )
             return beads or []
         except Exception:
@@ -264,8 +262,8 @@ class Signalman:
 
         try:
             beads = self._bead_store.query_sql(
-                "SELECT DISTINCT json_extract(content, '$.strategy_id') as sid "
-                "FROM beads WHERE bead_type = 'PERFORMANCE'",
+                "SELECT DISTINCT attr_value as sid FROM bead_attrs "
+                "WHERE attr_key = 'strategy_id' AND bead_type = 'PERFORMANCE'",
             )
             return [b.get("sid") for b in (beads or []) if b.get("sid")]
         except Exception:
@@ -0,0 +1,63 @@
+"""
+Chain Verify — nightly bead hash-chain audit.
+
+SPRINT: S30
+
+Runs memory.chain_verifier.ChainVerifier against the bead database,
+resuming from its last signed checkpoint. The signing key is read from
+PHOENIX_CHAIN_KEY.
+
+Usage:
+    python scripts/chain_verify.py                 # new beads since the checkpoint
+    python scripts/chain_verify.py --full          # all history, digest re-checked
+    python scripts/chain_verify.py --db-path beads.db --workers 8
+
+Exit code is 0 when the chain is intact, 1 on failures and 2 without a key.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+from memory.chain_verifier import KEY_ENV, ChainVerifier  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify the bead hash chain")
+    parser.add_argument("--db-path", type=Path, default=None)
+    parser.add_argument("--checkpoint-path", type=Path, default=None)
+    parser.add_argument("--full", action="store_true", help="Re-verify all history")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    key = os.environ.get(KEY_ENV)
+    if not key:
+        print(f"{KEY_ENV} is not set", file=sys.stderr)
+        return 2
+
+    verifier = ChainVerifier(
+        key.encode(),
+        db_path=args.db_path,
+        checkpoint_path=args.checkpoint_path,
+        max_workers=args.workers,
+    )
+    report = verifier.verify(full=args.full)
+
+    for failure in report.failures:
+        print(f"{failure.reason:<16} {failure.bead_id}")
+    checkpoint = report.checkpoint
+    print(
+        f"Verified {report.verified:,} beads ({checkpoint.bead_count:,} trusted), "
+        f"{len(report.failures)} failures; digest {checkpoint.digest[:16]}"
+    )
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
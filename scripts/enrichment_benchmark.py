@@ -0,0 +1,148 @@
+"""
+Enrichment Benchmark Runner — L1-L6 throughput suite and regression check.
+
+SPRINT: S27.0
+
+Runs enrichment.benchmark.run_case for every (timeframe, years) case, each
+in a fresh process so peak RSS belongs to that case only.
+
+Usage:
+    python scripts/enrichment_benchmark.py                  # 1m/15m/1H x 1/5/10 years
+    python scripts/enrichment_benchmark.py --timeframes 1H --years 1 --baseline old.json
+    python scripts/enrichment_benchmark.py --scaling        # also L5 reference vs indexed
+
+Results are written as JSON (reports/enrichment_benchmark_results.json by
+default). With --baseline, cases whose bars/sec dropped by more than the
+tolerance are reported and the exit code is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from enrichment.benchmark import (  # noqa: E402
+    DEFAULT_TOLERANCE,
+    DEFAULT_YEARS,
+    TIMEFRAME_MINUTES,
+    compare,
+    order_block_scaling,
+    run_case,
+)
+
+DEFAULT_OUTPUT = PHOENIX_ROOT / "reports" / "enrichment_benchmark_results.json"
+
+
+def run_suite(
+    timeframes: Iterable[str] = tuple(TIMEFRAME_MINUTES),
+    years: Iterable[int] = DEFAULT_YEARS,
+    repeat: int = 1,
+    seed: int = 0,
+) -> dict:
+    """Benchmark every (timeframe, years) case, each in a fresh process."""
+    results = []
+    context = get_context("spawn")
+    for timeframe in timeframes:
+        for y in years:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                case = pool.submit(run_case, timeframe, y * 365, repeat, seed).result()
+            case["years"] = y
+            results.append(case)
+            print(
+                f"{timeframe:>4} {y:>2}y {case['bars']:>9,} bars  "
+                f"chain {case['chain']['bars_per_sec']:>12,.0f} bars/s  "
+                f"peak {case['peak_rss_mb']:,.0f} MB"
+            )
+    return {"meta": _meta(repeat, seed), "results": results}
+
+
+def _meta(repeat: int, seed: int) -> dict:
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "seed": seed,
+    }
+
+
+def _git_commit() -> str | None:
+    """HEAD commit of the checkout (None outside git)."""
+    git = shutil.which("git")
+    if git is None:
+        return None
+    try:
+        return subprocess.run(  # noqa: S603 - fixed argv, resolved git binary
+            [git, "rev-parse", "HEAD"],
+            cwd=PHOENIX_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _print_scaling(scaling: dict) -> dict:
+    """Print L5 reference vs indexed seconds per history size."""
+    print("L5 tracking (trending, seconds):")
+    reference, indexed = scaling["seconds"]["reference"], scaling["seconds"]["indexed"]
+    for n, ref, idx in zip(scaling["sizes"], reference, indexed, strict=True):
+        print(f"  n={n:>5}: reference {ref:.3f}  indexed {idx:.3f}  ({ref / idx:.0f}x)")
+    return scaling
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark enrichment layers L1-L6")
+    parser.add_argument("--timeframes", nargs="+", default=list(TIMEFRAME_MINUTES))
+    parser.add_argument("--years", nargs="+", type=int, default=list(DEFAULT_YEARS))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--scaling", action="store_true", help="also time L5 OB modes")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.timeframes) - set(TIMEFRAME_MINUTES)
+    if unknown:
+        parser.error(f"unknown timeframes: {sorted(unknown)}")
+
+    report = run_suite(args.timeframes, args.years, args.repeat, args.seed)
+    if args.scaling:
+        report["order_block_scaling"] = _print_scaling(order_block_scaling(seed=args.seed))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results: {args.output}")
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(json.load(f), report, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
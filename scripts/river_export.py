@@ -0,0 +1,55 @@
+"""
+River Export — write a memory-mapped columnar snapshot of River.
+
+SPRINT: S30
+
+Streams River bar and enrichment tables through data.river_export into a
+snapshot directory that ColumnarRiverReader (data.river_columnar) serves.
+
+Usage:
+    python scripts/river_export.py snapshots/2025-06-01
+    python scripts/river_export.py out/ --pairs EURUSD --timeframes 1H 4H --layers
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+from data.river_export import export_river  # noqa: E402
+from data.river_reader import DEFAULT_CHUNK_ROWS, RiverReader  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Export River to a columnar snapshot")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--river-path", type=Path, default=None)
+    parser.add_argument("--caller", default="hunt")
+    parser.add_argument("--pairs", nargs="+", default=None)
+    parser.add_argument("--timeframes", nargs="+", default=None)
+    parser.add_argument("--layers", nargs="*", default=None)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    with RiverReader(caller=args.caller, river_path=args.river_path) as reader:
+        manifest = export_river(
+            reader,
+            args.out_dir,
+            pairs=args.pairs,
+            timeframes=args.timeframes,
+            layers=args.layers,
+            chunk_rows=args.chunk_rows,
+        )
+
+    for name, table in manifest["tables"].items():
+        print(f"{name:<32} {table['rows']:>12,} rows")
+    print(f"Snapshot: {args.out_dir} (dataset_hash {manifest['dataset_hash']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
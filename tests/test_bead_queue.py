@@ -0,0 +1,199 @@
+"""
+Test Bead Queue — write-behind bead emission with halt-safe flush.
+
+SPRINT: S30
+EXIT_GATE: bead_write_behind
+
+INVARIANTS:
+- INV-BEAD-QUEUE-1: Beads are written in emit order
+- INV-BEAD-QUEUE-2: flush() returns True only when all prior beads are written
+"""
+
+import sys
+import threading
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def make_bead(n, prev=None):
+    from memory.bead_store import Bead, BeadType, Signer
+
+    timestamp = START + timedelta(seconds=n)
+    content = {"n": n}
+    return Bead(
+        bead_id=f"BEAD-{n:04d}",
+        bead_type=BeadType.PERFORMANCE,
+        prev_bead_id=prev,
+        bead_hash=Bead.compute_hash(content, None, timestamp, "system"),
+        timestamp_utc=timestamp,
+        signer=Signer.SYSTEM,
+        version="1.0",
+        content=content,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    from memory.bead_store import BeadStore
+
+    with BeadStore(db_path=tmp_path / "beads.db") as store:
+        yield store
+
+
+class TestBeadWriteQueue:
+    """Write-behind queue in front of BeadStore.write_many."""
+
+    def test_emit_does_not_write(self, store):
+        from memory import BeadWriteQueue
+
+        queue = BeadWriteQueue.for_store(store)
+        queue.emit(make_bead(1))
+
+        assert store.count_beads() == 0
+        assert queue.pending == 1
+
+    def test_flush_without_thread_drains_inline(self, store):
+        from memory import BeadWriteQueue
+
+        queue = BeadWriteQueue.for_store(store, max_batch=4)
+        for n in range(10):
+            queue.emit(make_bead(n))
+
+        assert queue.flush()
+        assert store.count_beads() == 10
+        assert (queue.writer.written, queue.writer.batches, queue.pending) == (10, 3, 0)
+
+    def test_writer_thread_batches_in_order(self, store):
+        from memory import BeadWriteQueue
+
+        queue = BeadWriteQueue.for_store(store)
+        queue.start()
+        try:
+            queue.emit(make_bead(0))
+            for n in range(1, 200):
+                queue.emit(make_bead(n, prev=f"BEAD-{n - 1:04d}"))
+            assert queue.flush(timeout=5.0)
+        finally:
+            queue.close()
+
+        assert store.count_beads() == 200
+        assert store.read("BEAD-0199").prev_bead_id == "BEAD-0198"
+
+    def test_accepts_bead_dicts(self, store):
+        from memory import BeadWriteQueue
+
+        queue = BeadWriteQueue.for_store(store)
+        queue.emit(make_bead(1).to_dict())
+        queue.flush()
+
+        assert store.read("BEAD-0001").content == {"n": 1}
+
+    def test_failed_batch_retried_singly(self, store):
+        """One bad bead does not cost the rest of its batch."""
+        from memory import BeadWriteQueue
+
+        store.write(make_bead(2))
+        queue = BeadWriteQueue.for_store(store)
+        for n in range(5):
+            queue.emit(make_bead(n))
+
+        assert not queue.flush()
+        assert (queue.writer.written, queue.writer.failed) == (4, 1)
+        assert [b.bead_id for b in queue.dead_letters] == ["BEAD-0002"]
+        assert store.count_beads() == 5
+
+    def test_failed_beads_fail_flush(self, store):
+        """Payload dicts are not beads: flush is False and they are kept (INV-BEAD-QUEUE-2)."""
+        from memory import BeadWriteQueue
+
+        payload = {"position_id": "POS-1", "state": "APPROVED"}
+        queue = BeadWriteQueue.for_store(store)
+        queue.emit(payload)
+
+        assert not queue.flush(1.0)
+        assert (queue.writer.written, queue.writer.failed) == (0, 1)
+        assert queue.dead_letters == [payload]
+
+    def test_retry_failed_requeues_dead_letters(self):
+        from memory import BeadWriteQueue
+
+        written = []
+        broken = threading.Event()
+        broken.set()
+
+        def write(beads):
+            if broken.is_set():
+                raise OSError("disk full")
+            written.extend(beads)
+
+        queue = BeadWriteQueue(write)
+        queue.emit(1)
+        assert not queue.flush()
+
+        broken.clear()
+        assert queue.retry_failed() == 1
+        assert queue.flush()
+        assert (written, queue.dead_letters) == ([1], [])
+
+    def test_backpressure_when_full(self):
+        from memory import BeadWriteQueue
+        from memory.bead_queue import BeadQueueFullError
+
+        queue = BeadWriteQueue(lambda beads: None, max_size=2, put_timeout=0.05)
+        queue.emit("a")
+        queue.emit("b")
+
+        with pytest.raises(BeadQueueFullError):
+            queue.emit("c")
+        assert queue.pending == 2
+        assert queue.flush(timeout=1.0)
+
+    def test_full_queue_unblocks_when_drained(self):
+        from memory import BeadWriteQueue
+
+        written = []
+        queue = BeadWriteQueue(written.extend, max_size=1)
+        queue.emit(1)
+        producer = threading.Thread(target=queue.emit, args=(2,))
+        producer.start()
+
+        queue.flush()
+        producer.join(timeout=1.0)
+        queue.flush()
+
+        assert written == [1, 2]
+
+    def test_flush_timeout(self):
+        from memory import BeadWriteQueue
+
+        release = threading.Event()
+        queue = BeadWriteQueue(lambda beads: release.wait(5.0))
+        queue.start()
+        try:
+            queue.emit("slow")
+            assert not queue.flush(timeout=0.05)
+            release.set()
+            assert queue.flush(timeout=5.0)
+        finally:
+            queue.close()
+
+    def test_close_flushes_and_refuses(self, store):
+        from memory import BeadWriteQueue
+        from memory.bead_queue import BeadQueueClosedError
+
+        queue = BeadWriteQueue.for_store(store)
+        queue.start()
+        queue.emit(make_bead(1))
+
+        assert queue.close(timeout=5.0)
+        assert store.count_beads() == 1
+        assert not queue.running
+        with pytest.raises(BeadQueueClosedError):
+            queue.emit(make_bead(2))
@@ -0,0 +1,144 @@
+"""
+Test Bead Queue Wiring — producers, halt propagation and shutdown.
+
+SPRINT: S30
+EXIT_GATE: bead_write_behind
+
+INVARIANTS:
+- INV-BEAD-QUEUE-1: Beads are written in emit order
+- INV-BEAD-QUEUE-2: flush() returns True only when all prior beads are written
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+class TestBeadQueueWiring:
+    """Producers and halt propagation."""
+
+    def test_position_lifecycle_emits_through_queue(self):
+        from execution.positions.lifecycle import PositionLifecycle, create_position
+        from execution.positions.states import PositionState
+        from memory import BeadWriteQueue
+
+        written = []
+        queue = BeadWriteQueue.for_callback(written.append)
+        lifecycle = PositionLifecycle(emit_bead=queue.emit)
+        position = create_position("SIG-1", "EURUSD", "LONG", 1.0, 1.09, 1.11)
+
+        lifecycle.transition(position, PositionState.APPROVED, token_id="TOK-1")
+        assert written == []
+
+        queue.flush()
+        assert [b["state"] for b in written] == ["APPROVED"]
+
+    def test_halt_propagation_flushes(self):
+        from governance.halt import HaltManager
+        from memory import BeadWriteQueue
+
+        written = []
+        queue = BeadWriteQueue(written.extend)
+        queue.start()
+        try:
+            manager = HaltManager(module_id="execution")
+            manager.register_dependent("bead_queue", queue.on_halt)
+            for n in range(50):
+                queue.emit(n)
+
+            result = manager.request_halt()
+            report = manager.propagate_halt(result.halt_id)
+        finally:
+            queue.close()
+
+        assert [ack.module_id for ack in report.acks_received] == ["bead_queue"]
+        assert report.acks_received[0].ack
+        assert written == list(range(50))
+
+    def test_halt_ack_false_when_beads_failed(self):
+        from governance.halt import HaltManager
+        from memory import BeadWriteQueue
+
+        def write(beads):
+            raise OSError("disk full")
+
+        queue = BeadWriteQueue(write)
+        manager = HaltManager(module_id="execution")
+        manager.register_dependent("bead_queue", queue.on_halt)
+        queue.emit("bead")
+
+        report = manager.propagate_halt(manager.request_halt().halt_id)
+
+        assert not report.acks_received[0].ack
+        assert queue.dead_letters == ["bead"]
+
+    def test_register_halt_uses_queue_name(self):
+        from governance.halt import HaltManager
+        from memory import BeadWriteQueue
+
+        queue = BeadWriteQueue(list, name="position_beads")
+        manager = HaltManager(module_id="execution")
+        queue.register_halt(manager)
+
+        assert manager.get_dependents() == ["position_beads"]
+
+
+class TestProducerWiring:
+    """PositionTracker and Heartbeat emitting through the queue."""
+
+    def test_tracker_emits_through_queue(self):
+        from execution.positions import PositionTracker
+        from execution.positions.lifecycle import create_position
+        from execution.positions.states import PositionState
+        from memory import BeadWriteQueue
+
+        written = []
+        queue = BeadWriteQueue.for_callback(written.append)
+        tracker = PositionTracker(bead_queue=queue)
+        position = create_position("SIG-1", "EURUSD", "LONG", 1.0, 1.09, 1.11)
+
+        tracker.lifecycle.transition(position, PositionState.APPROVED, token_id="TOK-1")
+        assert written == []
+
+        assert tracker.close(timeout=1.0)
+        assert [b["state"] for b in written] == ["APPROVED"]
+
+    def test_tracker_close_refuses_new_beads(self):
+        from execution.positions import PositionTracker
+        from memory import BeadWriteQueue
+        from memory.bead_queue import BeadQueueClosedError
+
+        queue = BeadWriteQueue.for_callback(list)
+        PositionTracker(bead_queue=queue).close()
+
+        with pytest.raises(BeadQueueClosedError):
+            queue.emit({})
+
+    def test_tracker_rejects_emit_bead_with_queue(self):
+        from execution.positions import PositionTracker
+        from memory import BeadWriteQueue
+
+        with pytest.raises(ValueError, match="bead queue"):
+            PositionTracker(emit_bead=print, bead_queue=BeadWriteQueue.for_callback(list))
+
+    def test_heartbeat_starts_and_closes_queue(self):
+        from memory import BeadWriteQueue
+        from monitoring.ops.heartbeat import Heartbeat, HeartbeatConfig
+
+        written = []
+        queue = BeadWriteQueue.for_callback(written.append)
+        heartbeat = Heartbeat(
+            config=HeartbeatConfig(interval_sec=60.0, jitter_sec=0.0), bead_queue=queue
+        )
+
+        heartbeat.start()
+        assert queue.running
+        heartbeat.stop()
+
+        assert not queue.running
+        assert len(written) == 1
+        assert queue.pending == 0
@@ -0,0 +1 @@
+"""Bead Store Tests — S30 bead persistence, attribute and full-text indexes."""
@@ -0,0 +1,23 @@
+"""
+Test configuration for bead store tests.
+
+Ensures phoenix root is in sys.path and provides an empty BeadStore.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add phoenix root to path for imports
+_PHOENIX_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PHOENIX_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PHOENIX_ROOT))
+
+
+@pytest.fixture
+def store(tmp_path):
+    from memory.bead_store import BeadStore
+
+    with BeadStore(db_path=tmp_path / "beads.db") as store:
+        yield store
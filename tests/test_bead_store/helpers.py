@@ -0,0 +1,42 @@
+"""
+Bead store test helpers — bead builders.
+
+Imported by the test modules of this package and its conftest.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def make_bead(n, prev=None):
+    from memory.bead_store import Bead, BeadType, Signer
+
+    timestamp = START + timedelta(seconds=n)
+    content = {"n": n}
+    return Bead(
+        bead_id=f"BEAD-{n:04d}",
+        bead_type=BeadType.PERFORMANCE,
+        prev_bead_id=prev,
+        bead_hash=Bead.compute_hash(content, None, timestamp, "system"),
+        timestamp_utc=timestamp,
+        signer=Signer.SYSTEM,
+        version="1.0",
+        content=content,
+    )
+
+
+def make_content_bead(n, bead_type="PERFORMANCE", **content):
+    from memory.bead_store import Bead, BeadType, Signer
+
+    timestamp = START + timedelta(minutes=n)
+    return Bead(
+        bead_id=f"BEAD-{n:04d}",
+        bead_type=BeadType(bead_type),
+        prev_bead_id=None,
+        bead_hash=Bead.compute_hash(content, None, timestamp, "system"),
+        timestamp_utc=timestamp,
+        signer=Signer.SYSTEM,
+        version="1.0",
+        content=content,
+    )
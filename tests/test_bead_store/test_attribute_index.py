@@ -0,0 +1,177 @@
+"""
+Test Bead Store — bead_attrs index of hot content keys.
+
+SPRINT: S30
+EXIT_GATE: bead_attribute_index
+
+INVARIANTS:
+- INV-BEAD-IMMUTABLE-1: Index rows are only inserted, with the bead they index
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START, make_content_bead
+
+
+class TestAttributeIndex:
+    """bead_attrs side index for hot content keys."""
+
+    def test_attributes_indexed_on_write(self, store):
+        store.write(make_content_bead(1, strategy_id="FVG_LONDON", pair="EURUSD", count=3, ok=True))
+
+        rows = store.query_sql("SELECT attr_key, attr_value FROM bead_attrs ORDER BY attr_key")
+
+        assert [(r["attr_key"], r["attr_value"]) for r in rows] == [
+            ("pair", "EURUSD"),
+            ("strategy_id", "FVG_LONDON"),
+        ]
+
+    def test_find_by_attribute_newest_first(self, store):
+        store.write_many(
+            make_content_bead(n, strategy_id="FVG_LONDON" if n % 2 else "OTE_NEWYORK")
+            for n in range(10)
+        )
+
+        rows = store.find_by_attribute("strategy_id", "FVG_LONDON")
+
+        assert [r["bead_id"] for r in rows] == [f"BEAD-{n:04d}" for n in (9, 7, 5, 3, 1)]
+        assert json.loads(rows[0]["content"]) == {"strategy_id": "FVG_LONDON"}
+
+    def test_exact_match_not_substring(self, store):
+        store.write_many(
+            [
+                make_content_bead(1, strategy_id="FVG"),
+                make_content_bead(2, strategy_id="FVG_LONDON"),
+                make_content_bead(3, notes="FVG"),
+            ]
+        )
+
+        assert [r["bead_id"] for r in store.find_by_attribute("strategy_id", "FVG")] == [
+            "BEAD-0001"
+        ]
+
+    def test_type_since_and_limit(self, store):
+        from memory.bead_store import BeadType
+
+        store.write_many(
+            make_content_bead(n, "HUNT" if n < 3 else "PERFORMANCE", strategy_id="S1")
+            for n in range(6)
+        )
+
+        rows = store.find_by_attribute(
+            "strategy_id", "S1", BeadType.PERFORMANCE, since=START + timedelta(minutes=4)
+        )
+        assert [r["bead_id"] for r in rows] == ["BEAD-0005", "BEAD-0004"]
+
+        latest = store.find_by_attribute("strategy_id", "S1", "HUNT", limit=1)
+        assert [r["bead_id"] for r in latest] == ["BEAD-0002"]
+
+    def test_lookup_uses_primary_key(self, store):
+        from memory.bead_attrs import attribute_query
+
+        sql, params = attribute_query("strategy_id", "S1", "PERFORMANCE", limit=1)
+        plan = store._get_connection().execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        details = " ".join(row["detail"] for row in plan)
+
+        assert "USING PRIMARY KEY" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_attribute_filter(self, store):
+        from memory.bead_attrs import attribute_filter
+
+        store.write_many(
+            make_content_bead(n, pair=pair) for n, pair in enumerate(["EURUSD", "GBPUSD", "USDJPY"])
+        )
+        condition, params = attribute_filter("pair", ["EURUSD", "USDJPY"])
+
+        # Condition holds only placeholders; values are bound parameters
+        rows = store.query_sql(f"SELECT bead_id FROM beads WHERE {condition}", params)  # noqa: S608
+
+        assert sorted(r["bead_id"] for r in rows) == ["BEAD-0000", "BEAD-0002"]
+
+    def test_unindexed_key_rejected(self):
+        from memory.bead_attrs import attribute_query
+        from memory.bead_store import BeadStoreError
+
+        with pytest.raises(BeadStoreError, match="not indexed"):
+            attribute_query("notes", "x")
+
+    def test_existing_database_backfilled(self, tmp_path):
+        """A database from before bead_attrs is indexed on open."""
+        import sqlite3
+
+        from memory.bead_store import BeadStore
+
+        path = tmp_path / "beads.db"
+        with BeadStore(db_path=path) as store:
+            store.write_many(make_content_bead(n, pair="EURUSD", position_id=n) for n in range(3))
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE bead_attrs")
+        conn.commit()
+        conn.close()
+
+        with BeadStore(db_path=path) as store:
+            assert len(store.find_by_attribute("pair", "EURUSD")) == 3
+            assert [r["bead_id"] for r in store.find_by_attribute("position_id", 1)] == [
+                "BEAD-0001"
+            ]
+
+    def test_nested_pair_paths_indexed(self, store):
+        """HUNT beads carry the pair under hpg_json, PERFORMANCE under position."""
+        store.write_many(
+            [
+                make_content_bead(1, "HUNT", hpg_json={"pair": "EURUSD", "session": "LONDON"}),
+                make_content_bead(2, position={"pair": "EURUSD"}, pair="EURUSD"),
+                make_content_bead(3, "HUNT", hpg_json={"pair": "GBPUSD"}),
+            ]
+        )
+
+        rows = store.find_by_attribute("pair", "EURUSD")
+
+        assert [r["bead_id"] for r in rows] == ["BEAD-0002", "BEAD-0001"]
+
+    def test_athena_pair_filter_finds_nested_hunt_pair(self, store, tmp_path):
+        from memory import Athena, BeadStore
+        from memory.query_parser import QueryIR, Requester
+
+        store.write_many(
+            [
+                make_content_bead(1, "HUNT", hpg_json={"pair": "EURUSD"}),
+                make_content_bead(2, "HUNT", hpg_json={"pair": "GBPUSD"}),
+            ]
+        )
+        ir = QueryIR(
+            query_id="Q-1",
+            timestamp_utc=START,
+            requester=Requester.SYSTEM,
+            pair_filter=["EURUSD"],
+        )
+
+        with BeadStore(db_path=tmp_path / "beads.db", read_only=True) as reader:
+            athena = Athena(bead_store=reader)
+            rows = athena._execute(*athena._generate_sql(ir))
+
+        assert [r["bead_id"] for r in rows] == ["BEAD-0001"]
+
+    def test_nested_paths_backfilled_once(self, tmp_path):
+        """An index from before nested paths is completed on open."""
+        import sqlite3
+
+        from memory.bead_store import BeadStore
+
+        path = tmp_path / "beads.db"
+        with BeadStore(db_path=path) as store:
+            store.write(make_content_bead(1, "HUNT", hpg_json={"pair": "EURUSD"}))
+        conn = sqlite3.connect(path)
+        conn.execute("DELETE FROM bead_attrs")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        with BeadStore(db_path=path) as store:
+            assert [r["bead_id"] for r in store.find_by_attribute("pair", "EURUSD")] == [
+                "BEAD-0001"
+            ]
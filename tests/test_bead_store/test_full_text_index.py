@@ -0,0 +1,142 @@
+"""
+Test Bead Store — bead_fts trigram keyword index.
+
+SPRINT: S30
+EXIT_GATE: bead_full_text_index
+
+INVARIANTS:
+- INV-BEAD-IMMUTABLE-1: Index rows are only inserted, with the bead they index
+"""
+
+from .helpers import START, make_content_bead
+
+
+class TestFullTextIndex:
+    """bead_fts trigram index behind Athena keyword search."""
+
+    def write_notes(self, store, notes):
+        store.write_many(
+            make_content_bead(n, "HUNT", pair=pair, notes=note)
+            for n, (pair, note) in enumerate(notes)
+        )
+
+    def matching(self, store, keywords):
+        from memory.bead_fts import full_text_filter
+
+        # Condition holds only fixed LIKE terms; keywords are bound parameters
+        condition, params = full_text_filter(keywords)
+        rows = store.query_sql(f"SELECT bead_id FROM beads WHERE {condition}", params)  # noqa: S608
+        return sorted(r["bead_id"] for r in rows)
+
+    def test_index_maintained_on_write(self, store):
+        """External content: the index matches beads and holds no copy of content."""
+        self.write_notes(store, [("EURUSD", "FVG London open"), ("GBPUSD", "BOS Asia")])
+
+        assert store.has_full_text_index
+        store._get_connection().execute(
+            "INSERT INTO bead_fts (bead_fts, rank) VALUES ('integrity-check', 1)"
+        )
+        assert self.matching(store, ["asia"]) == ["BEAD-0001"]
+        assert not store.query_sql("SELECT name FROM sqlite_master WHERE name = 'bead_fts_content'")
+
+    def test_same_matches_as_like(self, store):
+        self.write_notes(
+            store,
+            [
+                ("EURUSD", "FVG London open"),
+                ("GBPUSD", "fvg asia"),
+                ("EURUSD", "BOS NY"),
+                ("USDJPY", "choch london"),
+            ],
+        )
+
+        for keywords in (["fvg"], ["london", "FVG"], ["ny"], ["eurusd", "ny"], ["nothing"]):
+            like = " AND ".join(["content LIKE ?"] * len(keywords))
+            expected = store.query_sql(
+                f"SELECT bead_id FROM beads WHERE {like}",  # noqa: S608 - fixed LIKE terms
+                tuple(f"%{k}%" for k in keywords),
+            )
+            assert self.matching(store, keywords) == sorted(r["bead_id"] for r in expected)
+
+    def test_keyword_uses_index(self, store):
+        from memory.bead_fts import full_text_filter
+
+        condition, params = full_text_filter(["london"])
+        plan = store._get_connection().execute(
+            f"EXPLAIN QUERY PLAN SELECT bead_id FROM beads WHERE {condition}",  # noqa: S608
+            params,
+        )
+        details = " ".join(row["detail"] for row in plan)
+
+        assert "VIRTUAL TABLE INDEX" in details
+        assert "SCAN beads" not in details
+
+    def test_existing_database_backfilled(self, tmp_path):
+        import sqlite3
+
+        from memory.bead_store import BeadStore
+
+        path = tmp_path / "beads.db"
+        with BeadStore(db_path=path) as store:
+            self.write_notes(store, [("EURUSD", "FVG London open")])
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE bead_fts")
+        conn.commit()
+        conn.close()
+
+        with BeadStore(db_path=path) as store:
+            assert self.matching(store, ["london"]) == ["BEAD-0000"]
+
+    def test_content_copying_index_replaced(self, tmp_path):
+        """An index holding its own copy of content is rebuilt as external content."""
+        import sqlite3
+
+        from memory.bead_store import BeadStore
+
+        path = tmp_path / "beads.db"
+        with BeadStore(db_path=path) as store:
+            self.write_notes(store, [("EURUSD", "FVG London open")])
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE bead_fts")
+        conn.execute(
+            "CREATE VIRTUAL TABLE bead_fts "
+            "USING fts5(bead_id UNINDEXED, content, tokenize = 'trigram')"
+        )
+        conn.commit()
+        conn.close()
+
+        with BeadStore(db_path=path) as store:
+            assert not store.query_sql(
+                "SELECT name FROM sqlite_master WHERE name = 'bead_fts_content'"
+            )
+            assert self.matching(store, ["london"]) == ["BEAD-0000"]
+
+    def test_athena_keyword_query(self, store, tmp_path):
+        """QueryIR keywords + pair + type through the index, newest first."""
+        from memory import Athena, BeadStore
+        from memory.query_parser import BeadTypeFilter, QueryIR, Requester
+
+        self.write_notes(
+            store,
+            [
+                ("EURUSD", "FVG London"),
+                ("GBPUSD", "FVG London"),
+                ("EURUSD", "fvg london retest"),
+                ("EURUSD", "BOS Asia"),
+            ],
+        )
+        ir = QueryIR(
+            query_id="Q-1",
+            timestamp_utc=START,
+            requester=Requester.SYSTEM,
+            bead_types=[BeadTypeFilter.HUNT],
+            keywords=["fvg", "london"],
+            pair_filter=["EURUSD"],
+        )
+
+        with BeadStore(db_path=tmp_path / "beads.db", read_only=True) as reader:
+            athena = Athena(bead_store=reader)
+            assert reader.has_full_text_index
+            rows = athena._execute(*athena._generate_sql(ir))
+
+        assert [r["bead_id"] for r in rows] == ["BEAD-0002", "BEAD-0000"]
@@ -0,0 +1,134 @@
+"""
+Test Bead Store — batched, group-committed bead writes.
+
+SPRINT: S30
+EXIT_GATE: bead_batch_write
+
+INVARIANTS:
+- INV-BEAD-IMMUTABLE-1: Beads cannot be modified after creation
+- INV-BEAD-CHAIN-1: prev_bead_id must exist
+"""
+
+import pytest
+
+from .helpers import make_bead
+
+
+class TestWriteMany:
+    """write_many(): one transaction for many beads."""
+
+    def test_writes_all_beads(self, store):
+        ids = store.write_many(make_bead(n) for n in range(50))
+
+        assert ids == [f"BEAD-{n:04d}" for n in range(50)]
+        assert store.count_beads() == 50
+        assert store.read("BEAD-0007").content == {"n": 7}
+
+    def test_one_transaction(self, store):
+        conn = store._get_connection()
+        statements = []
+        conn.set_trace_callback(statements.append)
+
+        store.write_many(make_bead(n) for n in range(20))
+
+        conn.set_trace_callback(None)
+        assert [s for s in statements if s in ("BEGIN IMMEDIATE", "COMMIT")] == [
+            "BEGIN IMMEDIATE",
+            "COMMIT",
+        ]
+        assert store.count_beads() == 20
+        assert not conn.in_transaction
+
+    def test_empty_batch(self, store):
+        assert store.write_many([]) == []
+        assert store.count_beads() == 0
+
+    def test_existing_bead_rejects_whole_batch(self, store):
+        from memory.bead_store import BeadImmutabilityError
+
+        store.write(make_bead(3))
+
+        with pytest.raises(BeadImmutabilityError, match="BEAD-0003"):
+            store.write_many(make_bead(n) for n in range(5))
+        assert store.count_beads() == 1
+
+    def test_duplicate_within_batch_rejected(self, store):
+        from memory.bead_store import BeadImmutabilityError
+
+        with pytest.raises(BeadImmutabilityError):
+            store.write_many([make_bead(1), make_bead(2), make_bead(1)])
+        assert store.count_beads() == 0
+
+    def test_chain_to_earlier_bead_in_batch(self, store):
+        store.write(make_bead(0))
+
+        store.write_many([make_bead(1, prev="BEAD-0000"), make_bead(2, prev="BEAD-0001")])
+
+        assert store.read("BEAD-0002").prev_bead_id == "BEAD-0001"
+
+    def test_missing_prev_rejected(self, store):
+        from memory.bead_store import BeadValidationError
+
+        with pytest.raises(BeadValidationError, match="INV-BEAD-CHAIN-1"):
+            store.write_many([make_bead(1), make_bead(2, prev="BEAD-0099")])
+        assert store.count_beads() == 0
+
+    def test_prev_later_in_batch_rejected(self, store):
+        from memory.bead_store import BeadValidationError
+
+        with pytest.raises(BeadValidationError):
+            store.write_many([make_bead(1, prev="BEAD-0002"), make_bead(2)])
+
+    def test_read_only_refused(self, store, tmp_path):
+        from memory.bead_store import BeadStore, BeadStoreError
+
+        with BeadStore(db_path=tmp_path / "beads.db", read_only=True) as reader:
+            with pytest.raises(BeadStoreError, match="read-only"):
+                reader.write_many([make_bead(1)])
+
+
+class TestBatch:
+    """batch() context manager."""
+
+    def test_writes_on_exit(self, store):
+        with store.batch() as batch:
+            for n in range(10):
+                batch.write(make_bead(n))
+            batch.write_dict(make_bead(10).to_dict())
+            assert store.count_beads() == 0
+
+        assert store.count_beads() == 11
+
+    def test_nothing_written_if_block_raises(self, store):
+        with pytest.raises(RuntimeError):
+            with store.batch() as batch:
+                batch.write(make_bead(1))
+                raise RuntimeError("abort")
+
+        assert store.count_beads() == 0
+
+
+class TestSingleWrite:
+    """write() keeps its per-bead behaviour."""
+
+    def test_write_and_reject_duplicate(self, store):
+        from memory.bead_store import BeadImmutabilityError
+
+        assert store.write(make_bead(1)) == "BEAD-0001"
+        with pytest.raises(BeadImmutabilityError):
+            store.write(make_bead(1))
+        assert store.count_beads() == 1
+
+    def test_write_after_failed_write(self, store):
+        """A rejected write leaves no transaction open."""
+        from memory.bead_store import BeadValidationError
+
+        with pytest.raises(BeadValidationError):
+            store.write(make_bead(1, prev="BEAD-0099"))
+        store.write(make_bead(2))
+
+        assert store.count_beads() == 1
+
+    def test_wal_journal(self, store):
+        mode = store._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
@@ -0,0 +1 @@
+"""Chain Verifier Tests — S30 incremental, checkpointed bead hash-chain audit."""
@@ -0,0 +1,27 @@
+"""
+Test configuration for chain verifier tests.
+
+Ensures phoenix root is in sys.path and provides a 100-bead chain.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add phoenix root to path for imports
+_PHOENIX_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PHOENIX_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PHOENIX_ROOT))
+
+from .helpers import chain_beads  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    from memory.bead_store import BeadStore
+
+    path = tmp_path / "beads.db"
+    with BeadStore(db_path=path) as store:
+        store.write_many(chain_beads(0, 100))
+    return path
@@ -0,0 +1,78 @@
+"""
+Chain verifier test helpers — chained beads and history tampering.
+
+Imported by the test modules of this package and its conftest.
+"""
+
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+KEY = b"test-chain-key"
+
+
+def chain_beads(first, count, prev=None):
+    """`count` beads chained with Bead.compute_hash, after bead `prev`."""
+    from memory.bead_store import Bead, BeadType, Signer
+
+    beads = []
+    for n in range(first, first + count):
+        timestamp = START + timedelta(seconds=n)
+        content = {"n": n, "pair": "EURUSD"}
+        bead = Bead(
+            bead_id=f"BEAD-{n:05d}",
+            bead_type=BeadType.PERFORMANCE,
+            prev_bead_id=prev.bead_id if prev else None,
+            bead_hash=Bead.compute_hash(
+                content, prev.bead_hash if prev else None, timestamp, "system"
+            ),
+            timestamp_utc=timestamp,
+            signer=Signer.SYSTEM,
+            version="1.0",
+            content=content,
+        )
+        beads.append(bead)
+        prev = bead
+    return beads
+
+
+def append_beads(db_path, count):
+    from memory.bead_store import BeadStore
+
+    with BeadStore(db_path=db_path) as store:
+        last = store.read(store.get_latest_bead_id())
+        first = int(last.bead_id.split("-")[1]) + 1
+        store.write_many(chain_beads(first, count, prev=last))
+
+
+def tamper(db_path, bead_id, content):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE beads SET content = ? WHERE bead_id = ?", (content, bead_id))
+    conn.commit()
+    conn.close()
+
+
+def rewrite_from(db_path, bead_id):
+    """Replace history from `bead_id` on with a valid chain of different content."""
+    from memory.bead_store import Bead
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT bead_id, prev_bead_id, timestamp_utc, signer FROM beads "
+        "WHERE rowid >= (SELECT rowid FROM beads WHERE bead_id = ?) ORDER BY rowid",
+        (bead_id,),
+    ).fetchall()
+    prev_hash = conn.execute(
+        "SELECT bead_hash FROM beads WHERE bead_id = ?", (rows[0][1],)
+    ).fetchone()
+    prev_hash = prev_hash[0] if prev_hash else None
+    for bid, _, timestamp, signer in rows:
+        content = {"rewritten": bid}
+        prev_hash = Bead.compute_hash(content, prev_hash, datetime.fromisoformat(timestamp), signer)
+        conn.execute(
+            "UPDATE beads SET content = ?, bead_hash = ? WHERE bead_id = ?",
+            (json.dumps(content), prev_hash, bid),
+        )
+    conn.commit()
+    conn.close()
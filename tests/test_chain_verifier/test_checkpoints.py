@@ -0,0 +1,151 @@
+"""
+Test Chain Verifier — incremental runs from signed checkpoints.
+
+SPRINT: S30
+EXIT_GATE: bead_chain_audit
+
+INVARIANTS:
+- INV-BEAD-CHAIN-1: prev_bead_id must reference an existing bead
+- INV-CHAIN-VERIFY-1: A checkpoint is trusted only if its signature verifies
+"""
+
+import pytest
+
+from .helpers import KEY, START, append_beads, chain_beads, rewrite_from, tamper
+
+
+class TestCheckpoints:
+    """Incremental runs from signed checkpoints."""
+
+    def test_second_run_verifies_only_new_beads(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        append_beads(db_path, 25)
+
+        report = verifier.verify()
+
+        assert report.verified == 25
+        assert report.resumed_from == "BEAD-00099"
+        assert report.checkpoint.bead_count == 125
+        assert report.ok
+
+    def test_idle_run_verifies_nothing(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        first = verifier.verify()
+        second = verifier.verify()
+
+        assert second.verified == 0
+        assert second.checkpoint.digest == first.checkpoint.digest
+
+    def test_incremental_digest_equals_full(self, db_path, tmp_path):
+        from memory import ChainVerifier
+
+        incremental = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        incremental.verify()
+        append_beads(db_path, 10)
+        resumed = incremental.verify()
+
+        full = ChainVerifier(
+            KEY, db_path=db_path, checkpoint_path=tmp_path / "full.jsonl", max_workers=1
+        ).verify(full=True)
+
+        assert resumed.checkpoint.digest == full.checkpoint.digest
+        assert resumed.checkpoint.bead_count == full.checkpoint.bead_count
+
+    def test_history_kept_and_signed(self, db_path):
+        import json
+
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        verifier.verify()
+
+        lines = verifier.checkpoint_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert all(json.loads(line)["signature"] for line in lines)
+        assert verifier.latest_checkpoint().to_dict() == json.loads(lines[-1])
+
+    def test_forged_checkpoint_rejected(self, db_path):
+        import json
+
+        from memory import ChainVerifier
+        from memory.chain_checkpoint import ChainVerificationError
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        data = json.loads(verifier.checkpoint_path.read_text())
+        data["last_rowid"] += 50
+        verifier.checkpoint_path.write_text(json.dumps(data) + "\n")
+
+        with pytest.raises(ChainVerificationError, match="signature"):
+            verifier.verify()
+
+    def test_other_key_rejected(self, db_path):
+        from memory import ChainVerifier
+        from memory.chain_checkpoint import ChainVerificationError
+
+        ChainVerifier(KEY, db_path=db_path, max_workers=1).verify()
+
+        with pytest.raises(ChainVerificationError):
+            ChainVerifier(b"other-key", db_path=db_path).latest_checkpoint()
+
+    def test_full_run_ignores_checkpoint(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        tamper(db_path, "BEAD-00003", "{}")
+
+        assert verifier.verify().ok  # before the checkpoint: not re-read
+        report = verifier.verify(full=True)
+
+        assert report.verified == 100
+        assert [f.bead_id for f in report.failures] == ["BEAD-00003"]
+
+    def test_moved_anchor_restarts_from_genesis(self, db_path):
+        from memory import ChainVerifier
+        from memory.chain_checkpoint import GENESIS_DIGEST, ChainCheckpoint, fold_digest
+
+        beads = chain_beads(0, 51)
+        digest = GENESIS_DIGEST
+        for bead in beads:
+            digest = fold_digest(digest, bead.bead_id, bead.bead_hash)
+
+        # Same history, anchor renumbered (as after VACUUM)
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        checkpoint = ChainCheckpoint(
+            last_rowid=7,
+            last_bead_id="BEAD-00050",
+            last_bead_hash=beads[-1].bead_hash,
+            bead_count=51,
+            digest=digest,
+            failure_count=0,
+            verified_at=START.isoformat(),
+        )
+        checkpoint.signature = verifier._sign(checkpoint)
+        verifier._append(checkpoint)
+
+        report = verifier.verify()
+
+        assert report.resumed_from is None
+        assert report.verified == 100
+        assert report.ok
+
+    def test_rewritten_anchor_not_resumed(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        rewrite_from(db_path, "BEAD-00099")
+
+        report = verifier.verify()
+
+        assert report.resumed_from is None
+        assert [(f.bead_id, f.reason) for f in report.failures] == [
+            ("BEAD-00099", "DIGEST_MISMATCH")
+        ]
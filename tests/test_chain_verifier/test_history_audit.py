@@ -0,0 +1,123 @@
+"""
+Test Chain Verifier — rewritten history and known failures.
+
+SPRINT: S30
+EXIT_GATE: bead_chain_audit
+
+INVARIANTS:
+- INV-BEAD-CHAIN-1: prev_bead_id must reference an existing bead
+- INV-CHAIN-VERIFY-1: A checkpoint is trusted only if its signature verifies
+"""
+
+import sqlite3
+
+from .helpers import KEY, append_beads, rewrite_from, tamper
+
+
+class TestHistoryAudit:
+    """Rewritten history and carried failures."""
+
+    def test_full_run_detects_rewritten_history(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        trusted = verifier.verify().checkpoint
+        rewrite_from(db_path, "BEAD-00010")
+
+        report = verifier.verify(full=True)
+
+        assert [(f.bead_id, f.reason, f.rowid) for f in report.failures] == [
+            ("BEAD-00099", "DIGEST_MISMATCH", 100)
+        ]
+        assert report.checkpoint == trusted
+        assert len(verifier.checkpoint_path.read_text().splitlines()) == 1
+
+    def test_full_run_detects_pruned_history(self, db_path):
+        from memory import ChainVerifier
+
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM beads WHERE bead_id IN ('BEAD-00000', 'BEAD-00001')")
+        conn.execute("UPDATE beads SET prev_bead_id = NULL WHERE bead_id = 'BEAD-00002'")
+        conn.commit()
+        conn.close()
+
+        report = verifier.verify(full=True)
+
+        assert ("BEAD-00099", "DIGEST_MISMATCH") in [(f.bead_id, f.reason) for f in report.failures]
+
+
+class TestKnownFailures:
+    """Failures recorded in the checkpoint and carried past."""
+
+    def test_checkpoint_advances_past_failure(self, db_path):
+        from memory import ChainVerifier
+        from memory.chain_checkpoint import ChainFailure
+
+        tamper(db_path, "BEAD-00042", "{}")
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+
+        report = verifier.verify()
+
+        assert report.checkpoint.last_bead_id == "BEAD-00099"
+        assert report.checkpoint.bead_count == 100
+        assert report.checkpoint.known_failures == [ChainFailure("BEAD-00042", "HASH_MISMATCH", 43)]
+        assert verifier.latest_checkpoint() == report.checkpoint
+
+    def test_failures_reported_again_incrementally(self, db_path):
+        from memory import ChainVerifier
+
+        tamper(db_path, "BEAD-00042", "{}")
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        append_beads(db_path, 5)
+
+        second = verifier.verify()
+
+        assert second.verified == 5
+        assert second.resumed_from == "BEAD-00099"
+        assert [f.bead_id for f in second.failures] == ["BEAD-00042"]
+        assert second.checkpoint.failure_count == 1
+
+    def test_early_failure_not_re_verified(self, db_path):
+        from memory import ChainVerifier
+
+        tamper(db_path, "BEAD-00001", "{}")
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+
+        report = verifier.verify()
+
+        assert report.verified == 0
+        assert [f.bead_id for f in report.failures] == ["BEAD-00001"]
+
+    def test_known_failure_with_new_failure(self, db_path):
+        from memory import ChainVerifier
+
+        tamper(db_path, "BEAD-00042", "{}")
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        append_beads(db_path, 5)
+        tamper(db_path, "BEAD-00102", "{}")
+
+        report = verifier.verify()
+
+        assert [f.bead_id for f in report.failures] == ["BEAD-00042", "BEAD-00102"]
+        assert report.checkpoint.failure_count == 2
+
+    def test_repaired_failure_cleared_by_full_run(self, db_path):
+        from memory import ChainVerifier
+
+        tamper(db_path, "BEAD-00042", "{}")
+        verifier = ChainVerifier(KEY, db_path=db_path, max_workers=1)
+        verifier.verify()
+        tamper(db_path, "BEAD-00042", '{"n": 42, "pair": "EURUSD"}')
+
+        incremental = verifier.verify()
+        full = verifier.verify(full=True)
+
+        assert [f.bead_id for f in incremental.failures] == ["BEAD-00042"]
+        assert full.ok
+        assert full.checkpoint.known_failures == []
+        assert verifier.verify().ok
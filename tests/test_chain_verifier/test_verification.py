@@ -0,0 +1,73 @@
+"""
+Test Chain Verifier — segment verification results.
+
+SPRINT: S30
+EXIT_GATE: bead_chain_audit
+
+INVARIANTS:
+- INV-BEAD-CHAIN-1: prev_bead_id must reference an existing bead
+- INV-CHAIN-VERIFY-1: A checkpoint is trusted only if its signature verifies
+"""
+
+import sqlite3
+
+from .helpers import KEY, tamper
+
+
+class TestChainVerifier:
+    """Verification results."""
+
+    def test_intact_chain(self, db_path):
+        from memory import ChainVerifier
+
+        report = ChainVerifier(KEY, db_path=db_path, max_workers=1).verify()
+
+        assert report.ok
+        assert report.verified == 100
+        assert report.resumed_from is None
+        assert report.checkpoint.last_bead_id == "BEAD-00099"
+        assert report.checkpoint.bead_count == 100
+
+    def test_tampered_content_detected(self, db_path):
+        from memory import ChainVerifier
+        from memory.chain_verifier import ChainFailure
+
+        tamper(db_path, "BEAD-00042", '{"n": 42, "pair": "GBPUSD"}')
+
+        report = ChainVerifier(KEY, db_path=db_path, max_workers=1).verify()
+
+        assert report.failures == [ChainFailure("BEAD-00042", "HASH_MISMATCH", 43)]
+        assert report.checkpoint.failure_count == 1
+
+    def test_missing_prev_detected(self, db_path):
+        from memory import ChainVerifier
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE beads SET prev_bead_id = 'BEAD-GONE' WHERE bead_id = 'BEAD-00007'")
+        conn.commit()
+        conn.close()
+
+        report = ChainVerifier(KEY, db_path=db_path, max_workers=1).verify()
+
+        assert [(f.bead_id, f.reason) for f in report.failures] == [("BEAD-00007", "MISSING_PREV")]
+
+    def test_parallel_matches_serial(self, db_path, tmp_path):
+        from memory import ChainVerifier
+
+        tamper(db_path, "BEAD-00013", "{}")
+        tamper(db_path, "BEAD-00077", "{}")
+
+        serial = ChainVerifier(
+            KEY, db_path=db_path, checkpoint_path=tmp_path / "serial.jsonl", max_workers=1
+        ).verify()
+        parallel = ChainVerifier(
+            KEY,
+            db_path=db_path,
+            checkpoint_path=tmp_path / "parallel.jsonl",
+            segment_size=16,
+            max_workers=3,
+        ).verify()
+
+        assert parallel.segments == 7
+        assert parallel.failures == serial.failures
+        assert parallel.checkpoint.digest == serial.checkpoint.digest
@@ -0,0 +1,90 @@
+"""
+Test Compact Schema — categorical enums round-trip and shrink frames.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+@pytest.fixture
+def enriched():
+    """Three weeks of fully enriched 1H bars."""
+    from enrichment import EnrichmentPipeline
+
+    n = 24 * 21
+    rng = np.random.default_rng(11)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0006)
+    open_ = np.r_[close[0], close[:-1]]
+    bars = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-03-03", periods=n, freq="1h", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0008,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0008,
+            "close": close,
+        }
+    )
+    return EnrichmentPipeline().run(bars)
+
+
+class TestCompactSchema:
+    """Compact enrichment dtypes (INV-CONTRACT-1)."""
+
+    def test_round_trip(self, enriched):
+        """decode(compact(df)) restores the enrichment frame exactly."""
+        from enrichment.compact import compact, decode
+
+        pd.testing.assert_frame_equal(decode(compact(enriched)), enriched)
+
+    def test_enums_are_categorical(self, enriched):
+        """Enum columns use fixed categories; flags stay numpy bool."""
+        from enrichment.compact import ENUM_CATEGORIES, compact
+
+        result = compact(enriched)
+
+        for col, categories in ENUM_CATEGORIES.items():
+            assert list(result[col].cat.categories) == list(categories)
+        assert result["is_asia_session"].dtype == bool
+        assert result["hour_ny"].dtype == np.int8
+        assert result["liq_pool_count_above"].dtype == np.int8
+        assert result["bars_since_any_displacement"].dtype == np.int32
+
+    def test_frame_shrinks(self, enriched):
+        """Schema columns shrink several-fold; the whole frame shrinks."""
+        from enrichment.compact import DATE_COLUMNS, ENUM_CATEGORIES, SMALL_INT_COLUMNS, compact
+
+        result = compact(enriched)
+        schema = [*ENUM_CATEGORIES, *SMALL_INT_COLUMNS, *DATE_COLUMNS]
+
+        before = enriched[schema].memory_usage(deep=True, index=False).sum()
+        after = result[schema].memory_usage(deep=True, index=False).sum()
+        assert after * 4 < before
+        assert result.memory_usage(deep=True).sum() < enriched.memory_usage(deep=True).sum()
+
+    @pytest.mark.parametrize("mode", ["columnar", "frame"])
+    def test_pipeline_compact_output(self, enriched, mode):
+        """compact=True equals compacting the default output."""
+        from enrichment import EnrichmentPipeline
+        from enrichment.compact import compact
+
+        bars = enriched[["timestamp", "open", "high", "low", "close"]]
+        result = EnrichmentPipeline(mode=mode, compact=True).run(bars)
+
+        pd.testing.assert_frame_equal(result, compact(enriched))
+
+    def test_unknown_enum_value_raises(self):
+        """Values outside the fixed categories are never silently dropped."""
+        from enrichment.compact import compact_column
+
+        with pytest.raises(ValueError, match="sideways"):
+            compact_column("order_flow", np.array(["bullish", "sideways"], dtype=object))
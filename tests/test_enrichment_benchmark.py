@@ -0,0 +1,81 @@
+"""
+Test Enrichment Benchmark — synthetic bars, case report, regression check.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+class TestEnrichmentBenchmark:
+    """Benchmark harness (not the timings themselves)."""
+
+    def test_synthetic_bars_deterministic(self):
+        """Same seed → same bars; weekdays only; flagged synthetic (INV-DATA-2)."""
+        from enrichment.benchmark import synthetic_bars
+
+        a = synthetic_bars("15m", 14, seed=3)
+        b = synthetic_bars("15m", 14, seed=3)
+
+        pd.testing.assert_frame_equal(a, b)
+        assert (a["timestamp"].dt.dayofweek < 5).all()
+        assert a["is_synthetic"].all()
+        assert (a["high"] >= a[["open", "close"]].max(axis=1)).all()
+        assert (a["low"] <= a[["open", "close"]].min(axis=1)).all()
+
+    def test_run_case_reports_every_layer(self):
+        """A case reports per-layer and chain throughput plus peak RSS."""
+        from enrichment.benchmark import LAYERS, run_case
+
+        case = run_case("1H", 21)
+
+        assert case["bars"] == 15 * 24
+        assert list(case["layers"]) == [name for name, _ in LAYERS]
+        for timing in [*case["layers"].values(), case["chain"]]:
+            assert timing["seconds"] > 0
+            assert timing["bars_per_sec"] > 0
+        assert case["peak_rss_mb"] > 0
+
+    def test_order_block_scaling_reports_every_mode(self):
+        """L5 scaling times each OB mode at every size on synthetic bars."""
+        from enrichment.benchmark import order_block_scaling, trending_bars
+        from enrichment.layers import l5_order_blocks
+
+        scaling = order_block_scaling(sizes=(200, 400))
+
+        assert scaling["sizes"] == [200, 400]
+        assert list(scaling["seconds"]) == list(l5_order_blocks.OB_MODES)
+        for timings in scaling["seconds"].values():
+            assert len(timings) == 2
+            assert all(seconds > 0 for seconds in timings)
+        assert trending_bars(10)["is_synthetic"].all()
+
+    def test_compare_flags_slowdowns(self):
+        """Only drops beyond the tolerance count as regressions."""
+        from enrichment.benchmark import compare
+
+        def report(chain_rate, l4_rate):
+            return {
+                "results": [
+                    {
+                        "timeframe": "1H",
+                        "days": 365,
+                        "chain": {"bars_per_sec": chain_rate},
+                        "layers": {"l4_structure_breaks": {"bars_per_sec": l4_rate}},
+                    }
+                ]
+            }
+
+        baseline = report(1000.0, 5000.0)
+
+        assert compare(baseline, report(900.0, 4500.0), tolerance=0.2) == []
+        regressions = compare(baseline, report(700.0, 4500.0), tolerance=0.2)
+        assert len(regressions) == 1
+        assert "chain" in regressions[0]
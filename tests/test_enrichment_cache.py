@@ -0,0 +1,178 @@
+"""
+Test Enrichment Cache — hits match the pipeline; stale entries never match.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def hourly_bars():
+    """Two weeks of 1H bars."""
+    n = 24 * 14
+    rng = np.random.default_rng(3)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0004)
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-03-03", periods=n, freq="1h", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0004,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0004,
+            "close": close,
+        }
+    )
+
+
+class TestEnrichmentCache:
+    """On-disk enrichment cache."""
+
+    def test_hit_matches_pipeline(self, tmp_path, hourly_bars, monkeypatch):
+        """Second call is served from disk and equals the pipeline output."""
+        from enrichment import EnrichmentCache, EnrichmentPipeline
+
+        cache = EnrichmentCache(tmp_path)
+        first = cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+
+        def fail(self, df):
+            raise AssertionError("pipeline ran on a cache hit")
+
+        monkeypatch.setattr(EnrichmentPipeline, "run", fail)
+        second = cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_raw_data_change_replaces_entry(self, tmp_path, hourly_bars):
+        """Changed bars miss and replace the stale file for the same window."""
+        from enrichment import EnrichmentCache
+
+        cache = EnrichmentCache(tmp_path)
+        cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+        corrupted = hourly_bars.copy()
+        corrupted.loc[100, "close"] += 0.0001
+        cache.get_or_enrich("EURUSD", "1H", corrupted)
+
+        assert cache.misses == 2
+        assert len(list(tmp_path.glob("*/*.parquet"))) == 1
+
+    def test_volume_change_misses(self, tmp_path, hourly_bars):
+        """Columns outside OHLC are part of the key (a hit returns them)."""
+        from enrichment import EnrichmentCache
+
+        bars = hourly_bars.assign(volume=100.0)
+        cache = EnrichmentCache(tmp_path)
+        cache.get_or_enrich("EURUSD", "1H", bars)
+        doubled = bars.assign(volume=bars["volume"] * 2)
+
+        result = cache.get_or_enrich("EURUSD", "1H", doubled)
+
+        assert cache.misses == 2
+        assert (result["volume"] == 200.0).all()
+
+    def test_sub_rounding_price_change_misses(self, tmp_path, hourly_bars):
+        """Prices are keyed at full precision, not rounded."""
+        from enrichment import EnrichmentCache
+
+        cache = EnrichmentCache(tmp_path)
+        cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+        nudged = hourly_bars.copy()
+        nudged["close"] += 1e-8
+
+        result = cache.get_or_enrich("EURUSD", "1H", nudged)
+
+        assert cache.misses == 2
+        pd.testing.assert_series_equal(result["close"], nudged["close"])
+
+    def test_layer_code_change_invalidates(self, tmp_path, hourly_bars, monkeypatch):
+        """A new layer version misses and evicts the old version directory."""
+        from enrichment import EnrichmentCache
+        from enrichment import cache as cache_module
+
+        cache = EnrichmentCache(tmp_path)
+        cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+        old_dirs = {p.name for p in tmp_path.iterdir()}
+
+        monkeypatch.setattr(cache_module, "layer_version", lambda: "0" * 16)
+        cache.get_or_enrich("EURUSD", "1H", hourly_bars)
+
+        assert cache.misses == 2
+        assert {p.name for p in tmp_path.iterdir()} == {"0" * 16}
+        assert old_dirs != {"0" * 16}
+
+    def test_version_covers_output_shaping_sources(self, tmp_path, monkeypatch):
+        """Builder and compact sources change the version; cache.py does not."""
+        from enrichment import cache as cache_module
+
+        for name in ("builder.py", "compact.py", "steps.py", "cache.py"):
+            (tmp_path / name).write_text("# v1\n")
+        monkeypatch.setattr(cache_module, "ENRICHMENT_ROOT", tmp_path)
+
+        def version_after(name):
+            cache_module.layer_version.cache_clear()
+            (tmp_path / name).write_text(f"# edited {name}\n")
+            return cache_module.layer_version()
+
+        try:
+            cache_module.layer_version.cache_clear()
+            versions = [cache_module.layer_version()]
+            versions += [version_after(n) for n in ("builder.py", "compact.py", "steps.py")]
+            unchanged = version_after("cache.py")
+        finally:
+            cache_module.layer_version.cache_clear()
+
+        assert len(set(versions)) == 4
+        assert unchanged == versions[-1]
+
+    def test_missing_pyarrow_fails_loudly(self, tmp_path, monkeypatch):
+        from enrichment import EnrichmentCache
+        from enrichment import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "PARQUET_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="pyarrow"):
+            EnrichmentCache(tmp_path)
+
+    def test_evicts_least_recently_used(self, tmp_path, hourly_bars):
+        """Entries beyond max_bytes are evicted oldest first."""
+        from enrichment import EnrichmentCache
+
+        cache = EnrichmentCache(tmp_path)
+        cache.get_or_enrich("EURUSD", "1H", hourly_bars, columns=["hour_ny"])
+        one_entry = cache.size_bytes()
+
+        small = EnrichmentCache(tmp_path, max_bytes=one_entry)
+        small.get_or_enrich("GBPUSD", "1H", hourly_bars, columns=["hour_ny"])
+
+        names = [p.name for p in tmp_path.glob("*/*.parquet")]
+        assert len(names) == 1
+        assert names[0].startswith("GBPUSD_1H_")
+
+
+class TestDatasetHash:
+    """TruthTeller.compute_dataset_hash is unchanged by its column-wise rewrite."""
+
+    def test_matches_row_hash_chain(self, hourly_bars):
+        import hashlib
+
+        from contracts.truth_teller import TruthTeller
+
+        teller = TruthTeller()
+        chain = "0" * 16
+        for _, row in hourly_bars.iterrows():
+            combined = f"{chain}|{teller.compute_bar_hash(row)}"
+            chain = hashlib.sha256(combined.encode()).hexdigest()[:16]
+
+        assert teller.compute_dataset_hash(hourly_bars) == chain
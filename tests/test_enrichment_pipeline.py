@@ -0,0 +1,138 @@
+"""
+Test Enrichment Pipeline — pruned runs match the full hand chain.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+def _full_chain(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    from enrichment.layers import (
+        l1_time_sessions,
+        l2_reference_levels,
+        l3_sweeps,
+        l4_structure_breaks,
+        l5_order_blocks,
+        l6_fvg_imbalances,
+    )
+
+    df = l1_time_sessions.enrich(df)
+    df = l2_reference_levels.enrich(df, symbol=symbol)
+    df = l3_sweeps.enrich(df, symbol=symbol)
+    df = l4_structure_breaks.enrich(df)
+    df = l6_fvg_imbalances.enrich(df)
+    return l5_order_blocks.enrich(df)
+
+
+@pytest.fixture
+def hourly_bars():
+    """Three weeks of 1H bars with displacement candles."""
+    n = 24 * 21
+    rng = np.random.default_rng(7)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0004)
+    jumps = rng.integers(5, n, n // 40)
+    close[jumps] += rng.standard_normal(len(jumps)) * 0.003
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-03-03", periods=n, freq="1h", tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0004,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0004,
+            "close": close,
+            "volume": 1000,
+        }
+    )
+
+
+class TestEnrichmentPipeline:
+    """Dependency-aware enrichment (INV-CONTRACT-1)."""
+
+    @pytest.mark.parametrize("symbol", ["EURUSD", "USDJPY"])
+    def test_full_run_matches_hand_chain(self, hourly_bars, symbol):
+        """columns=None produces the hand chain frame exactly."""
+        from enrichment import EnrichmentPipeline
+
+        result = EnrichmentPipeline(symbol=symbol).run(hourly_bars)
+
+        pd.testing.assert_frame_equal(result, _full_chain(hourly_bars, symbol))
+
+    @pytest.mark.parametrize("columns", [None, ["sweep_detected", "ob_bull_high", "bpr_type"]])
+    def test_columnar_matches_frame_mode(self, hourly_bars, columns):
+        """Columnar builder output equals the frame-mutating reference."""
+        from enrichment import EnrichmentPipeline
+
+        columnar = EnrichmentPipeline(columns=columns, mode="columnar").run(hourly_bars)
+        frame = EnrichmentPipeline(columns=columns, mode="frame").run(hourly_bars)
+
+        pd.testing.assert_frame_equal(columnar, frame)
+
+    def test_columnar_does_not_alias_input(self, hourly_bars):
+        """Output columns never share memory with the caller's frame."""
+        from enrichment import EnrichmentPipeline
+
+        result = EnrichmentPipeline(columns=["hour_ny"]).run(hourly_bars)
+        result.loc[0, "close"] = -1.0
+
+        assert hourly_bars.loc[0, "close"] != -1.0
+
+    def test_registry_covers_manifest(self):
+        """Every manifest column has exactly one producing step."""
+        from enrichment import EnrichmentPipeline, get_all_columns
+
+        produced = EnrichmentPipeline().columns
+
+        assert len(produced) == len(set(produced))
+        assert set(get_all_columns()) <= set(produced)
+
+    def test_pattern_columns_prune_layers(self, hourly_bars):
+        """CSO pattern columns skip unused steps and match the full chain."""
+        from enrichment import PATTERN_COLUMNS, EnrichmentPipeline
+
+        pipeline = EnrichmentPipeline(columns=PATTERN_COLUMNS)
+        result = pipeline.run(hourly_bars)
+        expected = _full_chain(hourly_bars, "EURUSD")
+
+        assert "l5_order_blocks" not in pipeline.steps
+        assert "l2_stubs" not in pipeline.steps
+        assert "l1_dow" not in pipeline.steps
+        assert list(result.columns[: len(hourly_bars.columns)]) == list(hourly_bars.columns)
+        assert set(result.columns) == set(hourly_bars.columns) | set(PATTERN_COLUMNS)
+        for col in PATTERN_COLUMNS:
+            pd.testing.assert_series_equal(result[col], expected[col])
+
+    def test_dependencies_are_pulled_in(self):
+        """L5 pulls in L6 displacement; L3 sweeps pull in L1 and L2 levels."""
+        from enrichment import EnrichmentPipeline
+
+        assert EnrichmentPipeline(columns=["ob_bull_high"]).steps == [
+            "l6_displacement",
+            "l5_order_blocks",
+        ]
+        assert EnrichmentPipeline(columns=["sweep_detected"]).steps == [
+            "l1_time",
+            "l2_asia",
+            "l2_pd",
+            "l2_pw",
+            "l3_sweeps",
+        ]
+        assert EnrichmentPipeline(columns=["fvg_bull"]).steps == ["l6_fvg"]
+
+    def test_missing_input_column_raises(self, hourly_bars):
+        """Unknown columns and missing raw inputs fail loudly."""
+        from enrichment import EnrichmentPipeline
+
+        with pytest.raises(ValueError, match="not_a_column"):
+            EnrichmentPipeline(columns=["not_a_column"]).run(hourly_bars)
+        with pytest.raises(ValueError, match="timestamp"):
+            EnrichmentPipeline(columns=["hour_ny"]).run(hourly_bars.drop(columns="timestamp"))
@@ -0,0 +1,138 @@
+"""
+Test Incremental Enricher — tail-only enrichment matches a full recompute.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from itertools import cycle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+def _bars(n: int, freq: str, start: str, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0004)
+
+    # Add displacement candles (L5/L6 need them)
+    jumps = rng.integers(5, n, n // 40)
+    close[jumps] += rng.standard_normal(len(jumps)) * 0.003
+
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start, periods=n, freq=freq, tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0004,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0004,
+            "close": close,
+        }
+    )
+
+
+def _full_chain(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    from enrichment.layers import (
+        l1_time_sessions,
+        l2_reference_levels,
+        l3_sweeps,
+        l4_structure_breaks,
+        l5_order_blocks,
+        l6_fvg_imbalances,
+    )
+
+    df = l1_time_sessions.enrich(df)
+    df = l2_reference_levels.enrich(df, symbol=symbol)
+    df = l3_sweeps.enrich(df, symbol=symbol)
+    df = l4_structure_breaks.enrich(df)
+    df = l6_fvg_imbalances.enrich(df)
+    return l5_order_blocks.enrich(df)
+
+
+@pytest.fixture
+def hourly_bars():
+    """Three weeks of 1H bars (crosses week + trading-day boundaries)."""
+    return _bars(24 * 21, "1h", "2025-03-03", seed=42)
+
+
+class TestIncrementalEnricher:
+    """Test tail-only enrichment (INV-CONTRACT-1)."""
+
+    @pytest.mark.parametrize("symbol", ["EURUSD", "USDJPY"])
+    def test_matches_full_recompute(self, hourly_bars, symbol):
+        """Any sequence of appends equals one full run, bit for bit."""
+        from enrichment.incremental import IncrementalEnricher
+
+        enricher = IncrementalEnricher(symbol=symbol)
+        enricher.seed(hourly_bars.iloc[:200])
+
+        pos = 200
+        for step in cycle([1, 7, 1, 40, 3]):
+            if pos >= len(hourly_bars):
+                break
+            enricher.append(hourly_bars.iloc[pos : pos + step])
+            pos += step
+
+        expected = _full_chain(hourly_bars.copy(), symbol)
+        pd.testing.assert_frame_equal(enricher.frame, expected, check_exact=True)
+
+    def test_short_seed_reseeds(self, hourly_bars):
+        """Appends below MIN_HISTORY_BARS fall back to a full run."""
+        from enrichment.incremental import MIN_HISTORY_BARS, IncrementalEnricher
+
+        enricher = IncrementalEnricher()
+        enricher.seed(hourly_bars.iloc[:5])
+        delta = enricher.append(hourly_bars.iloc[5 : MIN_HISTORY_BARS + 10])
+
+        assert len(delta.tail) == MIN_HISTORY_BARS + 5
+        expected = _full_chain(hourly_bars.iloc[: MIN_HISTORY_BARS + 10].copy(), "EURUSD")
+        pd.testing.assert_frame_equal(enricher.frame, expected, check_exact=True)
+
+    def test_delta_reports_patched_rows(self, hourly_bars):
+        """Rows whose group levels moved are reported and rewritten."""
+        from enrichment.incremental import IncrementalEnricher
+
+        enricher = IncrementalEnricher()
+        enricher.seed(hourly_bars.iloc[:100])
+
+        # Outsized high: today's session ranges move for earlier bars
+        bar = hourly_bars.iloc[100:101].copy()
+        bar["high"] += 0.05
+        delta = enricher.append(bar)
+
+        assert list(delta.tail.index) == [100]
+        assert len(delta.patched) > 0
+        assert delta.patched.max() < 100
+
+    def test_rejects_out_of_order_bars(self, hourly_bars):
+        """Appended bars must be strictly after history."""
+        from enrichment.incremental import IncrementalEnricher
+
+        enricher = IncrementalEnricher()
+        enricher.seed(hourly_bars.iloc[:100])
+
+        with pytest.raises(ValueError, match="strictly after"):
+            enricher.append(hourly_bars.iloc[90:95])
+
+    def test_rejects_missing_columns(self, hourly_bars):
+        """Appended bars must carry the seeded raw columns."""
+        from enrichment.incremental import IncrementalEnricher
+
+        enricher = IncrementalEnricher()
+        enricher.seed(hourly_bars.iloc[:100])
+
+        with pytest.raises(ValueError, match="Missing required columns"):
+            enricher.append(hourly_bars.iloc[100:101].drop(columns=["low"]))
+
+    def test_append_requires_seed(self, hourly_bars):
+        """append() before seed() is an error."""
+        from enrichment.incremental import IncrementalEnricher
+
+        with pytest.raises(ValueError, match="not seeded"):
+            IncrementalEnricher().append(hourly_bars.iloc[:1])
@@ -0,0 +1,109 @@
+"""
+Test L1 Time & Sessions — NY calendar table matches per-row conversion.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+def _bars(timestamps: pd.DatetimeIndex) -> pd.DataFrame:
+    n = len(timestamps)
+    close = 1.0850 + np.cumsum(np.random.default_rng(0).standard_normal(n) * 0.0002)
+    return pd.DataFrame({"timestamp": timestamps, "close": close})
+
+
+def _per_row_calendar(timestamps: pd.Series) -> pd.DataFrame:
+    """Original per-row definitions (tz_convert + apply)."""
+    ts_ny = timestamps.dt.tz_convert("America/New_York")
+    return pd.DataFrame(
+        {
+            "hour_ny": ts_ny.dt.hour,
+            "minute_ny": ts_ny.dt.minute,
+            "day_of_week": ts_ny.dt.weekday,
+            "trading_day": ts_ny.apply(
+                lambda x: x.date() if x.hour >= 17 else (x - pd.Timedelta(days=1)).date()
+            ),
+            "is_dst_us": ts_ny.apply(lambda x: bool(x.dst())),
+        }
+    )
+
+
+@pytest.fixture
+def dst_transition_bars():
+    """15m bars around every US DST transition 2019-2026 (plus year ends)."""
+    chunks = []
+    for year in range(2019, 2027):
+        for start in (f"{year}-03-07", f"{year}-10-31", f"{year}-12-30"):
+            chunks.append(pd.date_range(start, periods=4 * 24 * 10, freq="15min", tz="UTC"))
+    stamps = chunks[0].append(chunks[1:]).unique().sort_values()
+    return _bars(stamps)
+
+
+class TestL1NYCalendar:
+    """Cached NY calendar table (INV-CONTRACT-1)."""
+
+    def test_produces_columns(self, dst_transition_bars):
+        """L1 produces all expected columns."""
+        from enrichment.layers import l1_time_sessions
+
+        result = l1_time_sessions.enrich(dst_transition_bars)
+
+        for col in l1_time_sessions.LAYER_1_COLUMNS:
+            assert col in result.columns, f"Missing: {col}"
+
+    def test_calendar_matches_per_row(self, dst_transition_bars):
+        """Hour, minute, weekday, trading day and DST match tz_convert/apply."""
+        from enrichment.layers import l1_time_sessions
+
+        result = l1_time_sessions.enrich(dst_transition_bars)
+        expected = _per_row_calendar(dst_transition_bars["timestamp"])
+
+        for col in expected.columns:
+            pd.testing.assert_series_equal(result[col], expected[col], check_names=False)
+
+    def test_week_and_day_groups_match(self, dst_transition_bars):
+        """Integer week/day keys partition bars like the original string ids."""
+        from enrichment.layers import l1_time_sessions
+
+        ts_ny = dst_transition_bars["timestamp"].dt.tz_convert("America/New_York")
+        week_str = ts_ny.dt.isocalendar().week.astype(str) + "_" + ts_ny.dt.year.astype(str)
+        day_str = ts_ny.dt.date.astype(str)
+
+        cal = l1_time_sessions.ny_calendar(dst_transition_bars)
+        for keys, strings in ((cal["week"], week_str), (cal["day"], day_str)):
+            pairs = pd.DataFrame({"key": keys, "id": strings.values}).drop_duplicates()
+            assert pairs["key"].is_unique
+            assert pairs["id"].is_unique
+
+    def test_naive_timestamps_are_utc(self, dst_transition_bars):
+        """Naive timestamps are treated as UTC."""
+        from enrichment.layers import l1_time_sessions
+
+        naive = dst_transition_bars.assign(
+            timestamp=dst_transition_bars["timestamp"].dt.tz_localize(None)
+        )
+        result = l1_time_sessions.enrich(naive)
+        expected = l1_time_sessions.enrich(dst_transition_bars)
+
+        for col in l1_time_sessions.LAYER_1_COLUMNS:
+            pd.testing.assert_series_equal(result[col], expected[col])
+
+    def test_table_cached_per_year(self):
+        """Each UTC year's table is built once and is read-only."""
+        from enrichment.layers.l1_ny_calendar import ny_calendar_year
+
+        table = ny_calendar_year(2025)
+
+        assert ny_calendar_year(2025) is table
+        assert len(table["hour_ny"]) == 365 * 24
+        assert not table["hour_ny"].flags.writeable
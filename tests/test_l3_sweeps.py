@@ -0,0 +1,118 @@
+"""
+Test L3 Sweeps — Vectorized scan matches the reference loop.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+@pytest.fixture
+def sample_data_with_levels():
+    """Create 15m data enriched through L2 (reference levels present)."""
+    from enrichment.layers import l1_time_sessions, l2_reference_levels
+
+    np.random.seed(42)
+    n = 96 * 15
+
+    close = 1.0850 + np.cumsum(np.random.randn(n) * 0.0004)
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-03-03", periods=n, freq="15min", tz="UTC"),
+            "open": close - np.random.rand(n) * 0.0002,
+            "high": close + np.random.rand(n) * 0.0010,
+            "low": close - np.random.rand(n) * 0.0010,
+            "close": close,
+        }
+    )
+    df = l1_time_sessions.enrich(df)
+    return l2_reference_levels.enrich(df)
+
+
+class TestL3Sweeps:
+    """Test L3 sweep detection."""
+
+    def test_produces_columns(self, sample_data_with_levels):
+        """L3 produces all expected columns."""
+        from enrichment.layers import l3_sweeps
+
+        result = l3_sweeps.enrich(sample_data_with_levels)
+
+        for col in l3_sweeps.LAYER_3_COLUMNS:
+            assert col in result.columns, f"Missing: {col}"
+
+    @pytest.mark.parametrize("symbol", ["EURUSD", "USDJPY"])
+    def test_vectorized_matches_reference(self, sample_data_with_levels, symbol):
+        """Vectorized scan is identical to the per-bar loop (INV-CONTRACT-1)."""
+        from enrichment.layers import l3_sweeps
+
+        fast = l3_sweeps.enrich(sample_data_with_levels, symbol=symbol)
+        slow = l3_sweeps.enrich(sample_data_with_levels, symbol=symbol, mode="reference")
+
+        assert fast["sweep_detected"].any()
+        pd.testing.assert_frame_equal(fast, slow, check_exact=True)
+
+    def test_edge_cases_match_reference(self, sample_data_with_levels):
+        """Ties, NaN levels and bar 0 are handled like the loop."""
+        from enrichment.layers import l3_sweeps
+
+        df = sample_data_with_levels.copy()
+        df.loc[0, "pdh"] = df.loc[0, "high"] - 0.001  # bar 0 never scanned
+        df.loc[10:20, "pdh"] = df.loc[10:20, "high"]  # equal is not a sweep
+        df.loc[30:40, ["pdh", "pwh", "asia_high"]] = np.nan
+        df.loc[50:60, "pdl"] = df.loc[50:60, "low"] + 0.0012  # 12 pips: valid
+
+        fast = l3_sweeps.enrich(df)
+        slow = l3_sweeps.enrich(df, mode="reference")
+
+        assert not fast.loc[0, "sweep_detected"]
+        assert (fast.loc[50:60, "sweep_target_type"] != "pdh").all()
+        pd.testing.assert_frame_equal(fast, slow, check_exact=True)
+
+    def test_timing_and_extension_rules_match_reference(self):
+        """Array timing/extension rules equal the scalar rules at every hour and boundary."""
+        from enrichment.layers import l3_sweeps
+        from enrichment.layers.reference import l3_sweeps as reference
+
+        hours = np.arange(24)
+        during_kz, during_session = l3_sweeps._timing_flags(hours)
+        quality, score = l3_sweeps._timing_quality(during_kz, during_session)
+        for hour in hours:
+            assert reference.timing_quality(hour) == (
+                during_kz[hour],
+                during_session[hour],
+                quality[hour],
+                score[hour],
+            )
+
+        ext = np.array([0.0, 4.99, 5.0, 12.0, 20.0, 20.01, 50.0])
+        ext_class, is_valid = l3_sweeps._classify_extensions(ext)
+        assert [reference.classify_extension(e) for e in ext] == list(
+            zip(ext_class, is_valid, strict=True)
+        )
+
+    def test_missing_levels(self, sample_data_with_levels):
+        """Without L2 levels nothing is swept."""
+        from enrichment.layers import l3_sweeps
+
+        df = sample_data_with_levels[["timestamp", "hour_ny", "high", "low", "close"]]
+        result = l3_sweeps.enrich(df)
+
+        assert not result["sweep_detected"].any()
+        assert result["sweep_direction"].isna().all()
+
+    def test_unknown_mode_rejected(self, sample_data_with_levels):
+        """Only vectorized / reference modes exist."""
+        from enrichment.layers import l3_sweeps
+
+        with pytest.raises(ValueError, match="Unknown sweep mode"):
+            l3_sweeps.enrich(sample_data_with_levels, mode="numba")
@@ -97,3 +97,116 @@ class TestL4StructureBreaks:
         assert ".ffill(" not in source
         assert ".forward_fill(" not in source
         assert "method='ffill'" not in source
+
+
+class TestVectorizedStructure:
+    """Vectorized swings + state pass match the reference loop (INV-CONTRACT-1)."""
+
+    def test_enrich_matches_reference(self, sample_data):
+        """Default mode frame equals the per-bar reference frame."""
+        from enrichment.layers import l4_structure_breaks
+
+        fast = l4_structure_breaks.enrich(sample_data)
+        reference = l4_structure_breaks.enrich(sample_data, mode="reference")
+
+        pd.testing.assert_frame_equal(fast, reference)
+
+    @pytest.mark.parametrize("lookback", [0, 1, 2, 3, 5, 10])
+    def test_compute_matches_reference_any_lookback(self, sample_data, lookback):
+        """Columns and carry state match for every lookback, ties included."""
+        from enrichment.layers import l4_structure_breaks
+        from enrichment.layers.reference import l4_structure_breaks as reference
+
+        # Rounded prices produce equal highs/lows inside windows
+        highs = sample_data["high"].round(4).values
+        lows = sample_data["low"].round(4).values
+
+        fast, fast_state = l4_structure_breaks.compute_structure(highs, lows, lookback)
+        ref, ref_state = reference.compute_structure(highs, lows, lookback)
+
+        for col in l4_structure_breaks.LAYER_4_COLUMNS:
+            np.testing.assert_array_equal(fast[col], ref[col], err_msg=col)
+        assert fast_state == ref_state
+
+    def test_resume_from_state_matches_reference(self, sample_data):
+        """offset/state resume (incremental path) matches the reference."""
+        from enrichment.layers import l4_structure_breaks
+        from enrichment.layers.reference import l4_structure_breaks as reference
+
+        highs = sample_data["high"].values
+        lows = sample_data["low"].values
+        lookback = l4_structure_breaks.SWING_LOOKBACK
+        _, state = l4_structure_breaks.compute_structure(highs[:300], lows[:300], lookback)
+        w0 = 300 - 2 * lookback
+
+        fast, fast_state = l4_structure_breaks.compute_structure(
+            highs[w0:], lows[w0:], lookback, offset=w0, state=state
+        )
+        ref, ref_state = reference.compute_structure(
+            highs[w0:], lows[w0:], lookback, offset=w0, state=state
+        )
+
+        for col in l4_structure_breaks.LAYER_4_COLUMNS:
+            np.testing.assert_array_equal(fast[col], ref[col], err_msg=col)
+        assert fast_state == ref_state
+
+    @pytest.mark.parametrize("n", [0, 3, 7])
+    def test_short_input(self, n):
+        """Inputs shorter than a swing window keep the incoming state."""
+        from enrichment.layers import l4_structure_breaks
+        from enrichment.layers.reference import l4_structure_breaks as reference
+
+        highs = np.linspace(1.1, 1.2, n)
+        fast, fast_state = l4_structure_breaks.compute_structure(highs, highs - 0.001)
+        ref, ref_state = reference.compute_structure(highs, highs - 0.001)
+
+        for col in l4_structure_breaks.LAYER_4_COLUMNS:
+            np.testing.assert_array_equal(fast[col], ref[col], err_msg=col)
+        assert fast_state == ref_state
+
+    def test_strict_swings_match_cso_rule(self, sample_data):
+        """strict=True keeps only swings strictly beyond every neighbour."""
+        from enrichment.layers import l4_structure_breaks
+
+        highs = sample_data["high"].round(4).values
+        lows = sample_data["low"].round(4).values
+        lookback = 3
+
+        high_idx, low_idx = l4_structure_breaks.swing_points(highs, lows, lookback, strict=True)
+
+        def neighbours(values, i):
+            return np.r_[values[i - lookback : i], values[i + 1 : i + lookback + 1]]
+
+        middle = range(lookback, len(highs) - lookback)
+        assert list(high_idx) == [i for i in middle if (highs[i] > neighbours(highs, i)).all()]
+        assert list(low_idx) == [i for i in middle if (lows[i] < neighbours(lows, i)).all()]
+
+    def test_strict_swings_keep_cso_nan_rule(self, sample_data):
+        """strict=True skips NaN neighbours and keeps NaN bars, like the cso loop."""
+        from enrichment.layers import l4_structure_breaks
+
+        highs = sample_data["high"].round(4).values.copy()
+        lows = sample_data["low"].round(4).values.copy()
+        rng = np.random.default_rng(7)
+        highs[rng.random(len(highs)) < 0.1] = np.nan
+        lows[rng.random(len(lows)) < 0.1] = np.nan
+        lookback = 3
+
+        high_idx, low_idx = l4_structure_breaks.swing_points(highs, lows, lookback, strict=True)
+
+        def neighbours(values, i):
+            return np.r_[values[i - lookback : i], values[i + 1 : i + lookback + 1]]
+
+        # Original rule: a bar loses only to a neighbour at or beyond it
+        middle = range(lookback, len(highs) - lookback)
+        expected_highs = [i for i in middle if not (highs[i] <= neighbours(highs, i)).any()]
+        expected_lows = [i for i in middle if not (lows[i] >= neighbours(lows, i)).any()]
+        assert list(high_idx) == expected_highs
+        assert list(low_idx) == expected_lows
+        assert any(np.isnan(highs[i]) for i in high_idx)
+
+    def test_unknown_mode_raises(self, sample_data):
+        from enrichment.layers import l4_structure_breaks
+
+        with pytest.raises(ValueError, match="structure mode"):
+            l4_structure_breaks.enrich(sample_data, mode="fast")
@@ -102,3 +102,75 @@ class TestL5OrderBlocks:
         # The actual code shouldn't have ffill calls
         assert ".ffill(" not in source
         assert "method='ffill'" not in source
+
+
+class TestL5IndexedTracking:
+    """Indexed OB tracking matches the reference loops (INV-CONTRACT-1)."""
+
+    def test_indexed_matches_reference(self, sample_data_with_displacement):
+        """Vectorized scan + active-OB index equal the original loops."""
+        from enrichment.layers import l5_order_blocks, l6_fvg_imbalances
+
+        df = l6_fvg_imbalances.enrich(sample_data_with_displacement)
+        fast = l5_order_blocks.enrich(df)
+        slow = l5_order_blocks.enrich(df, mode="reference")
+
+        pd.testing.assert_frame_equal(fast, slow, check_exact=True)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_trending_matches_reference(self, seed):
+        """Many live OBs (inline displacement fallback) still match."""
+        from enrichment.benchmark import trending_bars
+        from enrichment.layers import l5_order_blocks
+
+        df = trending_bars(1500, seed)
+        fast = l5_order_blocks.enrich(df)
+        slow = l5_order_blocks.enrich(df, mode="reference")
+
+        assert fast["ob_bull_touches"].max() > 0
+        pd.testing.assert_frame_equal(fast, slow, check_exact=True)
+
+    def test_formation_scan_matches_reference(self):
+        """Vectorized formation scan returns the same OB events."""
+        from enrichment.benchmark import trending_bars
+        from enrichment.layers import l5_order_blocks
+
+        df = trending_bars(800, seed=3)
+        fast = l5_order_blocks.detect_order_blocks(df)
+        slow = l5_order_blocks.detect_order_blocks(df, mode="reference")
+
+        for side in ("bull", "bear"):
+            assert [ob["idx"] for ob in fast[side]] == [ob["idx"] for ob in slow[side]]
+            assert fast[side] == slow[side]
+
+    def test_resume_matches_single_pass(self):
+        """Tracking in two blocks with carried state equals one pass (and the reference)."""
+        from enrichment.benchmark import trending_bars
+        from enrichment.layers import l5_order_blocks
+        from enrichment.layers.reference import l5_order_blocks as reference
+
+        df = trending_bars(1000, seed=4)
+        obs = l5_order_blocks.detect_order_blocks(df)
+        arrays = (df["close"].values, df["high"].values, df["low"].values)
+
+        whole, whole_state = l5_order_blocks.track_order_blocks(*arrays, obs)
+        first, state = l5_order_blocks.track_order_blocks(*(a[:600] for a in arrays), obs)
+        second, end_state = l5_order_blocks.track_order_blocks(
+            *(a[600:] for a in arrays), obs, offset=600, active=state
+        )
+
+        ref, ref_state = reference.track_order_blocks(
+            *(a[600:] for a in arrays), obs, offset=600, active=state
+        )
+
+        for col in l5_order_blocks.LAYER_5_COLUMNS:
+            np.testing.assert_array_equal(np.r_[first[col], second[col]], whole[col])
+            np.testing.assert_array_equal(ref[col], second[col], err_msg=col)
+        assert end_state == whole_state == ref_state
+
+    def test_unknown_mode_rejected(self, sample_data_with_displacement):
+        """Only indexed / reference modes exist."""
+        from enrichment.layers import l5_order_blocks
+
+        with pytest.raises(ValueError, match="Unknown order block mode"):
+            l5_order_blocks.enrich(sample_data_with_displacement, mode="fast")
@@ -129,3 +129,82 @@ class TestL6FVGImbalances:
         assert ".ffill(" not in source
         assert ".forward_fill(" not in source
         assert "method='ffill'" not in source
+
+
+def _random_ohlc(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0005)
+    open_ = np.r_[close[0], close[:-1]] + rng.standard_normal(n) * 0.0002
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0006,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0006,
+            "close": close,
+        }
+    )
+
+
+class TestL6Kernels:
+    """Array kernels match the per-element definitions (INV-CONTRACT-1)."""
+
+    def test_bars_since_matches_loop(self):
+        """Running-max kernel equals explicit iteration."""
+        from enrichment.layers import l6_fvg_imbalances
+        from enrichment.layers.reference import l6_fvg_imbalances as reference
+
+        events = np.random.default_rng(1).random(2000) < 0.02
+        events[:50] = False  # leading 9999 sentinel
+
+        expected = reference.bars_since_event(pd.Series(events))
+        result = l6_fvg_imbalances.compute_bars_since(events)
+        np.testing.assert_array_equal(result, expected.values)
+
+    def test_bars_since_resumes(self):
+        """Carrying the last event index continues the count exactly."""
+        from enrichment.layers import l6_fvg_imbalances
+
+        events = np.random.default_rng(2).random(500) < 0.03
+        whole = l6_fvg_imbalances.compute_bars_since(events)
+
+        last = int(np.flatnonzero(events[:300])[-1])
+        resumed = l6_fvg_imbalances.compute_bars_since(events[300:], start=300, last=last)
+        np.testing.assert_array_equal(resumed, whole[300:])
+
+    def test_fvg_matches_loop(self):
+        """Vectorized gap detection equals the candle-by-candle definition."""
+        from enrichment.layers import l6_fvg_imbalances
+        from enrichment.layers.reference import l6_fvg_imbalances as reference
+
+        df = _random_ohlc(3000, seed=3)
+        fvg = l6_fvg_imbalances._fvg_arrays(df["high"].values, df["low"].values)
+        expected = reference.detect_fvg(df)
+
+        assert fvg["fvg_bull"].any() and fvg["fvg_bear"].any()
+        for col, values in expected.items():
+            np.testing.assert_array_equal(fvg[col], values, err_msg=col)
+
+    def test_atr_matches_pandas_definition(self):
+        """ATR equals EWM of the max(H-L, |H-Cp|, |L-Cp|) true range."""
+        from enrichment.layers import l6_fvg_imbalances
+        from enrichment.layers.reference import l6_fvg_imbalances as reference
+
+        df = _random_ohlc(3000, seed=4)
+        expected = reference.calculate_atr(df, 14)
+
+        result = l6_fvg_imbalances._calculate_atr(df, 14)
+        pd.testing.assert_series_equal(result, expected, check_exact=True)
+
+    def test_atr_resumes(self):
+        """Seeding with the previous ATR continues the recursion exactly."""
+        from enrichment.layers import l6_fvg_imbalances
+
+        df = _random_ohlc(1000, seed=5)
+        h, lo, c = df["high"].values, df["low"].values, df["close"].values
+        whole = l6_fvg_imbalances.compute_atr(l6_fvg_imbalances.compute_true_range(h, lo, c))
+
+        tail_tr = l6_fvg_imbalances.compute_true_range(
+            h[600:], lo[600:], c[600:], prev_close=c[599]
+        )
+        resumed = l6_fvg_imbalances.compute_atr(tail_tr, prev_atr=whole[599])
+        np.testing.assert_array_equal(resumed, whole[600:])
@@ -0,0 +1,101 @@
+"""
+Test Parallel Enricher — process pool output equals the serial path.
+
+SPRINT: S27.0
+EXIT_GATE: schema_integrity
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+
+def _bars(n: int, freq: str, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.0850 + np.cumsum(rng.standard_normal(n) * 0.0004)
+    jumps = rng.integers(5, n, n // 40)
+    close[jumps] += rng.standard_normal(len(jumps)) * 0.003
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-03-03", periods=n, freq=freq, tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n) * 0.0004,
+            "low": np.minimum(open_, close) - rng.random(n) * 0.0004,
+            "close": close,
+            "volume": rng.integers(100, 1000, n),
+        }
+    )
+
+
+@pytest.fixture
+def shards():
+    """Three pairs x two timeframes, uneven lengths."""
+    specs = [
+        (pair, tf, freq, n)
+        for pair in ("EURUSD", "USDJPY", "GBPUSD")
+        for tf, freq, n in (("1H", "1h", 24 * 21), ("15M", "15min", 4 * 24 * 8))
+    ]
+    return {(pair, tf): _bars(n, freq, seed) for seed, (pair, tf, freq, n) in enumerate(specs)}
+
+
+class TestParallelEnricher:
+    """Multi-pair enrichment (INV-CONTRACT-1)."""
+
+    def test_parallel_matches_serial(self, shards):
+        """Pool output is identical to the serial path, in input order."""
+        from enrichment import ParallelEnricher
+
+        enricher = ParallelEnricher(max_workers=3)
+        parallel = enricher.enrich(shards)
+        serial = enricher.enrich_serial(shards)
+
+        assert list(parallel) == list(shards)
+        for key in shards:
+            pd.testing.assert_frame_equal(parallel[key], serial[key])
+
+    def test_pruned_columns(self, shards):
+        """Requested columns pass through the pool unchanged."""
+        from enrichment import ParallelEnricher
+
+        enricher = ParallelEnricher(columns=["session_name", "sweep_detected"], max_workers=2)
+        parallel = enricher.enrich(shards)
+        serial = enricher.enrich_serial(shards)
+
+        for key in shards:
+            pd.testing.assert_frame_equal(parallel[key], serial[key])
+
+    def test_shared_memory_round_trip(self):
+        """Object, categorical, tz-aware and nullable columns survive the block."""
+        from enrichment.parallel import _read_frame, _release, _write_frame
+
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.date_range(
+                    "2025-03-09", periods=4, freq="h", tz="America/New_York"
+                ),
+                "name": ["asia", None, "london", "asia"],
+                "kind": pd.Categorical(["a", "b", None, "a"]),
+                "flag": [True, False, True, False],
+                "level": [1.5, np.nan, 2.5, 3.0],
+            }
+        )
+        shm, layout = _write_frame(df)
+        try:
+            result = _read_frame(shm, layout)
+        finally:
+            _release(shm)
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_active_pairs(self):
+        """Six ACTIVE pairs come from pairs.yaml."""
+        from enrichment.parallel import active_pairs
+
+        assert active_pairs() == ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD", "NZDUSD"]
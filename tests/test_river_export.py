@@ -0,0 +1,216 @@
+"""
+Test River Export — memory-mapped columnar snapshots of River history.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PHOENIX_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PHOENIX_ROOT))
+
+START = datetime(2025, 1, 6, tzinfo=UTC)
+END = START + timedelta(days=30)
+
+SESSIONS = ["asia", "london", None, "new_york"]
+
+
+@pytest.fixture
+def river_db(tmp_path):
+    """River database with one bar table, one enrichment layer and pair_state."""
+    path = tmp_path / "river.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE "EURUSD_1H" '
+        "(timestamp TEXT, open REAL, high REAL, low REAL, close REAL, volume REAL)"
+    )
+    conn.executemany(
+        'INSERT INTO "EURUSD_1H" VALUES (?, ?, ?, ?, ?, ?)',
+        [
+            ((START + timedelta(hours=i)).isoformat(), 1.1, 1.2, 1.0, 1.1 + i * 1e-4, 100.0)
+            for i in range(200)
+        ],
+    )
+    conn.execute(
+        'CREATE TABLE "EURUSD_enrichment_L1" '
+        "(timestamp TEXT, session_name TEXT, hour_ny INTEGER, in_kz INTEGER, atr REAL)"
+    )
+    conn.executemany(
+        'INSERT INTO "EURUSD_enrichment_L1" VALUES (?, ?, ?, ?, ?)',
+        [
+            (
+                (START + timedelta(hours=i)).isoformat(),
+                SESSIONS[i % 4],
+                i % 24,
+                None if i == 150 else i % 2,
+                None if i % 10 == 0 else i * 1e-5,
+            )
+            for i in range(200)
+        ],
+    )
+    conn.execute("CREATE TABLE pair_state (pair TEXT, timestamp TEXT, bid REAL, ask REAL)")
+    conn.execute("INSERT INTO pair_state VALUES ('EURUSD', '2025-01-06T00:00:00', 1.1, 1.1002)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def snapshot(river_db, tmp_path):
+    from data import RiverReader
+    from data.river_export import export_river
+
+    with RiverReader(caller="hunt", river_path=river_db) as reader:
+        export_river(reader, tmp_path / "snapshot", as_of=END, chunk_rows=64)
+    return tmp_path / "snapshot"
+
+
+class TestRiverExport:
+    """export_river() snapshot contents."""
+
+    def test_manifest_lists_tables(self, snapshot):
+        import json
+
+        manifest = json.loads((snapshot / "manifest.json").read_text())
+
+        assert set(manifest["tables"]) == {"EURUSD_1H", "EURUSD_enrichment_L1"}
+        bars = manifest["tables"]["EURUSD_1H"]
+        assert (bars["kind"], bars["pair"], bars["timeframe"], bars["rows"]) == (
+            "bars",
+            "EURUSD",
+            "1H",
+            200,
+        )
+        layer = manifest["tables"]["EURUSD_enrichment_L1"]
+        kinds = {c["name"]: c["kind"] for c in layer["columns"]}
+        assert kinds == {
+            "timestamp": "timestamp",
+            "session_name": "text",
+            "hour_ny": "int",
+            "in_kz": "int",
+            "atr": "float",
+        }
+
+    def test_dataset_hash_matches_truth_teller(self, river_db, snapshot):
+        """Chunked export hash equals TruthTeller over the whole table."""
+        from contracts.truth_teller import TruthTeller
+        from data import RiverReader
+        from data.river_columnar import ColumnarRiverReader
+
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            df = reader.get_bars("EURUSD", "1H", START, END)
+
+        columnar = ColumnarRiverReader(caller="hunt", snapshot_dir=snapshot)
+        assert columnar.get_table_version("EURUSD", "1H") == (
+            TruthTeller().compute_dataset_hash(df)
+        )
+
+    def test_hashes_independent_of_chunking(self, river_db, snapshot, tmp_path):
+        import json
+
+        from data import RiverReader
+        from data.river_export import export_river
+
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            other = export_river(reader, tmp_path / "other", as_of=END, chunk_rows=7)
+        manifest = json.loads((snapshot / "manifest.json").read_text())
+
+        assert other["dataset_hash"] == manifest["dataset_hash"]
+        for name, table in other["tables"].items():
+            assert table["sha256"] == manifest["tables"][name]["sha256"]
+
+    def test_existing_directory_refused(self, river_db, snapshot):
+        from data import RiverReader
+        from data.river_export import export_river
+
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            with pytest.raises(FileExistsError):
+                export_river(reader, snapshot)
+
+    def test_layer_selection(self, river_db, tmp_path):
+        from data import RiverReader
+        from data.river_export import export_river
+
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            manifest = export_river(reader, tmp_path / "bars_only", layers=[], as_of=END)
+
+        assert list(manifest["tables"]) == ["EURUSD_1H"]
+        assert not (tmp_path / ".bars_only.partial").exists()
+
+
+class TestColumnarRiverReader:
+    """RiverReader interface over a snapshot."""
+
+    def test_bars_match_river(self, river_db, snapshot):
+        import pandas as pd
+
+        from data import RiverReader
+        from data.river_columnar import ColumnarRiverReader
+
+        start, end = START + timedelta(hours=5), START + timedelta(hours=120)
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            expected = reader.get_bars("EURUSD", "1H", start, end)
+        expected["timestamp"] = pd.to_datetime(expected["timestamp"], utc=True)
+
+        columnar = ColumnarRiverReader(caller="hunt", snapshot_dir=snapshot)
+        pd.testing.assert_frame_equal(columnar.get_bars("EURUSD", "1H", start, end), expected)
+
+    def test_enrichment_matches_river(self, river_db, snapshot):
+        """Text NULLs decode to None, integer NULLs to NaN (as read_sql)."""
+        import pandas as pd
+
+        from data import RiverReader
+        from data.river_columnar import ColumnarRiverReader
+
+        with RiverReader(caller="hunt", river_path=river_db) as reader:
+            expected = reader.get_enrichment("EURUSD", "L1", START, END)
+        expected["timestamp"] = pd.to_datetime(expected["timestamp"], utc=True)
+
+        columnar = ColumnarRiverReader(caller="hunt", snapshot_dir=snapshot)
+        actual = columnar.get_enrichment("EURUSD", "L1", START, END)
+
+        pd.testing.assert_frame_equal(actual, expected)
+        assert actual["session_name"].iloc[2] is None
+
+    def test_arrays_are_read_only_views(self, snapshot):
+        import numpy as np
+
+        from data.river_columnar import ColumnarRiverReader
+
+        columnar = ColumnarRiverReader(caller="hunt", snapshot_dir=snapshot)
+        bars = columnar.get_bars_arrays("EURUSD", "1H", START, START + timedelta(hours=49))
+
+        assert len(bars) == 50
+        assert bars.timestamp.dtype == np.int64
+        assert isinstance(bars.close.base, np.memmap)
+        assert not bars.close.flags["WRITEABLE"]
+
+    def test_listing_and_missing_tables(self, snapshot):
+        from data import RiverReadError
+        from data.river_columnar import ColumnarRiverReader
+
+        columnar = ColumnarRiverReader(caller="cso", snapshot_dir=snapshot)
+
+        assert columnar.list_available_pairs() == ["EURUSD"]
+        assert columnar.list_available_timeframes("EURUSD") == ["1H"]
+        assert columnar.list_available_layers("EURUSD") == ["L1"]
+        assert columnar.has_data_for_pair("EURUSD", "1H")
+        with pytest.raises(RiverReadError, match="No such table"):
+            columnar.get_bars("EURUSD", "4H", START, END)
+        with pytest.raises(RiverReadError, match="no live state"):
+            columnar.get_latest_state("EURUSD")
+
+    def test_denied_caller_rejected(self, snapshot):
+        from data import RiverAccessDeniedError
+        from data.river_columnar import ColumnarRiverReader
+
+        with pytest.raises(RiverAccessDeniedError):
+            ColumnarRiverReader(caller="execution", snapshot_dir=snapshot)
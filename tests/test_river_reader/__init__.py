@@ -0,0 +1 @@
+"""River Reader Tests — S30 read-only River access and its sibling modules."""
@@ -0,0 +1,40 @@
+"""
+Test configuration for river reader tests.
+
+Ensures phoenix root is in sys.path and provides a small River database.
+"""
+
+import sqlite3
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+# Add phoenix root to path for imports
+_PHOENIX_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PHOENIX_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PHOENIX_ROOT))
+
+from .helpers import START  # noqa: E402
+
+
+@pytest.fixture
+def river_db(tmp_path):
+    """Small River database with one bar table and pair_state."""
+    path = tmp_path / "river.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE "EURUSD_1H" '
+        "(timestamp TEXT, open REAL, high REAL, low REAL, close REAL, volume REAL)"
+    )
+    rows = [
+        ((START + timedelta(hours=i)).isoformat(), 1.1, 1.2, 1.0, 1.1 + i * 1e-4, 100.0)
+        for i in range(200)
+    ]
+    conn.executemany('INSERT INTO "EURUSD_1H" VALUES (?, ?, ?, ?, ?, ?)', rows)
+    conn.execute("CREATE TABLE pair_state (pair TEXT, timestamp TEXT, bid REAL, ask REAL)")
+    conn.execute("INSERT INTO pair_state VALUES ('EURUSD', '2025-01-06T00:00:00', 1.1, 1.1002)")
+    conn.commit()
+    conn.close()
+    return path
@@ -0,0 +1,9 @@
+"""
+River reader test helpers — shared constants.
+
+Imported by the test modules of this package and its conftest.
+"""
+
+from datetime import UTC, datetime
+
+START = datetime(2025, 1, 6, tzinfo=UTC)
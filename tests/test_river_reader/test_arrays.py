@@ -0,0 +1,70 @@
+"""
+Test River Reader — columnar get_bars_arrays fetch.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestRiverReaderArrays:
+    """Columnar bar fetch (get_bars_arrays)."""
+
+    def test_arrays_match_get_bars(self, river_db):
+        """Same rows as get_bars, as typed contiguous arrays."""
+        import numpy as np
+        import pandas as pd
+
+        from data import RiverReader
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        end = START + timedelta(hours=99)
+        df = reader.get_bars("EURUSD", "1H", START, end)
+        bars = reader.get_bars_arrays("EURUSD", "1H", START, end)
+        reader.close()
+
+        assert len(bars) == len(df) == 100
+        assert bars.timestamp.dtype == np.int64
+        assert bars.close.dtype == np.float64
+        assert bars.close.flags["C_CONTIGUOUS"]
+        expected_ts = pd.DatetimeIndex(pd.to_datetime(df["timestamp"], utc=True)).as_unit("ns").asi8
+        np.testing.assert_array_equal(bars.timestamp, expected_ts)
+        for field in ["open", "high", "low", "close", "volume"]:
+            np.testing.assert_array_equal(getattr(bars, field), df[field].to_numpy())
+
+    def test_preallocated_buffer_is_filled_in_place(self, river_db):
+        from data import RiverReader, RiverReadError
+        from data.bar_arrays import BarArrays
+
+        buffer = BarArrays.allocate(150)
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        bars = reader.get_bars_arrays(
+            "EURUSD", "1H", START, START + timedelta(hours=49), out=buffer
+        )
+
+        assert len(bars) == 50
+        assert bars.close.base is buffer.close
+        assert buffer.close[49] == bars.close[-1]
+
+        with pytest.raises(RiverReadError, match="too small"):
+            reader.get_bars_arrays("EURUSD", "1H", START, START + timedelta(days=30), out=buffer)
+        reader.close()
+
+    def test_to_frame_round_trip(self, river_db):
+        from data import RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        bars = reader.get_bars_arrays("EURUSD", "1H", START, START + timedelta(hours=9))
+        reader.close()
+
+        frame = bars.to_frame()
+
+        assert list(frame.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert frame["timestamp"].iloc[0] == START
@@ -0,0 +1,132 @@
+"""
+Test River Reader — range-merging bar window cache.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestBarWindowCache:
+    """Range-merging window cache in front of RiverReader."""
+
+    @pytest.fixture
+    def cache(self, river_db):
+        from data import RiverReader
+        from data.bar_cache import BarWindowCache
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        yield BarWindowCache(reader)
+        reader.close()
+
+    def test_cached_window_matches_reader(self, cache):
+        """Hits, head/tail extensions and sub-windows equal direct reads."""
+        import pandas as pd
+
+        windows = [(10, 60), (20, 40), (0, 60), (10, 120), (130, 150), (5, 199)]
+        for a, b in windows:
+            start, end = START + timedelta(hours=a), START + timedelta(hours=b)
+            expected = cache._reader.get_bars("EURUSD", "1H", start, end)
+            pd.testing.assert_frame_equal(cache.get_bars("EURUSD", "1H", start, end), expected)
+
+    def test_only_missing_tail_is_fetched(self, cache):
+        cache.get_bars("EURUSD", "1H", START, START + timedelta(hours=50))
+        cache.get_bars("EURUSD", "1H", START + timedelta(hours=5), START + timedelta(hours=40))
+        assert (cache.hits, cache.fetches) == (1, 1)
+
+        tail = cache.get_bars(
+            "EURUSD", "1H", START + timedelta(hours=10), START + timedelta(hours=80)
+        )
+
+        assert cache.fetches == 2
+        assert len(tail) == 71
+
+    def test_appended_bars_fetch_only_new_rows(self, cache, river_db):
+        """An append bumps the version; only rows after it are read, ranges kept."""
+        import pandas as pd
+
+        end = START + timedelta(hours=300)
+        assert len(cache.get_bars("EURUSD", "1H", START, end)) == 200
+
+        conn = sqlite3.connect(river_db)
+        conn.execute(
+            'INSERT INTO "EURUSD_1H" VALUES (?, 1.1, 1.2, 1.0, 1.1, 100.0)',
+            ((START + timedelta(hours=200)).isoformat(),),
+        )
+        conn.commit()
+        conn.close()
+
+        bars = cache.get_bars("EURUSD", "1H", START, end)
+
+        assert len(bars) == 201
+        assert (cache.fetches, cache.refreshes, cache.hits) == (1, 1, 1)
+        pd.testing.assert_frame_equal(bars, cache._reader.get_bars("EURUSD", "1H", START, end))
+
+    def test_replaced_bar_is_refreshed(self, cache, river_db):
+        """INSERT OR REPLACE of a cached bar (new rowid) shows the new values."""
+        end = START + timedelta(hours=199)
+        cache.get_bars("EURUSD", "1H", START, end)
+        stamp = (START + timedelta(hours=7)).isoformat()
+
+        conn = sqlite3.connect(river_db)
+        conn.execute('DELETE FROM "EURUSD_1H" WHERE timestamp = ?', (stamp,))
+        conn.execute('INSERT INTO "EURUSD_1H" VALUES (?, 2.0, 2.0, 2.0, 2.0, 1.0)', (stamp,))
+        conn.commit()
+        conn.close()
+
+        bars = cache.get_bars("EURUSD", "1H", START, end)
+
+        assert len(bars) == 200
+        assert bars.loc[bars["timestamp"] == stamp, "close"].tolist() == [2.0]
+        assert cache.fetches == 1
+
+    def test_shrunk_table_refetches(self, cache, river_db):
+        """Deleting the newest bar lowers the version: the window is refetched."""
+        end = START + timedelta(hours=199)
+        cache.get_bars("EURUSD", "1H", START, end)
+
+        conn = sqlite3.connect(river_db)
+        conn.execute('DELETE FROM "EURUSD_1H" WHERE rowid = (SELECT MAX(rowid) FROM "EURUSD_1H")')
+        conn.commit()
+        conn.close()
+
+        assert len(cache.get_bars("EURUSD", "1H", START, end)) == 199
+        assert (cache.fetches, cache.refreshes) == (2, 0)
+
+    def test_lru_eviction_by_bytes(self, river_db):
+        """Least recently used pair/timeframes go first once over max_bytes."""
+        from data import RiverReader
+        from data.bar_cache import BarWindowCache
+
+        conn = sqlite3.connect(river_db)
+        conn.execute('CREATE TABLE "GBPUSD_1H" AS SELECT * FROM "EURUSD_1H"')
+        conn.commit()
+        conn.close()
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        end = START + timedelta(hours=199)
+        probe = BarWindowCache(reader)
+        probe.get_bars("EURUSD", "1H", START, end)
+
+        cache = BarWindowCache(reader, max_bytes=probe.nbytes)
+        cache.get_bars("EURUSD", "1H", START, end)
+        cache.get_bars("GBPUSD", "1H", START, end)
+        cache.get_bars("GBPUSD", "1H", START, end)
+
+        assert cache.nbytes == probe.nbytes
+        assert cache.hits == 1
+        cache.get_bars("EURUSD", "1H", START, end)
+        assert cache.fetches == 3
+        reader.close()
+
+    def test_passes_through_reader_methods(self, cache):
+        assert cache.list_available_pairs() == ["EURUSD"]
+        assert cache.has_data_for_pair("EURUSD")
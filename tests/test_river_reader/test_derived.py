@@ -0,0 +1,195 @@
+"""
+Test River Reader — higher timeframes derived from finer tables.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestHTFResampling:
+    """Higher timeframes derived from the finest stored table."""
+
+    def test_4h_buckets_follow_ny_trading_day(self, river_db):
+        """4H bars open at 17:00 NY + k * 4h (22:00, 02:00, ... UTC in winter)."""
+        from data import RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        bars = reader.get_bars("EURUSD", "4H", START - timedelta(days=1), START + timedelta(days=9))
+        reader.close()
+
+        assert bars["timestamp"].iloc[:3].tolist() == [
+            "2025-01-05T22:00:00+00:00",
+            "2025-01-06T02:00:00+00:00",
+            "2025-01-06T06:00:00+00:00",
+        ]
+        first, second = bars.iloc[0], bars.iloc[1]
+        assert first["volume"] == 200.0  # 00:00 and 01:00 UTC only
+        assert second["open"] == 1.1
+        assert second["close"] == pytest.approx(1.1 + 5e-4)
+        assert (second["high"], second["low"], second["volume"]) == (1.2, 1.0, 400.0)
+        assert bars["volume"].sum() == 200 * 100.0
+
+    def test_dst_fall_back_bucket_spans_five_hours(self):
+        import pandas as pd
+
+        from data.resample import bucket_starts
+
+        hours = pd.date_range("2025-11-02T05:00", "2025-11-02T10:00", freq="h", tz="UTC")
+        starts = pd.DatetimeIndex(bucket_starts(hours.asi8, "4H"), tz="UTC")
+
+        # 01:00 EDT .. 04:59 EST is one bucket; 05:00 EST opens the next
+        assert starts[:5].tolist() == [pd.Timestamp("2025-11-02T05:00", tz="UTC")] * 5
+        assert starts[5] == pd.Timestamp("2025-11-02T10:00", tz="UTC")
+
+    def test_new_base_bars_extend_cached_bars(self, river_db):
+        import pandas as pd
+
+        from data import RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        window = (START - timedelta(days=1), START + timedelta(days=30))
+        before = reader.get_bars("EURUSD", "4H", *window)
+
+        conn = sqlite3.connect(river_db)
+        conn.executemany(
+            'INSERT INTO "EURUSD_1H" VALUES (?, 1.1, 1.3, 0.9, 1.15, 100.0)',
+            [((START + timedelta(hours=h)).isoformat(),) for h in range(200, 206)],
+        )
+        conn.commit()
+        conn.close()
+
+        after = reader.get_bars("EURUSD", "4H", *window)
+        reader.close()
+        fresh_reader = RiverReader(caller="cso", river_path=river_db)
+        fresh = fresh_reader.get_bars("EURUSD", "4H", *window)
+        fresh_reader.close()
+
+        pd.testing.assert_frame_equal(after, fresh)
+        assert len(after) > len(before)
+        assert after["volume"].sum() == 206 * 100.0
+
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            "%Y-%m-%dT%H:%M:%S",
+            "%Y-%m-%d %H:%M:%S",
+            "%Y-%m-%dT%H:%M:%S+00:00",
+            "%Y-%m-%dT%H:%M:%SZ",
+        ],
+    )
+    def test_extend_matches_rebuild_for_each_layout(self, tmp_path, layout):
+        """Extending a bucket keeps its older base bars whatever the text layout."""
+        import pandas as pd
+
+        from data import RiverReader
+
+        path = tmp_path / "river.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            'CREATE TABLE "EURUSD_1H" '
+            "(timestamp TEXT, open REAL, high REAL, low REAL, close REAL, volume REAL)"
+        )
+
+        def insert(hours):
+            conn.executemany(
+                'INSERT INTO "EURUSD_1H" VALUES (?, ?, 1.2, 1.0, 1.1, 1.0)',
+                [((START + timedelta(hours=h)).strftime(layout), 100.0 + h) for h in hours],
+            )
+            conn.commit()
+
+        insert(range(99))  # hour 98 opens the 02:00 UTC bucket alone
+        reader = RiverReader(caller="cso", river_path=path)
+        window = (START - timedelta(days=1), START + timedelta(days=30))
+        reader.get_bars("EURUSD", "4H", *window)
+        insert(range(99, 121))
+        conn.close()
+
+        after = reader.get_bars("EURUSD", "4H", *window)
+        reader.close()
+        fresh_reader = RiverReader(caller="cso", river_path=path)
+        fresh = fresh_reader.get_bars("EURUSD", "4H", *window)
+        fresh_reader.close()
+
+        pd.testing.assert_frame_equal(after, fresh)
+        assert len(fresh) == 31
+        assert fresh["volume"].sum() == 121
+        bucket = (START + timedelta(hours=98)).strftime(layout)
+        assert fresh.loc[fresh["timestamp"] == bucket, "open"].tolist() == [198.0]
+
+    def test_derived_timeframes_listed_and_versioned(self, river_db):
+        from data import RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+
+        assert reader.list_available_timeframes("EURUSD") == ["1H"]
+        assert reader.list_available_timeframes("EURUSD", include_derived=True) == [
+            "1H",
+            "4H",
+            "1D",
+        ]
+        assert reader.has_data_for_pair("EURUSD", "4H")
+        assert not reader.has_data_for_pair("EURUSD", "15m")
+        assert reader.get_table_version("EURUSD", "4H") == (
+            reader.get_table_version("EURUSD", "1H")
+        )
+        reader.close()
+
+    def test_snapshot_includes_derived_windows(self, river_db):
+        import pandas as pd
+
+        from data import RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db, max_connections=1)
+        window = (START, START + timedelta(days=3))
+        snapshot = reader.get_snapshot([("EURUSD", "4H", *window), ("EURUSD", "1H", *window)])
+
+        pd.testing.assert_frame_equal(
+            snapshot.bars[("EURUSD", "4H")], reader.get_bars("EURUSD", "4H", *window)
+        )
+        reader.close()
+
+    def test_snapshot_derives_from_the_same_transaction(self, river_db, monkeypatch):
+        """Base rows written mid-snapshot show in neither stored nor derived windows."""
+        from data import RiverReader
+
+        conn = sqlite3.connect(river_db)
+        conn.execute("PRAGMA journal_mode=WAL")  # writer commits while the snapshot reads
+        conn.close()
+        reader = RiverReader(caller="cso", river_path=river_db, max_connections=1)
+        read_bars = reader._read_bars
+
+        def write_after_read(conn, *args):
+            bars = read_bars(conn, *args)
+            writer = sqlite3.connect(river_db)
+            writer.execute(
+                'INSERT INTO "EURUSD_1H" VALUES (?, 1.1, 1.3, 0.9, 1.15, 100.0)',
+                ((START + timedelta(hours=200)).isoformat(),),
+            )
+            writer.commit()
+            writer.close()
+            return bars
+
+        monkeypatch.setattr(reader, "_read_bars", write_after_read)
+        window = (START - timedelta(days=1), START + timedelta(days=30))
+        snapshot = reader.get_snapshot([("EURUSD", "1H", *window), ("EURUSD", "4H", *window)])
+        reader.close()
+
+        assert len(snapshot.bars[("EURUSD", "1H")]) == 200
+        assert snapshot.bars[("EURUSD", "4H")]["volume"].sum() == 200 * 100.0
+
+    def test_underivable_timeframe_still_fails(self, river_db):
+        from data import RiverReader, RiverReadError
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        with pytest.raises(RiverReadError, match="no such table"):
+            reader.get_bars("EURUSD", "15m", START, START + timedelta(days=1))
+        reader.close()
@@ -0,0 +1,117 @@
+"""
+Test River Reader — tail-follow subscriptions for new bars.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+import threading
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestRiverFollow:
+    """Tail-follow subscriptions (high-water mark per pair/timeframe)."""
+
+    @staticmethod
+    def _append(river_db, hours):
+        conn = sqlite3.connect(river_db)
+        conn.executemany(
+            'INSERT INTO "EURUSD_1H" VALUES (?, 1.1, 1.2, 1.0, 1.1, 100.0)',
+            [((START + timedelta(hours=h)).isoformat(),) for h in hours],
+        )
+        conn.commit()
+        conn.close()
+
+    def test_only_new_rows_are_returned(self, river_db):
+        from data import RiverFollower, RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        follower = RiverFollower(reader)
+        sub = follower.subscribe([("EURUSD", "1H")])
+
+        assert sub.poll() == {}
+        self._append(river_db, [200, 201])
+        new = sub.poll()
+        assert list(new) == [("EURUSD", "1H")]
+        assert new[("EURUSD", "1H")]["timestamp"].tolist() == [
+            (START + timedelta(hours=h)).isoformat() for h in (200, 201)
+        ]
+        assert sub.last_timestamp("EURUSD", "1H") == (START + timedelta(hours=201)).isoformat()
+        assert sub.poll() == {}
+        follower.close()
+        reader.close()
+
+    def test_idle_polls_skip_table_reads(self, river_db):
+        """Unchanged data_version: no table version queries."""
+        from data import RiverFollower, RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        follower = RiverFollower(reader)
+        sub = follower.subscribe([("EURUSD", "1H")])
+
+        for _ in range(5):
+            sub.poll()
+
+        assert follower.checks == 5
+        assert follower.refreshes == 1  # baseline only
+        follower.close()
+        reader.close()
+
+    def test_subscribers_share_checks_with_own_marks(self, river_db):
+        from data import RiverFollower, RiverReader
+
+        reader = RiverReader(caller="shadow", river_path=river_db)
+        follower = RiverFollower(reader)
+        first = follower.subscribe([("EURUSD", "1H")])
+        second = follower.subscribe([("EURUSD", "1H")], since=START + timedelta(hours=195))
+
+        assert first.poll() == {}
+        self._append(river_db, [200])
+        assert len(first.poll()[("EURUSD", "1H")]) == 1
+        assert len(second.poll()[("EURUSD", "1H")]) == 6  # 195..199 backlog + new bar
+        assert follower.refreshes == 2  # baseline + one change, seen once for both
+        follower.close()
+        reader.close()
+
+    def test_started_follower_calls_back(self, river_db):
+        from data import RiverFollower, RiverReader
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        follower = RiverFollower(reader, poll_interval=0.01)
+        received = []
+        delivered = threading.Event()
+
+        def on_new_bars(new):
+            received.append(new)
+            delivered.set()
+
+        follower.subscribe([("EURUSD", "1H")], callback=on_new_bars)
+        follower.start()
+        self._append(river_db, [200])
+
+        assert delivered.wait(timeout=5)
+        assert len(received[0][("EURUSD", "1H")]) == 1
+        follower.close()
+        reader.close()
+
+    def test_missing_table_and_closed_subscription(self, river_db):
+        from data import RiverFollower, RiverReader, RiverReadError
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        follower = RiverFollower(reader)
+        with pytest.raises(RiverReadError):
+            follower.subscribe([("GBPUSD", "1H")])
+
+        sub = follower.subscribe([("EURUSD", "1H")])
+        sub.close()
+        with pytest.raises(RiverReadError, match="closed"):
+            sub.poll()
+        follower.close()
+        reader.close()
@@ -0,0 +1,97 @@
+"""
+Test River Reader — chunked streaming of River history.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestRiverStreaming:
+    """Chunked iteration over River history (bounded memory)."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 50, 200, 1000])
+    def test_row_chunks_cover_range_once(self, river_db, chunk_rows):
+        import pandas as pd
+
+        from data import RiverReader
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        start, end = START + timedelta(hours=3), START + timedelta(hours=180)
+
+        chunks = list(reader.iter_bars("EURUSD", "1H", start, end, chunk_rows=chunk_rows))
+        expected = reader.get_bars("EURUSD", "1H", start, end)
+        reader.close()
+
+        assert all(len(c.data) <= chunk_rows and c.warmup == 0 for c in chunks)
+        streamed = pd.concat([c.new for c in chunks], ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, expected)
+
+    def test_span_chunks_cover_range_once(self, river_db):
+        import pandas as pd
+
+        from data import RiverReader
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        start, end = START, START + timedelta(hours=199)
+
+        chunks = list(reader.iter_bars("EURUSD", "1H", start, end, chunk_span=timedelta(days=1)))
+        expected = reader.get_bars("EURUSD", "1H", start, end)
+        reader.close()
+
+        assert [len(c.data) for c in chunks] == [24] * 8 + [8]
+        pd.testing.assert_frame_equal(
+            pd.concat([c.new for c in chunks], ignore_index=True), expected
+        )
+
+    def test_overlap_repeats_tail_as_warmup(self, river_db):
+        from data import RiverReader
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        end = START + timedelta(hours=199)
+
+        chunks = list(reader.iter_bars("EURUSD", "1H", START, end, chunk_rows=50, overlap=6))
+        reader.close()
+
+        assert [c.warmup for c in chunks] == [0, 6, 6, 6]
+        for prev, chunk in zip(chunks, chunks[1:], strict=False):
+            assert chunk.data["timestamp"].iloc[:6].tolist() == (
+                prev.data["timestamp"].iloc[-6:].tolist()
+            )
+
+    def test_duplicate_timestamps_not_skipped(self, river_db):
+        """Keyset on (timestamp, rowid) keeps rows that share a timestamp."""
+        from data import RiverReader
+
+        conn = sqlite3.connect(river_db)
+        dup = (START + timedelta(hours=10)).isoformat()
+        conn.executemany(
+            'INSERT INTO "EURUSD_1H" VALUES (?, 1.1, 1.2, 1.0, 1.1, 100.0)', [(dup,)] * 3
+        )
+        conn.commit()
+        conn.close()
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        end = START + timedelta(hours=199)
+        rows = sum(len(c.new) for c in reader.iter_bars("EURUSD", "1H", START, end, chunk_rows=2))
+        reader.close()
+
+        assert rows == 203
+
+    def test_invalid_arguments(self, river_db):
+        from data import RiverReader, RiverReadError
+
+        reader = RiverReader(caller="hunt", river_path=river_db)
+        with pytest.raises(ValueError, match="overlap"):
+            next(reader.iter_bars("EURUSD", "1H", START, START, overlap=-1))
+        with pytest.raises(RiverReadError, match="Invalid table name"):
+            next(reader.iter_bars("EUR-USD", "1H", START, START))
+        reader.close()
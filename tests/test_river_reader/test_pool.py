@@ -0,0 +1,110 @@
+"""
+Test River Reader — pooled read-only connections for concurrent readers.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestRiverConnectionPool:
+    """Pooled connections (INV-RIVER-RO-1)."""
+
+    def test_connections_are_read_only(self, river_db):
+        """Pooled connections reject writes at the database level."""
+        from data import RiverConnectionPool
+
+        pool = RiverConnectionPool(river_db, max_connections=2)
+        with pool.connection() as conn, pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM pair_state")
+        pool.close()
+
+    def test_threads_get_distinct_connections(self, river_db):
+        """Concurrent checkouts use separate connections up to the limit."""
+        from data import RiverConnectionPool
+
+        pool = RiverConnectionPool(river_db, max_connections=4)
+        barrier = threading.Barrier(4)
+        seen = []
+
+        def hold():
+            with pool.connection() as conn:
+                seen.append(id(conn))
+                barrier.wait(timeout=5)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: hold(), range(4)))
+
+        assert len(set(seen)) == 4
+        assert pool.open_connections == 4
+        pool.close()
+        assert pool.open_connections == 0
+
+    def test_checkout_times_out_when_exhausted(self, river_db):
+        from data import RiverConnectionPool, RiverPoolTimeoutError
+
+        pool = RiverConnectionPool(river_db, max_connections=1, checkout_timeout=0.05)
+        with pool.connection(), pytest.raises(RiverPoolTimeoutError):
+            with pool.connection():
+                pass
+        pool.close()
+
+
+class TestRiverReaderConcurrency:
+    """RiverReader shared across threads."""
+
+    def test_concurrent_get_bars(self, river_db):
+        """Many threads on one reader all get the full, identical result."""
+        from data import RiverReader
+
+        reader = RiverReader(caller="hunt", river_path=river_db, max_connections=4)
+        end = START + timedelta(hours=199)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            frames = list(
+                executor.map(lambda _: reader.get_bars("EURUSD", "1H", START, end), range(32))
+            )
+        reader.close()
+
+        assert all(len(df) == 200 for df in frames)
+        assert all(df.equals(frames[0]) for df in frames)
+
+    def test_shared_pool_survives_reader_close(self, river_db):
+        """Readers sharing a pool do not close it for each other."""
+        from data import RiverConnectionPool, RiverReader
+
+        pool = RiverConnectionPool(river_db)
+        hunt = RiverReader(caller="hunt", pool=pool)
+        cso = RiverReader(caller="cso", pool=pool)
+
+        hunt.close()
+
+        assert cso.list_available_pairs() == ["EURUSD"]
+        assert hunt.get_latest_state("EURUSD")["queried_by"] == "hunt"
+        pool.close()
+
+    def test_reader_reopens_after_close(self, river_db):
+        from data import RiverReader
+
+        reader = RiverReader(caller="shadow", river_path=river_db)
+        assert reader.has_data_for_pair("EURUSD")
+        reader.close()
+
+        assert reader.list_available_timeframes("EURUSD") == ["1H"]
+        reader.close()
+
+    def test_denied_caller_still_rejected(self, river_db):
+        from data import RiverAccessDeniedError, RiverConnectionPool, RiverReader
+
+        with pytest.raises(RiverAccessDeniedError):
+            RiverReader(caller="execution", pool=RiverConnectionPool(river_db))
@@ -0,0 +1,81 @@
+"""
+Test River Reader — consistent multi-query snapshots.
+
+SPRINT: S30
+EXIT_GATE: river_read_only
+
+INVARIANT: INV-RIVER-RO-1 "River reader cannot modify data"
+"""
+
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+from .helpers import START
+
+
+class TestRiverSnapshot:
+    """Batched multi-pair / multi-timeframe reads in one transaction."""
+
+    def test_snapshot_matches_individual_reads(self, river_db):
+        import pandas as pd
+
+        from data import RiverConnectionPool, RiverReader
+
+        conn = sqlite3.connect(river_db)
+        conn.execute('CREATE TABLE "EURUSD_4H" AS SELECT * FROM "EURUSD_1H" WHERE rowid % 4 = 1')
+        conn.executemany(
+            "INSERT INTO pair_state VALUES (?, ?, ?, ?)",
+            [
+                ("GBPUSD", "2025-01-06T00:00:00", 1.25, 1.2503),
+                ("EURUSD", "2025-01-06T01:00:00", 1.2, 1.2002),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        pool = RiverConnectionPool(river_db, max_connections=1)
+        reader = RiverReader(caller="cso", pool=pool)
+        end = START + timedelta(hours=150)
+        requests = [
+            ("EURUSD", "1H", START + timedelta(hours=100), end),
+            ("EURUSD", "4H", START, end),
+        ]
+
+        snapshot = reader.get_snapshot(requests)
+
+        for pair, timeframe, start, stop in requests:
+            pd.testing.assert_frame_equal(
+                snapshot.bars[(pair, timeframe)], reader.get_bars(pair, timeframe, start, stop)
+            )
+        assert list(snapshot.states) == ["EURUSD", "GBPUSD"]
+        assert snapshot.states["EURUSD"]["bid"] == 1.2
+        for pair, state in snapshot.states.items():
+            expected = reader.get_latest_state(pair)
+            assert {k: state[k] for k in ("timestamp", "bid", "ask", "spread", "mid")} == {
+                k: expected[k] for k in ("timestamp", "bid", "ask", "spread", "mid")
+            }
+        with pool.connection() as conn:
+            assert not conn.in_transaction
+        pool.close()
+
+    def test_duplicate_requests_rejected(self, river_db):
+        from data import RiverReader, RiverReadError
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+        window = ("EURUSD", "1H", START, START + timedelta(hours=5))
+
+        with pytest.raises(RiverReadError, match="Duplicate"):
+            reader.get_snapshot([window, window])
+        reader.close()
+
+    def test_failed_request_fails_snapshot(self, river_db):
+        """A missing table that cannot be derived (1W) fails the whole snapshot."""
+        from data import RiverReader, RiverReadError
+
+        reader = RiverReader(caller="cso", river_path=river_db)
+
+        with pytest.raises(RiverReadError, match="snapshot"):
+            reader.get_snapshot([("EURUSD", "1H", START, START), ("EURUSD", "1W", START, START)])
+        reader.close()